@@ -10,9 +10,7 @@ class Plugins(Command):
     Name = "plugins"
     Description = "Plugin yönetim komutu"
     Category = "core"
-    Usage = (
-        "plugins [list|enable|disable|info|search|install|update|remove] [argümanlar]"
-    )
+    Usage = "plugins [list|enable|disable|info|stats|search|install|update|remove] [argümanlar]"
 
     def __init__(self) -> None:
         super().__init__()
@@ -23,6 +21,8 @@ class Plugins(Command):
         "plugins info 'Audit Logger'",
         "plugins enable 'Audit Logger'",
         "plugins disable 'Audit Logger'",
+        "plugins stats              # Hook süreleri (yavaş eklentiler)",
+        "plugins stats reset        # Hook istatistiklerini sıfırla",
         "plugins search             # Uzak depolarda eklenti ara",
         "plugins install repo/name  # Uzak depodan eklenti kur",
         "plugins update name        # Kurulu bir eklentiyi güncelle",
@@ -61,6 +61,14 @@ class Plugins(Command):
             self._show_info(args[1])
             return True
 
+        elif subcommand == "stats":
+            if len(args) > 1 and args[1].lower() == "reset":
+                shared_state.plugin_manager.reset_hook_stats()
+                print("[bold green]Hook istatistikleri sıfırlandı.[/bold green]")
+                return True
+            self._show_hook_stats()
+            return True
+
         elif subcommand == "search":
             search_term = " ".join(args[1:]) if len(args) > 1 else None
             self._search_plugins(search_term)
@@ -230,6 +238,39 @@ class Plugins(Command):
 
         print("-" * 50)
 
+    def _show_hook_stats(self) -> None:
+        """Hook çağrı sürelerini (toplam süreye göre) listeler."""
+        if not shared_state.plugin_manager:
+            return
+
+        stats = shared_state.plugin_manager.get_hook_stats()
+        if not stats:
+            print("Henüz hook çağrısı kaydedilmedi.")
+            return
+
+        print("\nHook İstatistikleri")
+        print("-------------------")
+        print()
+        print(
+            f"   {'Plugin':<22} {'Hook':<18} {'Çağrı':>7} {'Hata':>5} "
+            f"{'Ort. ms':>9} {'Maks ms':>9} {'Yavaş':>6} {'Düşen':>6}"
+        )
+        print(
+            f"   {'------':<22} {'----':<18} {'-----':>7} {'----':>5} "
+            f"{'-------':>9} {'-------':>9} {'-----':>6} {'-----':>6}"
+        )
+        ordered = sorted(
+            stats.items(), key=lambda item: item[1].total_time, reverse=True
+        )
+        for (hook_name, owner), item in ordered:
+            line = (
+                f"   {owner[:22]:<22} {hook_name:<18} {item.calls:>7} {item.errors:>5} "
+                f"{item.avg_time * 1000:>9.2f} {item.max_time * 1000:>9.2f} "
+                f"{item.slow:>6} {item.dropped:>6}"
+            )
+            print(f"[yellow]{line}[/yellow]" if item.slow or item.dropped else line)
+        print()
+
     def _search_plugins(self, search_term: str | None = None) -> None:
         """Uzak depolardaki eklentileri arar."""
         if not shared_state.plugin_downloader:
@@ -322,6 +363,7 @@ class Plugins(Command):
                 "enable",
                 "disable",
                 "info",
+                "stats",
                 "search",
                 "install",
                 "update",
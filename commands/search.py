@@ -1,10 +1,18 @@
 import re
 import shutil
+from collections.abc import Mapping
 from typing import Any
 
 from core.command import Command
 from core.cont import COL_SPACING, DEFAULT_TERMINAL_WIDTH, LEFT_PADDING
 from core.module import BaseModule
+from core.module_catalog import (
+    FUZZY_MIN_SIMILARITY,
+    SEARCH_FIELDS,
+    SearchQuery,
+    parse_search_query,
+    trigram_similarity,
+)
 from core.module_manager import ModuleManager
 from core.shared_state import shared_state
 
@@ -23,39 +31,119 @@ class ModuleSearcher:
     def search(self, term: str) -> list[dict[str, Any]]:
         """_summary_Terim alarak aramaya sağlayan fonksiyon.
 
+        Sorgu ``author:``/``category:`` filtreleri içerebilir. Sonuçlar
+        ilgililiğe göre sıralıdır; tam eşleşme yoksa bulanık eşleşenler döner.
+
         Args:
             term (str): Aranacak terim.
 
         Returns:
             List[Dict[str, Any]]: Arama sonucunun liste çıktısı.
         """
+        query = parse_search_query(term)
+        if not (query.terms or query.author or query.category):
+            return []
         matching_modules = []
-        term_lower = term.lower()
-        all_modules: dict[str, BaseModule] = self.module_manager.get_all_modules()
-        for module_path, module_obj in all_modules.items():
-            search_fields = {
+        for record in self._candidates(query):
+            matching_modules.append(
+                {**record, "matches": self._matched_fields(record, query)}
+            )
+        return matching_modules
+
+    def _candidates(self, query: SearchQuery) -> list[dict[str, str]]:
+        """Sıralı aday kayıtlar ({alan: değer}).
+
+        Katalog veritabanı açıksa trigram indeksi kullanılır; aksi halde
+        bellekteki modüller aynı kurallarla doğrusal taranır.
+        """
+        metas = None
+        if isinstance(self.module_manager, ModuleManager):
+            metas = self.module_manager.search_catalog(query)
+        if metas is not None:
+            return [
+                {
+                    "path": meta.path,
+                    "name": meta.name,
+                    "description": meta.description,
+                    "author": meta.author,
+                    "category": meta.category or "uncategorized",
+                }
+                for meta in metas
+            ]
+        return self._scan(query)
+
+    def _scan(self, query: SearchQuery) -> list[dict[str, str]]:
+        all_modules: Mapping[str, BaseModule] = self.module_manager.get_all_modules()
+        records = [
+            {
+                "path": module_path,
                 "name": module_obj.Name,
                 "description": module_obj.Description,
                 "author": module_obj.Author,
                 "category": module_obj.Category,
-                "path": module_path,
             }
-            found_in_fields = {}
-            for field_name, field_value in search_fields.items():
-                if term_lower in str(field_value).lower():
-                    found_in_fields[field_name] = field_value
-            if found_in_fields:
-                matching_modules.append(
-                    {
-                        "path": module_path,
-                        "name": module_obj.Name,
-                        "description": module_obj.Description,
-                        "author": module_obj.Author,
-                        "category": module_obj.Category,
-                        "matches": found_in_fields,
-                    }
-                )
-        return matching_modules
+            for module_path, module_obj in all_modules.items()
+        ]
+        records = [r for r in records if self._passes_filters(r, query)]
+        terms = [t.lower() for t in query.terms]
+        exact = [
+            r
+            for r in records
+            if all(any(t in str(r[f]).lower() for f in SEARCH_FIELDS) for t in terms)
+        ]
+        if exact or not terms:
+            return sorted(exact, key=lambda r: not self._is_prefix(r, terms))
+        scored = []
+        for record in records:
+            similarities = [
+                max(trigram_similarity(t, str(record[f])) for f in SEARCH_FIELDS)
+                for t in terms
+            ]
+            if min(similarities) >= FUZZY_MIN_SIMILARITY:
+                scored.append((-sum(similarities), record["path"], record))
+        scored.sort(key=lambda item: item[:2])
+        return [record for *_, record in scored]
+
+    @staticmethod
+    def _passes_filters(record: dict[str, str], query: SearchQuery) -> bool:
+        if query.author and not str(record["author"]).lower().startswith(
+            query.author.lower()
+        ):
+            return False
+        if query.category:
+            category = str(record["category"]).lower()
+            wanted = query.category.lower()
+            return category == wanted or category.startswith(wanted + "/")
+        return True
+
+    @staticmethod
+    def _is_prefix(record: dict[str, str], terms: list[str]) -> bool:
+        name = str(record["name"]).lower()
+        leaf = record["path"].rsplit("/", 1)[-1].lower()
+        return any(name.startswith(t) or leaf.startswith(t) for t in terms)
+
+    @staticmethod
+    def _matched_fields(record: dict[str, str], query: SearchQuery) -> dict[str, str]:
+        """Sonuç satırında eşleşen alanlar (filtreler dahil)."""
+        terms = [t.lower() for t in query.terms]
+        found = {
+            f: record[f]
+            for f in SEARCH_FIELDS
+            if any(t in str(record[f]).lower() for t in terms)
+        }
+        if terms and not found:
+            # Bulanık eşleşme: benzer alanları göster
+            found = {
+                f: record[f]
+                for f in SEARCH_FIELDS
+                if max(trigram_similarity(t, str(record[f])) for t in terms)
+                >= FUZZY_MIN_SIMILARITY
+            }
+        if query.author:
+            found["author"] = record["author"]
+        if query.category:
+            found["category"] = record["category"]
+        return found
 
 
 class Search(Command):
@@ -72,12 +160,15 @@ class Search(Command):
     Description = "Modülleri arar."
     Category = "core"
     Aliases = []
-    Usage = "search <arama_terimi>"
+    Usage = "search <arama_terimi> [author:<yazar>] [category:<kategori>]"
     Examples = [
         "search vsftpd            # vsftpd içeren modülleri listeler",
         "search scanner           # scanner içeren modülleri listeler",
         "search exploit           # exploit kategorisindeki modülleri bulur",
         "search Mahmut            # Yazar adına göre arar",
+        "search brute category:auxiliary   # auxiliary/* altında brute arar",
+        "search author:mahmut     # Yazara göre filtreler",
+        "search bannr             # Yazım hatasında bulanık eşleşme (banner)",
     ]
 
     def __init__(self) -> None:
@@ -119,7 +210,9 @@ class Search(Command):
         if not results:
             print("Eşleşen modül bulunamadı.")
             return True
-        self._display_search_results(results, search_term)
+        query = parse_search_query(search_term)
+        highlight_terms = [*query.terms, query.author or "", query.category or ""]
+        self._display_search_results(results, " ".join(t for t in highlight_terms if t))
         return True
 
     def _display_search_results(
@@ -233,12 +326,15 @@ class Search(Command):
 
         Args:
             text (str): genel yazı
-            term (str): aranan terim.
+            term (str): aranan terim(ler), boşlukla ayrılmış.
 
         Returns:
             str: renkli çıktı.
         """
-        term_pattern = re.compile(re.escape(term), re.IGNORECASE)
+        words = sorted(set(term.split()), key=len, reverse=True)
+        if not words:
+            return text
+        term_pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
         return term_pattern.sub(lambda match: f"\033[91m{match.group(0)}\033[0m", text)
 
     def _get_ansi_len_diff(self, text: str) -> int:
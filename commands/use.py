@@ -49,20 +49,24 @@ class Use(Command):
         if not module_manager:
             return []
 
-        get_paths = getattr(module_manager, "get_module_paths", None)
-        all_module_paths = (
-            get_paths()
-            if callable(get_paths)
-            else sorted(module_manager.get_all_modules().keys())
-        )
+        # Önek indeksi; çok eşleşmede "auxiliary/scanner/" gibi alt ağaçlar önerilir
+        complete_paths = getattr(module_manager, "complete_module_paths", None)
+        if not callable(complete_paths):
+            get_paths = getattr(module_manager, "get_module_paths", None)
+            all_module_paths = (
+                get_paths()
+                if callable(get_paths)
+                else sorted(module_manager.get_all_modules().keys())
+            )
+
+            def complete_paths(prefix: str) -> list[str]:
+                return [path for path in all_module_paths if path.startswith(prefix)]
 
         if len(parts) == 1 and text.endswith(" "):
-            return list(all_module_paths)
+            return list(complete_paths(""))
         elif len(parts) == 2 and not text.endswith(" "):
             current_arg = parts[1]
-            matches = [
-                path for path in all_module_paths if path.startswith(current_arg)
-            ]
+            matches = complete_paths(current_arg)
             return [
                 Completion(path, start_position=-len(current_arg)) for path in matches
             ]
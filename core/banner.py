@@ -1,3 +1,4 @@
+import math
 import random
 
 import pyfiglet
@@ -10,6 +11,12 @@ def print_banner() -> None:
     # Konsol çıktısı için Rich kütüphanesi başlatılıyor
     console = Console()
 
+    # Oluşturulan renkli banner konsola yazdırılıyor.
+    console.print(render_banner())
+
+
+def render_banner() -> Text:
+    """Banner'ı yazdırmadan oluşturur (açılışta arka plan thread'inde hazırlanır)."""
     # Okunabilir ve iyi boyutlandırılmış fontların özenle seçilmiş listesi.
     # Bu liste, çerçeve başlatıldığında kullanıcıya farklı görsel deneyimler sunmak için kullanılır.
     # Her font farklı bir ASCII sanat stili üretir.
@@ -74,5 +81,105 @@ def print_banner() -> None:
         # Her satırın sonuna yeni satır karakteri ekleniyor.
         rich_text.append("\n")
 
-    # Oluşturulan renkli banner konsola yazdırılıyor.
-    console.print(rich_text)
+    return rich_text
+
+
+# ==============================================================================
+#  GRADIENT BANNER YARDIMCI FONKSİYONLARI (%20 İhtimalle Devreye Girer)
+# ==============================================================================
+def rgb_to_ansi_fg(r: int, g: int, b: int) -> str:
+    return f"\033[38;2;{r};{g};{b}m"
+
+
+def hsl_to_rgb(h: float, s: float, lightness: float) -> tuple[int, int, int]:
+    h = h % 360
+    c = (1 - abs(2 * lightness - 1)) * s
+    x = c * (1 - abs((h / 60) % 2 - 1))
+    m = lightness - c / 2
+    r1: float
+    g1: float
+    b1: float
+    if h < 60:
+        r1, g1, b1 = c, x, 0
+    elif h < 120:
+        r1, g1, b1 = x, c, 0
+    elif h < 180:
+        r1, g1, b1 = 0, c, x
+    elif h < 240:
+        r1, g1, b1 = 0, x, c
+    elif h < 300:
+        r1, g1, b1 = x, 0, c
+    else:
+        r1, g1, b1 = c, 0, x
+    return (int((r1 + m) * 255), int((g1 + m) * 255), int((b1 + m) * 255))
+
+
+def interpolate_color(
+    color1: tuple[int, int, int], color2: tuple[int, int, int], t: float
+) -> tuple[int, int, int]:
+    t = max(0.0, min(1.0, t))
+    return (
+        int(color1[0] + (color2[0] - color1[0]) * t),
+        int(color1[1] + (color2[1] - color1[1]) * t),
+        int(color1[2] + (color2[2] - color1[2]) * t),
+    )
+
+
+def apply_two_color_lolcat(
+    lines: list[str], color1: tuple[int, int, int], color2: tuple[int, int, int]
+) -> str:
+    if not lines:
+        return ""
+    result = []
+    phase = random.random() * math.pi * 2
+    for row_idx, line in enumerate(lines):
+        colored_line = ""
+        for col_idx, ch in enumerate(line):
+            wave = math.sin(col_idx * 0.08 + row_idx * 0.4 + phase)
+            t = (wave + 1) / 2
+            r, g, b = interpolate_color(color1, color2, t)
+            colored_line += rgb_to_ansi_fg(r, g, b) + ch
+        colored_line += "\033[0m"
+        result.append(colored_line)
+    return "\n".join(result)
+
+
+def render_gradient_banner() -> str:
+    """İki renkli dalga (lolcat) efektli kısa banner'ı ANSI metni olarak üretir."""
+    curated_fonts = [
+        "slant",
+        "standard",
+        "doom",
+        "big",
+        "small",
+        "cybermedium",
+        "smslant",
+        "block",
+        "digital",
+        "shadow",
+        "speed",
+        "lean",
+        "mini",
+        "script",
+        "ivrit",
+        "computer",
+    ]
+    font = random.choice(curated_fonts)
+
+    try:
+        ascii_art = pyfiglet.figlet_format("Mah", font=font)
+    except Exception:
+        ascii_art = pyfiglet.figlet_format("Mah", font="slant")
+
+    lines = ascii_art.rstrip("\n").split("\n")
+
+    # İki kontrast rastgele renk oluştur
+    h1 = random.randint(0, 359)
+    color1 = hsl_to_rgb(h1, random.uniform(0.7, 1.0), random.uniform(0.45, 0.65))
+    color2 = hsl_to_rgb(
+        (h1 + random.randint(60, 180)) % 360,
+        random.uniform(0.7, 1.0),
+        random.uniform(0.45, 0.65),
+    )
+
+    return apply_two_color_lolcat(lines, color1, color2)
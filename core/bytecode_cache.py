@@ -0,0 +1,173 @@
+"""İçerik özetiyle (content_hash) anahtarlanan derlenmiş kod önbelleği.
+
+``ModuleManager`` ve ``CommandManager`` gerçek yüklemede kaynağı
+``spec_from_file_location`` + ``exec_module`` ile, kısıtlı modda ise
+``SandboxExecutor`` ile her açılışta yeniden ayrıştırıp derler; doğrulama
+hattı da aynı dosyayı her seferinde yeniden tarar ve çalıştırır.
+``BytecodeCache`` derlenmiş kod nesnesini (``marshal``) ve doğrulama
+sonucunu diske yazar; içeriği değişmeyen modüller sonraki açılışlarda
+ayrıştırma, derleme ve doğrulama adımlarını atlar.
+
+Python'un kendi ``__pycache__``'inden farkları:
+
+- Anahtar dosya mtime'ı değil içerik özetidir (``git checkout`` / kopyalama
+  sonrası da geçerli kalır, aynı mtime'lı düzenlemelerde bayat kalmaz).
+- Kısıtlı (sandbox) yükleme yolu da önbelleğe alınır.
+- Doğrulama sonucu (verdict) da saklanır; ``ValidationPipeline`` kendi
+  girdilerini tarayıcı kural sürümünü içeren ayrı bir modla yazar.
+
+Girdi biçimi: ``importlib.util.MAGIC_NUMBER`` + ``marshal`` edilmiş
+``(ENTRY_FORMAT, verdict, code)`` demeti. Farklı Python sürümünün
+girdileri anahtardaki sihirli sayı sayesinde birbirini ezmez; bozuk veya
+uyumsuz girdi yok sayılır.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+from core import logger
+
+# Girdi yapısı değişirse artırılır; eski girdiler okunmaz
+ENTRY_FORMAT = 1
+
+_SUFFIX = ".mahc"
+
+
+def source_hash(source: str) -> str:
+    """Katalogdaki ``ModuleMeta.content_hash`` ile aynı içerik özeti."""
+    return hashlib.sha256(source.encode("utf-8", errors="ignore")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """Önbellekten okunan girdi; alanlardan biri veya ikisi boş olabilir."""
+
+    code: CodeType | None = None
+    verdict: dict[str, Any] | None = None
+
+
+class BytecodeCache:
+    """Derlenmiş kod ve doğrulama sonucu için disk önbelleği.
+
+    Args:
+        cache_dir: Girdilerin yazılacağı dizin (ilk yazmada oluşturulur).
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(content_hash: str, filename: str, mode: str) -> str:
+        # Kod nesnesi co_filename taşır; aynı içerik farklı yolda ayrı girdidir
+        raw = "\0".join(
+            (
+                content_hash,
+                os.path.abspath(filename),
+                mode,
+                importlib.util.MAGIC_NUMBER.hex(),
+            )
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _entry_path(self, content_hash: str, filename: str, mode: str) -> Path:
+        key = self._key(content_hash, filename, mode)
+        return self.cache_dir / key[:2] / f"{key}{_SUFFIX}"
+
+    def load(
+        self, content_hash: str, filename: str, mode: str = "exec"
+    ) -> CacheEntry | None:
+        """Girdiyi okur; yoksa veya geçersizse None."""
+        entry = self._read_raw(self._entry_path(content_hash, filename, mode))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        content_hash: str,
+        filename: str,
+        mode: str = "exec",
+        code: CodeType | None = None,
+        verdict: dict[str, Any] | None = None,
+    ) -> bool:
+        """Girdiyi atomik olarak yazar (mevcut alanlar korunur). Başarıda True."""
+        path = self._entry_path(content_hash, filename, mode)
+        with self._lock:
+            if code is None or verdict is None:
+                current = self._read_raw(path)
+                if current is not None:
+                    code = code if code is not None else current.code
+                    verdict = verdict if verdict is not None else current.verdict
+            try:
+                payload = importlib.util.MAGIC_NUMBER + marshal.dumps(
+                    (ENTRY_FORMAT, verdict, code)
+                )
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(payload)
+                    os.replace(tmp_name, path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+            except (OSError, ValueError) as e:
+                logger.debug(f"Bytecode önbelleğe yazılamadı ({filename}): {e}")
+                return False
+        return True
+
+    def _read_raw(self, path: Path) -> CacheEntry | None:
+        magic = importlib.util.MAGIC_NUMBER
+        try:
+            data = path.read_bytes()
+            if data[: len(magic)] != magic:
+                return None
+            fmt, verdict, code = marshal.loads(data[len(magic) :])
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if fmt != ENTRY_FORMAT or not (code is None or isinstance(code, CodeType)):
+            logger.debug(f"Uyumsuz bytecode önbellek girdisi yok sayıldı: {path}")
+            return None
+        return CacheEntry(code=code, verdict=verdict)
+
+    def get_code(
+        self, source: str, filename: str, content_hash: str, mode: str = "exec"
+    ) -> CodeType:
+        """Önbellekteki kodu döndürür; yoksa derleyip yazar.
+
+        ``SyntaxError`` çağırana iletilir (hatalı kaynak önbelleğe alınmaz).
+        """
+        entry = self.load(content_hash, filename, mode)
+        if entry is not None and entry.code is not None:
+            return entry.code
+        code = compile(source, filename, "exec", dont_inherit=True)
+        self.store(content_hash, filename, mode, code=code)
+        return code
+
+    def clear(self) -> int:
+        """Tüm girdileri siler; silinen dosya sayısını döndürür."""
+        removed = 0
+        if not self.cache_dir.is_dir():
+            return removed
+        for path in self.cache_dir.glob(f"*/*{_SUFFIX}"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
@@ -1,4 +1,5 @@
 import ast
+import hashlib
 
 EXECUTION_PATTERNS: list[tuple[str, str, str]] = [
     ("eval", "execution", "eval() çağrısı tespit edildi"),
@@ -20,6 +21,40 @@ NATIVE_PATTERNS: list[tuple[str, str, str]] = [
 ]
 
 
+# strict modda shell=True ile çağrılması tehlikeli sayılan subprocess fonksiyonları
+STRICT_SHELL_CALLS = frozenset({"Popen", "run", "call", "check_call", "check_output"})
+
+# Tarama mantığı (desen listeleri dışında) değişince artırılır
+_SCANNER_REVISION = 1
+
+
+def _compile_rules(
+    *pattern_lists: list[tuple[str, str, str]],
+) -> dict[str, tuple[tuple[str, str, str], ...]]:
+    """Desen listelerini çağrı adının son parçasına göre tek bir sözlükte toplar.
+
+    ``os.system`` → ``"system"`` anahtarı. Çağrıların çoğu (``print``,
+    ``self.foo``...) tek bir sözlük aramasıyla elenir; tam ad yalnızca son
+    parça bir desenle eşleştiğinde çıkarılır. Liste sırası korunur.
+    """
+    rules: dict[str, list[tuple[str, str, str]]] = {}
+    for patterns in pattern_lists:
+        for rule in patterns:
+            rules.setdefault(rule[0].rsplit(".", 1)[-1], []).append(rule)
+    return {leaf: tuple(items) for leaf, items in rules.items()}
+
+
+_CALL_RULES = _compile_rules(EXECUTION_PATTERNS, SHELL_PATTERNS, NATIVE_PATTERNS)
+
+# Desenlerden türetilen kural sürümü; tarama/doğrulama sonucu önbellekleri bu
+# değerle anahtarlanır, desen eklenince eski sonuçlar kendiliğinden geçersizleşir.
+RULES_VERSION = hashlib.sha256(
+    repr(
+        (_SCANNER_REVISION, sorted(_CALL_RULES.items()), sorted(STRICT_SHELL_CALLS))
+    ).encode("utf-8")
+).hexdigest()[:16]
+
+
 class ScanResult:
     def __init__(self, file_path: str):
         self.file_path = file_path
@@ -53,27 +88,31 @@ def scan_source(source: str, file_path: str = "<memory>", strict: bool = False)
         if not isinstance(node, ast.Call):
             continue
 
-        func_name = _get_full_func_name(node.func)
-        if not func_name:
+        func = node.func
+        if isinstance(func, ast.Name):
+            leaf = func.id
+        elif isinstance(func, ast.Attribute):
+            leaf = func.attr
+        else:
             continue
 
-        for pattern, category, desc in EXECUTION_PATTERNS:
-            if func_name == pattern or func_name.endswith("." + pattern):
-                result.dangerous.append((pattern, category, desc, node.lineno))
+        rules = _CALL_RULES.get(leaf)
+        shell_check = (
+            strict and isinstance(func, ast.Attribute) and leaf in STRICT_SHELL_CALLS
+        )
+        if not rules and not shell_check:
+            continue
 
-        for pattern, category, desc in SHELL_PATTERNS:
-            if func_name == pattern or func_name.endswith("." + pattern):
-                result.dangerous.append((pattern, category, desc, node.lineno))
+        # Tam ad çözülemeyen çağrılar (ör. f().system()) eskisi gibi atlanır
+        func_name = _get_full_func_name(func)
+        if not func_name:
+            continue
 
-        for pattern, category, desc in NATIVE_PATTERNS:
+        for pattern, category, desc in rules or ():
             if func_name == pattern or func_name.endswith("." + pattern):
                 result.dangerous.append((pattern, category, desc, node.lineno))
 
-        if (
-            strict
-            and isinstance(node.func, ast.Attribute)
-            and node.func.attr in ("Popen", "run", "call", "check_call", "check_output")
-        ):
+        if shell_check:
             for kw in node.keywords:
                 if (
                     kw.arg == "shell"
@@ -82,9 +121,9 @@ def scan_source(source: str, file_path: str = "<memory>", strict: bool = False)
                 ):
                     result.dangerous.append(
                         (
-                            f"subprocess.{node.func.attr}(shell=True)",
+                            f"subprocess.{leaf}(shell=True)",
                             "subprocess",
-                            f"subprocess.{node.func.attr}() shell=True ile çağrılmış",
+                            f"subprocess.{leaf}() shell=True ile çağrılmış",
                             node.lineno,
                         )
                     )
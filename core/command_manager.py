@@ -14,10 +14,12 @@ from typing import Any
 from rich import print
 
 from core import logger
+from core.bytecode_cache import BytecodeCache, source_hash
 from core.command import Command  # Temel Komut sınıfı
+from core.completion_index import PrefixIndex
 
 # Sabitler: Alias dosya yolu ve komut kategorileri
-from core.cont import ALIASES_FILE
+from core.cont import ALIASES_FILE, BYTECODE_CACHE_DIR
 from core.hooks import HookType
 from core.plugin_manager import PluginManager as PluginManagerType
 from core.shared_state import shared_state
@@ -163,6 +165,8 @@ class CommandManager:
         commands_dir: str = "commands",
         plugin_manager: PluginManagerType | None = None,
         context: Any = None,
+        use_bytecode_cache: bool = True,
+        bytecode_cache_dir: str | Path | None = None,
     ) -> None:
         """
         CommandManager başlatıcı metod.
@@ -171,6 +175,8 @@ class CommandManager:
             commands_dir (str, optional): Komut dosyalarının bulunduğu dizin yolu. Varsayılan: "commands".
             plugin_manager (PluginManager | None, optional): DI ile enjekte edilen plugin yöneticisi.
             context (Any, optional): AppContext örneği (DI için).
+            use_bytecode_cache (bool, optional): Derlenmiş komut kodunu içerik özetiyle önbelleğe alır.
+            bytecode_cache_dir (str | Path | None, optional): Önbellek dizini. Varsayılan: BYTECODE_CACHE_DIR.
         """
         self.commands_dir = Path(commands_dir)  # Komutların aranacağı dizin
         self.commands: dict[
@@ -181,7 +187,14 @@ class CommandManager:
         ] = {}  # Yüklenen alias'ları tutan sözlük (Alias -> Hedef Komut)
         self._plugin_manager = plugin_manager
         self._context = context
-        self._completion_names_cache: list[str] | None = None
+        # Komut + alias adları için önek indeksi (ilk tamamlamada kurulur)
+        self._completion_index: PrefixIndex | None = None
+        # Derlenmiş komut kodu önbelleği (ModuleManager ile aynı dizin)
+        self.bytecode_cache: BytecodeCache | None = (
+            BytecodeCache(bytecode_cache_dir or BYTECODE_CACHE_DIR)
+            if use_bytecode_cache
+            else None
+        )
         # Alias dosyasının varlığından emin ol, yoksa oluştur.
         self._ensure_aliases_file()
 
@@ -194,15 +207,20 @@ class CommandManager:
         return shared_state.plugin_manager
 
     def _invalidate_completion_cache(self) -> None:
-        self._completion_names_cache = None
+        self._completion_index = None
+
+    def _get_completion_index(self) -> PrefixIndex:
+        if self._completion_index is None:
+            self._completion_index = PrefixIndex([*self.commands, *self.aliases])
+        return self._completion_index
 
     def get_completion_names(self) -> list[str]:
         """Komut + alias isimlerinin sıralı anlık görüntüsü."""
-        if self._completion_names_cache is None:
-            names = set(self.commands.keys())
-            names.update(self.aliases.keys())
-            self._completion_names_cache = sorted(names)
-        return self._completion_names_cache
+        return self._get_completion_index().items()
+
+    def complete_names(self, prefix: str) -> list[str]:
+        """``prefix`` ile başlayan komut + alias isimleri (bisect, O(log n + sonuç))."""
+        return self._get_completion_index().complete(prefix)
 
     def _ensure_aliases_file(self) -> None:
         """
@@ -229,6 +247,7 @@ class CommandManager:
                 self.aliases.clear()  # Mevcut hafızadaki aliasları temizle
                 for alias, target in loaded_aliases.items():
                     self.aliases[alias] = target
+            self._invalidate_completion_cache()
             # Başarılı yükleme sonrası loglanabilir veya sessiz geçilebilir.
             # print(f"{len(self.aliases)} alias yüklendi.")
         except FileNotFoundError:
@@ -278,7 +297,8 @@ class CommandManager:
             return False
 
         self.aliases[alias_name] = target_command
-        self._invalidate_completion_cache()
+        if self._completion_index is not None:
+            self._completion_index.add(alias_name)
         if persist:
             self.save_aliases()
         return True
@@ -287,7 +307,8 @@ class CommandManager:
         """Mevcut bir alias'ı siler ve dosyayı günceller."""
         if alias_name in self.aliases:
             del self.aliases[alias_name]
-            self._invalidate_completion_cache()
+            if self._completion_index is not None and alias_name not in self.commands:
+                self._completion_index.discard(alias_name)
             self.save_aliases()
             return True
         return False
@@ -353,7 +374,14 @@ class CommandManager:
                 return None
 
             command_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(command_module)
+            if self.bytecode_cache is not None:
+                source = file_path.read_text(encoding="utf-8")
+                code = self.bytecode_cache.get_code(
+                    source, str(file_path), source_hash(source)
+                )
+                exec(code, command_module.__dict__)
+            else:
+                spec.loader.exec_module(command_module)
 
             command_instance: Command | None = None
             for _name, obj in command_module.__dict__.items():
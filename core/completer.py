@@ -100,8 +100,12 @@ class CLICompleter(Completer):
         """
         Girilen kelime parçasına uygun komut ve alias önerilerini üretir.
         """
+        complete_names = getattr(self.command_manager, "complete_names", None)
         get_names = getattr(self.command_manager, "get_completion_names", None)
-        if callable(get_names):
+        if callable(complete_names):
+            # Önek indeksi: yalnızca eşleşen aralık döner
+            all_names = complete_names(current_word)
+        elif callable(get_names):
             all_names = get_names()
         else:
             all_names = sorted(
@@ -126,6 +130,9 @@ class CLICompleter(Completer):
 
     def _get_module_paths_completions(self, current_word: str) -> list[str]:
         """Modül yollarını tamamlamak için yardımcı metod."""
+        complete_paths = getattr(self.module_manager, "complete_module_paths", None)
+        if callable(complete_paths):
+            return complete_paths(current_word)
         get_paths = getattr(self.module_manager, "get_module_paths", None)
         if callable(get_paths):
             module_paths = get_paths()
@@ -0,0 +1,101 @@
+"""Sıralı dizi + ikili arama (bisect) tabanlı önek tamamlama indeksi.
+
+``CLICompleter`` (komut/alias adları) ve modül yolu tamamlaması bu indeksi
+kullanır. Bir önekle başlayan tüm öğeler sıralı dizide ardışık durduğundan
+aralık iki ``bisect`` ile bulunur: O(log n + sonuç). Ekleme/silme yerinde
+yapılır; yükleme/yeniden yüklemede tüm liste yeniden sıralanmaz.
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
+
+# Önek aralığının üst sınırı için kullanılan en büyük kod noktası
+_MAX_CHAR = "\U0010ffff"
+
+# suggest: eşleşme bu sayıyı aşarsa tam liste yerine hiyerarşik parçalar önerilir
+FLAT_COMPLETION_LIMIT = 100
+
+
+class PrefixIndex:
+    """Sıralı, tekil dizgi kümesi üzerinde önek tamamlama.
+
+    Args:
+        items: Başlangıç öğeleri.
+        presorted: ``items`` zaten sıralı ve tekil ise (ör. SQLite
+            ``ORDER BY`` çıktısı) yeniden sıralama yapılmaz.
+    """
+
+    def __init__(self, items: Iterable[str] = (), presorted: bool = False) -> None:
+        self._items: list[str] = list(items) if presorted else sorted(set(items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        index = bisect_left(self._items, item)
+        return index < len(self._items) and self._items[index] == item
+
+    def items(self) -> list[str]:
+        """Sıralı öğe listesi (kopyalanmaz; değiştirilmemelidir)."""
+        return self._items
+
+    def add(self, item: str) -> None:
+        if item not in self:
+            insort(self._items, item)
+
+    def discard(self, item: str) -> None:
+        index = bisect_left(self._items, item)
+        if index < len(self._items) and self._items[index] == item:
+            del self._items[index]
+
+    def _range(self, prefix: str) -> tuple[int, int]:
+        if not prefix:
+            return 0, len(self._items)
+        lo = bisect_left(self._items, prefix)
+        hi = bisect_left(self._items, prefix + _MAX_CHAR, lo)
+        return lo, hi
+
+    def complete(self, prefix: str, limit: int | None = None) -> list[str]:
+        """``prefix`` ile başlayan öğeler (sıralı)."""
+        lo, hi = self._range(prefix)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return self._items[lo:hi]
+
+    def count(self, prefix: str) -> int:
+        lo, hi = self._range(prefix)
+        return hi - lo
+
+    def complete_segments(self, prefix: str, sep: str = "/") -> list[str]:
+        """Hiyerarşik tamamlama: önekten sonraki ilk ``sep``'e kadar olan parçalar.
+
+        ``auxiliary/sc`` için ``auxiliary/scanner/`` (alt ağaç) ve
+        ``auxiliary/scan_x`` (yaprak) gibi tekil girdiler döner. Her alt ağaç
+        tek bir ``bisect`` ile atlandığından maliyet sonuç sayısıyla orantılıdır.
+        """
+        lo, hi = self._range(prefix)
+        results: list[str] = []
+        while lo < hi:
+            item = self._items[lo]
+            cut = item.find(sep, len(prefix))
+            if cut == -1:
+                results.append(item)
+                lo += 1
+                continue
+            group = item[: cut + len(sep)]
+            results.append(group)
+            lo = bisect_left(self._items, group + _MAX_CHAR, lo, hi)
+        return results
+
+    def suggest(
+        self, prefix: str, flat_limit: int = FLAT_COMPLETION_LIMIT, sep: str = "/"
+    ) -> list[str]:
+        """Az eşleşmede tüm öğeler, çok eşleşmede ``complete_segments`` sonucu."""
+        if self.count(prefix) <= flat_limit:
+            return self.complete(prefix)
+        return self.complete_segments(prefix, sep)
@@ -32,6 +32,7 @@ from core.completer import CLICompleter  # Özel tamamlama mantığı
 from core.cont import DEFAULT_TERMINAL_WIDTH
 from core.hooks import HookType
 from core.module_manager import ModuleManager
+from core.module_prewarm import ModulePrewarmer
 
 # Framework'ün diğer bileşenleri
 from core.shared_state import shared_state
@@ -86,8 +87,12 @@ class Console:
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         history_file = os.path.join(base_dir, ".mah_history")
         _trim_history_file(history_file, max_lines=2000)
+        self.history_file = history_file
         self.history = FileHistory(history_file)
 
+        # Arka plan modül ön yüklemesi (start_prewarm ile başlatılır)
+        self.prewarmer: ModulePrewarmer | None = None
+
         # Otomatik tamamlama nesnesini oluştur
         self.completer = CLICompleter(command_manager, module_manager)
 
@@ -139,6 +144,18 @@ class Console:
             ),
         )
 
+    def start_prewarm(self, audit_log: str | None = None, **kwargs: Any) -> None:
+        """Geçmişte sık kullanılan modülleri konsol boştayken arka planda yükler.
+
+        Args:
+            audit_log: Kullanım sıklığına eklenecek denetim logu.
+            **kwargs: ``ModulePrewarmer`` ayarları (memory_budget_mb, max_modules, idle_delay).
+        """
+        self.prewarmer = ModulePrewarmer.from_usage(
+            self.module_manager, self.history_file, audit_log, **kwargs
+        )
+        self.prewarmer.start()
+
     def _get_prompt_string(self) -> HTML:
         """
         Kullanıcıya gösterilecek komut istemi (prompt) metnini dinamik olarak oluşturur.
@@ -196,7 +213,12 @@ class Console:
             return
 
         # Komutun çalıştırılması için CommandManager'a devret.
-        self.command_manager.execute_command(processed_line)
+        # Komut sürerken arka plan ön yüklemesi bekler.
+        if self.prewarmer is not None:
+            with self.prewarmer.busy():
+                self.command_manager.execute_command(processed_line)
+        else:
+            self.command_manager.execute_command(processed_line)
 
     def start(self) -> None:
         """
@@ -255,6 +277,10 @@ class Console:
 
         self.running = False
 
+        # Arka plan ön yüklemesini durdur
+        if self.prewarmer is not None:
+            self.prewarmer.cancel()
+
         # Eklentilere kapanış sinyali gönder (ON_SHUTDOWN hook)
         if shared_state.plugin_manager:
             shared_state.plugin_manager.trigger_hook(HookType.ON_SHUTDOWN)
@@ -263,5 +289,9 @@ class Console:
         if shared_state.session_manager:
             shared_state.session_manager.shutdown_all()
 
+        # Asenkron hook kuyruğundaki olayları (ör. ON_SESSION_CLOSE) işle
+        if shared_state.plugin_manager:
+            shared_state.plugin_manager.shutdown_hooks()
+
         logger.info("Konsol kapatılıyor")
         print("Konsol kapatıldı.")
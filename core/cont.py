@@ -94,6 +94,46 @@ COMMAND_CATEGORIES = {
 # bu desen (herhangi bir karakter dizisi) kullanılır.
 DEFAULT_REGEX = r".*"
 
+# ==============================================================================
+# MODÜL ÖN YÜKLEME (PRE-WARM) SABİTLERİ
+# Açılıştan sonra sık kullanılan modüllerin arka planda import edilmesini ayarlar.
+# ==============================================================================
+
+# Ön yükleme için kullanılacak denetim (audit) logu; .mah_history ile birlikte okunur.
+AUDIT_LOG_FILE = "config/logs/audit.log"
+
+# Ön yüklemenin kullanabileceği toplam ek bellek (MB). Aşılınca yükleme durur.
+PREWARM_MEMORY_BUDGET_MB = 64
+
+# Tek oturumda ön yüklenecek en fazla modül sayısı.
+PREWARM_MAX_MODULES = 8
+
+# Son kullanıcı komutundan sonra ön yüklemeye başlamadan beklenecek boşta kalma süresi (saniye).
+PREWARM_IDLE_DELAY = 1.5
+
+# Kullanım sıklığı hesaplanırken her dosyanın sonundan okunacak en fazla bayt.
+PREWARM_TAIL_BYTES = 1024 * 1024
+
+# Modül ve komutların derlenmiş kodu ile doğrulama sonuçlarının saklandığı dizin.
+# İçerik özetiyle anahtarlanır; silinmesi güvenlidir, ilk yüklemede yeniden oluşur.
+BYTECODE_CACHE_DIR = "config/bytecode_cache"
+
+# İlk prompt'a kadar geçmesi hedeflenen süre (ms). 'main.py --startup-report'
+# aşamaları bu bütçeye göre raporlar; aşılırsa log'a uyarı düşülür.
+STARTUP_BUDGET_MS = 500
+
+# ==============================================================================
+# PLUGIN HOOK SABİTLERİ
+# Hook dağıtımı ve asenkron hook kuyruğu ayarları.
+# ==============================================================================
+
+# AsyncHooks kullanan plugin'ler için bekleyen olay kuyruğunun kapasitesi.
+# Kuyruk doluysa yeni olaylar düşürülür (tetikleyen taraf beklemez).
+HOOK_QUEUE_SIZE = 256
+
+# Bu süreyi (saniye) aşan hook çağrıları 'plugins stats' çıktısında yavaş sayılır.
+HOOK_SLOW_THRESHOLD = 0.1
+
 # ==============================================================================
 # UYGULAMA METADATA SABİTLERİ (Bilgi Amaçlı)
 # ==============================================================================
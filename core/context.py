@@ -67,6 +67,8 @@ class AppContext:
     def trigger_hook(self, hook_type: HookType, **kwargs: Any) -> None:
         """Hook tetikler."""
         handlers: list = self._hook_handlers.get(hook_type, [])
+        if not handlers:
+            return
         for _, handler in handlers:
             if callable(handler):
                 try:
@@ -0,0 +1,357 @@
+"""Eşzamanlı servis / banner parmak izi motoru.
+
+Her ``host:port`` çifti için önce porta özgü probe'lar (ör. HTTP portlarına
+GET), sonra hiçbir şey göndermeden sunucunun kendi banner'ı (NULL probe),
+ardından genel probe'lar sırayla denenir ve ilk eşleşen imzada durulur.
+TLS portlarında aynı sıra önce TLS üzerinden denenir.
+İmzalar ilk kullanımda bir kez derlenir ve probe adına göre gruplanır; bir
+yanıt yalnızca o probe ile anlamlı imzalara karşı denenir.
+
+Motor asyncio üzerinde sabit bir pencereyle çalışır: aynı anda en fazla
+``window`` hedef uçuştadır, hedefler tembel okunur ve her sonuç hazır olduğu
+anda ``on_result`` ile bildirilir.
+"""
+
+import asyncio
+import contextlib
+import re
+import ssl
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# Aynı anda uçuşta tutulacak varsayılan hedef sayısı
+DEFAULT_WINDOW = 200
+
+# Yanıttan okunacak en fazla bayt
+MAX_BANNER_BYTES = 4096
+
+# Probe'ların önce TLS üzerinden deneneceği portlar (HTTPS, SMTPS, IMAPS, POP3S...);
+# TLS el sıkışması kurulamazsa aynı probe'lar düz bağlantıyla denenir
+TLS_PORTS = frozenset({443, 465, 636, 853, 993, 995, 8443})
+
+
+@dataclass(frozen=True)
+class Probe:
+    """Hedefe gönderilecek istek; ``ports`` boşsa genel probe'dur."""
+
+    name: str
+    payload: bytes
+    ports: frozenset[int] = frozenset()
+
+
+# NULL ilk sırada durmalıdır (SignatureDB.probes_for buna güvenir)
+PROBES = (
+    Probe("NULL", b""),
+    Probe(
+        "GetRequest",
+        b"GET / HTTP/1.0\r\n\r\n",
+        frozenset({80, 81, 443, 591, 3000, 5000, 8000, 8008, 8080, 8081, 8443, 8888}),
+    ),
+    Probe("RedisPing", b"PING\r\n", frozenset({6379})),
+    Probe("GenericLines", b"\r\n\r\n"),
+)
+
+# (probe adları, servis, desen, ürün, sürüm grubu)
+# Ürün ``$1`` gibi grup referansı içerebilir; sürüm grubu yoksa None.
+SIGNATURES: tuple[tuple[tuple[str, ...], str, bytes, str, int | None], ...] = (
+    (("NULL",), "ssh", rb"^SSH-[\d.]+-OpenSSH_([\w.+-]+)", "OpenSSH", 1),
+    (("NULL",), "ssh", rb"^SSH-[\d.]+-dropbear_([\w.]+)", "Dropbear sshd", 1),
+    (("NULL",), "ssh", rb"^SSH-([\d.]+)-", "SSH", 1),
+    (("NULL",), "ftp", rb"^220[ -].*\(vsFTPd ([\w.]+)\)", "vsftpd", 1),
+    (("NULL",), "ftp", rb"^220[ -].*ProFTPD ([\w.]+)", "ProFTPD", 1),
+    (("NULL",), "ftp", rb"^220[ -].*Pure-FTPd", "Pure-FTPd", None),
+    (("NULL",), "ftp", rb"^220[ -][^\r\n]*FTP", "FTP", None),
+    (("NULL",), "smtp", rb"^220[ -][^\r\n]*ESMTP Postfix", "Postfix smtpd", None),
+    (("NULL",), "smtp", rb"^220[ -][^\r\n]*Exim ([\w.]+)", "Exim smtpd", 1),
+    (("NULL",), "smtp", rb"^220[ -][^\r\n]*E?SMTP", "SMTP", None),
+    (("NULL",), "pop3", rb"^\+OK[^\r\n]*Dovecot", "Dovecot pop3d", None),
+    (("NULL",), "pop3", rb"^\+OK", "POP3", None),
+    (("NULL",), "imap", rb"^\* OK[^\r\n]*Dovecot", "Dovecot imapd", None),
+    (("NULL",), "imap", rb"^\* OK[^\r\n]*IMAP", "IMAP", None),
+    # MariaDB 10.x+ sürümünün önüne MySQL istemcileri için "5.5.5-" ekler;
+    # MySQL imzasından önce denenmeli ve önek sürümden atılmalı
+    (
+        ("NULL",),
+        "mysql",
+        rb"^.\x00\x00\x00\x0a(?:5\.5\.5-)?([\w.-]+-MariaDB[\w.-]*)[^\x00]*\x00",
+        "MariaDB",
+        1,
+    ),
+    (("NULL",), "mysql", rb"^.\x00\x00\x00\x0a(5\.[\w.-]+|8\.[\w.-]+)\x00", "MySQL", 1),
+    (("NULL", "GenericLines"), "telnet", rb"^\xff[\xfb-\xfe]", "Telnet", None),
+    (("GetRequest",), "http", rb"(?im)^Server: nginx/?([\w.]*)", "nginx", 1),
+    (("GetRequest",), "http", rb"(?im)^Server: Apache/?([\w.]*)", "Apache httpd", 1),
+    (
+        ("GetRequest",),
+        "http",
+        rb"(?im)^Server: Microsoft-IIS/([\w.]+)",
+        "Microsoft IIS httpd",
+        1,
+    ),
+    (("GetRequest",), "http", rb"(?im)^Server: ([^\r\n/]+)/?([^\s\r\n]*)", "$1", 2),
+    (("GetRequest", "GenericLines"), "http", rb"^HTTP/1\.[01] \d{3}", "HTTP", None),
+    (("RedisPing", "GenericLines"), "redis", rb"^(\+PONG|-NOAUTH|-ERR)", "Redis", None),
+)
+
+
+@dataclass
+class ServiceResult:
+    """Tek ``host:port`` çiftinin parmak izi sonucu."""
+
+    host: str
+    port: int
+    service: str = "unknown"
+    product: str = ""
+    version: str = ""
+    banner: str = ""
+    probe: str = ""
+    tls: bool = False
+    error: str = ""
+
+    @property
+    def identified(self) -> bool:
+        return self.service != "unknown"
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Signature:
+    service: str
+    pattern: re.Pattern[bytes]
+    product: str
+    version_group: int | None
+
+
+@dataclass
+class SignatureDB:
+    """Probe adına göre gruplanmış, derlenmiş imzalar."""
+
+    probes: tuple[Probe, ...] = PROBES
+    by_probe: dict[str, list[_Signature]] = field(default_factory=dict)
+
+    @classmethod
+    def compile(
+        cls,
+        signatures: Iterable[
+            tuple[tuple[str, ...], str, bytes, str, int | None]
+        ] = SIGNATURES,
+        probes: Iterable[Probe] = PROBES,
+    ) -> "SignatureDB":
+        db = cls(probes=tuple(probes))
+        for probe_names, service, pattern, product, version_group in signatures:
+            compiled = _Signature(
+                service, re.compile(pattern, re.DOTALL), product, version_group
+            )
+            for name in probe_names:
+                db.by_probe.setdefault(name, []).append(compiled)
+        return db
+
+    def probes_for(self, port: int) -> list[Probe]:
+        """Porta özgü probe'lar, NULL, genel probe'lar, son olarak diğerleri.
+
+        Porta özgü probe'u olan (HTTP gibi istemcinin önce konuştuğu)
+        servislerde NULL probe'un okuma zaman aşımı beklenmez; standart
+        dışı portlardaki servisler için diğer portların probe'ları en sona
+        bırakılır.
+        """
+        specific = [p for p in self.probes[1:] if port in p.ports]
+        generic = [p for p in self.probes[1:] if not p.ports]
+        others = [p for p in self.probes[1:] if p.ports and port not in p.ports]
+        return [*specific, self.probes[0], *generic, *others]
+
+    def match(self, probe: str, data: bytes) -> tuple[str, str, str] | None:
+        """(servis, ürün, sürüm) veya None."""
+        for signature in self.by_probe.get(probe, ()):
+            found = signature.pattern.search(data)
+            if found is None:
+                continue
+            product = signature.product
+            if product.startswith("$"):
+                product = _decode(found.group(int(product[1:])))
+            version = ""
+            if signature.version_group is not None:
+                version = _decode(found.group(signature.version_group))
+            return signature.service, product, version
+        return None
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace").strip()
+
+
+def _printable_banner(data: bytes) -> str:
+    """Banner'ın ilk satırlarını tabloya uygun, yazdırılabilir metne çevirir."""
+    text = data.decode("utf-8", errors="replace")
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    return " | ".join(lines[:3])[:200]
+
+
+def _error_text(error: BaseException) -> str:
+    """Bağlantı hatasını platformdan bağımsız kısa metne çevirir."""
+    if isinstance(error, ConnectionRefusedError):
+        return "connection refused"
+    if isinstance(error, TimeoutError):
+        return "timed out"
+    return str(error) or type(error).__name__
+
+
+_DEFAULT_DB: SignatureDB | None = None
+
+
+def default_db() -> SignatureDB:
+    """Yerleşik imza veritabanı (ilk kullanımda bir kez derlenir)."""
+    global _DEFAULT_DB
+    if _DEFAULT_DB is None:
+        _DEFAULT_DB = SignatureDB.compile()
+    return _DEFAULT_DB
+
+
+class FingerprintEngine:
+    """``host:port`` çiftlerini sabit pencereyle eşzamanlı parmak izine alır.
+
+    ``timeout`` bağlantı kurma, ``read_timeout`` her probe'dan sonra yanıt
+    bekleme süresidir (saniye). NULL probe'da sunucu banner göndermezse
+    ``read_timeout`` kadar beklenip diğer probe'lara geçilir.
+    """
+
+    def __init__(
+        self,
+        db: SignatureDB | None = None,
+        window: int = DEFAULT_WINDOW,
+        timeout: float = 3.0,
+        read_timeout: float = 2.0,
+    ):
+        self.db = db or default_db()
+        self.window = max(1, int(window))
+        self.timeout = float(timeout)
+        self.read_timeout = float(read_timeout)
+        self._tls_context: ssl.SSLContext | None = None
+
+    def _tls(self) -> ssl.SSLContext:
+        if self._tls_context is None:
+            context = ssl.create_default_context()
+            # Parmak izi için sertifika doğrulanmaz
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            self._tls_context = context
+        return self._tls_context
+
+    async def _exchange(self, host: str, port: int, payload: bytes, tls: bool) -> bytes:
+        """Yeni bağlantıda payload'u gönderip yanıtı okur."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                host,
+                port,
+                ssl=self._tls() if tls else None,
+                server_hostname=host if tls else None,
+            ),
+            self.timeout,
+        )
+        try:
+            if payload:
+                writer.write(payload)
+                await writer.drain()
+            chunks: list[bytes] = []
+            size = 0
+            while size < MAX_BANNER_BYTES:
+                try:
+                    chunk = await asyncio.wait_for(
+                        reader.read(MAX_BANNER_BYTES - size),
+                        self.read_timeout if not chunks else self.read_timeout / 4,
+                    )
+                except TimeoutError:
+                    break
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+            return b"".join(chunks)
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError, ssl.SSLError):
+                await writer.wait_closed()
+
+    async def fingerprint(self, host: str, port: int) -> ServiceResult:
+        """Probe'ları sırayla dener; ilk imza eşleşmesinde durur.
+
+        TLS portlarında probe'lar (NULL dahil) önce TLS üzerinden denenir;
+        el sıkışma başarılıysa düz probe'lar atlanır, başarısızsa kalan TLS
+        denemeleri atlanıp düz probe'lara geçilir.
+        """
+        result = ServiceResult(host=host, port=int(port))
+        probes = self.db.probes_for(result.port)
+        attempts = [(probe, False) for probe in probes]
+        if result.port in TLS_PORTS:
+            attempts = [(probe, True) for probe in probes] + attempts
+
+        connected = tls_ok = tls_failed = False
+        for probe, tls in attempts:
+            if (tls and tls_failed) or (not tls and tls_ok):
+                continue
+            try:
+                data = await self._exchange(host, result.port, probe.payload, tls)
+            except (OSError, TimeoutError, EOFError) as e:
+                refused = isinstance(e, ConnectionRefusedError)
+                if not connected and (refused or not tls):
+                    # Bağlantı hiç kurulamadıysa diğer probe'lar da kurulamaz
+                    result.error = _error_text(e)
+                    return result
+                if tls and not tls_ok:
+                    tls_failed = True
+                continue
+            connected = True
+            tls_ok = tls_ok or tls
+            if not data:
+                continue
+            if not result.banner:
+                result.banner = _printable_banner(data)
+                result.probe = probe.name
+                result.tls = tls
+            matched = self.db.match(probe.name, data)
+            if matched:
+                result.service, result.product, result.version = matched
+                result.banner = _printable_banner(data)
+                result.probe = probe.name
+                result.tls = tls
+                return result
+        return result
+
+    async def _run_stream(
+        self,
+        targets: Iterable[tuple[str, int]],
+        on_result: Callable[[ServiceResult], None],
+    ) -> None:
+        targets = iter(targets)
+        pending: set[asyncio.Future] = set()
+
+        def fill() -> None:
+            while len(pending) < self.window:
+                target = next(targets, None)
+                if target is None:
+                    return
+                pending.add(asyncio.ensure_future(self.fingerprint(*target)))
+
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                on_result(task.result())
+            fill()
+
+    def run_stream(
+        self,
+        targets: Iterable[tuple[str, int]],
+        on_result: Callable[[ServiceResult], None],
+    ) -> None:
+        """Her hedef için sonuç hazır olduğunda on_result(ServiceResult) çağırır."""
+        asyncio.run(self._run_stream(targets, on_result))
+
+    def run_many(self, targets: Iterable[tuple[str, int]]) -> list[ServiceResult]:
+        """Tüm hedefleri tarayıp (host, port) sırasına dizilmiş sonuçları döner."""
+        results: list[ServiceResult] = []
+        self.run_stream(targets, results.append)
+        return sorted(results, key=lambda r: (r.host, r.port))
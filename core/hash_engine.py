@@ -0,0 +1,169 @@
+"""Çok çekirdekli, toplu sözlük (dictionary) hash kırma motoru.
+
+Her aday kelime hash tipi başına yalnızca bir kez hash'lenir ve ham
+``digest()`` baytları o tipteki tüm hedeflerin kümesinde aranır; böylece
+maliyet O(hash × kelime) yerine O(kelime) olur. Wordlist satır sınırına
+hizalı bayt aralıklarına bölünür ve ``ProcessPoolExecutor`` worker'ları her
+aralığı mmap üzerinden kendileri okur; kelimeler süreçler arasında taşınmaz.
+
+Worker fonksiyonları pickle ile alt süreçlere taşınabilmeleri için modül
+dosyalarında değil burada (import edilebilir bir core modülünde) durur.
+"""
+
+import functools
+import hashlib
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+from core.wordlist import Wordlist, iter_lines
+
+# Alt süreç başına hedef kümeleri (initializer ile bir kez aktarılır)
+_WORKER_TARGETS: dict[str, frozenset[bytes]] = {}
+
+# Bir worker'a tek seferde verilecek wordlist aralığı (bayt)
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+
+def parse_digest(hash_value: str) -> bytes | None:
+    """Hex hash metnini ham digest baytlarına çevirir; geçersizse None."""
+    try:
+        return bytes.fromhex(hash_value.strip())
+    except ValueError:
+        return None
+
+
+def crack_chunk(
+    words: Iterable[bytes], targets: dict[str, frozenset[bytes]]
+) -> dict[tuple[str, bytes], bytes]:
+    """Bir kelime parçasını tüm hedef tiplere karşı dener.
+
+    Returns:
+        {(hash_tipi, digest): kelime} eşleşmeleri.
+    """
+    found: dict[tuple[str, bytes], bytes] = {}
+    # hashlib.md5 gibi doğrudan kurucular hashlib.new'den hızlıdır
+    checks = [
+        (ht, getattr(hashlib, ht, None) or functools.partial(hashlib.new, ht), digests)
+        for ht, digests in targets.items()
+        if digests
+    ]
+    for word in words:
+        for ht, constructor, digests in checks:
+            digest = constructor(word).digest()
+            if digest in digests:
+                found[(ht, digest)] = word
+    return found
+
+
+def _init_worker(targets: dict[str, frozenset[bytes]]) -> None:
+    global _WORKER_TARGETS
+    _WORKER_TARGETS = targets
+
+
+def crack_range(
+    path: str, start: int, end: int, targets: dict[str, frozenset[bytes]]
+) -> tuple[dict[tuple[str, bytes], bytes], int]:
+    """Wordlist'in bir bayt aralığını dener; (eşleşmeler, denenen_kelime) döner."""
+    count = 0
+
+    def counted() -> Iterator[bytes]:
+        nonlocal count
+        for word in iter_lines(path, start, end):
+            count += 1
+            yield word
+
+    found = crack_chunk(counted(), targets)
+    return found, count
+
+
+def _crack_range_in_worker(
+    path: str, start: int, end: int
+) -> tuple[dict[tuple[str, bytes], bytes], int]:
+    return crack_range(path, start, end, _WORKER_TARGETS)
+
+
+def crack_batch(
+    targets: dict[str, Iterable[bytes]],
+    wordlist: Wordlist,
+    workers: int = 0,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> dict[tuple[str, bytes], bytes]:
+    """Hedef digest'leri wordlist'e karşı kırar.
+
+    Args:
+        targets: {hash_tipi: digest baytları}.
+        wordlist: Okunacak ``Wordlist``.
+        workers: Süreç sayısı; 0 ise çekirdek sayısı, 1 ise aynı süreçte çalışır.
+        chunk_bytes: Bir worker'a tek seferde verilecek aralık boyutu.
+        on_progress: Her aralık bittiğinde (kelime_sayısı, bayt) ile çağrılır.
+
+    Tüm hedefler kırıldığında kalan aralıklar okunmadan durulur.
+    """
+    remaining = {ht: frozenset(d) for ht, d in targets.items() if d}
+    total = sum(len(d) for d in remaining.values())
+    if not total:
+        return {}
+
+    workers = workers or os.cpu_count() or 1
+    ranges = wordlist.split(chunk_bytes)
+    try:
+        return _run_ranges(
+            wordlist.path, ranges, remaining, total, workers, on_progress
+        )
+    finally:
+        # Erken çıkışta split() içindeki mmap'i hemen kapat
+        ranges.close()
+
+
+def _run_ranges(
+    path: str,
+    ranges: Iterator[tuple[int, int]],
+    remaining: dict[str, frozenset[bytes]],
+    total: int,
+    workers: int,
+    on_progress: Callable[[int, int], None] | None,
+) -> dict[tuple[str, bytes], bytes]:
+    found: dict[tuple[str, bytes], bytes] = {}
+    if workers <= 1:
+        for start, end in ranges:
+            matches, count = crack_range(path, start, end, remaining)
+            found.update(matches)
+            if on_progress:
+                on_progress(count, end - start)
+            if len(found) >= total:
+                break
+        return found
+
+    pending: dict[Future, int] = {}
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(remaining,)
+    ) as pool:
+        try:
+            exhausted = False
+            while True:
+                # Kuyrukta en fazla workers*2 aralık tutulur
+                while not exhausted and len(pending) < workers * 2:
+                    item = next(ranges, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    start, end = item
+                    future = pool.submit(_crack_range_in_worker, path, start, end)
+                    pending[future] = end - start
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    nbytes = pending.pop(future)
+                    matches, count = future.result()
+                    found.update(matches)
+                    if on_progress:
+                        on_progress(count, nbytes)
+                if len(found) >= total:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+    return found
@@ -0,0 +1,199 @@
+"""Plugin hook dağıtım katmanı.
+
+``PluginManager.trigger_hook`` her komut, modül çalıştırma ve oturum
+olayında çağrılır. ``HookDispatcher``:
+
+- Abonesi olan hook türleri için değişmez (tuple) bir yönlendirme tablosu
+  tutar; abonesi olmayan tür tek bir sözlük aramasıyla döner, kayıt
+  değişikliği sırasında tetiklenen hook'lar yarım liste görmez.
+- ``BasePlugin.AsyncHooks`` ile seçilen handler'ları sınırlı bir kuyruğa
+  atar; tek worker thread'i sırayla çalıştırır (plugin içi olay sırası
+  korunur). Kuyruk doluysa olay düşürülür ve sayılır, tetikleyen taraf
+  (prompt, listener accept döngüsü) hiçbir zaman beklemez.
+- Her (hook, plugin) için çağrı sayısı, hata, toplam/en uzun süre ve
+  ``HOOK_SLOW_THRESHOLD`` üzerindeki çağrı sayısını tutar.
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from core import logger
+from core.cont import HOOK_QUEUE_SIZE, HOOK_SLOW_THRESHOLD
+from core.hooks import HookType
+
+
+@dataclass
+class HookStats:
+    """Tek bir (hook, plugin) çifti için çalışma istatistikleri."""
+
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    slow: int = 0
+    dropped: int = 0
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class HookRoute:
+    """Yönlendirme tablosundaki bir handler kaydı."""
+
+    handler: Callable[..., Any]
+    owner: str
+    is_async: bool = False
+
+
+_STOP = object()
+
+
+class HookDispatcher:
+    """Hook handler'larını senkron veya kuyruk üzerinden çalıştırır.
+
+    Args:
+        queue_size: Asenkron kuyruğun kapasitesi.
+        slow_threshold: Bu süreyi (saniye) aşan çağrılar yavaş sayılır.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = HOOK_QUEUE_SIZE,
+        slow_threshold: float = HOOK_SLOW_THRESHOLD,
+    ) -> None:
+        self.slow_threshold = slow_threshold
+        self._routes: dict[HookType, tuple[HookRoute, ...]] = {}
+        self._stats: dict[tuple[str, str], HookStats] = {}
+        self._stats_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    # ── Yönlendirme ──────────────────────────────────────────────────────
+
+    def set_routes(self, routes: dict[HookType, list[HookRoute]]) -> None:
+        """Tabloyu tek atamada değiştirir; boş hook türleri tabloya girmez."""
+        self._routes = {
+            hook_type: tuple(entries)
+            for hook_type, entries in routes.items()
+            if entries
+        }
+
+    def has_subscribers(self, hook_type: HookType) -> bool:
+        return hook_type in self._routes
+
+    def dispatch(self, hook_type: HookType, kwargs: dict[str, Any]) -> None:
+        routes = self._routes.get(hook_type)
+        if not routes:
+            return
+        for route in routes:
+            if route.is_async:
+                self._enqueue(hook_type, route, kwargs)
+            else:
+                self._invoke(hook_type, route, kwargs)
+
+    def _invoke(
+        self, hook_type: HookType, route: HookRoute, kwargs: dict[str, Any]
+    ) -> None:
+        failed = False
+        start = time.perf_counter()
+        try:
+            route.handler(**kwargs)
+        except Exception:
+            # Bir eklentinin çökmesi, framework'ü veya diğer eklentileri durdurmamalı.
+            failed = True
+            logger.exception(f"Plugin hook hatası ({hook_type.value}, {route.owner})")
+        elapsed = time.perf_counter() - start
+
+        with self._stats_lock:
+            stats = self._stats.setdefault((hook_type.value, route.owner), HookStats())
+            stats.calls += 1
+            stats.errors += failed
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            if elapsed >= self.slow_threshold:
+                stats.slow += 1
+        if elapsed >= self.slow_threshold:
+            logger.debug(
+                f"Yavaş plugin hook'u: {route.owner} ({hook_type.value}) {elapsed * 1000:.0f} ms"
+            )
+
+    # ── Asenkron kuyruk ──────────────────────────────────────────────────
+
+    def _enqueue(
+        self, hook_type: HookType, route: HookRoute, kwargs: dict[str, Any]
+    ) -> None:
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((hook_type, route, kwargs))
+            return
+        except queue.Full:
+            pass
+        with self._stats_lock:
+            stats = self._stats.setdefault((hook_type.value, route.owner), HookStats())
+            stats.dropped += 1
+            first_drop = stats.dropped == 1
+        if first_drop:
+            logger.warning(
+                f"Plugin hook kuyruğu dolu; '{route.owner}' için {hook_type.value} olayları düşürülüyor"
+            )
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="plugin-hooks", daemon=True
+                )
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._invoke(*item)
+            finally:
+                self._queue.task_done()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Kuyruktaki olaylar işlenene kadar bekler; süre dolarsa False."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if self._worker is None or not self._worker.is_alive():
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def shutdown(self, timeout: float | None = 2.0) -> None:
+        """Bekleyen olayları işler ve worker'ı durdurur."""
+        worker = self._worker
+        if worker is None or not worker.is_alive():
+            return
+        self.drain(timeout)
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        worker.join(timeout)
+
+    # ── İstatistik ───────────────────────────────────────────────────────
+
+    def stats(self) -> dict[tuple[str, str], HookStats]:
+        """{(hook, plugin): istatistik} anlık kopyası."""
+        with self._stats_lock:
+            return {key: replace(value) for key, value in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
@@ -0,0 +1,281 @@
+"""Piksel çözmeden, segment düzeyinde görüntü metadata temizleme.
+
+JPEG, PNG ve WebP dosyaları bayt akışı olarak okunur; metadata taşıyan
+segment/chunk'lar atlanır, geri kalan her şey (sıkıştırılmış görüntü verisi
+dahil) olduğu gibi kopyalanır. Görüntü yeniden kodlanmadığı için temizlik
+kayıpsızdır, bellek kullanımı sabittir ve hız disk hızıyla sınırlıdır.
+
+Kaldırılanlar:
+
+- JPEG: APP1 (EXIF, XMP), APP13 (Photoshop/IPTC), COM ve APP0 JFIF / APP2
+  ICC profili / APP14 Adobe dışındaki tüm APPn segmentleri; EOI sonrası
+  ekler (MPF ikincil görüntüleri, üretici trailer'ları).
+- PNG: tEXt, zTXt, iTXt, eXIf ve tIME chunk'ları.
+- WebP: EXIF ve "XMP " chunk'ları (VP8X bayrakları da güncellenir).
+
+Worker süreçlerinden çağrılabilmesi için yalnızca standart kütüphaneye
+dayanır; Pillow gerektirmez.
+"""
+
+import os
+import struct
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+# Akış kopyalamada tek seferde okunacak bayt
+COPY_CHUNK_BYTES = 1024 * 1024
+
+JPEG_SOI = b"\xff\xd8"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Görüntünün doğru çözülmesi için korunan APPn segmentleri (marker, önek)
+_JPEG_KEEP_APP = (
+    (0xE0, b"JFIF\x00"),
+    (0xE2, b"ICC_PROFILE\x00"),
+    (0xEE, b"Adobe"),
+)
+_JPEG_APP_NAMES = {0xE1: "APP1", 0xED: "APP13/IPTC", 0xFE: "COM"}
+
+# Uzunluk alanı olmayan JPEG marker'ları (TEM, RSTn)
+_JPEG_STANDALONE = {0x01, *range(0xD0, 0xD8)}
+
+PNG_METADATA_CHUNKS = frozenset({b"tEXt", b"zTXt", b"iTXt", b"eXIf", b"tIME"})
+WEBP_METADATA_CHUNKS = frozenset({b"EXIF", b"XMP "})
+
+# VP8X bayrak baytındaki EXIF ve XMP bitleri
+_VP8X_EXIF_FLAG = 0x08
+_VP8X_XMP_FLAG = 0x04
+
+
+class MetadataFormatError(ValueError):
+    """Dosya beklenen görüntü yapısına uymuyor (bozuk veya kesik)."""
+
+
+@dataclass
+class StripResult:
+    """Segment düzeyinde temizliğin özeti."""
+
+    format: str
+    removed: list[str] = field(default_factory=list)
+    bytes_removed: int = 0
+
+    def add(self, name: str, size: int) -> None:
+        self.removed.append(name)
+        self.bytes_removed += size
+
+
+def detect_format(path: str) -> str | None:
+    """Dosya imzasından 'JPEG', 'PNG' veya 'WEBP'; segment yolu desteklenmiyorsa None."""
+    with open(path, "rb") as f:
+        head = f.read(12)
+    if head.startswith(JPEG_SOI):
+        return "JPEG"
+    if head.startswith(PNG_SIGNATURE):
+        return "PNG"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
+
+def _read_exact(src: BinaryIO, size: int) -> bytes:
+    data = src.read(size)
+    if len(data) != size:
+        raise MetadataFormatError("Dosya beklenenden önce bitti")
+    return data
+
+
+def _copy_bytes(src: BinaryIO, dst: BinaryIO, size: int) -> None:
+    """``src``'den ``dst``'ye tam ``size`` bayt kopyalar."""
+    while size > 0:
+        chunk = src.read(min(size, COPY_CHUNK_BYTES))
+        if not chunk:
+            raise MetadataFormatError("Dosya beklenenden önce bitti")
+        dst.write(chunk)
+        size -= len(chunk)
+
+
+def _skip_bytes(src: BinaryIO, size: int) -> None:
+    src.seek(size, os.SEEK_CUR)
+
+
+def _keep_jpeg_app(marker: int, payload_head: bytes) -> bool:
+    return any(
+        marker == keep and payload_head.startswith(prefix)
+        for keep, prefix in _JPEG_KEEP_APP
+    )
+
+
+def _copy_entropy_until_eoi(src: BinaryIO, dst: BinaryIO) -> int:
+    """SOS sonrası veriyi EOI dahil kopyalar; EOI sonrası atlanan bayt sayısını döner.
+
+    Sıkıştırılmış veride 0xFF baytları doldurulduğu (0xFF00) için ilk
+    0xFFD9 görüntünün sonudur.
+    """
+    carry = b""
+    while True:
+        chunk = src.read(COPY_CHUNK_BYTES)
+        if not chunk:
+            # EOI'siz kesik dosya: okunanı olduğu gibi bırak
+            dst.write(carry)
+            return 0
+        data = carry + chunk
+        end = data.find(b"\xff\xd9")
+        if end != -1:
+            dst.write(data[: end + 2])
+            trailing = len(data) - end - 2
+            position = src.tell()
+            src.seek(0, os.SEEK_END)
+            return trailing + src.tell() - position
+        # Marker iki parçaya bölünmüş olabilir; son bayt sonraki tura taşınır
+        dst.write(data[:-1])
+        carry = data[-1:]
+
+
+def strip_jpeg(src: BinaryIO, dst: BinaryIO) -> StripResult:
+    result = StripResult("JPEG")
+    if _read_exact(src, 2) != JPEG_SOI:
+        raise MetadataFormatError("JPEG SOI bulunamadı")
+    dst.write(JPEG_SOI)
+
+    while True:
+        byte = _read_exact(src, 1)
+        if byte != b"\xff":
+            raise MetadataFormatError("JPEG marker beklenirken veri bulundu")
+        marker = _read_exact(src, 1)[0]
+        while marker == 0xFF:  # Dolgu baytları
+            marker = _read_exact(src, 1)[0]
+        if marker in _JPEG_STANDALONE:
+            dst.write(bytes((0xFF, marker)))
+            continue
+        if marker == 0xD9:  # Görüntü verisi olmadan EOI
+            dst.write(b"\xff\xd9")
+            return result
+
+        length_bytes = _read_exact(src, 2)
+        length = struct.unpack(">H", length_bytes)[0]
+        if length < 2:
+            raise MetadataFormatError("Geçersiz JPEG segment uzunluğu")
+        payload_size = length - 2
+
+        is_app = 0xE0 <= marker <= 0xEF
+        if is_app or marker == 0xFE:
+            head = _read_exact(src, min(payload_size, 32))
+            if is_app and _keep_jpeg_app(marker, head):
+                dst.write(bytes((0xFF, marker)) + length_bytes + head)
+                _copy_bytes(src, dst, payload_size - len(head))
+            else:
+                _skip_bytes(src, payload_size - len(head))
+                name = _JPEG_APP_NAMES.get(marker, f"APP{marker - 0xE0}")
+                if marker == 0xE1 and head.startswith(b"http://ns.adobe.com/xap"):
+                    name = "XMP"
+                elif marker == 0xE1 and head.startswith(b"Exif\x00"):
+                    name = "EXIF"
+                result.add(name, length + 2)
+            continue
+
+        dst.write(bytes((0xFF, marker)) + length_bytes)
+        _copy_bytes(src, dst, payload_size)
+        if marker == 0xDA:  # SOS: ardından sıkıştırılmış veri gelir
+            trailing = _copy_entropy_until_eoi(src, dst)
+            if trailing:
+                result.add("trailer", trailing)
+            return result
+
+
+def strip_png(src: BinaryIO, dst: BinaryIO) -> StripResult:
+    result = StripResult("PNG")
+    if _read_exact(src, 8) != PNG_SIGNATURE:
+        raise MetadataFormatError("PNG imzası bulunamadı")
+    dst.write(PNG_SIGNATURE)
+
+    while True:
+        header = src.read(8)
+        if not header:
+            return result
+        if len(header) != 8:
+            raise MetadataFormatError("Kesik PNG chunk başlığı")
+        length, chunk_type = struct.unpack(">I4s", header)
+        if chunk_type in PNG_METADATA_CHUNKS:
+            _skip_bytes(src, length + 4)  # veri + CRC
+            result.add(chunk_type.decode("ascii"), length + 12)
+            continue
+        dst.write(header)
+        _copy_bytes(src, dst, length + 4)
+        if chunk_type == b"IEND":
+            return result
+
+
+def strip_webp(src: BinaryIO, dst: BinaryIO) -> StripResult:
+    result = StripResult("WEBP")
+    header = _read_exact(src, 12)
+    if header[:4] != b"RIFF" or header[8:12] != b"WEBP":
+        raise MetadataFormatError("WebP RIFF başlığı bulunamadı")
+    dst.write(header)
+
+    vp8x_flags_offset = None
+    while True:
+        chunk_header = src.read(8)
+        if not chunk_header:
+            break
+        if len(chunk_header) != 8:
+            raise MetadataFormatError("Kesik WebP chunk başlığı")
+        fourcc, size = struct.unpack("<4sI", chunk_header)
+        padded = size + (size & 1)
+        if fourcc in WEBP_METADATA_CHUNKS:
+            _skip_bytes(src, padded)
+            result.add(fourcc.decode("ascii").strip(), padded + 8)
+            continue
+        if fourcc == b"VP8X":
+            vp8x_flags_offset = dst.tell() + 8
+        dst.write(chunk_header)
+        _copy_bytes(src, dst, padded)
+
+    end = dst.tell()
+    if result.removed and vp8x_flags_offset is not None:
+        dst.seek(vp8x_flags_offset)
+        flags = dst.read(1)[0]
+        dst.seek(vp8x_flags_offset)
+        dst.write(bytes((flags & ~(_VP8X_EXIF_FLAG | _VP8X_XMP_FLAG),)))
+    # RIFF boyutu: "WEBP" dahil, "RIFF" ve boyut alanı hariç
+    dst.seek(4)
+    dst.write(struct.pack("<I", end - 8))
+    dst.seek(end)
+    return result
+
+
+_STRIPPERS: dict[str, Callable[[BinaryIO, BinaryIO], StripResult]] = {
+    "JPEG": strip_jpeg,
+    "PNG": strip_png,
+    "WEBP": strip_webp,
+}
+
+
+def strip_metadata(src_path: str, dst_path: str) -> StripResult | None:
+    """``src_path``'i metadata'sız olarak ``dst_path``'e yazar.
+
+    Çıktı önce aynı dizinde geçici dosyaya yazılıp yerine taşınır; bu
+    sayede ``src_path == dst_path`` (yerinde temizlik) güvenlidir ve hata
+    durumunda hedef yarım kalmaz. Format segment yolunca desteklenmiyorsa
+    hiçbir şey yazılmaz ve None döner.
+    """
+    image_format = detect_format(src_path)
+    if image_format is None:
+        return None
+
+    directory = os.path.dirname(os.path.abspath(dst_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".strip-", suffix=".tmp")
+    try:
+        with open(src_path, "rb") as src, os.fdopen(fd, "w+b") as dst:
+            result = _STRIPPERS[image_format](src, dst)
+        if os.path.exists(dst_path):
+            os.chmod(temp_path, os.stat(dst_path).st_mode & 0o7777)
+        elif os.path.exists(src_path):
+            os.chmod(temp_path, os.stat(src_path).st_mode & 0o7777)
+        os.replace(temp_path, dst_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return result
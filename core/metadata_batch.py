@@ -0,0 +1,485 @@
+"""Görüntü metadata modülleri için toplu (dizin / glob) işleme motoru.
+
+Dosya ağacı tembel gezilir; yollar ``batch_size``'lık gruplar halinde
+``ProcessPoolExecutor`` worker'larına dağıtılır ve kuyrukta en fazla
+``workers * 2`` grup tutulur, böylece on binlerce dosyalık bir ağaçta da
+bellek sabit kalır. Metadata çıkarımı yalnızca dosyanın başındaki
+``HEADER_BYTES`` baytı okur (EXIF/XMP dosyanın başındadır); görüntü verisi
+çözülmez.
+
+Sonuçlar JSONL veya CSV olarak geldikçe yazılır ve her ``checkpoint_every``
+kayıtta diske aktarılır. Yarıda kalan bir çalıştırma aynı çıktı dosyasıyla
+yeniden başlatıldığında, dosyada kaydı bulunan yollar atlanır.
+
+Worker fonksiyonları pickle ile alt süreçlere taşınabilmeleri için modül
+dosyalarında değil burada durur (bkz. ``core.hash_engine``).
+"""
+
+import csv
+import glob
+import hashlib
+import io
+import json
+import os
+import shutil
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+from core.image_metadata import PNG_SIGNATURE, MetadataFormatError, strip_metadata
+
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+
+# Uzantı -> Pillow kayıt formatı (yeniden kodlamada hedef format)
+SAVE_FORMATS = {
+    ".jpg": "JPEG",
+    ".jpeg": "JPEG",
+    ".png": "PNG",
+    ".tiff": "TIFF",
+    ".tif": "TIFF",
+    ".bmp": "BMP",
+    ".gif": "GIF",
+    ".webp": "WEBP",
+}
+
+IMAGE_EXTENSIONS = frozenset(SAVE_FORMATS)
+
+# Çıkarım için dosya başından okunacak bayt (JPEG APP segmentleri dahil)
+HEADER_BYTES = 256 * 1024
+
+# Bir worker'a tek seferde verilecek dosya sayısı
+DEFAULT_BATCH_SIZE = 32
+
+# Kaç kayıtta bir çıktı diske aktarılır
+CHECKPOINT_EVERY = 200
+
+EXTRACT_FIELDS = (
+    "path",
+    "size",
+    "format",
+    "width",
+    "height",
+    "mode",
+    "make",
+    "model",
+    "datetime",
+    "software",
+    "gps_lat",
+    "gps_lon",
+    "error",
+)
+
+CLEAN_FIELDS = ("path", "output", "method", "removed", "bytes_removed", "error")
+
+# EXIF tag numaraları
+_TAG_MAKE, _TAG_MODEL, _TAG_SOFTWARE, _TAG_DATETIME = 0x010F, 0x0110, 0x0131, 0x0132
+_TAG_DATETIME_ORIGINAL, _IFD_EXIF, _IFD_GPS = 0x9003, 0x8769, 0x8825
+_GPS_LAT_REF, _GPS_LAT, _GPS_LON_REF, _GPS_LON = 1, 2, 3, 4
+
+
+def is_pattern(value: str) -> bool:
+    """Değer glob deseni mi (``*``, ``?`` veya ``[``)?"""
+    return glob.has_magic(value)
+
+
+def pattern_root(target: str) -> str:
+    """Glob deseninin sabit (joker içermeyen) baş dizini; dizin ise kendisi."""
+    if not is_pattern(target):
+        return target if os.path.isdir(target) else os.path.dirname(target)
+    parts = []
+    for part in target.split(os.sep):
+        if is_pattern(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or "."
+
+
+def iter_image_files(
+    target: str, recursive: bool = True, extensions: Iterable[str] = IMAGE_EXTENSIONS
+) -> Iterator[str]:
+    """Dizin veya glob deseninden desteklenen görüntü yollarını tembel üretir.
+
+    Dizinler ``os.scandir`` ile derinlik öncelikli ve ad sırasıyla gezilir;
+    sıra kararlı olduğundan checkpoint'ten devam eden çalıştırma aynı
+    sırayı izler.
+    """
+    extensions = frozenset(ext.lower() for ext in extensions)
+    if is_pattern(target):
+        for path in glob.iglob(target, recursive=True):
+            if os.path.splitext(path)[1].lower() in extensions and os.path.isfile(path):
+                yield path
+        return
+
+    stack = [target]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif (
+                    entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in extensions
+                ):
+                    yield entry.path
+            except OSError:
+                continue
+        if recursive:
+            stack.extend(reversed(subdirs))
+
+
+def _ratio(value: Any) -> float:
+    if isinstance(value, tuple) and len(value) == 2:
+        return value[0] / value[1] if value[1] else 0.0
+    return float(value)
+
+
+def _gps_degrees(coords: Any, ref: Any) -> float | None:
+    try:
+        degrees = _ratio(coords[0]) + _ratio(coords[1]) / 60 + _ratio(coords[2]) / 3600
+    except (TypeError, ValueError, IndexError, ZeroDivisionError):
+        return None
+    if isinstance(ref, bytes):
+        ref = ref.decode("ascii", errors="ignore")
+    return -degrees if str(ref).strip().upper() in ("S", "W") else degrees
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    return str(value).strip("\x00 ").strip() if value is not None else ""
+
+
+def _open_header(path: str) -> "PILImage.Image":
+    """Görüntüyü yalnızca başlık baytlarından açar; yetmezse dosyadan açar."""
+    from PIL import Image
+
+    with open(path, "rb") as f:
+        head = f.read(HEADER_BYTES)
+    try:
+        return Image.open(io.BytesIO(head))
+    except Exception:
+        if len(head) < HEADER_BYTES:
+            raise
+        # Başlık tampondan büyük: Pillow da yalnızca başlığı okur
+        return Image.open(path)
+
+
+def _png_exif_chunk(path: str) -> bytes | None:
+    """PNG'deki eXIf chunk'ını görüntü verisini (IDAT) okumadan atlayarak bulur."""
+    with open(path, "rb") as f:
+        if f.read(8) != PNG_SIGNATURE:
+            return None
+        while True:
+            header = f.read(8)
+            if len(header) != 8:
+                return None
+            length, chunk_type = struct.unpack(">I4s", header)
+            if chunk_type == b"eXIf":
+                return f.read(length)
+            if chunk_type == b"IEND":
+                return None
+            f.seek(length + 4, os.SEEK_CUR)  # veri + CRC
+
+
+def _read_exif(img: "PILImage.Image", path: str) -> "PILImage.Exif":
+    if img.format != "PNG":
+        return img.getexif()
+    # Pillow, IDAT'tan önce eXIf görmediyse getexif() için tüm pikselleri
+    # çözer; tampon kesik olduğundan bu başarısız olur. Chunk dosyadan okunur.
+    from PIL import Image
+
+    exif = Image.Exif()
+    data = img.info.get("exif") or _png_exif_chunk(path)
+    if data:
+        exif.load(data)
+    return exif
+
+
+def _fill_record(record: dict[str, Any], img: "PILImage.Image", path: str) -> None:
+    record["format"] = img.format or ""
+    record["width"], record["height"] = img.size
+    record["mode"] = img.mode
+    exif = _read_exif(img, path)
+    record["make"] = _text(exif.get(_TAG_MAKE))
+    record["model"] = _text(exif.get(_TAG_MODEL))
+    record["software"] = _text(exif.get(_TAG_SOFTWARE))
+    original = exif.get_ifd(_IFD_EXIF).get(_TAG_DATETIME_ORIGINAL)
+    record["datetime"] = _text(original or exif.get(_TAG_DATETIME))
+    gps = exif.get_ifd(_IFD_GPS)
+    if _GPS_LAT in gps and _GPS_LON in gps:
+        lat = _gps_degrees(gps[_GPS_LAT], gps.get(_GPS_LAT_REF, "N"))
+        lon = _gps_degrees(gps[_GPS_LON], gps.get(_GPS_LON_REF, "E"))
+        if lat is not None and lon is not None:
+            record["gps_lat"], record["gps_lon"] = round(lat, 7), round(lon, 7)
+
+
+def extract_file(path: str) -> dict[str, Any]:
+    """Tek dosyanın özet metadata kaydı; hata kayıtta ``error`` alanındadır."""
+    record: dict[str, Any] = dict.fromkeys(EXTRACT_FIELDS, "")
+    record["path"] = path
+    try:
+        record["size"] = os.path.getsize(path)
+        try:
+            with _open_header(path) as img:
+                _fill_record(record, img, path)
+        except Exception:
+            if record["size"] <= HEADER_BYTES:
+                raise
+            # Metadata başlık tamponunun ötesinde (ör. dosya sonundaki TIFF
+            # IFD'leri): aynı dosya tamamından yeniden okunur
+            from PIL import Image
+
+            with Image.open(path) as img:
+                _fill_record(record, img, path)
+    except Exception as e:
+        record["error"] = str(e) or type(e).__name__
+    return record
+
+
+def extract_files(paths: list[str]) -> list[dict[str, Any]]:
+    return [extract_file(path) for path in paths]
+
+
+def reencode_without_metadata(src: str, dst: str) -> None:
+    """Pikselleri metadata'sız yeni bir görüntüye kopyalayıp Pillow ile kaydeder.
+
+    Segment düzeyinde temizlenemeyen formatlar (TIFF, BMP, GIF) ve format
+    dönüşümleri içindir.
+    """
+    from PIL import Image
+
+    with Image.open(src) as img:
+        img.load()
+        # tobytes/frombytes tek bir bayt tamponu kullanır; piksel başına nesne yok
+        clean_img = Image.frombytes(img.mode, img.size, img.tobytes())
+        if img.mode in ("P", "PA") and img.getpalette():
+            clean_img.putpalette(img.getpalette())
+
+        ext = os.path.splitext(dst)[1].lower()
+        save_format = SAVE_FORMATS.get(ext, img.format or "JPEG")
+
+        # Kaydet (exif parametresi olmadan)
+        save_kwargs: dict[str, Any] = {}
+        if save_format == "JPEG":
+            save_kwargs["quality"] = 95
+        elif save_format == "PNG":
+            save_kwargs["optimize"] = True
+        if "transparency" in img.info and save_format in ("PNG", "GIF"):
+            save_kwargs["transparency"] = img.info["transparency"]
+
+    clean_img.save(dst, format=save_format, **save_kwargs)
+    clean_img.close()
+
+
+def clean_file(
+    path: str, root: str = "", output_dir: str = "", backup: bool = False
+) -> dict[str, Any]:
+    """Tek dosyayı temizler; ``output_dir`` verilirse ``root``'a göre göreli ağaç korunur."""
+    record: dict[str, Any] = dict.fromkeys(CLEAN_FIELDS, "")
+    record["path"] = path
+    try:
+        if output_dir:
+            relative = os.path.relpath(path, root) if root else os.path.basename(path)
+            output = os.path.join(output_dir, relative)
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        else:
+            output = path
+            # Var olan yedek özgün dosyadır; yarıda kalan ya da baştan alınan
+            # çalıştırma zaten temizlenmiş dosyayla onu ezmemelidir.
+            if backup and not os.path.exists(path + ".backup"):
+                shutil.copy2(path, path + ".backup")
+        record["output"] = output
+
+        try:
+            result = strip_metadata(path, output)
+        except MetadataFormatError:
+            result = None
+        if result is not None:
+            record["method"] = "segment"
+            record["removed"] = ",".join(result.removed)
+            record["bytes_removed"] = result.bytes_removed
+        else:
+            before = os.path.getsize(path)
+            reencode_without_metadata(path, output)
+            record["method"] = "reencode"
+            record["bytes_removed"] = before - os.path.getsize(output)
+    except Exception as e:
+        record["error"] = str(e) or type(e).__name__
+    return record
+
+
+def clean_files(
+    paths: list[str], root: str = "", output_dir: str = "", backup: bool = False
+) -> list[dict[str, Any]]:
+    return [clean_file(path, root, output_dir, backup) for path in paths]
+
+
+class ResultWriter:
+    """JSONL/CSV sonuç dosyası; aynı zamanda devam noktası (checkpoint) kaydıdır.
+
+    Kayıtlar bellekte biriktirilir ve her ``checkpoint_every`` kayıtta dosyaya
+    eklenip ``fsync`` edilir; kesintide en fazla son checkpoint'ten sonraki
+    kayıtlar yeniden işlenir. ``resume=True`` ile açılırsa mevcut kayıtların
+    yolları ``done`` kümesine okunur ve yarım kalmış son satır kesilir;
+    ``False`` ise dosya sıfırlanır.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fields: tuple[str, ...],
+        fmt: str = "jsonl",
+        resume: bool = True,
+        checkpoint_every: int = CHECKPOINT_EVERY,
+    ):
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"Desteklenmeyen çıktı biçimi: {fmt}")
+        self.path = path
+        self.fields = fields
+        self.fmt = fmt
+        self.checkpoint_every = max(1, int(checkpoint_every))
+        self.done: set[str] = set()
+        self.written = 0
+        self._buffer = io.StringIO()
+        self._pending = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if resume and os.path.exists(path):
+            self._load_done()
+        elif os.path.exists(path):
+            os.unlink(path)
+        self._csv = (
+            csv.DictWriter(self._buffer, fieldnames=fields) if fmt == "csv" else None
+        )
+        if self._csv is not None and (
+            not os.path.exists(path) or os.path.getsize(path) == 0
+        ):
+            self._csv.writeheader()
+
+    def _load_done(self) -> None:
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            # Kesinti anında yarım yazılmış son satırı at
+            end = data.rfind(b"\n") + 1
+            if end != len(data):
+                f.truncate(end)
+                data = data[:end]
+        text = data.decode("utf-8", errors="replace")
+        if self.fmt == "csv":
+            for row in csv.DictReader(io.StringIO(text)):
+                if row.get("path"):
+                    self.done.add(row["path"])
+            return
+        for line in text.splitlines():
+            try:
+                self.done.add(json.loads(line)["path"])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow({k: record.get(k, "") for k in self.fields})
+        else:
+            self._buffer.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.done.add(record["path"])
+        self.written += 1
+        self._pending += 1
+        if self._pending >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """Biriken kayıtları dosyaya ekler ve diske zorlar."""
+        data = self._buffer.getvalue()
+        if not data:
+            return
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.checkpoint()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _batches(paths: Iterable[str], size: int) -> Iterator[list[str]]:
+    batch: list[str] = []
+    for path in paths:
+        batch.append(path)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def run_batch(
+    func: Callable[[list[str]], list[dict[str, Any]]],
+    paths: Iterable[str],
+    on_result: Callable[[dict[str, Any]], None],
+    workers: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """``func``'ı yol gruplarına uygular; her kayıt için on_result çağırır.
+
+    ``func`` pickle edilebilir olmalıdır (modül düzeyi fonksiyon veya
+    ``functools.partial``). ``workers`` 0 ise çekirdek sayısı, 1 ise aynı
+    süreçte çalışır.
+    """
+    workers = workers or os.cpu_count() or 1
+    batches = _batches(paths, max(1, int(batch_size)))
+    if workers <= 1:
+        for batch in batches:
+            for record in func(batch):
+                on_result(record)
+        return
+
+    pending: set[Future] = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            exhausted = False
+            while True:
+                # Kuyrukta en fazla workers*2 grup tutulur
+                while not exhausted and len(pending) < workers * 2:
+                    batch = next(batches, [])
+                    if not batch:
+                        exhausted = True
+                        break
+                    pending.add(pool.submit(func, batch))
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    for record in future.result():
+                        on_result(record)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def checkpoint_name(prefix: str, target: str, fmt: str) -> str:
+    """Aynı hedef için her çalıştırmada aynı çıktı adını üretir (devam için)."""
+    digest = hashlib.sha1(os.path.abspath(target).encode("utf-8")).hexdigest()[:10]
+    return f"{prefix}-{digest}.{fmt}"
+
+
+def skip_done(paths: Iterable[str], done: set[str]) -> Iterator[str]:
+    return (path for path in paths if path not in done)
@@ -0,0 +1,440 @@
+"""SQLite tabanlı modül kataloğu.
+
+``ModuleManager`` keşif sonuçlarını (modül meta verisi, dizin durumları,
+modül olmayan dosyalar) burada saklar. Açılışta katalog belleğe
+yüklenmez; ``path``/``category``/``author`` üzerindeki indeksler ve
+FTS5 trigram ters indeksi (ad, açıklama, yol, yazar, kategori) ile
+sorgulanır. Değişen dosyalar tek satır olarak güncellenir, tüm katalog
+yeniden yazılmaz; FTS indeksi tetikleyicilerle eşzamanlı tutulur.
+
+``search`` komutu sorguları ``parse_search_query`` ile ayrıştırır:
+``author:``/``category:`` alan filtreleri, bm25 sıralaması, ad/yol önek
+önceliği ve tam eşleşme yoksa trigram benzerliğiyle bulanık eşleşme.
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import astuple, dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.module_manager import ModuleMeta
+
+# Şema değişirse artırılır; eski veritabanı silinip yeniden oluşturulur
+SCHEMA_VERSION = 2
+
+# FTS5 trigram sorguları en az 3 karakter ister; daha kısa terimler LIKE ile aranır
+_MIN_FTS_TERM = 3
+
+# Aranan alanlar ve bm25 ağırlıkları (FTS sütun sırasıyla aynı)
+SEARCH_FIELDS = ("name", "description", "path", "author", "category")
+_BM25_WEIGHTS = (10.0, 2.0, 6.0, 4.0, 3.0)
+
+# Bulanık eşleşmede terim trigram'larının en az bu oranı alanda geçmeli
+FUZZY_MIN_SIMILARITY = 0.5
+
+# Bulanık aramada bm25 ile ön seçilen en fazla aday sayısı
+FUZZY_CANDIDATES = 200
+
+# Sorgu dilinde desteklenen alan filtreleri
+_FILTER_KEYS = ("author", "category")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS modules (
+    path TEXT PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    author TEXT NOT NULL,
+    category TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    scan_ok INTEGER NOT NULL,
+    dir TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_modules_category ON modules (category);
+CREATE INDEX IF NOT EXISTS idx_modules_author ON modules (author COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_modules_dir ON modules (dir);
+CREATE INDEX IF NOT EXISTS idx_modules_file ON modules (file_path);
+
+CREATE TABLE IF NOT EXISTS skipped (
+    file_path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    dir TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_skipped_dir ON skipped (dir);
+
+CREATE TABLE IF NOT EXISTS dirs (
+    rel TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    files TEXT NOT NULL,
+    subdirs TEXT NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS modules_fts USING fts5(
+    name, description, path, author, category,
+    content='modules', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS modules_ai AFTER INSERT ON modules BEGIN
+    INSERT INTO modules_fts(rowid, name, description, path, author, category)
+    VALUES (new.rowid, new.name, new.description, new.path, new.author, new.category);
+END;
+CREATE TRIGGER IF NOT EXISTS modules_ad AFTER DELETE ON modules BEGIN
+    INSERT INTO modules_fts(modules_fts, rowid, name, description, path, author, category)
+    VALUES ('delete', old.rowid, old.name, old.description, old.path, old.author,
+            old.category);
+END;
+CREATE TRIGGER IF NOT EXISTS modules_au AFTER UPDATE ON modules BEGIN
+    INSERT INTO modules_fts(modules_fts, rowid, name, description, path, author, category)
+    VALUES ('delete', old.rowid, old.name, old.description, old.path, old.author,
+            old.category);
+    INSERT INTO modules_fts(rowid, name, description, path, author, category)
+    VALUES (new.rowid, new.name, new.description, new.path, new.author, new.category);
+END;
+"""
+
+
+@dataclass
+class SearchQuery:
+    """Ayrıştırılmış arama sorgusu: serbest terimler ve alan filtreleri."""
+
+    terms: list[str] = field(default_factory=list)
+    author: str | None = None
+    category: str | None = None
+
+
+def parse_search_query(query: str) -> SearchQuery:
+    """``ssh brute author:mahmut category:auxiliary`` biçimindeki sorguyu ayrıştırır.
+
+    Tırnaklı değerler desteklenir (``author:"Mahmut P."``); bilinmeyen
+    ``anahtar:değer`` ifadeleri serbest terim olarak aranır.
+    """
+    try:
+        tokens = shlex.split(query)
+    except ValueError:
+        tokens = query.split()
+    parsed = SearchQuery()
+    for token in tokens:
+        key, sep, value = token.partition(":")
+        if sep and value and key.lower() in _FILTER_KEYS:
+            setattr(parsed, key.lower(), value)
+        elif token:
+            parsed.terms.append(token)
+    return parsed
+
+
+def trigrams(text: str) -> set[str]:
+    """Küçük harfe çevrilmiş metnin trigram kümesi (kısa metin kendisidir)."""
+    text = text.lower()
+    if len(text) < 3:
+        return {text} if text else set()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def trigram_similarity(term: str, text: str) -> float:
+    """Terim trigram'larının metinde geçme oranı (0.0–1.0)."""
+    term_grams = trigrams(term)
+    if not term_grams:
+        return 0.0
+    return len(term_grams & trigrams(text)) / len(term_grams)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+class ModuleCatalogStore:
+    """Modül kataloğu veritabanı.
+
+    Bağlantı thread'ler arasında paylaşılır; tüm erişim tek kilit altındadır.
+
+    Args:
+        db_path: Veritabanı dosyası (``":memory:"`` testler için).
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self.has_fts = False
+        self._ensure_schema()
+
+    # ── Şema ─────────────────────────────────────────────────────────────
+
+    def _ensure_schema(self) -> None:
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                self._conn.executescript(
+                    "DROP TABLE IF EXISTS modules_fts; DROP TABLE IF EXISTS modules;"
+                    "DROP TABLE IF EXISTS skipped; DROP TABLE IF EXISTS dirs;"
+                )
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.has_fts = True
+            except sqlite3.OperationalError:
+                # FTS5/trigram derlenmemiş SQLite: aramalar LIKE ile yapılır
+                self.has_fts = False
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Satır dönüşümleri ────────────────────────────────────────────────
+
+    @staticmethod
+    def _row_to_meta(row: sqlite3.Row) -> ModuleMeta:
+        from core.module_manager import ModuleMeta
+
+        values = {f.name: row[f.name] for f in fields(ModuleMeta)}
+        values["scan_ok"] = bool(values["scan_ok"])
+        return ModuleMeta(**values)
+
+    # ── Okuma ────────────────────────────────────────────────────────────
+
+    def get(self, path: str) -> ModuleMeta | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM modules WHERE path = ?", (path,)
+            ).fetchone()
+        return self._row_to_meta(row) if row else None
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            return (
+                self._conn.execute(
+                    "SELECT 1 FROM modules WHERE path = ?", (path,)
+                ).fetchone()
+                is not None
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM modules").fetchone()[0]
+
+    def paths(self) -> list[str]:
+        """Sıralı modül yolları (yalnızca indeks okunur)."""
+        with self._lock:
+            return [
+                row[0]
+                for row in self._conn.execute("SELECT path FROM modules ORDER BY path")
+            ]
+
+    def iter_all(self) -> Iterator[ModuleMeta]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM modules ORDER BY path").fetchall()
+        for row in rows:
+            yield self._row_to_meta(row)
+
+    def count_by_category(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*) FROM modules GROUP BY category"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def search(
+        self, query: SearchQuery, limit: int | None = None, fuzzy: bool = True
+    ) -> list[ModuleMeta]:
+        """Sıralı katalog araması.
+
+        Tüm terimler (VE) herhangi bir alanda alt dizgi olarak geçmelidir;
+        sonuçlar bm25 ile sıralanır ve adı/yolu bir terimle başlayan
+        modüller öne alınır. Hiç sonuç yoksa ve ``fuzzy`` açıksa trigram
+        benzerliği ``FUZZY_MIN_SIMILARITY`` üzerindeki modüller döner.
+        """
+        fts_terms = [t for t in query.terms if self.has_fts and len(t) >= _MIN_FTS_TERM]
+        like_terms = [t for t in query.terms if t not in fts_terms]
+        match = " ".join(_fts_phrase(t) for t in fts_terms)
+        rows = self._search_rows(match, like_terms, query, limit)
+        if rows or not fuzzy or not query.terms:
+            return self._rank_prefix(rows, query.terms)
+
+        # Bulanık: terimin trigram'larından en az biri geçen adaylar
+        grams = sorted(set().union(*(trigrams(t) for t in query.terms)))
+        if self.has_fts and all(len(g) == 3 for g in grams):
+            match = " OR ".join(_fts_phrase(g) for g in grams)
+            candidates = self._search_rows(match, [], query, FUZZY_CANDIDATES)
+        else:
+            candidates = self._search_rows("", [], query, None)
+        scored = []
+        for row in candidates:
+            values = [str(row[name]) for name in SEARCH_FIELDS]
+            similarities = [
+                max(trigram_similarity(term, value) for value in values)
+                for term in query.terms
+            ]
+            if min(similarities) >= FUZZY_MIN_SIMILARITY:
+                scored.append((-sum(similarities), row["path"], row))
+        scored.sort(key=lambda item: item[:2])
+        return [self._row_to_meta(row) for *_, row in scored[:limit]]
+
+    def _search_rows(
+        self, match: str, like_terms: list[str], query: SearchQuery, limit: int | None
+    ) -> list[sqlite3.Row]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        sql = "SELECT m.* FROM modules m"
+        if match:
+            weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+            sql += (
+                f" JOIN (SELECT rowid, bm25(modules_fts, {weights}) AS rank"
+                " FROM modules_fts WHERE modules_fts MATCH ?) r ON r.rowid = m.rowid"
+            )
+            params.append(match)
+        for term in like_terms:
+            pattern = f"%{_escape_like(term)}%"
+            clauses.append(
+                "("
+                + " OR ".join(f"m.{name} LIKE ? ESCAPE '\\'" for name in SEARCH_FIELDS)
+                + ")"
+            )
+            params.extend([pattern] * len(SEARCH_FIELDS))
+        if query.category:
+            clauses.append(
+                "(m.category = ? COLLATE NOCASE OR m.category LIKE ? ESCAPE '\\')"
+            )
+            params.extend([query.category, f"{_escape_like(query.category)}/%"])
+        if query.author:
+            # Yazar öneki: author:mah → "Mahmut P."
+            clauses.append("m.author LIKE ? ESCAPE '\\'")
+            params.append(f"{_escape_like(query.author)}%")
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY r.rank, m.path" if match else " ORDER BY m.path"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _rank_prefix(
+        self, rows: list[sqlite3.Row], terms: list[str]
+    ) -> list[ModuleMeta]:
+        """Adı veya yolun son parçası bir terimle başlayanları öne alır (kararlı sıralama)."""
+        lowered = [t.lower() for t in terms]
+
+        def is_prefix(row: sqlite3.Row) -> bool:
+            name = row["name"].lower()
+            leaf = row["path"].rsplit("/", 1)[-1].lower()
+            return any(name.startswith(t) or leaf.startswith(t) for t in lowered)
+
+        if lowered:
+            rows = sorted(rows, key=lambda row: not is_prefix(row))
+        return [self._row_to_meta(row) for row in rows]
+
+    # ── Keşif durumu ─────────────────────────────────────────────────────
+
+    def dir_states(self) -> dict[str, tuple[int, list[str], list[str]]]:
+        """{dizin: (mtime_ns, dosyalar, alt_dizinler)}."""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM dirs").fetchall()
+        return {
+            row["rel"]: (
+                row["mtime_ns"],
+                json.loads(row["files"]),
+                json.loads(row["subdirs"]),
+            )
+            for row in rows
+        }
+
+    def files_in_dir(
+        self, rel: str
+    ) -> tuple[dict[str, ModuleMeta], dict[str, tuple[int, int]]]:
+        """Dizindeki (modül kayıtları, modül olmayan dosyalar), dosya yoluna göre."""
+        with self._lock:
+            module_rows = self._conn.execute(
+                "SELECT * FROM modules WHERE dir = ?", (rel,)
+            ).fetchall()
+            skipped_rows = self._conn.execute(
+                "SELECT * FROM skipped WHERE dir = ?", (rel,)
+            ).fetchall()
+        modules = {row["file_path"]: self._row_to_meta(row) for row in module_rows}
+        skipped = {
+            row["file_path"]: (row["mtime_ns"], row["size"]) for row in skipped_rows
+        }
+        return modules, skipped
+
+    # ── Yazma ────────────────────────────────────────────────────────────
+
+    def apply_changes(
+        self,
+        upserts: Iterable[tuple[ModuleMeta, str]] = (),
+        deleted_paths: Iterable[str] = (),
+        skipped: Iterable[tuple[str, int, int, str]] = (),
+        deleted_files: Iterable[str] = (),
+        dirs: Iterable[tuple[str, int, list[str], list[str]]] = (),
+        deleted_dirs: Iterable[str] = (),
+    ) -> None:
+        """Keşif değişikliklerini tek transaction içinde uygular.
+
+        Silmeler eklemelerden önce yapılır; böylece modül olmaktan çıkan
+        (veya modüle dönüşen) bir dosya aynı çağrıda taşınabilir.
+        """
+        from core.module_manager import ModuleMeta
+
+        columns = [f.name for f in fields(ModuleMeta)] + ["dir"]
+        insert_sql = (
+            f"INSERT INTO modules ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            "ON CONFLICT(path) DO UPDATE SET "
+            + ", ".join(f"{c} = excluded.{c}" for c in columns if c != "path")
+        )
+        with self._lock, self._conn:
+            for rel in deleted_dirs:
+                self._conn.execute("DELETE FROM dirs WHERE rel = ?", (rel,))
+                self._conn.execute("DELETE FROM modules WHERE dir = ?", (rel,))
+                self._conn.execute("DELETE FROM skipped WHERE dir = ?", (rel,))
+            for file_path in deleted_files:
+                self._conn.execute(
+                    "DELETE FROM modules WHERE file_path = ?", (file_path,)
+                )
+                self._conn.execute(
+                    "DELETE FROM skipped WHERE file_path = ?", (file_path,)
+                )
+            self._conn.executemany(
+                "DELETE FROM modules WHERE path = ?", ((p,) for p in deleted_paths)
+            )
+            # UPSERT: INSERT OR REPLACE silme tetikleyicisini çalıştırmaz, FTS bozulur
+            self._conn.executemany(
+                insert_sql, ((*astuple(meta), rel) for meta, rel in upserts)
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO skipped (file_path, mtime_ns, size, dir) "
+                "VALUES (?, ?, ?, ?)",
+                skipped,
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO dirs (rel, mtime_ns, files, subdirs) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (rel, mtime_ns, json.dumps(files), json.dumps(subdirs))
+                    for rel, mtime_ns, files, subdirs in dirs
+                ),
+            )
+
+    def upsert(self, meta: ModuleMeta, rel: str) -> None:
+        self.apply_changes(upserts=[(meta, rel)])
+
+    def delete(self, path: str) -> None:
+        self.apply_changes(deleted_paths=[path])
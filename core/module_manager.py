@@ -5,25 +5,60 @@
 from __future__ import annotations
 
 import ast
-import hashlib
 import importlib.util
-import json
-from dataclasses import asdict, dataclass
+import os
+import sqlite3
+import threading
+from collections.abc import ItemsView, Iterator, MutableMapping, ValuesView
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from rich import print
 
 from core import logger
-from core.code_scanner import print_scan_report, scan_source
+from core.bytecode_cache import BytecodeCache, source_hash
+from core.code_scanner import ScanResult, print_scan_report, scan_source
+from core.completion_index import PrefixIndex
+from core.cont import BYTECODE_CACHE_DIR
 from core.hooks import HookType
 from core.module import BaseModule
+from core.module_catalog import ModuleCatalogStore, SearchQuery
 from core.plugin_manager import PluginManager as PluginManagerType
 from core.shared_state import shared_state
 from core.validation_pipeline import ValidationPipeline, print_validation_report
 
-MANIFEST_VERSION = 1
-DEFAULT_MANIFEST_PATH = Path("config/module_manifest.json")
+DEFAULT_CATALOG_PATH = Path("config/module_catalog.db")
+
+# Bu sayıdan az dosya yeniden ayrıştırılacaksa süreç havuzu açmaya değmez
+PARALLEL_INDEX_THRESHOLD = 64
+
+# Arka plan ön yüklemesi sırasında modül yükleme hataları ekrana basılmaz
+# (thread'e özel; prompt satırını bozmasın, hata kullanıcı modülü seçince görünür)
+_output_state = threading.local()
+
+
+def _reporting() -> bool:
+    return not getattr(_output_state, "quiet", False)
+
+
+def _report(*args: Any) -> None:
+    if _reporting():
+        print(*args)
+
+
+@contextmanager
+def quiet_output() -> Iterator[None]:
+    """Bu thread'deki modül yükleme çıktısını geçici olarak susturur."""
+    previous = getattr(_output_state, "quiet", False)
+    _output_state.quiet = True
+    try:
+        yield
+    finally:
+        _output_state.quiet = previous
+
 
 # Seçilebilir framework modülü olmayan destek dosya adları (yine de BaseModule varsa yüklenir).
 _SUPPORT_FILENAMES = frozenset(
@@ -66,6 +101,109 @@ class ModuleStub(BaseModule):
         raise RuntimeError(f"Modül henüz yüklenmedi: {self.Path}")
 
 
+class CatalogModuleMap(MutableMapping):
+    """Katalog veritabanı üzerinde tembel (lazy) ``{yol: modül}`` eşlemesi.
+
+    Stub'lar yalnızca erişildiklerinde oluşturulur; anahtar listesi ve
+    kategori sayıları doğrudan veritabanı indeksinden okunur. Yüklenen
+    modüller ve katalog dışı atamalar bellekte tutulur, silinen
+    (``pop``) kayıtlar veritabanına dokunmadan gizlenir.
+    """
+
+    def __init__(self, store: ModuleCatalogStore | None = None) -> None:
+        self._store = store
+        self._items: dict[str, BaseModule] = {}
+        self._hidden: set[str] = set()
+
+    def __getitem__(self, module_path: str) -> BaseModule:
+        module = self._items.get(module_path)
+        if module is not None:
+            return module
+        if self._store is None or module_path in self._hidden:
+            raise KeyError(module_path)
+        meta = self._store.get(module_path)
+        if meta is None:
+            raise KeyError(module_path)
+        module = self._items[module_path] = ModuleStub(meta)
+        return module
+
+    def __setitem__(self, module_path: str, module: BaseModule) -> None:
+        self._items[module_path] = module
+        self._hidden.discard(module_path)
+
+    def __delitem__(self, module_path: str) -> None:
+        if module_path not in self:
+            raise KeyError(module_path)
+        self._items.pop(module_path, None)
+        if self._store is not None:
+            self._hidden.add(module_path)
+
+    def __contains__(self, module_path: object) -> bool:
+        if not isinstance(module_path, str):
+            return False
+        if module_path in self._items:
+            return True
+        if self._store is None or module_path in self._hidden:
+            return False
+        return module_path in self._store
+
+    @property
+    def hidden(self) -> frozenset[str]:
+        """Katalogda olup gizlenen (ör. yüklenemeyen) modül yolları."""
+        return frozenset(self._hidden)
+
+    def _paths(self) -> list[str]:
+        stored = self._store.paths() if self._store is not None else []
+        paths = [path for path in stored if path not in self._hidden]
+        known = set(stored)
+        paths.extend(path for path in self._items if path not in known)
+        return paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths())
+
+    def __len__(self) -> int:
+        return len(self._paths())
+
+    def _materialize(self) -> None:
+        """Tüm stub'ları tek sorguda oluşturur (items/values için)."""
+        if self._store is None:
+            return
+        for meta in self._store.iter_all():
+            if meta.path not in self._items and meta.path not in self._hidden:
+                self._items[meta.path] = ModuleStub(meta)
+
+    def items(self) -> ItemsView:
+        self._materialize()
+        return super().items()
+
+    def values(self) -> ValuesView:
+        self._materialize()
+        return super().values()
+
+    def count_by_category(self) -> dict[str, int]:
+        """{Kategori: modül sayısı}; stub oluşturmadan indeksten sayar."""
+        counts: dict[str, int] = {}
+
+        def add(category: str, delta: int) -> None:
+            key = (category or "uncategorized").capitalize()
+            counts[key] = counts.get(key, 0) + delta
+            if not counts[key]:
+                del counts[key]
+
+        if self._store is not None:
+            for category, count in self._store.count_by_category().items():
+                add(category, count)
+            for module_path in self._hidden:
+                meta = self._store.get(module_path)
+                if meta is not None:
+                    add(meta.category, -1)
+        for module_path, module in self._items.items():
+            if self._store is None or module_path not in self._store:
+                add(module.Category, 1)
+        return counts
+
+
 def _ast_str(node: ast.AST | None) -> str | None:
     if isinstance(node, ast.Constant) and isinstance(node.value, str):
         return node.value
@@ -98,7 +236,7 @@ def extract_module_meta_from_source(
     except SyntaxError:
         return None
 
-    content_hash = hashlib.sha256(source.encode("utf-8", errors="ignore")).hexdigest()
+    content_hash = source_hash(source)
 
     for node in tree.body:
         if not isinstance(node, ast.ClassDef):
@@ -162,6 +300,29 @@ def extract_module_meta_from_source(
     return None
 
 
+def index_module_file(
+    file_path: str, module_id: str, mtime_ns: int, size: int
+) -> tuple[ModuleMeta | None, ScanResult | None]:
+    """Tek dosyayı okuyup meta verisini ve güvenlik taramasını üretir.
+
+    Süreç havuzunda çalışabilmesi için modül seviyesinde tanımlıdır; çıktı
+    yazdırmaz, tarama raporu ana süreçte gösterilir.
+    """
+    path = Path(file_path)
+    try:
+        source = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None, None
+
+    meta = extract_module_meta_from_source(source, module_id, path, mtime_ns, size)
+    if meta is None or "payloads" in path.parts:
+        return meta, None
+
+    scan_result = scan_source(source, file_path, strict=False)
+    meta.scan_ok = scan_result.is_safe
+    return meta, scan_result
+
+
 class ModuleManager:
     """
     Modül Yönetim Sınıfı.
@@ -177,20 +338,43 @@ class ModuleManager:
         context: Any = None,
         use_validation_pipeline: bool = False,
         restricted_exec: bool = False,
-        manifest_path: str | Path | None = None,
+        catalog_path: str | Path | None = None,
+        index_workers: int = 0,
+        dir_mtime_shortcut: bool = True,
+        use_bytecode_cache: bool = True,
+        bytecode_cache_dir: str | Path | None = None,
     ) -> None:
         self.modules_dir = Path(modules_dir)
-        self.modules: dict[str, BaseModule] = {}
-        self._catalog: dict[str, ModuleMeta] = {}
+        self.modules: MutableMapping[str, BaseModule] = CatalogModuleMap()
         self._plugin_manager = plugin_manager
         self._context = context
         self.use_validation_pipeline = use_validation_pipeline
         self.restricted_exec = restricted_exec
+        self.catalog_path = Path(catalog_path) if catalog_path else DEFAULT_CATALOG_PATH
+        self._store: ModuleCatalogStore | None = None
+        # Modül yolu tamamlama indeksi; load_modules sonrası ilk kullanımda kurulur
+        self._path_index: PrefixIndex | None = None
+        # 0: çekirdek sayısı, 1: süreç havuzu kullanma
+        self.index_workers = index_workers
+        # Dizin mtime'ı değişmemişse içindeki dosyalar stat edilmez. Dosya
+        # ekleme/silme/yeniden adlandırma (git pull, editörlerin atomik
+        # kaydetmesi) dizin mtime'ını günceller; yerinde düzenlemeler için
+        # reload_module kullanılır.
+        self.dir_mtime_shortcut = dir_mtime_shortcut
+        # Aynı modülün ön yükleme thread'i ve prompt tarafından iki kez yüklenmesini önler
+        self._load_locks: dict[str, threading.RLock] = {}
+        self._load_locks_guard = threading.Lock()
+        # İçerik özetiyle anahtarlanan derlenmiş kod + doğrulama sonucu önbelleği
+        self.bytecode_cache: BytecodeCache | None = (
+            BytecodeCache(bytecode_cache_dir or BYTECODE_CACHE_DIR)
+            if use_bytecode_cache
+            else None
+        )
         self._validation_pipeline: ValidationPipeline | None = (
-            ValidationPipeline() if use_validation_pipeline else None
+            ValidationPipeline(verdict_cache=self.bytecode_cache)
+            if use_validation_pipeline
+            else None
         )
-        self.manifest_path = Path(manifest_path) if manifest_path else DEFAULT_MANIFEST_PATH
-        self._module_paths_cache: list[str] | None = None
 
     @property
     def plugin_manager(self) -> Any:
@@ -205,43 +389,44 @@ class ModuleManager:
         self._plugin_manager = value
 
     def _invalidate_path_cache(self) -> None:
-        self._module_paths_cache = None
+        self._path_index = None
+
+    def _update_path_index(self, module_path: str, present: bool) -> None:
+        """Tamamlama indeksini tek yol için yerinde günceller."""
+        if self._path_index is None:
+            return
+        if present:
+            self._path_index.add(module_path)
+        else:
+            self._path_index.discard(module_path)
+
+    def get_path_index(self) -> PrefixIndex:
+        if self._path_index is None:
+            self._path_index = PrefixIndex(self.modules.keys())
+        return self._path_index
 
     def get_module_paths(self) -> list[str]:
         """Sıralı modül yolu listesi (completer cache)."""
-        if self._module_paths_cache is None:
-            self._module_paths_cache = sorted(self.modules.keys())
-        return self._module_paths_cache
+        return self.get_path_index().items()
 
-    def _load_manifest(self) -> dict[str, ModuleMeta]:
-        if not self.manifest_path.exists():
-            return {}
-        try:
-            with open(self.manifest_path, encoding="utf-8") as f:
-                data = json.load(f)
-            if data.get("version") != MANIFEST_VERSION:
-                return {}
-            entries: dict[str, ModuleMeta] = {}
-            for path, raw in data.get("entries", {}).items():
-                entries[path] = ModuleMeta(**raw)
-            return entries
-        except Exception:
-            logger.debug("Modül manifest okunamadı; yeniden oluşturulacak")
-            return {}
+    def complete_module_paths(self, prefix: str) -> list[str]:
+        """Önekle eşleşen modül yolları; çok eşleşmede ``auxiliary/scanner/`` gibi alt ağaçlar."""
+        return self.get_path_index().suggest(prefix)
 
-    def _save_manifest(self) -> None:
-        try:
-            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            payload = {
-                "version": MANIFEST_VERSION,
-                "entries": {path: asdict(meta) for path, meta in self._catalog.items()},
-            }
-            tmp = self.manifest_path.with_suffix(".tmp")
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-            tmp.replace(self.manifest_path)
-        except Exception:
-            logger.debug("Modül manifest yazılamadı")
+    def _open_store(self) -> ModuleCatalogStore:
+        """Katalog veritabanını açar (yalnızca ilk çağrıda)."""
+        if self._store is None:
+            try:
+                self._store = ModuleCatalogStore(self.catalog_path)
+            except (sqlite3.Error, OSError):
+                logger.debug(
+                    "Modül kataloğu açılamadı; bellek içi katalog kullanılıyor"
+                )
+                self._store = ModuleCatalogStore(":memory:")
+        return self._store
+
+    def _dir_rel(self, file_path: Path) -> str:
+        return file_path.parent.relative_to(self.modules_dir).as_posix()
 
     def _module_id_for_file(self, file_path: Path) -> str:
         relative_path = file_path.relative_to(self.modules_dir)
@@ -257,68 +442,151 @@ class ModuleManager:
             return True
         return False
 
-    def load_modules(self) -> None:
-        """Modül kataloğunu diskten oluşturur (lazy; exec yok)."""
-        self.modules.clear()
-        self._catalog.clear()
-        self._invalidate_path_cache()
-
-        cached = self._load_manifest()
-
-        for file_path in self.modules_dir.rglob("*.py"):
-            if self._should_skip_file(file_path):
-                continue
-
+    def _walk_modules_dir(
+        self, cached_dirs: dict[str, tuple[int, list[str], list[str]]]
+    ) -> tuple[dict[str, list[Path]], dict[str, tuple[int, list[str], list[str]]]]:
+        """modules/ ağacını dolaşır.
+
+        Dizin mtime'ı katalogdaki ile aynıysa dizin yeniden listelenmez ve
+        içindeki dosyalar stat edilmez; yalnızca alt dizinlere inilir.
+
+        Returns:
+            ({değişen dizin: aday .py dosyaları}, {dizin: (mtime_ns, dosyalar, alt_dizinler)})
+        """
+        changed: dict[str, list[Path]] = {}
+        dir_state: dict[str, tuple[int, list[str], list[str]]] = {}
+        stack = [self.modules_dir]
+        while stack:
+            directory = stack.pop()
             try:
-                stat = file_path.stat()
+                mtime_ns = directory.stat().st_mtime_ns
             except OSError:
                 continue
+            rel = directory.relative_to(self.modules_dir).as_posix()
+            cached = cached_dirs.get(rel)
 
-            module_id = self._module_id_for_file(file_path)
-            cached_meta = cached.get(module_id)
-
-            if (
-                cached_meta
-                and cached_meta.mtime_ns == stat.st_mtime_ns
-                and cached_meta.size == stat.st_size
-            ):
-                meta = cached_meta
-                meta.file_path = str(file_path)
+            if self.dir_mtime_shortcut and cached and cached[0] == mtime_ns:
+                state = cached
             else:
+                candidates: list[Path] = []
+                subdirs: list[str] = []
                 try:
-                    source = file_path.read_text(encoding="utf-8", errors="ignore")
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if entry.is_dir():
+                                subdirs.append(entry.name)
+                            elif entry.name.endswith(".py"):
+                                file_path = Path(entry.path)
+                                if not self._should_skip_file(file_path):
+                                    candidates.append(file_path)
                 except OSError:
                     continue
-
-                extracted = extract_module_meta_from_source(
-                    source,
-                    module_id,
-                    file_path,
-                    stat.st_mtime_ns,
-                    stat.st_size,
-                )
-                if extracted is None:
-                    continue
-                meta = extracted
-
-                is_payload = "payloads" in file_path.parts
-                if not is_payload:
-                    scan_result = scan_source(source, str(file_path), strict=False)
-                    meta.scan_ok = scan_result.is_safe
-                    if not scan_result.is_safe:
-                        print(
-                            f"[bold yellow]⚠ Güvenlik uyarısı:[/bold yellow] '{file_path.name}'"
+                files = sorted(path.name for path in candidates)
+                state = (mtime_ns, files, sorted(subdirs))
+                changed[rel] = candidates
+
+            dir_state[rel] = state
+            stack.extend(directory / name for name in reversed(state[2]))
+        return changed, dir_state
+
+    def _index_files(
+        self, jobs: list[tuple[str, str, int, int]]
+    ) -> list[tuple[ModuleMeta | None, ScanResult | None]]:
+        """Değişen dosyaları ayrıştırır; çok dosya varsa süreç havuzu kullanır."""
+        workers = self.index_workers or os.cpu_count() or 1
+        if workers > 1 and len(jobs) >= PARALLEL_INDEX_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(
+                        pool.map(
+                            index_module_file,
+                            *zip(*jobs, strict=True),
+                            chunksize=max(1, len(jobs) // (workers * 4)),
                         )
-                        print_scan_report(scan_result)
-
-            # Keşifte hook yok — PRE/POST_MODULE_LOAD yalnızca ensure_loaded sırasında.
-            stub = ModuleStub(meta)
-            self._catalog[module_id] = meta
-            self.modules[module_id] = stub
+                    )
+            except Exception:
+                logger.debug("Paralel indeksleme başarısız; seri moda geçiliyor")
+        return [index_module_file(*job) for job in jobs]
 
-        self._save_manifest()
+    def load_modules(self) -> None:
+        """Modül kataloğunu diskle eşitler (lazy; exec yok).
+
+        Katalog SQLite veritabanında durur ve belleğe yüklenmez. Yalnızca
+        mtime'ı değişen dizinlerdeki dosyalar stat edilir ve imzası
+        (mtime/boyut) değişenler yeniden ayrıştırılır; değişiklik yoksa
+        veritabanına yazılmaz.
+        """
+        store = self._open_store()
+        self.modules = CatalogModuleMap(store)
         self._invalidate_path_cache()
-        logger.info(f"{len(self.modules)} modül indekslendi (lazy)")
+
+        cached_dirs = store.dir_states()
+        changed_dirs, dir_state = self._walk_modules_dir(cached_dirs)
+
+        jobs: list[tuple[str, str, int, int]] = []
+        job_dirs: list[str] = []
+        deleted_files: list[str] = []
+        for rel, candidates in changed_dirs.items():
+            known_modules, known_skipped = store.files_in_dir(rel)
+            present: set[str] = set()
+            for file_path in candidates:
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                file_key = str(file_path)
+                present.add(file_key)
+                signature = (stat.st_mtime_ns, stat.st_size)
+                known_meta = known_modules.get(file_key)
+                if known_meta and (known_meta.mtime_ns, known_meta.size) == signature:
+                    continue
+                if known_skipped.get(file_key) == signature:
+                    continue
+                jobs.append((file_key, self._module_id_for_file(file_path), *signature))
+                job_dirs.append(rel)
+                # Eski kayıt (modül veya modül dışı) yenisi yazılmadan silinir
+                if file_key in known_modules or file_key in known_skipped:
+                    deleted_files.append(file_key)
+            deleted_files.extend(
+                file_key
+                for file_key in (*known_modules, *known_skipped)
+                if file_key not in present
+            )
+
+        upserts: list[tuple[ModuleMeta, str]] = []
+        skipped: list[tuple[str, int, int, str]] = []
+        for (file_key, _, mtime_ns, size), rel, (meta, scan_result) in zip(
+            jobs, job_dirs, self._index_files(jobs), strict=True
+        ):
+            if meta is None:
+                skipped.append((file_key, mtime_ns, size, rel))
+                continue
+            if scan_result is not None and not scan_result.is_safe:
+                print(
+                    f"[bold yellow]⚠ Güvenlik uyarısı:[/bold yellow] '{Path(file_key).name}'"
+                )
+                print_scan_report(scan_result)
+            upserts.append((meta, rel))
+
+        dirs = [
+            (rel, *state)
+            for rel, state in dir_state.items()
+            if cached_dirs.get(rel) != state
+        ]
+        deleted_dirs = [rel for rel in cached_dirs if rel not in dir_state]
+
+        # Keşifte hook yok — PRE/POST_MODULE_LOAD yalnızca ensure_loaded sırasında.
+        if upserts or skipped or deleted_files or dirs or deleted_dirs:
+            store.apply_changes(
+                upserts=upserts,
+                skipped=skipped,
+                deleted_files=deleted_files,
+                dirs=dirs,
+                deleted_dirs=deleted_dirs,
+            )
+        logger.info(
+            f"{len(store)} modül indekslendi (lazy, {len(jobs)} dosya ayrıştırıldı)"
+        )
 
     def _instantiate_from_file(self, module_path: str, file_path: Path) -> BaseModule | None:
         """Dosyayı import edip BaseModule örneği oluşturur."""
@@ -334,47 +602,62 @@ class ModuleManager:
         try:
             source = file_path.read_text(encoding="utf-8", errors="ignore")
         except OSError as e:
-            print(f"[bold red]Dosya okunamadı:[/bold red] {file_path} ({e})")
+            _report(f"[bold red]Dosya okunamadı:[/bold red] {file_path} ({e})")
             return None
 
-        if not is_payload and self._validation_pipeline:
-            # Validation pipeline dosyayı kendi okur; keşifte zaten tarandı.
-            vresult = self._validation_pipeline.validate_module_file(
-                str(file_path), strict_scan=False, sandbox=self.restricted_exec
+        # Kısıtlı çalıştırma doğrulama hattının sandbox'ını kullanır; hat yoksa normal yüklenir
+        pipeline = self._validation_pipeline
+        restricted = self.restricted_exec and not is_payload and pipeline is not None
+        mode = "restricted" if restricted else "exec"
+        cache = self.bytecode_cache
+        content_hash = source_hash(source)
+        entry = cache.load(content_hash, str(file_path), mode) if cache else None
+
+        if not is_payload and pipeline is not None:
+            # Sonuç pipeline'ın önbelleğinde (içerik özeti + kural sürümü) tutulur
+            vresult = pipeline.validate_module_file(
+                str(file_path),
+                strict_scan=False,
+                sandbox=self.restricted_exec,
+                source=source,
             )
             if not vresult.is_valid:
-                print(f"[bold red]✗ Doğrulama hatası:[/bold red] '{file_path.name}'")
-                print_validation_report(vresult)
+                _report(f"[bold red]✗ Doğrulama hatası:[/bold red] '{file_path.name}'")
+                if _reporting():
+                    print_validation_report(vresult)
                 return None
 
         try:
             spec = importlib.util.spec_from_file_location(module_path, str(file_path))
             if spec is None or spec.loader is None:
-                print(f"Modül spesifikasyonu alınamadı: {file_path}")
+                _report(f"Modül spesifikasyonu alınamadı: {file_path}")
                 return None
 
             module = importlib.util.module_from_spec(spec)
-
-            if self.restricted_exec and not is_payload:
-                sandbox = (
-                    self._validation_pipeline.sandbox
-                    if self._validation_pipeline
-                    else None
+            code = entry.code if entry else None
+
+            if restricted and pipeline is not None:
+                sandbox = pipeline.sandbox
+                if code is None:
+                    code = sandbox.compile_restricted(source, str(file_path))
+                    if code is not None and cache:
+                        cache.store(content_hash, str(file_path), mode, code=code)
+                restricted_module = (
+                    sandbox.exec_restricted_code(code, str(file_path)) if code else None
                 )
-                if sandbox:
-                    restricted_module = sandbox.exec_module_restricted(
-                        source, str(file_path)
+                if restricted_module is None:
+                    _report(
+                        f"[bold red]✗ Kısıtlı çalıştırma hatası:[/bold red] '{file_path.name}'"
                     )
-                    if restricted_module is None:
-                        print(
-                            f"[bold red]✗ Kısıtlı çalıştırma hatası:[/bold red] '{file_path.name}'"
-                        )
-                        return None
-                    module.__dict__.update(restricted_module.__dict__)
-                else:
-                    spec.loader.exec_module(module)
+                    return None
+                module.__dict__.update(restricted_module.__dict__)
             else:
-                spec.loader.exec_module(module)
+                if code is None:
+                    # spec.loader.exec_module ile aynı derleme (dont_inherit)
+                    code = compile(source, str(file_path), "exec", dont_inherit=True)
+                    if cache:
+                        cache.store(content_hash, str(file_path), mode, code=code)
+                exec(code, module.__dict__)
 
             for _name, obj in module.__dict__.items():
                 if (
@@ -406,35 +689,72 @@ class ModuleManager:
                     return module_instance
 
         except SyntaxError:
-            print(
+            _report(
                 f"[bold red]Sözdizimi hatası:[/bold red] '{file_path.name}' dosyasında hata var."
             )
             logger.exception(f"Modül yüklenirken sözdizimi hatası '{file_path}'")
         except ImportError as e:
-            print(
+            _report(
                 f"[bold red]İçe aktarma hatası:[/bold red] '{file_path.name}' - {e}"
             )
             logger.exception(f"Modül yüklenirken import hatası '{file_path}'")
         except AttributeError:
-            print(
+            _report(
                 f"[bold red]Öznitelik hatası:[/bold red] '{file_path.name}' - Modül sınıfı doğru tanımlanmamış."
             )
             logger.exception(f"Modül yüklenirken öznitelik hatası '{file_path}'")
         except Exception:
-            print(
+            _report(
                 f"[bold red]Beklenmeyen hata:[/bold red] '{file_path.name}' yüklenirken hata oluştu."
             )
             logger.exception(f"Modül yüklenirken beklenmeyen hata '{file_path}'")
 
         return None
 
-    def ensure_loaded(self, module_path: str) -> BaseModule | None:
-        """Stub ise gerçek modülü yükler ve cache'ler."""
+    def _load_lock(self, module_path: str) -> threading.RLock:
+        with self._load_locks_guard:
+            return self._load_locks.setdefault(module_path, threading.RLock())
+
+    def _is_loaded(self, module_path: str) -> BaseModule | None:
         current = self.modules.get(module_path)
         if current is not None and not getattr(current, "_is_stub", False):
             return current
+        return None
 
-        meta = self._catalog.get(module_path)
+    def ensure_loaded(self, module_path: str) -> BaseModule | None:
+        """Stub ise gerçek modülü yükler ve cache'ler."""
+        if (current := self._is_loaded(module_path)) is not None:
+            return current
+        with self._load_lock(module_path):
+            # Beklerken ön yükleme thread'i yüklemiş olabilir
+            if (current := self._is_loaded(module_path)) is not None:
+                return current
+            return self._load_into_catalog(module_path)
+
+    def prewarm_module(self, module_path: str) -> bool:
+        """Modülü arka planda sessizce yükler.
+
+        ``ensure_loaded``'dan farkı: hata ekrana basılmaz ve stub katalogdan
+        kaldırılmaz; kullanıcı modülü seçtiğinde yükleme yeniden denenir ve
+        hata o zaman gösterilir.
+        """
+        with self._load_lock(module_path):
+            if self._is_loaded(module_path) is not None:
+                return True
+            meta = self._store.get(module_path) if self._store is not None else None
+            if meta is None or module_path not in self.modules:
+                return False
+            with quiet_output():
+                instance = self._instantiate_from_file(
+                    module_path, Path(meta.file_path)
+                )
+            if instance is None:
+                return False
+            self.modules[module_path] = instance
+            return True
+
+    def _load_into_catalog(self, module_path: str) -> BaseModule | None:
+        meta = self._store.get(module_path) if self._store is not None else None
         if meta is not None:
             file_path = Path(meta.file_path)
         else:
@@ -445,15 +765,16 @@ class ModuleManager:
         if not file_path.exists():
             # Katalogda ölü kayıt kalmasın
             self.modules.pop(module_path, None)
-            self._catalog.pop(module_path, None)
-            self._invalidate_path_cache()
+            if self._store is not None:
+                self._store.delete(module_path)
+            self._update_path_index(module_path, False)
             return None
 
         instance = self._instantiate_from_file(module_path, file_path)
         if instance is None:
             # Yükleme başarısız: stub ile yanıltıcı listelemeyi kaldır
             self.modules.pop(module_path, None)
-            self._invalidate_path_cache()
+            self._update_path_index(module_path, False)
             return None
 
         self.modules[module_path] = instance
@@ -461,8 +782,12 @@ class ModuleManager:
 
     def reload_module(self, module_path: str) -> bool:
         """Belirtilen modülü diskten yeniden yükler (hot-reload)."""
+        with self._load_lock(module_path):
+            return self._reload_locked(module_path)
+
+    def _reload_locked(self, module_path: str) -> bool:
         self.modules.pop(module_path, None)
-        self._catalog.pop(module_path, None)
+        self._update_path_index(module_path, False)
 
         full_path = self.modules_dir / f"{module_path}.py"
         if not full_path.exists():
@@ -475,9 +800,11 @@ class ModuleManager:
             meta = extract_module_meta_from_source(
                 source, module_path, full_path, stat.st_mtime_ns, stat.st_size
             )
-            if meta:
-                self._catalog[module_path] = meta
-                self._save_manifest()
+            if self._store is not None:
+                if meta:
+                    self._store.upsert(meta, self._dir_rel(full_path))
+                else:
+                    self._store.delete(module_path)
         except OSError:
             pass
 
@@ -486,13 +813,15 @@ class ModuleManager:
             return False
 
         self.modules[module_path] = instance
-        self._invalidate_path_cache()
+        self._update_path_index(module_path, True)
         logger.info(f"Modül başarıyla yeniden yüklendi: {module_path}")
         return True
 
     def has_module(self, module_path: str) -> bool:
         """Katalogda modül var mı (import tetiklemez)."""
-        return module_path in self.modules or module_path in self._catalog
+        if module_path in self.modules:
+            return True
+        return self._store is not None and module_path in self._store
 
     def get_module(self, module_path: str) -> BaseModule | None:
         """Verilen yol ile eşleşen modülü döndürür (gerekirse lazy load)."""
@@ -500,7 +829,7 @@ class ModuleManager:
             return None
         return self.ensure_loaded(module_path)
 
-    def get_all_modules(self) -> dict[str, BaseModule]:
+    def get_all_modules(self) -> MutableMapping[str, BaseModule]:
         """Katalogdaki tüm modülleri döndürür (stub veya loaded)."""
         return self.modules
 
@@ -513,6 +842,40 @@ class ModuleManager:
             categorized_modules[category][module_path] = module_obj
         return categorized_modules
 
+    def count_by_category(self) -> dict[str, int]:
+        """{Kategori: modül sayısı}; katalogda stub oluşturmadan sayar."""
+        if isinstance(self.modules, CatalogModuleMap):
+            return self.modules.count_by_category()
+        return {
+            category: len(modules)
+            for category, modules in self.get_modules_by_category().items()
+        }
+
+    def search_catalog(
+        self, query: SearchQuery, limit: int | None = None
+    ) -> list[ModuleMeta] | None:
+        """Katalogdaki trigram indeksinde sıralı arama (bkz. ``ModuleCatalogStore.search``).
+
+        Katalog açık değilse None döner; çağıran bellek içi taramaya düşer.
+        Yüklenemediği için katalogdan gizlenen modüller sonuçlarda yer almaz.
+        """
+        if self._store is None:
+            return None
+        hidden = (
+            self.modules.hidden
+            if isinstance(self.modules, CatalogModuleMap)
+            else frozenset()
+        )
+        if not hidden:
+            return self._store.search(query, limit=limit)
+        wanted = limit + len(hidden) if limit is not None else None
+        metas = [
+            meta
+            for meta in self._store.search(query, limit=wanted)
+            if meta.path not in hidden
+        ]
+        return metas[:limit] if limit is not None else metas
+
     def run_module(self, module_path: str) -> bool:
         module = self.get_module(module_path)
 
@@ -0,0 +1,213 @@
+"""Açılıştan sonra sık kullanılan modülleri arka planda önceden yükleme.
+
+``ModuleManager.ensure_loaded`` gerçek import'u, doğrulama hattını ve
+(isteğe bağlı) kısıtlı çalıştırmayı ``use`` komutu içinde eşzamanlı yapar;
+ağır modüller ilk seçimde prompt'u bekletir. ``ModulePrewarmer`` konsol
+boştayken en sık kullanılan modülleri ayrı bir thread'de yükler:
+
+- Aday sırası ``.mah_history`` (``use``/``info``) ve denetim logundaki
+  (``MODULE: Run:``) kullanım sıklığından çıkarılır.
+- Kullanıcı bir komut çalıştırırken (``busy``) ve ardından
+  ``idle_delay`` saniye boyunca yükleme yapılmaz.
+- Süreç belleği (RSS) başlangıca göre ``memory_budget_mb`` kadar artınca
+  veya ``max_modules`` modül yüklenince durur; ``cancel`` ile hemen durdurulur.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from core import logger
+from core.cont import (
+    PREWARM_IDLE_DELAY,
+    PREWARM_MAX_MODULES,
+    PREWARM_MEMORY_BUDGET_MB,
+    PREWARM_TAIL_BYTES,
+)
+
+# prompt_toolkit FileHistory girdileri "+" ile başlar: "+use auxiliary/scanner/x"
+_HISTORY_MODULE_RE = re.compile(r"^\+\s*(?:use|info)\s+(\S+)")
+
+# Denetim logunda modül çalıştırma kaydı. "COMMAND: Exec: use ..." satırları
+# .mah_history ile aynı olayı tekrar saydırmasın diye kullanılmaz.
+_AUDIT_MODULE_RE = re.compile(r"\bMODULE: Run: (\S+)")
+
+
+def _tail_lines(path: str | Path, max_bytes: int = PREWARM_TAIL_BYTES) -> list[str]:
+    """Dosyanın son ``max_bytes`` baytındaki tam satırlar (büyük loglar için)."""
+    try:
+        with open(path, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - max_bytes)
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return []
+    lines = data.decode("utf-8", errors="ignore").splitlines()
+    if start > 0 and lines:
+        lines = lines[1:]  # yarım kalan ilk satır
+    return lines
+
+
+def usage_frequencies(
+    history_file: str | Path | None,
+    audit_log: str | Path | None = None,
+    max_bytes: int = PREWARM_TAIL_BYTES,
+) -> list[tuple[str, int]]:
+    """Modül yollarını kullanım sıklığına göre (çoktan aza) sıralar.
+
+    Eşit sıklıkta son kullanılan öne alınır.
+    """
+    counts: Counter[str] = Counter()
+    last_seen: dict[str, int] = {}
+    position = 0
+    sources = ((history_file, _HISTORY_MODULE_RE), (audit_log, _AUDIT_MODULE_RE))
+    for path, pattern in sources:
+        if not path:
+            continue
+        for line in _tail_lines(path, max_bytes):
+            match = pattern.search(line)
+            if match:
+                module_path = match.group(1)
+                counts[module_path] += 1
+                last_seen[module_path] = position
+                position += 1
+    return sorted(counts.items(), key=lambda item: (-item[1], -last_seen[item[0]]))
+
+
+def current_rss() -> int | None:
+    """Süreç belleği (bayt); ölçülemiyorsa None.
+
+    Linux'ta /proc anlık değeri, diğer POSIX sistemlerde en yüksek RSS
+    (``ru_maxrss``) kullanılır. Ölçüm yoksa bütçe uygulanmaz, yalnızca
+    modül sayısı sınırı geçerlidir.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS bayt, Linux/BSD kilobayt döndürür
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class ModulePrewarmer:
+    """Aday modülleri konsol boştayken arka planda yükleyen worker.
+
+    Args:
+        module_manager: ``prewarm_module`` sağlayan modül yöneticisi.
+        candidates: Öncelik sırasıyla modül yolları.
+        memory_budget_mb: Ön yüklemenin kullanabileceği ek RSS (0: sınırsız).
+        max_modules: En fazla yüklenecek modül sayısı.
+        idle_delay: Son komuttan sonra beklenecek süre (saniye).
+    """
+
+    def __init__(
+        self,
+        module_manager: Any,
+        candidates: list[str],
+        memory_budget_mb: float = PREWARM_MEMORY_BUDGET_MB,
+        max_modules: int = PREWARM_MAX_MODULES,
+        idle_delay: float = PREWARM_IDLE_DELAY,
+    ) -> None:
+        self.module_manager = module_manager
+        self.candidates = candidates[:max_modules] if max_modules else list(candidates)
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.idle_delay = idle_delay
+        self.loaded: list[str] = []
+        self.stop_reason: str | None = None
+        self._cancel = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._last_activity = time.monotonic()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_usage(
+        cls,
+        module_manager: Any,
+        history_file: str | Path | None,
+        audit_log: str | Path | None = None,
+        **kwargs: Any,
+    ) -> "ModulePrewarmer":
+        """Kullanım sıklığından aday listesi çıkarır (katalogda olmayanlar atlanır)."""
+        candidates = [
+            module_path
+            for module_path, _ in usage_frequencies(history_file, audit_log)
+            if module_manager.has_module(module_path)
+        ]
+        return cls(module_manager, candidates, **kwargs)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running or not self.candidates:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="module-prewarm", daemon=True
+        )
+        self._thread.start()
+
+    def cancel(self, timeout: float | None = 1.0) -> None:
+        """Ön yüklemeyi durdurur; süren import bitince thread çıkar."""
+        self._cancel.set()
+        self._idle.set()  # bekleyen worker'ı uyandır
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @contextmanager
+    def busy(self) -> Iterator[None]:
+        """Kullanıcı komutu süresince ön yüklemeyi bekletir."""
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._last_activity = time.monotonic()
+            self._idle.set()
+
+    def _wait_until_idle(self) -> bool:
+        """Konsol ``idle_delay`` süredir boştaysa True; iptal edildiyse False."""
+        while not self._cancel.is_set():
+            self._idle.wait()
+            remaining = self.idle_delay - (time.monotonic() - self._last_activity)
+            if remaining <= 0 and self._idle.is_set():
+                return not self._cancel.is_set()
+            self._cancel.wait(max(remaining, 0.05))
+        return False
+
+    def _run(self) -> None:
+        baseline = current_rss()
+        for module_path in self.candidates:
+            if not self._wait_until_idle():
+                self.stop_reason = "cancelled"
+                break
+            if self.memory_budget and baseline is not None:
+                rss = current_rss()
+                if rss is not None and rss - baseline >= self.memory_budget:
+                    self.stop_reason = "memory"
+                    break
+            try:
+                if self.module_manager.prewarm_module(module_path):
+                    self.loaded.append(module_path)
+            except Exception:
+                logger.debug(f"Ön yükleme başarısız: {module_path}")
+        else:
+            self.stop_reason = "done"
+        logger.info(
+            f"Modül ön yüklemesi bitti ({self.stop_reason}): {len(self.loaded)} modül"
+        )
@@ -46,6 +46,15 @@ class BasePlugin:
     Düşük sayı = Yüksek öncelik (Daha önce çalışır).
     """
 
+    AsyncHooks: bool | frozenset[HookType] = False
+    """
+    Hook'ların arka plan kuyruğunda (asenkron) çalıştırılmasını seçer.
+    True ise tüm hook'lar, HookType kümesi verilirse yalnızca o hook'lar asenkron çalışır.
+    Asenkron handler'lar tetikleyen işlemi (prompt, listener) bekletmez ancak
+    sonucu engelleyemez; kuyruk doluysa olaylar düşürülür.
+    Örnek: AsyncHooks = frozenset({HookType.ON_SESSION_OPEN})
+    """
+
     DefaultConfig: dict = {}
     """
     Plugin'in varsayılan yapılandırma ayarları.
@@ -7,7 +7,10 @@ from pathlib import Path
 from typing import Any
 
 from core import logger
+from core.bytecode_cache import BytecodeCache
 from core.code_scanner import print_scan_report, scan_file
+from core.cont import BYTECODE_CACHE_DIR
+from core.hook_dispatch import HookDispatcher, HookRoute, HookStats
 from core.hooks import HookType
 from core.plugin import BasePlugin
 from core.validation_pipeline import ValidationPipeline, print_validation_report
@@ -47,10 +50,16 @@ class PluginManager:
             hook: [] for hook in HookType
         }
 
+        # Handler -> HookRoute (sahibi ve asenkron mu); dispatcher tablosu buradan kurulur.
+        self._routes: dict[Callable[..., Any], HookRoute] = {}
+        self._dispatcher = HookDispatcher()
+
         self.use_validation_pipeline = use_validation_pipeline
         self.restricted_exec = restricted_exec
         self._validation_pipeline: ValidationPipeline | None = (
-            ValidationPipeline() if use_validation_pipeline else None
+            ValidationPipeline(verdict_cache=BytecodeCache(BYTECODE_CACHE_DIR))
+            if use_validation_pipeline
+            else None
         )
 
     def load_plugins(self) -> None:
@@ -62,6 +71,8 @@ class PluginManager:
         self.plugins.clear()
         for hook in self.hooks:
             self.hooks[hook].clear()
+        self._routes.clear()
+        self._rebuild_dispatch()
 
         # Plugin dizini yoksa uyarı ver ve çık.
         if not self.plugins_dir.exists():
@@ -100,8 +111,13 @@ class PluginManager:
                         continue
 
                 # 2. AST tabanlı statik güvenlik taraması (plugin'ler framework içinde çalışır, strict=True).
-                scan_result = scan_file(str(file_path), strict=True)
-                if not scan_result.is_safe:
+                # Pipeline aynı taramayı strict modda zaten yaptı (sonucu önbellekte olabilir).
+                scan_result = (
+                    None
+                    if self._validation_pipeline
+                    else scan_file(str(file_path), strict=True)
+                )
+                if scan_result is not None and not scan_result.is_safe:
                     logger.warning(
                         f"Plugin '{file_path.name}' tehlikeli kod içeriyor, yüklenmiyor."
                     )
@@ -184,6 +200,7 @@ class PluginManager:
         # Tüm kayıtlar bittikten sonra hook listelerini bir kez sırala
         for hook_type in self.hooks:
             self.hooks[hook_type].sort(key=lambda x: x[0])
+        self._rebuild_dispatch()
 
         logger.info(f"{len(self.plugins)} plugin yüklendi")
 
@@ -196,11 +213,19 @@ class PluginManager:
             sort_now: False ise sıralamayı çağırana bırakır (toplu yükleme).
         """
         plugin_hooks = plugin.get_hooks()
+        async_hooks = getattr(plugin, "AsyncHooks", False)
 
         for hook_type, handler in plugin_hooks.items():
             self.hooks[hook_type].append((plugin.Priority, handler))
+            self._routes[handler] = HookRoute(
+                handler=handler,
+                owner=plugin.Name,
+                is_async=async_hooks is True
+                or (not isinstance(async_hooks, bool) and hook_type in async_hooks),
+            )
             if sort_now:
                 self.hooks[hook_type].sort(key=lambda x: x[0])
+        self._rebuild_dispatch()
 
     def _unregister_hooks(self, plugin: BasePlugin) -> None:
         """
@@ -213,6 +238,24 @@ class PluginManager:
             self.hooks[hook_type] = [
                 (p, h) for p, h in self.hooks[hook_type] if h != handler
             ]
+            self._routes.pop(handler, None)
+        self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self) -> None:
+        """Hook listelerinden dispatcher'ın değişmez yönlendirme tablosunu kurar."""
+        self._dispatcher.set_routes(
+            {
+                hook_type: [
+                    self._routes.get(handler)
+                    or HookRoute(
+                        handler, getattr(handler, "__qualname__", repr(handler))
+                    )
+                    # Toplu yüklemede liste henüz sıralanmamış olabilir (kararlı sıralama)
+                    for _, handler in sorted(entries, key=lambda x: x[0])
+                ]
+                for hook_type, entries in self.hooks.items()
+            }
+        )
 
     def unload_plugin(self, plugin_name: str) -> bool:
         """
@@ -285,16 +328,24 @@ class PluginManager:
             hook_type: Tetiklenen olayın türü (örn: HookType.PRE_COMMAND).
             **kwargs: İşleyicilere (handler) gönderilecek parametreler (örn: command_line="help").
         """
-        handlers = self.hooks.get(hook_type, [])
+        # Abonesi olmayan hook türü tek sözlük aramasıyla döner; AsyncHooks
+        # seçen plugin'lerin handler'ları kuyruğa atılır, diğerleri burada çalışır.
+        self._dispatcher.dispatch(hook_type, kwargs)
 
-        for priority, handler in handlers:
-            try:
-                # İşleyici fonksiyonu çağır.
-                handler(**kwargs)
-            except Exception:
-                # Bir eklentinin çökmesi, framework'ü veya diğer eklentileri durdurmamalı.
-                logger.exception(f"Plugin hook hatası ({hook_type.value})")
-                continue
+    def has_subscribers(self, hook_type: HookType) -> bool:
+        """Hook türünü dinleyen aktif handler var mı."""
+        return self._dispatcher.has_subscribers(hook_type)
+
+    def get_hook_stats(self) -> dict[tuple[str, str], HookStats]:
+        """{(hook, plugin): HookStats} — yavaş plugin'leri bulmak için."""
+        return self._dispatcher.stats()
+
+    def reset_hook_stats(self) -> None:
+        self._dispatcher.reset_stats()
+
+    def shutdown_hooks(self, timeout: float | None = 2.0) -> None:
+        """Asenkron kuyruktaki olayları işleyip worker'ı durdurur (kapanışta)."""
+        self._dispatcher.shutdown(timeout)
 
     def get_all_plugins(self) -> dict[str, BasePlugin]:
         """Yüklü tüm plugin'leri döndürür."""
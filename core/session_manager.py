@@ -63,21 +63,22 @@ class SessionManager:
             # Bir sonraki ID'yi hazırla
             self.next_session_id += 1
 
-            # Eklentilere (plugin) haber ver
-            try:
-                from core.hooks import HookType
-                from core.shared_state import shared_state
+        # Eklentilere (plugin) haber ver — kilit dışında: yavaş bir plugin
+        # diğer handler'ların oturum eklemesini (accept döngüsünü) bekletmesin.
+        try:
+            from core.hooks import HookType
+            from core.shared_state import shared_state
 
-                if shared_state.plugin_manager:
-                    shared_state.plugin_manager.trigger_hook(
-                        HookType.ON_SESSION_OPEN,
-                        session_id=session_id,
-                        info=connection_info,
-                    )
-            except Exception:
-                pass
+            if shared_state.plugin_manager:
+                shared_state.plugin_manager.trigger_hook(
+                    HookType.ON_SESSION_OPEN,
+                    session_id=session_id,
+                    info=connection_info,
+                )
+        except Exception:
+            pass
 
-            return session_id
+        return session_id
 
     def remove_session(self, session_id: int) -> None:
         """
@@ -138,21 +139,25 @@ class SessionManager:
         """
         with self.lock:
             # Iterasyon sırasında silme yapmamak için list() kullanılır
+            closed: list[int] = []
             for session_id, session in list(self.sessions.items()):
                 try:
                     if hasattr(session["handler"], "stop"):
                         session["handler"].stop()
-
-                    try:
-                        from core.hooks import HookType
-                        from core.shared_state import shared_state
-
-                        if shared_state.plugin_manager:
-                            shared_state.plugin_manager.trigger_hook(
-                                HookType.ON_SESSION_CLOSE, session_id=session_id
-                            )
-                    except Exception:
-                        pass
                 except Exception:
                     pass
+                closed.append(session_id)
             self.sessions.clear()
+
+        # Hook'lar kilit dışında tetiklenir (add_session ile aynı gerekçe)
+        try:
+            from core.hooks import HookType
+            from core.shared_state import shared_state
+
+            if shared_state.plugin_manager:
+                for session_id in closed:
+                    shared_state.plugin_manager.trigger_hook(
+                        HookType.ON_SESSION_CLOSE, session_id=session_id
+                    )
+        except Exception:
+            pass
@@ -0,0 +1,115 @@
+"""Açılış süresi ölçümü ve açılışta arka planda yürütülen işler.
+
+``main.py`` ağır import'ları (rich konsolu, pyfiglet banner'ı, prompt_toolkit)
+yalnızca gerektiği yerde yapar. ``StartupTimer`` açılışı aşamalara böler
+(import, komut/plugin/modül indeksleme, konsol, banner) ve toplamı
+``STARTUP_BUDGET_MS`` bütçesiyle karşılaştırır. ``BackgroundTask`` banner ve
+sürüm bilgisinin (``git rev-list``) katalog indekslenirken hazırlanmasını sağlar.
+
+Bu modül açılışın en başında içe aktarıldığından yalnızca standart
+kütüphaneye ve ``core.cont``'a bağımlıdır.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from core.cont import STARTUP_BUDGET_MS
+
+
+class StartupTimer:
+    """Açılış aşamalarının sürelerini tutar.
+
+    Her ``mark`` çağrısı bir önceki işaretten bu yana geçen süreyi verilen
+    aşamaya yazar; aşamalar ardışık olduğundan toplamları açılış süresidir.
+
+    Args:
+        started: Ölçümün başlangıcı (``time.perf_counter`` değeri).
+        budget_ms: Hedef açılış süresi (ms).
+    """
+
+    def __init__(
+        self, started: float | None = None, budget_ms: float = STARTUP_BUDGET_MS
+    ) -> None:
+        self.started = time.perf_counter() if started is None else started
+        self.budget_ms = budget_ms
+        self.phases: list[tuple[str, float]] = []
+        self._last = self.started
+
+    def mark(self, name: str) -> float:
+        """Son işaretten bu yana geçen süreyi ``name`` aşamasına yazar (ms)."""
+        now = time.perf_counter()
+        elapsed = (now - self._last) * 1000
+        self.phases.append((name, elapsed))
+        self._last = now
+        return elapsed
+
+    @property
+    def total_ms(self) -> float:
+        return (self._last - self.started) * 1000
+
+    @property
+    def within_budget(self) -> bool:
+        return self.total_ms <= self.budget_ms
+
+    def summary(self) -> str:
+        """Log için tek satırlık özet."""
+        parts = ", ".join(f"{name} {ms:.0f}" for name, ms in self.phases)
+        return f"Açılış {self.total_ms:.0f} ms (bütçe {self.budget_ms:.0f} ms): {parts}"
+
+    def print_report(self) -> None:
+        """Aşama tablosunu ve bütçe durumunu yazdırır."""
+        from rich import print
+        from rich.table import Table
+
+        total = self.total_ms or 1.0
+        table = Table(title="Açılış Süresi", title_style="bold cyan")
+        table.add_column("Aşama", style="cyan")
+        table.add_column("Süre (ms)", justify="right")
+        table.add_column("Pay", justify="right", style="dim")
+        for name, ms in self.phases:
+            table.add_row(name, f"{ms:.1f}", f"%{ms / total * 100:.0f}")
+        status = "green" if self.within_budget else "red"
+        table.add_section()
+        table.add_row(
+            "[bold]toplam[/bold]",
+            f"[bold {status}]{self.total_ms:.1f}[/bold {status}]",
+            f"bütçe {self.budget_ms:.0f}",
+        )
+        print(table)
+
+
+class BackgroundTask:
+    """Bir fonksiyonu daemon thread'de hemen başlatır; sonucu ``result`` verir.
+
+    Args:
+        func: Çalıştırılacak fonksiyon.
+        *args: Fonksiyon argümanları.
+        name: Thread adı.
+    """
+
+    def __init__(
+        self, func: Callable[..., Any], *args: Any, name: str = "startup-task"
+    ) -> None:
+        self._value: Any = None
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, args=(func, args), name=name, daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, func: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        try:
+            self._value = func(*args)
+        except BaseException as e:
+            self._error = e
+
+    def result(self, timeout: float | None = None) -> Any:
+        """İş bitene kadar bekler; iş hata verdiyse aynı hatayı yükseltir."""
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError(f"{self._thread.name} zamanında bitmedi")
+        if self._error is not None:
+            raise self._error
+        return self._value
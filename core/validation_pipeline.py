@@ -7,7 +7,12 @@ import types
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
-from core.code_scanner import ScanResult, scan_file
+from core.bytecode_cache import BytecodeCache, source_hash
+from core.code_scanner import RULES_VERSION, ScanResult, scan_file, scan_source
+
+# Tarayıcı kural sürümü + pipeline revizyonu (imza kontrolleri değişince
+# artırılır). Önbellekteki eski doğrulama sonuçları (verdict) geçersiz sayılır.
+VALIDATION_RULES_VERSION = f"{RULES_VERSION}.1"
 
 
 @runtime_checkable
@@ -54,6 +59,27 @@ class ValidationResult:
     def add_warning(self, msg: str) -> None:
         self.warnings.append(msg)
 
+    def to_verdict(self) -> dict[str, Any]:
+        """Önbelleğe yazılabilir (marshal) özet; tarama ayrıntısı saklanmaz."""
+        return {
+            "rules": VALIDATION_RULES_VERSION,
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+        }
+
+    @classmethod
+    def from_verdict(cls, file_path: str, verdict: Any) -> "ValidationResult | None":
+        """``to_verdict`` çıktısından sonuç üretir; kural sürümü eskiyse None."""
+        if (
+            not isinstance(verdict, dict)
+            or verdict.get("rules") != VALIDATION_RULES_VERSION
+        ):
+            return None
+        result = cls(file_path)
+        result.errors = list(verdict.get("errors", []))
+        result.warnings = list(verdict.get("warnings", []))
+        return result
+
 
 class SignatureValidator:
     """Modül/Plugin imza doğrulayıcı."""
@@ -151,8 +177,8 @@ class SandboxExecutor:
             "__name__": "__restricted__",
         }
 
-    def exec_module_restricted(self, source: str, filename: str) -> types.ModuleType | None:
-        """Kaynak kodu kısıtlı ortamda çalıştırır."""
+    def compile_restricted(self, source: str, filename: str) -> types.CodeType | None:
+        """Kaynağı ayrıştırıp izinli import kontrolünden geçirir ve derler."""
         try:
             tree = ast.parse(source, filename=filename)
         except SyntaxError:
@@ -168,12 +194,20 @@ class SandboxExecutor:
                 if node.module and node.module not in self.ALLOWED_MODULES:
                     return None
 
-        # Kısıtlı globals ile compile et
+        try:
+            return compile(tree, filename, "exec")
+        except (SyntaxError, ValueError):
+            return None
+
+    def exec_restricted_code(
+        self, code: types.CodeType, filename: str
+    ) -> types.ModuleType | None:
+        """``compile_restricted`` çıktısını kısıtlı globals ile çalıştırır."""
         restricted_globals = self.create_restricted_globals()
         restricted_locals: dict[str, Any] = {}
 
         try:
-            exec(compile(tree, filename, "exec"), restricted_globals, restricted_locals)
+            exec(code, restricted_globals, restricted_locals)
         except Exception:
             return None
 
@@ -182,6 +216,15 @@ class SandboxExecutor:
             setattr(mod, key, value)
         return mod
 
+    def exec_module_restricted(
+        self, source: str, filename: str
+    ) -> types.ModuleType | None:
+        """Kaynak kodu kısıtlı ortamda çalıştırır."""
+        code = self.compile_restricted(source, filename)
+        if code is None:
+            return None
+        return self.exec_restricted_code(code, filename)
+
 
 class ValidationPipeline:
     """Modül/Plugin doğrulama pipeline'ı.
@@ -192,18 +235,97 @@ class ValidationPipeline:
     3. Sandbox (opsiyonel - güvenilmeyen modüller için)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, verdict_cache: BytecodeCache | None = None) -> None:
         self.signature_validator = SignatureValidator()
         self.sandbox = SandboxExecutor()
+        # Verilirse geçerli sonuçlar içerik özeti + kural sürümüyle diske yazılır;
+        # değişmemiş dosyanın doğrulaması tek bir önbellek okumasına iner.
+        self.verdict_cache = verdict_cache
+
+    @staticmethod
+    def _read_source(file_path: str) -> str | None:
+        try:
+            with open(file_path, encoding="utf-8", errors="ignore") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _cached(
+        self, kind: str, file_path: str, source: str | None, options: tuple[bool, ...]
+    ) -> tuple[ValidationResult | None, str | None, str]:
+        """(önbellekteki sonuç, içerik özeti, önbellek modu)."""
+        mode = f"verdict:{kind}:{VALIDATION_RULES_VERSION}:" + "".join(
+            str(int(flag)) for flag in options
+        )
+        if self.verdict_cache is None or source is None:
+            return None, None, mode
+        content_hash = source_hash(source)
+        entry = self.verdict_cache.load(content_hash, file_path, mode)
+        cached = (
+            ValidationResult.from_verdict(file_path, entry.verdict) if entry else None
+        )
+        return cached, content_hash, mode
+
+    def _remember(
+        self, result: ValidationResult, content_hash: str | None, mode: str
+    ) -> None:
+        # Yalnızca geçerli sonuç saklanır: eksik bağımlılık gibi içerik dışı
+        # hatalar dosya değişmeden de düzelebilir.
+        if self.verdict_cache is not None and content_hash and result.is_valid:
+            self.verdict_cache.store(
+                content_hash, result.file_path, mode, verdict=result.to_verdict()
+            )
 
     def validate_module_file(
-        self, file_path: str, strict_scan: bool = False, sandbox: bool = False
+        self,
+        file_path: str,
+        strict_scan: bool = False,
+        sandbox: bool = False,
+        source: str | None = None,
+    ) -> ValidationResult:
+        """Bir modül dosyasını pipeline'dan geçirir.
+
+        ``source`` verilirse dosya yeniden okunmaz (keşifte okunan kaynak).
+        """
+        if source is None and self.verdict_cache is not None:
+            source = self._read_source(file_path)
+        cached, content_hash, mode = self._cached(
+            "module", file_path, source, (strict_scan, sandbox)
+        )
+        if cached is not None:
+            return cached
+        result = self._validate_module(file_path, source, strict_scan, sandbox)
+        self._remember(result, content_hash, mode)
+        return result
+
+    def validate_plugin_file(
+        self, file_path: str, sandbox: bool = False, source: str | None = None
+    ) -> ValidationResult:
+        """Bir plugin dosyasını pipeline'dan geçirir."""
+        if source is None and self.verdict_cache is not None:
+            source = self._read_source(file_path)
+        cached, content_hash, mode = self._cached(
+            "plugin", file_path, source, (sandbox,)
+        )
+        if cached is not None:
+            return cached
+        result = self._validate_plugin(file_path, source, sandbox)
+        self._remember(result, content_hash, mode)
+        return result
+
+    @staticmethod
+    def _scan(file_path: str, source: str | None, strict: bool) -> ScanResult:
+        if source is None:
+            return scan_file(file_path, strict=strict)
+        return scan_source(source, file_path=file_path, strict=strict)
+
+    def _validate_module(
+        self, file_path: str, source: str | None, strict_scan: bool, sandbox: bool
     ) -> ValidationResult:
-        """Bir modül dosyasını pipeline'dan geçirir."""
         result = ValidationResult(file_path)
 
         # 1. AST Analizi
-        result.scan_result = scan_file(file_path, strict=strict_scan)
+        result.scan_result = self._scan(file_path, source, strict_scan)
         if not result.scan_result.is_safe:
             for pattern, cat, desc, lineno in result.scan_result.dangerous:
                 result.add_error(f"{desc} (satır {lineno})")
@@ -220,8 +342,9 @@ class ValidationPipeline:
                 return result
 
             if sandbox:
-                with open(file_path, encoding="utf-8", errors="ignore") as f:
-                    source = f.read()
+                if source is None:
+                    with open(file_path, encoding="utf-8", errors="ignore") as f:
+                        source = f.read()
                 module = self.sandbox.exec_module_restricted(source, file_path)
                 if module is None:
                     result.add_error("Sandbox çalıştırma başarısız")
@@ -249,14 +372,13 @@ class ValidationPipeline:
             result.add_error(f"Beklenmeyen hata: {e}")
             return result
 
-    def validate_plugin_file(
-        self, file_path: str, sandbox: bool = False
+    def _validate_plugin(
+        self, file_path: str, source: str | None, sandbox: bool
     ) -> ValidationResult:
-        """Bir plugin dosyasını pipeline'dan geçirir."""
         result = ValidationResult(file_path)
 
         # 1. AST Analizi (strict=True - plugin'ler daha sıkı denetlenir)
-        result.scan_result = scan_file(file_path, strict=True)
+        result.scan_result = self._scan(file_path, source, True)
         if not result.scan_result.is_safe:
             for pattern, cat, desc, lineno in result.scan_result.dangerous:
                 result.add_error(f"{desc} (satır {lineno})")
@@ -265,8 +387,9 @@ class ValidationPipeline:
         # 2. Plugin yükle
         try:
             if sandbox:
-                with open(file_path, encoding="utf-8", errors="ignore") as f:
-                    source = f.read()
+                if source is None:
+                    with open(file_path, encoding="utf-8", errors="ignore") as f:
+                        source = f.read()
                 module = self.sandbox.exec_module_restricted(source, file_path)
                 if module is None:
                     result.add_error("Sandbox çalıştırma başarısız")
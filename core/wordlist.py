@@ -0,0 +1,188 @@
+"""Bellek eşlemeli (mmap), akış tabanlı wordlist okuyucu.
+
+Wordlist kullanan modüller (hash_cracker, http_dir_buster, subdomain_finder,
+ssh_brute) listeyi belleğe yüklemek yerine bu sınıf üzerinden sabit bellekle
+satır satır okur. Sağlanan yardımcılar:
+
+- ``Wordlist`` üzerinde iterasyon: kırpılmış, boş olmayan satırlar (str).
+- ``split``: worker süreçleri için satır sınırına hizalı bayt aralıkları.
+- ``iter_lines``: bir aralığı ham bayt olarak okur (alt süreçte de çağrılabilir).
+- ``estimate_lines``: ilerleme çubukları için örneklemeye dayalı satır tahmini.
+- ``dedup=True``: ilk görülme sırasını koruyarak disk üzerinde tekilleştirme.
+"""
+
+import hashlib
+import heapq
+import mmap
+import os
+import shutil
+import tempfile
+from collections.abc import Generator, Iterator
+from contextlib import ExitStack
+
+# Satır tahmini için okunacak örnek boyutu
+ESTIMATE_SAMPLE_BYTES = 1024 * 1024
+
+# Tekilleştirmede bellekte tek seferde işlenecek kova boyutu. Kovadaki her
+# tekil satır görülenler kümesinde ~100 bayt tuttuğundan kısa satırlı
+# listelerde satır sayısı, uzun satırlılarda bayt boyutu sınırlayıcıdır.
+DEDUP_BUCKET_BYTES = 64 * 1024 * 1024
+DEDUP_BUCKET_LINES = 1_000_000
+
+
+def iter_lines(path: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+    """``[start, end)`` aralığında başlayan satırları ham bayt olarak üretir.
+
+    Satırlar kırpılır ve boş satırlar atlanır. ``split`` ile üretilen
+    aralıklar satır sınırına hizalı olduğundan hiçbir satır iki aralığa
+    birden düşmez.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        end = size if end is None else min(end, size)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            while pos < end:
+                newline = mm.find(b"\n", pos)
+                if newline == -1:
+                    newline = size
+                word = mm[pos:newline].strip()
+                if word:
+                    yield word
+                pos = newline + 1
+
+
+class Wordlist:
+    """Sabit bellekle okunan wordlist.
+
+    ``dedup=True`` verilirse kaynak dosyanın tekilleştirilmiş bir kopyası
+    geçici dizinde oluşturulur; ``close()`` (veya ``with`` bloğundan çıkış)
+    bu kopyayı siler.
+
+    Args:
+        path: Wordlist dosya yolu.
+        dedup: Tekrarlanan satırları disk üzerinde ayıkla.
+        encoding: ``str`` iterasyonunda kullanılacak kodlama.
+    """
+
+    def __init__(self, path: str, dedup: bool = False, encoding: str = "utf-8"):
+        if not os.path.isfile(path):
+            raise FileNotFoundError(path)
+        self.source_path = path
+        self.encoding = encoding
+        self._tmp_dir: str | None = None
+        self.path = path
+        if dedup:
+            self._tmp_dir = tempfile.mkdtemp(prefix="mah_wordlist_")
+            self.path = self._deduplicate(os.path.join(self._tmp_dir, "wordlist.txt"))
+
+    def __enter__(self) -> "Wordlist":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Tekilleştirme için oluşturulan geçici dosyaları siler."""
+        if self._tmp_dir:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    def __iter__(self) -> Iterator[str]:
+        for word in iter_lines(self.path):
+            yield word.decode(self.encoding, errors="ignore")
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        return iter_lines(self.path)
+
+    def split(self, chunk_bytes: int) -> Generator[tuple[int, int], None, None]:
+        """Dosyayı yaklaşık ``chunk_bytes`` boyutlu, satır sınırına hizalı aralıklara böler."""
+        size = self.size
+        if size == 0:
+            return
+        chunk_bytes = max(1, int(chunk_bytes))
+        with (
+            open(self.path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            start = 0
+            while start < size:
+                boundary = min(start + chunk_bytes, size)
+                if boundary < size:
+                    newline = mm.find(b"\n", boundary - 1)
+                    boundary = size if newline == -1 else newline + 1
+                yield start, boundary
+                start = boundary
+
+    def estimate_lines(self, sample_bytes: int = ESTIMATE_SAMPLE_BYTES) -> int:
+        """Satır sayısını dosyanın başından alınan örnekle tahmin eder.
+
+        Dosya örnekten küçükse sonuç kesindir (boş satırlar dahil).
+        """
+        size = self.size
+        if size == 0:
+            return 0
+        with open(self.path, "rb") as f:
+            sample = f.read(sample_bytes)
+        lines = sample.count(b"\n")
+        if len(sample) >= size:
+            return lines + (0 if sample.endswith(b"\n") else 1)
+        return max(1, round(size * lines / len(sample)))
+
+    def _dedup_buckets(self) -> int:
+        """Kova sayısı: her kova hem bayt hem (tahmini) satır sınırının altında kalır."""
+        by_bytes = -(-self.size // DEDUP_BUCKET_BYTES)
+        by_lines = -(-self.estimate_lines() // DEDUP_BUCKET_LINES)
+        return max(1, by_bytes, by_lines)
+
+    def _deduplicate(self, out_path: str) -> str:
+        """İlk görülme sırasını koruyarak tekrarlanan satırları ayıklar.
+
+        Satırlar hash'lerine göre kovalara ofset sırasıyla dağıtılır; her kova
+        akış halinde okunup yalnızca ilk görülen satırlar yazılır (sıralama
+        gerekmez) ve kovalar ofset sırasıyla birleştirilir. Bellekte aynı anda
+        yalnızca tek kovanın tekil satır kümesi tutulur.
+        """
+        buckets = self._dedup_buckets()
+        bucket_dir = os.path.dirname(out_path)
+        bucket_paths = [os.path.join(bucket_dir, f"bucket_{i}") for i in range(buckets)]
+
+        # 1) Satırları "<ofset> <satır>" biçiminde kovalara dağıt
+        with ExitStack() as stack:
+            writers = [stack.enter_context(open(p, "wb")) for p in bucket_paths]
+            for offset, word in enumerate(iter_lines(self.source_path)):
+                index = 0
+                if buckets > 1:
+                    digest = hashlib.blake2b(word, digest_size=8).digest()
+                    index = int.from_bytes(digest, "big") % buckets
+                writers[index].write(b"%016x %s\n" % (offset, word))
+
+        # 2) Her kovada yalnızca ilk görülen satırları tut (kayıtlar zaten ofset sıralı)
+        for bucket_path in bucket_paths:
+            seen: set[bytes] = set()
+            with (
+                open(bucket_path, "rb") as src,
+                open(bucket_path + ".tmp", "wb") as dst,
+            ):
+                for record in src:
+                    word = record[17:]
+                    if word not in seen:
+                        seen.add(word)
+                        dst.write(record)
+            os.replace(bucket_path + ".tmp", bucket_path)
+
+        # 3) Kovaları ofset sırasıyla birleştir
+        with ExitStack() as stack:
+            readers = [stack.enter_context(open(p, "rb")) for p in bucket_paths]
+            with open(out_path, "wb") as out:
+                for record in heapq.merge(*readers):
+                    out.write(record[17:])
+        for bucket_path in bucket_paths:
+            os.remove(bucket_path)
+        return out_path
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -145,6 +146,58 @@ class WorkspaceManager:
             )
         return out
 
+    def iter_ports_loot(self) -> Iterator[tuple[str, list[int]]]:
+        """hosts/*/ports.json dosyalarından (host, açık portlar) üretir.
+
+        Dosyalar tek tek okunur; bozuk veya okunamayan loot atlanır.
+        """
+        base = self.get_active_path()
+        if base is None:
+            return
+        for ports_file in sorted((base / "hosts").glob("*/ports.json")):
+            try:
+                data = json.loads(ports_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            host = data.get("host") or ports_file.parent.name
+            open_ports = [int(p) for p in data.get("open_ports", [])]
+            if open_ports:
+                yield host, open_ports
+
+    def write_services_loot(
+        self,
+        host: str,
+        services: list[dict[str, Any]],
+        extra: dict[str, Any] | None = None,
+    ) -> Path | None:
+        """hosts/<ip>/services.json yazar; aktif workspace yoksa None.
+
+        Aynı portun önceki sonucu yenisiyle değiştirilir, diğer portlar korunur.
+        """
+        host_dir = self.get_host_dir(host, ensure=True)
+        if host_dir is None:
+            return None
+        out = host_dir / "services.json"
+        merged: dict[int, dict[str, Any]] = {}
+        if out.is_file():
+            try:
+                previous = json.loads(out.read_text(encoding="utf-8"))
+                merged = {int(s["port"]): s for s in previous.get("services", [])}
+            except (OSError, ValueError, KeyError, TypeError):
+                merged = {}
+        for service in services:
+            merged[int(service["port"])] = service
+        payload: dict[str, Any] = {
+            "host": host,
+            "services": [merged[port] for port in sorted(merged)],
+        }
+        if extra:
+            payload.update(extra)
+        out.write_text(
+            json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        return out
+
     def resolve_save_path(
         self, filename: str, category: str = "loot"
     ) -> Path:
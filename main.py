@@ -1,24 +1,20 @@
-import math
 import random
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from rich import print as rprint
-from rich.console import Console
-
-from core import logger
-from core.banner import print_banner
-from core.command_manager import CommandManager
-from core.console import Console as AppConsole
-from core.context import AppContext, get_global_context
-from core.hooks import HookType
-from core.module_downloader import ModuleDownloader
-from core.module_manager import ModuleManager
-from core.plugin_manager import PluginManager
-from core.repo_manager import RepoManager
-from core.service_container import ServiceContainer, get_container
-from core.session_manager import SessionManager
-from core.shared_state import shared_state
-from core.workspace_manager import WorkspaceManager
+from core.cont import AUDIT_LOG_FILE, PREWARM_MEMORY_BUDGET_MB
+from core.startup import BackgroundTask, StartupTimer
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from core.command_manager import CommandManager
+    from core.module_manager import ModuleManager
+
+# Açılış ölçümünün başlangıcı. rich, pyfiglet, prompt_toolkit ve yöneticiler
+# main() içinde içe aktarılır; import maliyetleri de raporda görünür.
+_STARTED = time.perf_counter()
 
 
 def _get_cached_framework_version(base_dir: Path) -> str:
@@ -54,120 +50,29 @@ def _get_cached_framework_version(base_dir: Path) -> str:
         return ""
 
 
-# ==============================================================================
-#  GRADIENT BANNER YARDIMCI FONKSİYONLARI (%20 İhtimalle Devreye Girer)
-# ==============================================================================
-def rgb_to_ansi_fg(r: int, g: int, b: int) -> str:
-    return f"\033[38;2;{r};{g};{b}m"
-
-
-def hsl_to_rgb(h: float, s: float, lightness: float) -> tuple[int, int, int]:
-    h = h % 360
-    c = (1 - abs(2 * lightness - 1)) * s
-    x = c * (1 - abs((h / 60) % 2 - 1))
-    m = lightness - c / 2
-    r1: float
-    g1: float
-    b1: float
-    if h < 60:
-        r1, g1, b1 = c, x, 0
-    elif h < 120:
-        r1, g1, b1 = x, c, 0
-    elif h < 180:
-        r1, g1, b1 = 0, c, x
-    elif h < 240:
-        r1, g1, b1 = 0, x, c
-    elif h < 300:
-        r1, g1, b1 = x, 0, c
-    else:
-        r1, g1, b1 = c, 0, x
-    return (int((r1 + m) * 255), int((g1 + m) * 255), int((b1 + m) * 255))
-
-
-def interpolate_color(
-    color1: tuple[int, int, int], color2: tuple[int, int, int], t: float
-) -> tuple[int, int, int]:
-    t = max(0.0, min(1.0, t))
-    return (
-        int(color1[0] + (color2[0] - color1[0]) * t),
-        int(color1[1] + (color2[1] - color1[1]) * t),
-        int(color1[2] + (color2[2] - color1[2]) * t),
-    )
-
-
-def apply_two_color_lolcat(
-    lines: list[str], color1: tuple[int, int, int], color2: tuple[int, int, int]
-) -> str:
-    if not lines:
-        return ""
-    result = []
-    phase = random.random() * math.pi * 2
-    for row_idx, line in enumerate(lines):
-        colored_line = ""
-        for col_idx, ch in enumerate(line):
-            wave = math.sin(col_idx * 0.08 + row_idx * 0.4 + phase)
-            t = (wave + 1) / 2
-            r, g, b = interpolate_color(color1, color2, t)
-            colored_line += rgb_to_ansi_fg(r, g, b) + ch
-        colored_line += "\033[0m"
-        result.append(colored_line)
-    return "\n".join(result)
-
-
-def print_inline_gradient_banner() -> bool:
-    try:
-        import pyfiglet
-    except ImportError:
-        return False
-
-    curated_fonts = [
-        "slant",
-        "standard",
-        "doom",
-        "big",
-        "small",
-        "cybermedium",
-        "smslant",
-        "block",
-        "digital",
-        "shadow",
-        "speed",
-        "lean",
-        "mini",
-        "script",
-        "ivrit",
-        "computer",
-    ]
-    font = random.choice(curated_fonts)
-
-    try:
-        ascii_art = pyfiglet.figlet_format("Mah", font=font)
-    except Exception:
-        ascii_art = pyfiglet.figlet_format("Mah", font="slant")
-
-    lines = ascii_art.rstrip("\n").split("\n")
-
-    # İki kontrast rastgele renk oluştur
-    h1 = random.randint(0, 359)
-    color1 = hsl_to_rgb(h1, random.uniform(0.7, 1.0), random.uniform(0.45, 0.65))
-    color2 = hsl_to_rgb(
-        (h1 + random.randint(60, 180)) % 360,
-        random.uniform(0.7, 1.0),
-        random.uniform(0.45, 0.65),
-    )
+def _prepare_banner(base_dir: Path) -> tuple[Any, str]:
+    """Banner'ı ve sürüm bilgisini hazırlar (açılışta arka plan thread'inde).
 
-    output = apply_two_color_lolcat(lines, color1, color2)
-    print(output)
-    return True
+    pyfiglet yazı tipinin yüklenmesi ve ``git rev-list`` çağrısı komut, plugin
+    ve modül katalogları indekslenirken yapılır; ana thread yalnızca yazdırır.
 
+    Returns:
+        tuple: (%20 ihtimalle gradient ANSI metni, değilse rich Text, sürüm)
+    """
+    from core.banner import render_banner, render_gradient_banner
 
-# ==============================================================================
+    if random.random() < 0.20:
+        banner: Any = render_gradient_banner()
+    else:
+        banner = render_banner()
+    return banner, _get_cached_framework_version(base_dir)
 
 
 def print_startup_info(
-    command_manager: CommandManager,
-    module_manager: ModuleManager,
+    command_manager: "CommandManager",
+    module_manager: "ModuleManager",
     plugin_count: int = 0,
+    banner_task: BackgroundTask | None = None,
 ) -> None:
     """Startup bilgisi basmaya yarıyan fonksiyon (Metasploit tarzı).
 
@@ -175,33 +80,39 @@ def print_startup_info(
         command_manager (CommandManager): Komut yöneticisi
         module_manager (ModuleManager): Modül yöneticisi.
         plugin_count (int): Yüklü plugin sayısı.
+        banner_task (BackgroundTask | None): ``_prepare_banner`` işi; verilmezse
+            banner burada hazırlanır.
     """
     from rich.console import Console
 
     console = Console()
+    base_dir = Path(__file__).parent
 
     # Banner'ı bas ( %20 ihtimalle gradient, değilse normal banner )
+    version = ""
     try:
-        if random.random() < 0.20:
-            success = print_inline_gradient_banner()
-            if not success:  # Eğer pyfiglet vs yoksa normal bannera düş
-                print_banner()
+        if banner_task is not None:
+            banner, version = banner_task.result()
         else:
-            print_banner()
+            banner, version = _prepare_banner(base_dir)
+        if isinstance(banner, str):
+            print(banner)
+        else:
+            console.print(banner)
     except Exception as e:
         print(f"Banner basılırken hata oluştu: {e}")
         print("Mah Framework")
 
     # İstatistikleri topla
     total_commands = len(command_manager.get_all_commands())
-    categorized_modules = module_manager.get_modules_by_category()
+    # Katalog indeksinden sayılır; modül stub'ları oluşturulmaz
+    module_counts = module_manager.count_by_category()
 
     # Tüm kategorileri ve sayılarını dinamik olarak al
     category_counts: dict[str, int] = {}
     total_modules = 0
 
-    for category, modules in categorized_modules.items():
-        count = len(modules)
+    for category, count in module_counts.items():
         total_modules += count
         # Kategori adını düzelt - alt kategorileri birleştir (auxiliary/scanner → auxiliary)
         top_level_category = category.split("/")[0] if "/" in category else category
@@ -213,7 +124,6 @@ def print_startup_info(
         else:
             category_counts[display_name] = count
 
-    version = _get_cached_framework_version(Path(__file__).parent)
     if version:
         version_line = (
             f"[dim]       =[[/dim] [bold cyan]Mah Framework[/bold cyan] "
@@ -280,7 +190,7 @@ def print_startup_info(
     _show_update_reminder(console)
 
 
-def _show_update_reminder(console: Console) -> None:
+def _show_update_reminder(console: "Console") -> None:
     """7 günde bir güncelleme hatırlatıcısı gösterir.
 
     Son hatırlatma tarihini config/last_update_reminder.txt dosyasında saklar.
@@ -321,6 +231,8 @@ def main() -> None:
     """Main fonksiyon, objeler tanımlanıyor ve sistem başlatılıyor."""
     import argparse
 
+    timer = StartupTimer(started=_STARTED)
+
     # Argüman ayrıştırıcı
     parser = argparse.ArgumentParser(
         description="Mah Framework - Modüler Güvenlik Aracı"
@@ -345,16 +257,66 @@ def main() -> None:
         metavar="KOMUTLAR",
         help="Başlangıçta çalıştırılacak komutlar (noktalı virgül ile ayır)",
     )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        action="store_true",
+        help="-r/-x çalıştıktan sonra çık; banner ve etkileşimli konsol yüklenmez",
+    )
+    parser.add_argument(
+        "--no-prewarm",
+        action="store_true",
+        help="Sık kullanılan modülleri arka planda önceden yükleme",
+    )
+    parser.add_argument(
+        "--prewarm-budget",
+        type=float,
+        default=PREWARM_MEMORY_BUDGET_MB,
+        metavar="MB",
+        help=f"Ön yükleme bellek bütçesi (varsayılan: {PREWARM_MEMORY_BUDGET_MB} MB)",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Açılış aşamalarının sürelerini bütçeyle birlikte göster",
+    )
     args = parser.parse_args()
+    if args.batch and not (args.resource or args.execute):
+        parser.error("--batch yalnızca -r veya -x ile birlikte kullanılabilir")
 
     # Base directory determination for absolute paths
     base_dir = Path(__file__).parent.resolve()
 
+    # Banner ve sürüm bilgisi kataloglar indekslenirken arka planda hazırlanır
+    show_banner = not (args.quiet or args.batch)
+    banner_task = (
+        BackgroundTask(_prepare_banner, base_dir, name="startup-banner")
+        if show_banner
+        else None
+    )
+
+    from rich import print as rprint
+
+    from core import logger
+    from core.command_manager import CommandManager
+    from core.context import AppContext, get_global_context
+    from core.hooks import HookType
+    from core.module_downloader import ModuleDownloader
+    from core.module_manager import ModuleManager
+    from core.plugin_downloader import PluginDownloader
+    from core.plugin_manager import PluginManager
+    from core.repo_manager import RepoManager
+    from core.service_container import get_container
+    from core.session_manager import SessionManager
+    from core.workspace_manager import WorkspaceManager
+
+    timer.mark("import")
+
     # Logger'ı başlat
     logger.setup_logger()
     logger.info("Uygulama başlatılıyor...")
 
-    if not args.quiet:
+    if show_banner:
         print("Uygulama başlatılıyor...")
 
     # -- Service Container & AppContext (DI) --
@@ -390,8 +352,6 @@ def main() -> None:
     container.register(WorkspaceManager, workspace_manager)
 
     # Repo / downloader'ları lazy singleton olarak kaydet (ilk kullanımda oluşur)
-    from core.plugin_downloader import PluginDownloader
-
     container.register_singleton(RepoManager, RepoManager)
     container.register_singleton(
         ModuleDownloader,
@@ -401,52 +361,91 @@ def main() -> None:
         PluginDownloader,
         lambda: PluginDownloader(plugins_dir=str(base_dir / "plugins")),
     )
+    timer.mark("setup")
 
     command_manager.load_commands()
+    timer.mark("commands")
 
     # Plugin'leri modüllerden önce yükle (PRE/POST_MODULE_LOAD hook'ları açılsın)
     plugin_manager = PluginManager(plugins_dir=str(base_dir / "plugins"))
     plugin_manager.load_plugins()
     app_context.plugin_manager = plugin_manager
     module_manager.plugin_manager = plugin_manager
+    timer.mark("plugins")
 
     module_manager.load_modules()
+    timer.mark("modules")
 
-    console = AppConsole(command_manager, module_manager, context=app_context)
-    app_context.console_instance = console
+    # Toplu modda prompt_toolkit ve etkileşimli konsol hiç yüklenmez
+    console = None
+    if not args.batch:
+        from core.console import Console as AppConsole
+
+        console = AppConsole(command_manager, module_manager, context=app_context)
+        app_context.console_instance = console
+        timer.mark("console")
 
     # Sessiz mod değilse banner ve bilgi göster
-    if not args.quiet:
+    if banner_task is not None:
         plugin_count = len(plugin_manager.get_all_plugins())
-        print_startup_info(command_manager, module_manager, plugin_count)
+        print_startup_info(command_manager, module_manager, plugin_count, banner_task)
+        timer.mark("banner")
 
     # ON_STARTUP hook'unu tetikle
     plugin_manager.trigger_hook(HookType.ON_STARTUP)
+    timer.mark("hooks")
 
-    # Resource dosyası belirtildiyse çalıştır
-    if args.resource:
-        resource_path = Path(args.resource)
-        if resource_path.exists():
-            resource_cmd = command_manager.get_all_commands().get("resource")
-            if resource_cmd:
-                resource_cmd.run_resource_file(resource_path)  # type: ignore[attr-defined]
-            else:
-                print("[bold red]Hata:[/bold red] resource komutu bulunamadı")
-        else:
-            print(
-                f"[bold red]Hata:[/bold red] Resource dosyası bulunamadı: {args.resource}"
-            )
+    if timer.within_budget:
+        logger.info(timer.summary())
+    else:
+        logger.warning(f"Açılış bütçesi aşıldı - {timer.summary()}")
+    if args.startup_report:
+        timer.print_report()
 
-    # -x ile komut belirtildiyse çalıştır (tek dispatcher: hook/log/alias/makro)
-    if args.execute:
-        rprint("\n[bold cyan]⚡ Komutlar çalıştırılıyor...[/bold cyan]\n")
-        for cmd_line in args.execute.split(";"):
-            cmd_line = cmd_line.strip()
-            if not cmd_line:
-                continue
-            rprint(f"[bold yellow]>[/bold yellow] {cmd_line}")
-            command_manager.execute_command(cmd_line)
-        print()
+    try:
+        # Resource dosyası belirtildiyse çalıştır
+        if args.resource:
+            resource_path = Path(args.resource)
+            if resource_path.exists():
+                resource_cmd = command_manager.get_all_commands().get("resource")
+                if resource_cmd:
+                    resource_cmd.run_resource_file(resource_path)  # type: ignore[attr-defined]
+                else:
+                    print("[bold red]Hata:[/bold red] resource komutu bulunamadı")
+            else:
+                print(
+                    f"[bold red]Hata:[/bold red] Resource dosyası bulunamadı: {args.resource}"
+                )
+
+        # -x ile komut belirtildiyse çalıştır (tek dispatcher: hook/log/alias/makro)
+        if args.execute:
+            if not args.batch:
+                rprint("\n[bold cyan]⚡ Komutlar çalıştırılıyor...[/bold cyan]\n")
+            for cmd_line in args.execute.split(";"):
+                cmd_line = cmd_line.strip()
+                if not cmd_line:
+                    continue
+                if not args.batch:
+                    rprint(f"[bold yellow]>[/bold yellow] {cmd_line}")
+                command_manager.execute_command(cmd_line)
+            if not args.batch:
+                print()
+    finally:
+        if console is None:
+            # Toplu mod: konsolun kapanış adımları (hook, oturumlar, hook kuyruğu)
+            plugin_manager.trigger_hook(HookType.ON_SHUTDOWN)
+            session_manager.shutdown_all()
+            plugin_manager.shutdown_hooks()
+            logger.info("Toplu çalıştırma tamamlandı")
+
+    if console is None:
+        return
+
+    # Konsol boştayken sık kullanılan modülleri arka planda yükle
+    if not args.no_prewarm:
+        console.start_prewarm(
+            audit_log=AUDIT_LOG_FILE, memory_budget_mb=args.prewarm_budget
+        )
 
     logger.info("Uygulama başlatıldı")
     try:
@@ -1,8 +1,9 @@
 import logging
-import socket
 
 from rich import print
+from rich.markup import escape
 
+from core.fingerprint import FingerprintEngine
 from core.module import BaseModule
 from core.option import Option
 
@@ -45,56 +46,44 @@ class BannerGrabber(BaseModule):
         """
         target_host = options.get("RHOST")
         target_port = int(options.get("RPORT"))
-        timeout = int(options.get("TIMEOUT"))
+        timeout = float(options.get("TIMEOUT"))
 
         print(
             f"[bold blue][*][/bold blue] Hedef: {target_host}:{target_port} üzerinde banner aranıyor..."
         )
 
+        # Sunucu önce konuşmazsa (HTTP vb.) porta uygun probe'lar da denenir
+        engine = FingerprintEngine(window=1, timeout=timeout, read_timeout=timeout)
         try:
-            # Socket oluştur
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(timeout)
-
-            # Bağlan
-            connect_result = s.connect_ex((target_host, target_port))
-
-            if connect_result == 0:
-                print(
-                    f"[bold green][+][/bold green] Port {target_port} açık. Veri bekleniyor..."
-                )
-
-                # HTTP servisleri bazen istek bekler, ancak saf banner grabber önce okumayı dener.
-                # Eğer okuma boş dönerse belki bir HTTP isteği atmayı deneyebiliriz ama
-                # şimdilik temel TCP banner grabbing yapıyoruz (SSH, FTP, SMTP vb. için ideal).
-                try:
-                    banner = s.recv(1024)
-                    if banner:
-                        banner_str = banner.decode("utf-8", errors="ignore").strip()
-                        print("[bold green][SUCCESS][/bold green] Banner Yakalandı!")
-                        print(
-                            f"[bold white on blue] BANNER [/bold white on blue] {banner_str}"
-                        )
-                        return True
-                    else:
-                        print(
-                            "[yellow][!][/yellow] Bağlantı sağlandı ancak sunucu herhangi bir veri göndermedi (Empty Response)."
-                        )
-                        return False
-                except TimeoutError:
-                    print(
-                        "[yellow][!][/yellow] Bağlantı başarılı ama veri okuma zaman aşımına uğradı."
-                    )
-                    return False
-            else:
-                print(
-                    f"[bold red][-][/bold red] Port {target_port} kapalı veya ulaşılamaz."
-                )
-                return False
-
-            s.close()
-
+            result = engine.run_many([(target_host, target_port)])[0]
         except Exception as e:
             print(f"[bold red][!][/bold red] Hata oluştu: {e}")
             logging.error(f"Banner grabber hatasi: {e}")
             return False
+
+        if result.error:
+            print(
+                f"[bold red][-][/bold red] Port {target_port} kapalı veya ulaşılamaz."
+            )
+            return False
+
+        print(
+            f"[bold green][+][/bold green] Port {target_port} açık. Veri bekleniyor..."
+        )
+        if not result.banner:
+            print(
+                "[yellow][!][/yellow] Bağlantı sağlandı ancak sunucu herhangi bir veri göndermedi (Empty Response)."
+            )
+            return False
+
+        print("[bold green][SUCCESS][/bold green] Banner Yakalandı!")
+        print(
+            f"[bold white on blue] BANNER [/bold white on blue] {escape(result.banner)}"
+        )
+        if result.identified:
+            label = " ".join(p for p in (result.product, result.version) if p)
+            print(
+                f"[bold green][+][/bold green] Servis: {result.service} {escape(label)}"
+                + (f" (probe: {result.probe})" if result.probe != "NULL" else "")
+            )
+        return True
@@ -10,21 +10,43 @@
 #   2. set FILE /path/to/image.jpg
 #   3. run
 #
+# Toplu mod: FILE bir dizin veya glob deseni ise dosyalar süreç havuzunda
+# temizlenir; OUTPUT verilirse çıktı dizini olarak kullanılır (alt ağaç
+# korunur). Sonuçlar aktif workspace loot'una JSONL/CSV olarak yazılır.
+#
 # Desteklenen Formatlar:
 #   JPEG, PNG, TIFF, BMP, GIF, WebP
 #
 # =============================================================================
 
+import functools
 import os
 import shutil
+from pathlib import Path
 from typing import Any
 
 from rich import print
+from rich.progress import Progress
 from rich.table import Table
 
 from core import logger
+from core.image_metadata import MetadataFormatError, detect_format, strip_metadata
+from core.metadata_batch import (
+    CLEAN_FIELDS,
+    SAVE_FORMATS,
+    ResultWriter,
+    checkpoint_name,
+    clean_files,
+    is_pattern,
+    iter_image_files,
+    pattern_root,
+    reencode_without_metadata,
+    run_batch,
+    skip_done,
+)
 from core.module import BaseModule
 from core.option import Option
+from core.workspace_manager import get_workspace_manager
 
 try:
     from PIL import Image
@@ -72,6 +94,8 @@ class MetadataCleaner(BaseModule):
         ".webp",
     }
 
+    FORMAT_MAP = SAVE_FORMATS
+
     def __init__(self):
         """Modül başlatıcı."""
         super().__init__()
@@ -81,7 +105,7 @@ class MetadataCleaner(BaseModule):
                 name="FILE",
                 value="",
                 required=True,
-                description="Hedef görsel dosya yolu",
+                description="Hedef görsel dosya yolu, dizin veya glob deseni (toplu mod)",
                 completion_dir=".",
                 completion_extensions=[
                     ".jpg",
@@ -98,7 +122,7 @@ class MetadataCleaner(BaseModule):
                 name="OUTPUT",
                 value="",
                 required=False,
-                description="Çıktı dosya yolu (boşsa üzerine yazar)",
+                description="Çıktı dosya yolu; toplu modda çıktı dizini (boşsa üzerine yazar)",
                 completion_dir=".",
             ),
             "BACKUP": Option(
@@ -108,6 +132,33 @@ class MetadataCleaner(BaseModule):
                 description="Orijinal dosyanın yedeğini al (true/false)",
                 choices=["true", "false"],
             ),
+            "RECURSIVE": Option(
+                name="RECURSIVE",
+                value="true",
+                required=False,
+                description="Toplu modda alt dizinlere de in (true/false)",
+                choices=["true", "false"],
+            ),
+            "WORKERS": Option(
+                name="WORKERS",
+                value=0,
+                required=False,
+                description="Toplu modda süreç sayısı (0: tüm çekirdekler, 1: tek süreç)",
+            ),
+            "OUTPUT_FORMAT": Option(
+                name="OUTPUT_FORMAT",
+                value="jsonl",
+                required=False,
+                description="Toplu mod sonuç dosyası biçimi",
+                choices=["jsonl", "csv"],
+            ),
+            "RESUME": Option(
+                name="RESUME",
+                value="true",
+                required=False,
+                description="Toplu modda önceki sonuç dosyasından kaldığı yerden devam et",
+                choices=["true", "false"],
+            ),
         }
 
         for option_name, option_obj in self.Options.items():
@@ -202,50 +253,38 @@ class MetadataCleaner(BaseModule):
 
         return summary
 
-    def _clean_metadata(self, file_path: str, output_path: str) -> bool:
+    def _clean_metadata(self, file_path: str, output_path: str) -> str:
         """Dosyadan metadata'yı temizler.
 
+        Kaynak ve çıktı aynı formattaysa (JPEG, PNG, WebP) metadata
+        segmentleri bayt akışından çıkarılır; pikseller çözülmez ve görüntü
+        yeniden kodlanmaz. Diğer durumlarda Pillow ile yeniden kaydedilir.
+
         Args:
             file_path: Kaynak dosya yolu
             output_path: Çıktı dosya yolu
 
         Returns:
-            bool: Başarılı ise True
+            Kullanılan yöntemin açıklaması
         """
-        img = Image.open(file_path)
-
-        # Yeni bir görüntü oluştur (metadata olmadan)
-        clean_img = Image.new(img.mode, img.size)
-        clean_img.putdata(list(img.getdata()))
-
-        # Format belirleme
+        source_format = detect_format(file_path)
         ext = os.path.splitext(output_path)[1].lower()
-        save_format = img.format or "JPEG"
-
-        format_map = {
-            ".jpg": "JPEG",
-            ".jpeg": "JPEG",
-            ".png": "PNG",
-            ".tiff": "TIFF",
-            ".tif": "TIFF",
-            ".bmp": "BMP",
-            ".gif": "GIF",
-            ".webp": "WEBP",
-        }
-        save_format = format_map.get(ext, save_format)
-
-        # Kaydet (exif parametresi olmadan)
-        save_kwargs = {}
-        if save_format == "JPEG":
-            save_kwargs["quality"] = 95
-        elif save_format == "PNG":
-            save_kwargs["optimize"] = True
-
-        clean_img.save(output_path, format=save_format, **save_kwargs)
-
-        img.close()
-        clean_img.close()
-        return True
+        if source_format and self.FORMAT_MAP.get(ext, source_format) == source_format:
+            try:
+                result = strip_metadata(file_path, output_path)
+            except MetadataFormatError as e:
+                # Standart dışı yapı: yeniden kodlamaya düş
+                logger.warning(f"Segment temizliği yapılamadı ({file_path}): {e}")
+            else:
+                if result is not None:
+                    return f"Segment (kayıpsız, {len(result.removed)} segment)"
+
+        self._reencode(file_path, output_path)
+        return "Yeniden kodlama (Pillow)"
+
+    def _reencode(self, file_path: str, output_path: str) -> None:
+        """Pikselleri metadata'sız yeni bir görüntüye kopyalayıp kaydeder."""
+        reencode_without_metadata(file_path, output_path)
 
     def run(self, options: dict[str, Any]) -> bool:
         """Modülün ana çalıştırma metodu.
@@ -268,6 +307,9 @@ class MetadataCleaner(BaseModule):
             print("[bold red]Hata:[/bold red] FILE parametresi boş olamaz!")
             return False
 
+        if os.path.isdir(file_path) or is_pattern(file_path):
+            return self._run_batch(file_path, options)
+
         if not os.path.isfile(file_path):
             print(f"[bold red]Hata:[/bold red] Dosya bulunamadı: {file_path}")
             return False
@@ -326,11 +368,16 @@ class MetadataCleaner(BaseModule):
             # --- Yedek Al ---
             if backup and output_path == file_path:
                 backup_path = file_path + ".backup"
-                shutil.copy2(file_path, backup_path)
-                print(f"\n[bold green]✓[/bold green] Yedek oluşturuldu: {backup_path}")
+                if os.path.exists(backup_path):
+                    print(f"\n[dim]Mevcut yedek korunuyor:[/dim] {backup_path}")
+                else:
+                    shutil.copy2(file_path, backup_path)
+                    print(
+                        f"\n[bold green]✓[/bold green] Yedek oluşturuldu: {backup_path}"
+                    )
 
             # --- Temizleme İşlemi ---
-            self._clean_metadata(file_path, output_path)
+            method = self._clean_metadata(file_path, output_path)
 
             # --- Temizleme Sonrası Analiz ---
             after = self._get_metadata_summary(output_path)
@@ -360,6 +407,7 @@ class MetadataCleaner(BaseModule):
                 "✅ Var" if before["has_datetime"] else "❌ Yok",
                 "✅ Var" if after["has_datetime"] else "❌ Yok",
             )
+            after_table.add_row("Yöntem", "", method)
             after_table.add_row(
                 "Dosya Boyutu",
                 f"{before['file_size']:,} byte",
@@ -396,3 +444,80 @@ class MetadataCleaner(BaseModule):
             )
             logger.exception(f"Metadata temizleme hatası: {file_path}")
             return False
+
+    def _run_batch(self, target: str, options: dict[str, Any]) -> bool:
+        """Dizin/glob hedefindeki tüm görüntüleri süreç havuzunda temizler.
+
+        Args:
+            target: Dizin yolu veya glob deseni
+            options: Kullanıcının ayarladığı seçenekler
+
+        Returns:
+            bool: Hatasız tamamlandıysa True
+        """
+        output_dir = options.get("OUTPUT", "") or ""
+        backup = str(options.get("BACKUP", "true")).lower() == "true"
+        recursive = str(options.get("RECURSIVE", "true")).lower() == "true"
+        resume = str(options.get("RESUME", "true")).lower() == "true"
+        fmt = str(options.get("OUTPUT_FORMAT") or "jsonl").lower()
+        workers = int(options.get("WORKERS") or 0)
+
+        name = checkpoint_name("metadata_cleaner", target, fmt)
+        wm = get_workspace_manager()
+        report = wm.resolve_save_path(name, "loot") if wm else Path.cwd() / name
+
+        try:
+            writer = ResultWriter(str(report), CLEAN_FIELDS, fmt=fmt, resume=resume)
+        except ValueError as e:
+            print(f"[bold red]Hata:[/bold red] {e}")
+            return False
+
+        print("\n[bold cyan]🧹 Metadata Cleaner (toplu mod)[/bold cyan]\n")
+        print(f"[dim]Hedef:[/dim] {target}")
+        print(f"[dim]Çıktı:[/dim] {output_dir or 'yerinde (üzerine yazar)'}")
+        print(f"[dim]Rapor:[/dim] {report}")
+        if writer.done:
+            print(
+                f"[dim]Devam:[/dim] {len(writer.done)} dosya zaten işlenmiş, atlanacak"
+            )
+
+        worker = functools.partial(
+            clean_files,
+            root=pattern_root(target),
+            output_dir=output_dir,
+            backup=backup and not output_dir,
+        )
+        counts = {"files": 0, "errors": 0, "segment": 0, "bytes": 0}
+        with writer, Progress() as progress:
+            task = progress.add_task("Temizleniyor...", total=None)
+
+            def on_result(record):
+                writer.write(record)
+                counts["files"] += 1
+                if record["error"]:
+                    counts["errors"] += 1
+                else:
+                    counts["segment"] += record["method"] == "segment"
+                    counts["bytes"] += int(record["bytes_removed"] or 0)
+                progress.advance(task)
+
+            # Çıktı dizini hedefin içindeyse temizlenen kopyalar yeniden taranmaz
+            paths = iter_image_files(target, recursive)
+            if output_dir:
+                skip = os.path.abspath(output_dir) + os.sep
+                paths = (p for p in paths if not os.path.abspath(p).startswith(skip))
+            run_batch(worker, skip_done(paths, writer.done), on_result, workers=workers)
+            progress.update(task, total=counts["files"], completed=counts["files"])
+
+        cleaned = counts["files"] - counts["errors"]
+        print(
+            f"\n[bold green]✓[/bold green] {cleaned} dosya temizlendi "
+            f"(kayıpsız: {counts['segment']}, yeniden kodlama: {cleaned - counts['segment']}), "
+            f"{counts['bytes']:,} byte metadata kaldırıldı."
+        )
+        if counts["errors"]:
+            print(
+                f"[yellow]⚠ {counts['errors']} dosya temizlenemedi; ayrıntılar raporda.[/yellow]"
+            )
+        logger.info(f"Toplu metadata temizleme: {target} ({cleaned} dosya)")
+        return counts["errors"] == 0
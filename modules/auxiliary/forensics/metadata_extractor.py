@@ -10,20 +10,37 @@
 #   2. set FILE /path/to/image.jpg
 #   3. run
 #
+# Toplu mod: FILE bir dizin veya glob deseni (örn: evidence/**/*.jpg) ise
+# dosyalar süreç havuzunda işlenir ve sonuçlar aktif workspace loot'una
+# JSONL/CSV olarak yazılır (yarıda kalırsa kaldığı yerden devam eder).
+#
 # Desteklenen Formatlar:
 #   JPEG, PNG, TIFF, BMP, GIF, WebP
 #
 # =============================================================================
 
 import os
+from pathlib import Path
 from typing import Any
 
 from rich import print
+from rich.progress import Progress
 from rich.table import Table
 
 from core import logger
+from core.metadata_batch import (
+    EXTRACT_FIELDS,
+    ResultWriter,
+    checkpoint_name,
+    extract_files,
+    is_pattern,
+    iter_image_files,
+    run_batch,
+    skip_done,
+)
 from core.module import BaseModule
 from core.option import Option
+from core.workspace_manager import get_workspace_manager
 
 try:
     from PIL import Image
@@ -81,7 +98,7 @@ class MetadataExtractor(BaseModule):
                 name="FILE",
                 value="",
                 required=True,
-                description="Hedef görsel dosya yolu",
+                description="Hedef görsel dosya yolu, dizin veya glob deseni (toplu mod)",
                 completion_dir=".",
                 completion_extensions=[
                     ".jpg",
@@ -101,6 +118,33 @@ class MetadataExtractor(BaseModule):
                 description="Tüm raw EXIF tag'lerini göster (true/false)",
                 choices=["true", "false"],
             ),
+            "RECURSIVE": Option(
+                name="RECURSIVE",
+                value="true",
+                required=False,
+                description="Toplu modda alt dizinlere de in (true/false)",
+                choices=["true", "false"],
+            ),
+            "WORKERS": Option(
+                name="WORKERS",
+                value=0,
+                required=False,
+                description="Toplu modda süreç sayısı (0: tüm çekirdekler, 1: tek süreç)",
+            ),
+            "OUTPUT_FORMAT": Option(
+                name="OUTPUT_FORMAT",
+                value="jsonl",
+                required=False,
+                description="Toplu mod sonuç dosyası biçimi",
+                choices=["jsonl", "csv"],
+            ),
+            "RESUME": Option(
+                name="RESUME",
+                value="true",
+                required=False,
+                description="Toplu modda önceki sonuç dosyasından kaldığı yerden devam et",
+                choices=["true", "false"],
+            ),
         }
 
         for option_name, option_obj in self.Options.items():
@@ -336,6 +380,9 @@ class MetadataExtractor(BaseModule):
             print("[bold red]Hata:[/bold red] FILE parametresi boş olamaz!")
             return False
 
+        if os.path.isdir(file_path) or is_pattern(file_path):
+            return self._run_batch(file_path, options)
+
         if not os.path.isfile(file_path):
             print(f"[bold red]Hata:[/bold red] Dosya bulunamadı: {file_path}")
             return False
@@ -428,3 +475,68 @@ class MetadataExtractor(BaseModule):
             print(f"[bold red]Hata:[/bold red] Metadata çekilirken sorun oluştu: {e}")
             logger.exception(f"Metadata çekme hatası: {file_path}")
             return False
+
+    def _run_batch(self, target: str, options: dict[str, Any]) -> bool:
+        """Dizin/glob hedefindeki tüm görüntüleri süreç havuzunda işler.
+
+        Dosya başına tablo basılmaz; her kayıt loot dosyasına eklenir.
+
+        Args:
+            target: Dizin yolu veya glob deseni
+            options: Kullanıcının ayarladığı seçenekler
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        recursive = str(options.get("RECURSIVE", "true")).lower() == "true"
+        resume = str(options.get("RESUME", "true")).lower() == "true"
+        fmt = str(options.get("OUTPUT_FORMAT") or "jsonl").lower()
+        workers = int(options.get("WORKERS") or 0)
+
+        name = checkpoint_name("metadata_extractor", target, fmt)
+        wm = get_workspace_manager()
+        output = wm.resolve_save_path(name, "loot") if wm else Path.cwd() / name
+
+        try:
+            writer = ResultWriter(str(output), EXTRACT_FIELDS, fmt=fmt, resume=resume)
+        except ValueError as e:
+            print(f"[bold red]Hata:[/bold red] {e}")
+            return False
+
+        print("\n[bold cyan]🔍 Metadata Extractor (toplu mod)[/bold cyan]\n")
+        print(f"[dim]Hedef:[/dim] {target}")
+        print(f"[dim]Çıktı:[/dim] {output}")
+        if writer.done:
+            print(
+                f"[dim]Devam:[/dim] {len(writer.done)} dosya zaten işlenmiş, atlanacak"
+            )
+
+        counts = {"files": 0, "errors": 0, "gps": 0}
+        with writer, Progress() as progress:
+            task = progress.add_task("İşleniyor...", total=None)
+
+            def on_result(record):
+                writer.write(record)
+                counts["files"] += 1
+                if record["error"]:
+                    counts["errors"] += 1
+                elif record["gps_lat"] != "":
+                    counts["gps"] += 1
+                progress.advance(task)
+
+            paths = skip_done(iter_image_files(target, recursive), writer.done)
+            run_batch(extract_files, paths, on_result, workers=workers)
+            progress.update(task, total=counts["files"], completed=counts["files"])
+
+        print(
+            f"\n[bold green]✓[/bold green] {counts['files']} dosya işlendi "
+            f"(GPS içeren: {counts['gps']}, hata: {counts['errors']})."
+        )
+        if counts["gps"]:
+            print(
+                f"[bold red]⚠ DİKKAT:[/bold red] {counts['gps']} dosya GPS konum bilgisi içeriyor!"
+            )
+        logger.info(
+            f"Toplu metadata çıkarımı: {target} -> {output} ({counts['files']} dosya)"
+        )
+        return True
@@ -1,3 +1,8 @@
+import asyncio
+import ipaddress
+import json
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 from rich import print
@@ -5,6 +10,108 @@ from rich.table import Table
 
 from core.module import BaseModule
 from core.option import Option
+from core.wordlist import Wordlist
+from core.workspace_manager import get_workspace_manager
+
+# Her domain için sorgulanan kayıt tipleri
+RECORD_TYPES = ("A", "MX", "NS", "TXT", "CNAME")
+
+# Aynı anda uçuşta tutulacak varsayılan sorgu sayısı
+DEFAULT_CONCURRENCY = 50
+
+# Sorgu sonuçları (yanıt olmayan durumlar)
+NXDOMAIN = "NXDOMAIN"
+TIMEOUT = "TIMEOUT"
+
+
+def build_resolver(nameservers: str = "", timeout: float = 3.0, cache=None):
+    """Tüm sorgularda paylaşılan asenkron resolver'ı kurar.
+
+    ``nameservers`` '1.1.1.1, 127.0.0.1:5353' biçiminde verilebilir; boşsa
+    sistem ayarı kullanılır. ``cache`` (``dns.resolver.Cache``) yanıtları
+    TTL süresince saklar; NXDOMAIN ve boş yanıtlar da SOA süresince önbellekte
+    tutulur.
+    """
+    import dns.asyncresolver
+    import dns.nameserver
+    import dns.resolver
+
+    resolver = dns.asyncresolver.Resolver()
+    entries = [
+        item.strip() for item in str(nameservers or "").split(",") if item.strip()
+    ]
+    if entries:
+        servers = []
+        for entry in entries:
+            host, port = entry, 53
+            # IPv6 adreslerinde birden fazla ':' bulunur; port yalnızca IPv4 için ayrılır
+            if entry.count(":") == 1:
+                host, _, port_text = entry.partition(":")
+                port = int(port_text)
+            ipaddress.ip_address(host)
+            servers.append(dns.nameserver.Do53Nameserver(host, port))
+        resolver.nameservers = servers
+    resolver.lifetime = float(timeout)
+    resolver.timeout = min(float(timeout), 2.0)
+    resolver.cache = cache if cache is not None else dns.resolver.Cache()
+    return resolver
+
+
+class RecordResolver:
+    """(domain, kayıt tipi) sorgularını sabit pencereyle eşzamanlı çözer.
+
+    Tüm domainlerin tüm kayıt tipleri tek bir kuyruğa dizilir; pencere
+    boşaldıkça yeni sorgu başlatılır ve her yanıt geldiği anda
+    ``on_result`` çağrılır. Domain listesi tembel okunur, tamamı belleğe
+    alınmaz.
+    """
+
+    def __init__(
+        self, resolver, window: int = DEFAULT_CONCURRENCY, record_types=RECORD_TYPES
+    ):
+        self.resolver = resolver
+        self.window = max(1, int(window))
+        self.record_types = tuple(record_types)
+
+    async def query(self, domain: str, qtype: str):
+        """Kayıtların metin listesi; NXDOMAIN/TIMEOUT sabitlerinden biri veya hata metni."""
+        import dns.exception
+        import dns.resolver
+
+        try:
+            answer = await self.resolver.resolve(
+                domain, qtype, raise_on_no_answer=False
+            )
+        except dns.resolver.NXDOMAIN:
+            return NXDOMAIN
+        except (dns.exception.Timeout, dns.resolver.LifetimeTimeout):
+            return TIMEOUT
+        except dns.exception.DNSException as e:
+            return str(e) or type(e).__name__
+        return [rdata.to_text() for rdata in answer.rrset] if answer.rrset else []
+
+    async def _resolve_stream(self, domains, on_result):
+        jobs = ((domain, qtype) for domain in domains for qtype in self.record_types)
+        pending = {}
+
+        def fill():
+            while len(pending) < self.window:
+                job = next(jobs, None)
+                if job is None:
+                    return
+                pending[asyncio.ensure_future(self.query(*job))] = job
+
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                domain, qtype = pending.pop(task)
+                on_result(domain, qtype, task.result())
+            fill()
+
+    def resolve_stream(self, domains, on_result):
+        """Her yanıt için on_result(domain, tip, sonuç) çağırır."""
+        asyncio.run(self._resolve_stream(domains, on_result))
 
 
 class dns_enum(BaseModule):
@@ -13,10 +120,10 @@ class dns_enum(BaseModule):
     """
 
     Name = "DNS Enum"
-    Description = "Perform DNS enumeration (A, MX, NS, TXT, CNAME) for a given domain."
+    Description = "Perform DNS enumeration (A, MX, NS, TXT, CNAME) for one domain or a domain list."
     Author = "Mahmut P."
     Category = "auxiliary/recon"
-    Version = "1.0"
+    Version = "1.1"
 
     # 'dnspython' kütüphanesine ihtiyaç duyar
     Requirements = {"python": ["dnspython"]}
@@ -25,57 +132,150 @@ class dns_enum(BaseModule):
         super().__init__()
         self.Options = {
             "DOMAIN": Option(
-                "DOMAIN", "", True, "Sorgulanacak hedef domain (örn: example.com)"
+                "DOMAIN", "", False, "Sorgulanacak hedef domain (örn: example.com)"
+            ),
+            "DOMAIN_FILE": Option(
+                "DOMAIN_FILE",
+                "",
+                False,
+                "Satır başına bir domain içeren dosya (DOMAIN yerine toplu tarama)",
+            ),
+            "NAMESERVERS": Option(
+                "NAMESERVERS",
+                "",
+                False,
+                "Virgülle ayrılmış DNS sunucuları (örn: 1.1.1.1,8.8.8.8:53). Boşsa sistem ayarı",
+            ),
+            "CONCURRENCY": Option(
+                "CONCURRENCY",
+                DEFAULT_CONCURRENCY,
+                False,
+                "Aynı anda uçuşta tutulacak DNS sorgusu sayısı",
+            ),
+            "TIMEOUT": Option(
+                "TIMEOUT", 3.0, False, "Tek sorgu için toplam süre sınırı (saniye)"
             ),
         }
         for option_name, option_obj in self.Options.items():
             setattr(self, option_name, option_obj.value)
+        # Yanıt önbelleği çalıştırmalar arasında korunur (TTL dolana kadar)
+        self.cache = None
+
+    def _loot_file(self):
+        """Aktif workspace varsa loot/dns_enum.jsonl; yoksa None."""
+        wm = get_workspace_manager()
+        if not (wm and wm.active_name):
+            return None
+        return wm.resolve_save_path("dns_enum.jsonl", "loot")
 
     def run(self, options: dict[str, Any]):
-        domain = options.get("DOMAIN")
-        if not domain:
-            print("[bold red][-] Lütfen sorgulanacak bir DOMAIN giriniz.[/bold red]")
+        domain = str(options.get("DOMAIN") or "").strip()
+        domain_file = str(options.get("DOMAIN_FILE") or "").strip()
+        if not domain and not domain_file:
+            print(
+                "[bold red][-] Lütfen bir DOMAIN veya DOMAIN_FILE giriniz.[/bold red]"
+            )
+            return False
+        if domain_file and not Path(domain_file).is_file():
+            print(f"[bold red][-] Domain dosyası bulunamadı: {domain_file}[/bold red]")
             return False
 
-        print(f"[bold cyan][*] '{domain}' için DNS kayıtları aranıyor...[/bold cyan]")
-
-        import dns.exception
         import dns.resolver
 
-        record_types = ["A", "MX", "NS", "TXT", "CNAME"]
-        table = Table(
-            title=f"DNS Records for {domain}",
-            show_header=True,
-            header_style="bold magenta",
-        )
+        if self.cache is None:
+            self.cache = dns.resolver.Cache()
+        try:
+            resolver = RecordResolver(
+                build_resolver(
+                    options.get("NAMESERVERS"),
+                    timeout=float(options.get("TIMEOUT") or 3.0),
+                    cache=self.cache,
+                ),
+                window=int(options.get("CONCURRENCY") or DEFAULT_CONCURRENCY),
+            )
+        except ValueError as e:
+            print(f"[bold red][-] Geçersiz resolver ayarı: {e}[/bold red]")
+            return False
+
+        batch = bool(domain_file)
+        title = f"DNS Records ({domain_file})" if batch else f"DNS Records for {domain}"
+        table = Table(title=title, show_header=True, header_style="bold magenta")
+        if batch:
+            table.add_column("Domain", style="cyan")
         table.add_column("Record Type", style="dim", width=12)
         table.add_column("Data")
 
-        found_any = False
-
-        for qtype in record_types:
-            try:
-                answers = dns.resolver.resolve(domain, qtype)
-                for rdata in answers:
-                    table.add_row(qtype, rdata.to_text())
-                    found_any = True
-            except dns.resolver.NoAnswer:
-                pass
-            except dns.resolver.NXDOMAIN:
-                print(
-                    f"[bold red][-] Domain '{domain}' bulunamadı (NXDOMAIN).[/bold red]"
+        counts = {"records": 0, "nxdomain": set(), "timeout": 0}
+        loot_path = self._loot_file()
+        loot = loot_path.open("a", encoding="utf-8") if loot_path else None
+
+        def on_result(name, qtype, result):
+            if result == NXDOMAIN:
+                if name not in counts["nxdomain"]:
+                    counts["nxdomain"].add(name)
+                    if batch:
+                        print(f"[yellow][-] {name}: bulunamadı (NXDOMAIN)[/yellow]")
+                return
+            if result == TIMEOUT:
+                counts["timeout"] += 1
+                return
+            if isinstance(result, str):
+                return  # Bazen sadece bazı kayıtlar dönmez, diğerleri devam etsin
+            for data in result:
+                counts["records"] += 1
+                table.add_row(*([name] if batch else []), qtype, data)
+                if batch:
+                    print(f"[green][+][/green] {name} {qtype} {data}")
+            if loot is not None and result:
+                loot.write(
+                    json.dumps(
+                        {
+                            "domain": name,
+                            "type": qtype,
+                            "records": result,
+                            "resolved_at": datetime.now(UTC).isoformat(),
+                        },
+                        ensure_ascii=False,
+                    )
+                    + "\n"
                 )
+                loot.flush()
+
+        if batch:
+            print(
+                f"[bold cyan][*] '{domain_file}' içindeki domainler için DNS kayıtları aranıyor "
+                f"(pencere: {resolver.window})...[/bold cyan]"
+            )
+        else:
+            print(
+                f"[bold cyan][*] '{domain}' için DNS kayıtları aranıyor...[/bold cyan]"
+            )
+
+        try:
+            if batch:
+                with Wordlist(domain_file) as domains:
+                    resolver.resolve_stream(domains, on_result)
+            else:
+                resolver.resolve_stream([domain], on_result)
+        finally:
+            if loot is not None:
+                loot.close()
+
+        if not batch and counts["nxdomain"]:
+            print(f"[bold red][-] Domain '{domain}' bulunamadı (NXDOMAIN).[/bold red]")
+            return False
+        if counts["timeout"]:
+            print(
+                f"[bold yellow][!] {counts['timeout']} DNS sorgusu zaman aşımına uğradı.[/bold yellow]"
+            )
+            if not batch and not counts["records"]:
                 return False
-            except dns.exception.Timeout:
-                print("[bold red][-] DNS sorgusu zaman aşımına uğradı.[/bold red]")
-                return False
-            except Exception:
-                pass  # Bazen sadece bazı kayıtlar dönmez, döngü devam etsin
 
-        if found_any:
+        if counts["records"]:
             print()
             print(table)
-            return True
+            if loot_path:
+                print(f"[bold blue][*][/bold blue] Loot yazıldı: {loot_path}")
         else:
             print("[yellow][!] Hiçbir DNS kaydı bulunamadı.[/yellow]")
-            return True
+        return True
@@ -1,16 +1,174 @@
+import asyncio
+import ipaddress
 import logging
 import os
-import socket
+import uuid
 
 from rich import print
-from rich.progress import track
+from rich.progress import Progress
 from rich.table import Table
 
 from core.module import BaseModule
 from core.option import Option
+from core.wordlist import Wordlist
+
+# Wildcard kalibrasyonunda çözülecek rastgele etiket sayısı
+CALIBRATION_PROBES = 3
+
+# Sistem resolver yapılandırması okunamazsa kullanılacak sunucular
+FALLBACK_NAMESERVERS = ["1.1.1.1", "8.8.8.8"]
+
+
+class WildcardCache:
+    """Wildcard DNS yanıtlarının önbelleği.
+
+    Rastgele etiketlerin çözüldüğü IP kümeleri saklanır; bir bulgunun IP
+    kümesi bunlardan biriyle aynıysa ya da tamamen wildcard IP'lerinden
+    oluşuyorsa sahte kabul edilir.
+    """
+
+    def __init__(self):
+        self._answers = set()
+        self._addresses = set()
+
+    def add(self, ips):
+        ips = frozenset(ips)
+        if ips:
+            self._answers.add(ips)
+            self._addresses |= ips
+
+    def matches(self, ips):
+        ips = frozenset(ips)
+        return ips in self._answers or (bool(ips) and ips <= self._addresses)
+
+    @property
+    def addresses(self):
+        return sorted(self._addresses)
+
+    def __bool__(self):
+        return bool(self._answers)
+
+
+def parse_nameservers(value):
+    """'1.1.1.1, 127.0.0.1:5353' biçimindeki listeyi (ip, port) çiftlerine çevirir.
+
+    Boş değer verilirse sistem resolver'ının sunucuları kullanılır.
+    """
+    entries = [item.strip() for item in str(value or "").split(",") if item.strip()]
+    if not entries:
+        try:
+            import dns.resolver
+
+            entries = list(dns.resolver.get_default_resolver().nameservers)
+        except Exception:
+            entries = []
+        entries = [ns for ns in entries if isinstance(ns, str)] or FALLBACK_NAMESERVERS
+
+    servers = []
+    for entry in entries:
+        host, port = entry, 53
+        # IPv6 adreslerinde birden fazla ':' bulunur; port yalnızca IPv4/ad için ayrılır
+        if entry.count(":") == 1:
+            host, _, port_text = entry.partition(":")
+            port = int(port_text)
+        ipaddress.ip_address(host)
+        servers.append((host, port))
+    return servers
+
+
+class ConcurrentResolver:
+    """dnspython ile sabit pencereli, eşzamanlı A kaydı çözücüsü.
+
+    Aynı anda en fazla ``window`` sorgu uçuşta tutulur; sorgular sunucu
+    havuzuna sırayla dağıtılır ve zaman aşımı / SERVFAIL durumunda bir
+    sonraki sunucuyla ``retries`` kez yeniden denenir.
+    """
+
+    def __init__(self, nameservers, window=100, timeout=2.0, retries=2):
+        if not nameservers:
+            raise ValueError("En az bir DNS sunucusu gerekli")
+        self.nameservers = list(nameservers)
+        self.window = max(1, int(window))
+        self.timeout = float(timeout)
+        self.retries = max(0, int(retries))
+        self._next_server = 0
+
+    async def query(self, name):
+        """Adın IPv4 adreslerini döner.
+
+        NXDOMAIN/boş yanıtta boş liste, tüm denemeler başarısız olursa None.
+        """
+        import dns.asyncquery
+        import dns.exception
+        import dns.flags
+        import dns.message
+        import dns.rcode
+        import dns.rdatatype
+
+        request = dns.message.make_query(name, dns.rdatatype.A)
+        start = self._next_server
+        self._next_server = (start + 1) % len(self.nameservers)
+
+        for attempt in range(self.retries + 1):
+            host, port = self.nameservers[(start + attempt) % len(self.nameservers)]
+            try:
+                response = await dns.asyncquery.udp(
+                    request, host, timeout=self.timeout, port=port
+                )
+                if response.flags & dns.flags.TC:
+                    response = await dns.asyncquery.tcp(
+                        request, host, timeout=self.timeout, port=port
+                    )
+            except (dns.exception.DNSException, OSError):
+                continue
+
+            rcode = response.rcode()
+            if rcode == dns.rcode.NXDOMAIN:
+                return []
+            if rcode != dns.rcode.NOERROR:
+                # SERVFAIL / REFUSED: başka bir sunucuyla dene
+                continue
+            return [
+                rdata.address
+                for rrset in response.answer
+                if rrset.rdtype == dns.rdatatype.A
+                for rdata in rrset
+            ]
+        return None
+
+    async def _resolve_stream(self, names, on_result):
+        names = iter(names)
+        pending = {}
+
+        def fill():
+            while len(pending) < self.window:
+                name = next(names, None)
+                if name is None:
+                    return
+                pending[asyncio.ensure_future(self.query(name))] = name
+
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                on_result(pending.pop(task), task.result())
+            fill()
+
+    def resolve_stream(self, names, on_result):
+        """Adları pencere dolu kalacak şekilde çözer; her sonuç için on_result(ad, ipler)."""
+        asyncio.run(self._resolve_stream(names, on_result))
+
+    def resolve_many(self, names):
+        """Adları çözüp {ad: ipler} sözlüğü döner."""
+        results = {}
+        self.resolve_stream(names, results.__setitem__)
+        return results
 
 
 class SubdomainFinder(BaseModule):
+    # 'dnspython' kütüphanesine ihtiyaç duyar
+    Requirements = {"python": ["dnspython"]}
+
     def __init__(self):
         # --- Modül Bilgileri ---
         self.Name = "Subdomain Finder"
@@ -36,22 +194,65 @@ class SubdomainFinder(BaseModule):
                 description="Kullanılacak kelime listesi (wordlist) yolu",
                 completion_dir="config/wordlists/subdomains/",
             ),
-            "THREADS": Option(  # Gelecekte eklenebilir, şimdilik tek thread
-                name="THREADS",
-                value=1,
+            "CONCURRENCY": Option(
+                name="CONCURRENCY",
+                value=100,
+                required=False,
+                description="Aynı anda uçuşta tutulacak DNS sorgusu sayısı (sorgu penceresi)",
+            ),
+            "NAMESERVERS": Option(
+                name="NAMESERVERS",
+                value="",
+                required=False,
+                description="Virgülle ayrılmış DNS sunucuları (örn: 1.1.1.1,8.8.8.8:53). Boşsa sistem ayarı",
+                regex_check=False,
+            ),
+            "TIMEOUT": Option(
+                name="TIMEOUT",
+                value=2.0,
+                required=False,
+                description="Tek sorgu için zaman aşımı (saniye)",
+            ),
+            "RETRIES": Option(
+                name="RETRIES",
+                value=2,
+                required=False,
+                description="Zaman aşımı/SERVFAIL durumunda farklı sunucuyla yeniden deneme sayısı",
+            ),
+            "CALIBRATE": Option(
+                name="CALIBRATE",
+                value="true",
+                required=False,
+                description="Taramadan önce rastgele etiketlerle wildcard DNS kalibrasyonu yap",
+                choices=["true", "false"],
+            ),
+            "DEDUP": Option(
+                name="DEDUP",
+                value="false",
                 required=False,
-                description="Thread sayısı (Şu an aktif değil, tek thread çalışır)",
+                description="Wordlist'teki tekrarlanan satırları disk üzerinde ayıkla",
+                choices=["true", "false"],
             ),
         }
 
         super().__init__()
 
+    def calibrate(self, resolver, domain, probes=CALIBRATION_PROBES):
+        """Var olmaması gereken rastgele alt alan adlarını çözüp wildcard önbelleğini doldurur."""
+        cache = WildcardCache()
+        names = [f"{uuid.uuid4().hex[:16]}.{domain}" for _ in range(probes)]
+        for ips in resolver.resolve_many(names).values():
+            cache.add(ips or [])
+        return cache
+
     def run(self, options):
         """
         Subdomain Finder ana fonksiyonu.
         """
         domain = options.get("DOMAIN")
         wordlist_path = options.get("WORDLIST")
+        calibrate = str(options.get("CALIBRATE", "true")).lower() == "true"
+        dedup = str(options.get("DEDUP", "false")).lower() == "true"
 
         # Dosya kontrolü
         if not os.path.exists(wordlist_path):
@@ -60,35 +261,82 @@ class SubdomainFinder(BaseModule):
             )
             return False
 
+        try:
+            nameservers = parse_nameservers(options.get("NAMESERVERS"))
+            resolver = ConcurrentResolver(
+                nameservers,
+                window=int(options.get("CONCURRENCY") or 100),
+                timeout=float(options.get("TIMEOUT") or 2.0),
+                retries=int(options.get("RETRIES", 2)),
+            )
+        except ValueError as e:
+            print(f"[bold red][!][/bold red] Geçersiz resolver ayarı: {e}")
+            return False
+
         print(f"[bold blue][*][/bold blue] Hedef: {domain}")
         print(f"[bold blue][*][/bold blue] Wordlist: {wordlist_path}")
-        print("[bold blue][*][/bold blue] Tarama başlatılıyor...")
-
-        found_subdomains = []
+        print(
+            f"[bold blue][*][/bold blue] DNS sunucuları: "
+            f"{', '.join(f'{host}:{port}' for host, port in nameservers)} "
+            f"(pencere: {resolver.window})"
+        )
 
         try:
-            with open(wordlist_path, encoding="utf-8", errors="ignore") as f:
-                subdomains = [line.strip() for line in f if line.strip()]
+            wildcard = WildcardCache()
+            if calibrate:
+                wildcard = self.calibrate(resolver, domain)
+                if wildcard:
+                    print(
+                        f"[bold yellow][!][/bold yellow] Wildcard DNS tespit edildi "
+                        f"({', '.join(wildcard.addresses)}); eşleşen yanıtlar filtrelenecek."
+                    )
+
+            print("[bold blue][*][/bold blue] Tarama başlatılıyor...")
+
+            found_subdomains = []
+            counts = {"done": 0, "filtered": 0, "failed": 0}
 
-            # Kullanıcıya ilerleme çubuğu gösterelim
-            for sub in track(subdomains, description="Taranıyor..."):
-                target = f"{sub}.{domain}"
-                try:
-                    # DNS sorgusu yap
-                    ip_address = socket.gethostbyname(target)
+            with (
+                Wordlist(wordlist_path, dedup=dedup) as wordlist,
+                Progress() as progress,
+            ):
+                task = progress.add_task(
+                    "Taranıyor...", total=wordlist.estimate_lines() or None
+                )
+
+                def on_result(target, ips):
+                    counts["done"] += 1
+                    progress.advance(task)
+                    if ips is None:
+                        # Tüm denemeler zaman aşımına uğradı
+                        counts["failed"] += 1
+                        return
+                    if not ips:
+                        return
+                    if wildcard and wildcard.matches(ips):
+                        counts["filtered"] += 1
+                        return
 
-                    # Eğer IP döndüyse subdomain vardır (Wildcard DNS kontrolü yapılmıyor şimdilik)
+                    ip_address = ", ".join(ips)
                     print(
                         f"[green][+][/green] Bulundu: [bold cyan]{target}[/bold cyan] -> {ip_address}"
                     )
                     found_subdomains.append((target, ip_address))
 
-                except socket.gaierror:
-                    # DNS çözümlenemedi (Normal durum)
-                    pass
-                except Exception:
-                    # Diğer hatalar
-                    pass
+                resolver.resolve_stream(
+                    (f"{sub}.{domain}" for sub in wordlist), on_result
+                )
+                # Tahmin sapmış olabilir; çubuğu gerçek sayıyla kapat
+                progress.update(task, total=counts["done"], completed=counts["done"])
+
+            if counts["filtered"]:
+                print(
+                    f"[bold blue][*][/bold blue] {counts['filtered']} wildcard yanıtı filtrelendi."
+                )
+            if counts["failed"]:
+                print(
+                    f"[bold yellow][!][/bold yellow] {counts['failed']} ad yeniden denemelere rağmen çözülemedi (zaman aşımı)."
+                )
 
             # Sonuçları Tablo Olarak Göster
             if found_subdomains:
@@ -103,7 +351,7 @@ class SubdomainFinder(BaseModule):
                 table.add_column("Subdomain", style="cyan")
                 table.add_column("IP Adresi", style="white")
 
-                for sub, ip in found_subdomains:
+                for sub, ip in sorted(found_subdomains):
                     table.add_row(sub, ip)
                 print(table)
             else:
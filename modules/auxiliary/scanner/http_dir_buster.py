@@ -1,12 +1,236 @@
-import concurrent.futures
+import hashlib
+import http.client
 import os
+import queue
+import ssl
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
+import uuid
 
 from rich import print
 
+from core import logger
 from core.module import BaseModule
 from core.option import Option
+from core.wordlist import Wordlist
+
+# Kuyruk kapasitesi = THREADS * bu katsayı (üretici bu sınırda bekler)
+QUEUE_DEPTH_PER_THREAD = 4
+
+USER_AGENT = "Mozilla/5.0 (MahFramework)"
+REQUEST_TIMEOUT = 3
+
+# Kalibrasyon: rastgele yol sayısı ve parmak izi için okunacak azami gövde
+CALIBRATION_PROBES = 3
+FINGERPRINT_BODY_LIMIT = 256 * 1024
+
+# urllib'in HTTPRedirectHandler'ıyla aynı sınır ve durum kodları
+MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# HEAD desteklemeyen sunucularda istek GET ile tekrarlanır
+_HEAD_UNSUPPORTED = (405, 501)
+
+# Kalıcı bağlantı sunucu tarafından kapatılmışsa tek sefer yeniden denenir
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class _SessionReuseHTTPSConnection(http.client.HTTPSConnection):
+    """Yeni TLS el sıkışmalarında havuzun sakladığı oturumu (session resumption) kullanır."""
+
+    def __init__(self, *args, pool, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = pool
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=self.host, session=self._pool.tls_session
+        )
+
+
+class PooledHttpClient:
+    """Thread başına kalıcı (keep-alive) HTTP/1.1 bağlantıları.
+
+    Her worker thread kendi bağlantısını tekrar kullanır; HTTPS'te tüm
+    bağlantılar aynı SSLContext'i ve son TLS oturumunu paylaşır, böylece
+    yeniden bağlanmalarda tam el sıkışma yapılmaz.
+    """
+
+    def __init__(self, base_url, timeout=REQUEST_TIMEOUT):
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Geçersiz hedef URL: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.tls_session = None
+        self._ssl_context = (
+            ssl.create_default_context() if self.scheme == "https" else None
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.scheme == "https":
+                conn = _SessionReuseHTTPSConnection(
+                    self.host,
+                    self.port,
+                    timeout=self.timeout,
+                    context=self._ssl_context,
+                    pool=self,
+                )
+            else:
+                conn = http.client.HTTPConnection(
+                    self.host, self.port, timeout=self.timeout
+                )
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _request_path(self, path):
+        quoted = urllib.parse.quote(path.lstrip("/"), safe="/%?&=:@!$'()*+,;~")
+        return f"{self.base_path}/{quoted}"
+
+    def _exchange(self, method, request_path, body_limit=0):
+        """(durum, gövde, Location başlığı) veya hata halinde None döner."""
+        conn = self._connection()
+        for attempt in range(2):
+            try:
+                conn.request(
+                    method,
+                    request_path,
+                    headers={"User-Agent": USER_AGENT, "Connection": "keep-alive"},
+                )
+                response = conn.getresponse()
+                body = response.read(body_limit) if body_limit else b""
+                response.read()
+                if self.scheme == "https" and conn.sock is not None:
+                    self.tls_session = conn.sock.session or self.tls_session
+                if response.will_close:
+                    conn.close()
+                return response.status, body, response.getheader("Location")
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if attempt:
+                    return None
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                return None
+        return None
+
+    def request(self, method, path, body_limit=0):
+        """İsteği kalıcı bağlantıdan gönderir; (durum, gövde) veya hata halinde None döner.
+
+        Gövdenin en fazla ``body_limit`` baytı döner; kalanı bağlantının
+        tekrar kullanılabilmesi için okunup atılır.
+        """
+        result = self._exchange(method, self._request_path(path), body_limit)
+        return result[:2] if result else None
+
+    def resolve(self, path):
+        """Yolun urllib ile aynı şekilde takip edilmiş son durumunu bulur.
+
+        HEAD'i 405/501 ile reddeden sunucularda GET'e düşülür. Aynı kökene
+        (şema, host, port) yönlendirmeler kalıcı bağlantıdan takip edilir;
+        başka bir kökene yönlendirmede ``(durum, hedef URL)`` döner. Normalde
+        ``(durum, None)``; hata veya yönlendirme döngüsünde None döner.
+        """
+        request_path = self._request_path(path)
+        for _ in range(MAX_REDIRECTS + 1):
+            result = self._exchange("HEAD", request_path)
+            if result is not None and result[0] in _HEAD_UNSUPPORTED:
+                result = self._exchange("GET", request_path)
+            if result is None:
+                return None
+            status, _body, location = result
+            if status not in _REDIRECT_STATUSES or not location:
+                return status, None
+            current = f"{self.scheme}://{self.host}{f':{self.port}' if self.port else ''}{request_path}"
+            target = urllib.parse.urljoin(current, location)
+            parts = urllib.parse.urlsplit(target)
+            if (parts.scheme, parts.hostname, parts.port) != (
+                self.scheme,
+                self.host,
+                self.port,
+            ):
+                return status, target
+            request_path = parts.path or "/"
+            if parts.query:
+                request_path += f"?{parts.query}"
+        return None
+
+    def head(self, path):
+        """HEAD isteği gönderir; durum kodunu veya hata halinde None döner."""
+        result = self.request("HEAD", path)
+        return result[0] if result else None
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+class SoftNotFoundCache:
+    """Wildcard / soft-404 yanıt parmak izleri.
+
+    Kalibrasyonda rastgele yolların yanıtları kaydedilir; taramada bir
+    bulgunun durum kodu bu kümede değilse hiç gövde çekilmez. Aksi halde
+    gövdedeki yol metni çıkarılıp hash'i karşılaştırılır (küme üyeliği, O(1)).
+
+    ``length_tolerance`` verilirse hash tutmayan yanıtlar, aynı durum kodlu
+    bir kalibrasyon yanıtıyla normalize uzunluk farkı bu değeri aşmıyorsa da
+    eşleşir (zaman damgası gibi değişken içerikli hata sayfaları için).
+    Aynı boyutlu gerçek sayfaları da eleyebileceğinden varsayılan olarak kapalıdır.
+    """
+
+    def __init__(self, length_tolerance=None):
+        self.statuses = set()
+        self.length_tolerance = length_tolerance
+        self._lengths = {}
+        self._hashes = set()
+
+    @staticmethod
+    def fingerprint(status, body, path):
+        # Soft-404 sayfaları çoğunlukla istenen yolu gövdede tekrarlar
+        token = path.strip("/").encode("utf-8", errors="ignore")
+        normalized = body.replace(token, b"") if token else body
+        return len(normalized), (status, hashlib.sha1(normalized).hexdigest())
+
+    def add(self, status, body, path):
+        length, by_hash = self.fingerprint(status, body, path)
+        self.statuses.add(status)
+        self._lengths.setdefault(status, set()).add(length)
+        self._hashes.add(by_hash)
+
+    def matches(self, status, body, path):
+        if status not in self.statuses:
+            return False
+        length, by_hash = self.fingerprint(status, body, path)
+        if by_hash in self._hashes:
+            return True
+        if self.length_tolerance is None:
+            return False
+        return any(
+            abs(length - known) <= self.length_tolerance
+            for known in self._lengths[status]
+        )
+
+    def __bool__(self):
+        return bool(self.statuses)
 
 
 class HttpDirBuster(BaseModule):
@@ -37,6 +261,33 @@ class HttpDirBuster(BaseModule):
                 required=True,
                 description="Eşzamanlı tarama yapacak thread sayısı",
             ),
+            "CLIENT": Option(
+                name="CLIENT",
+                value="pooled",
+                required=False,
+                description="HTTP istemcisi: pooled (keep-alive, TLS oturum paylaşımı) veya urllib",
+                choices=["pooled", "urllib"],
+            ),
+            "CALIBRATE": Option(
+                name="CALIBRATE",
+                value="true",
+                required=False,
+                description="Taramadan önce rastgele yollarla wildcard/soft-404 kalibrasyonu yap",
+                choices=["true", "false"],
+            ),
+            "SOFT404_LENGTH_TOLERANCE": Option(
+                name="SOFT404_LENGTH_TOLERANCE",
+                value="",
+                required=False,
+                description="Hash tutmayan yanıtları aynı durum kodu ve ± bu kadar byte uzunlukla da soft-404 say (boş: kapalı)",
+            ),
+            "DEDUP": Option(
+                name="DEDUP",
+                value="false",
+                required=False,
+                description="Wordlist'teki tekrarlanan satırları disk üzerinde ayıkla",
+                choices=["true", "false"],
+            ),
         }
 
         super().__init__()
@@ -47,10 +298,10 @@ class HttpDirBuster(BaseModule):
         try:
             req = urllib.request.Request(
                 target_url,
-                headers={"User-Agent": "Mozilla/5.0 (MahFramework)"},
+                headers={"User-Agent": USER_AGENT},
                 method="HEAD",  # Sadece başlıkları çek, içeriği değil (Daha hızlı)
             )
-            with urllib.request.urlopen(req, timeout=3) as response:
+            with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
                 return (path, response.status, target_url)
         except urllib.error.HTTPError as e:
             # 403 Forbidden veya 401 Unauthorized da ilginç olabilir
@@ -60,6 +311,132 @@ class HttpDirBuster(BaseModule):
         except Exception:
             return None
 
+    @staticmethod
+    def _urllib_status(url):
+        """URL'in yönlendirmeler takip edilmiş durum kodu; bağlantı hatasında None."""
+        req = urllib.request.Request(
+            url, headers={"User-Agent": USER_AGENT}, method="HEAD"
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code
+        except Exception:
+            return None
+
+    def check_url_pooled(self, client, base_url, path):
+        """check_url ile aynı sonuç biçimi; isteği havuzdaki bağlantıdan gönderir.
+
+        check_url gibi yönlendirmeler takip edilir ve son durum raporlanır;
+        HEAD'e 405 dönen sunucularda GET kullanılır. Başka bir kökene giden
+        yönlendirme urllib ile takip edilir.
+        """
+        resolved = client.resolve(path)
+        if resolved is None:
+            return None
+        status, elsewhere = resolved
+        if elsewhere:
+            status = self._urllib_status(elsewhere)
+            if status is None:
+                return None
+        if status < 400 or status in (401, 403):
+            target_url = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+            return (path, status, target_url)
+        return None
+
+    def fetch(self, client, base_url, path):
+        """Parmak izi için GET yanıtını (durum, gövde) olarak döner."""
+        if client is not None:
+            return client.request("GET", path, body_limit=FINGERPRINT_BODY_LIMIT)
+        target_url = f"{base_url.rstrip('/')}/{path.lstrip('/')}"
+        req = urllib.request.Request(target_url, headers={"User-Agent": USER_AGENT})
+        try:
+            with urllib.request.urlopen(req, timeout=REQUEST_TIMEOUT) as response:
+                return response.status, response.read(FINGERPRINT_BODY_LIMIT)
+        except urllib.error.HTTPError as e:
+            return e.code, e.read(FINGERPRINT_BODY_LIMIT)
+        except Exception:
+            return None
+
+    def calibrate(
+        self, client, base_url, probes=CALIBRATION_PROBES, length_tolerance=None
+    ):
+        """Var olmaması gereken rastgele yolları isteyip soft-404 önbelleğini doldurur."""
+        cache = SoftNotFoundCache(length_tolerance)
+        for _ in range(probes):
+            path = uuid.uuid4().hex
+            result = self.fetch(client, base_url, path)
+            if result is None:
+                continue
+            status, body = result
+            if status < 400 or status in (401, 403):
+                cache.add(status, body, path)
+        return cache
+
+    @staticmethod
+    def iter_wordlist(path):
+        """Wordlist'i satır satır, belleğe almadan üretir."""
+        yield from Wordlist(path)
+
+    def scan_stream(self, base_url, paths, threads, on_hit, check=None):
+        """Sınırlı kuyruklu üretici/tüketici hattı.
+
+        Ana thread yolları kuyruğa besler; kuyruk doluysa bekler (backpressure).
+        Bellek kullanımı wordlist boyutundan bağımsızdır. Gönderilen yol
+        sayısını döner. ``check`` verilmezse check_url kullanılır.
+
+        ``check`` veya ``on_hit`` hata fırlatırsa yol loglanıp atlanır; worker
+        ölmez, böylece üretici dolu kuyrukta sonsuza dek beklemez.
+        """
+        check = check or self.check_url
+        jobs = queue.Queue(maxsize=max(1, threads) * QUEUE_DEPTH_PER_THREAD)
+        errors = []
+
+        def worker():
+            while True:
+                path = jobs.get()
+                if path is None:
+                    return
+                try:
+                    result = check(base_url, path)
+                    if result:
+                        on_hit(result)
+                except Exception:
+                    errors.append(path)
+                    logger.exception(f"Dizin tarama hatası: {base_url} {path}")
+
+        workers = [
+            threading.Thread(target=worker, daemon=True) for _ in range(max(1, threads))
+        ]
+        for t in workers:
+            t.start()
+
+        sent = 0
+        try:
+            for path in paths:
+                jobs.put(path)
+                sent += 1
+        except BaseException:
+            # Kesinti: bekleyen işleri at, worker'lar yalnızca elindekini bitirsin
+            while True:
+                try:
+                    jobs.get_nowait()
+                except queue.Empty:
+                    break
+            raise
+        finally:
+            for _ in workers:
+                jobs.put(None)
+            for t in workers:
+                t.join()
+            if errors:
+                print(
+                    f"[bold yellow][!][/bold yellow] {len(errors)} yol kontrol edilirken "
+                    f"hata oluştu; ayrıntılar logda."
+                )
+        return sent
+
     def run(self, options):
         target_url = options.get("RHOST")
         wordlist_path = options.get("WORDLIST")
@@ -67,6 +444,16 @@ class HttpDirBuster(BaseModule):
             threads = int(options.get("THREADS"))
         except:
             threads = 10
+        client_mode = str(options.get("CLIENT") or "pooled").lower()
+        calibrate = str(options.get("CALIBRATE", "true")).lower() == "true"
+        dedup = str(options.get("DEDUP", "false")).lower() == "true"
+        tolerance = str(options.get("SOFT404_LENGTH_TOLERANCE") or "").strip()
+        if tolerance and not tolerance.isdigit():
+            print(
+                f"[bold red][!][/bold red] Geçersiz SOFT404_LENGTH_TOLERANCE: {tolerance}"
+            )
+            return False
+        length_tolerance = int(tolerance) if tolerance else None
 
         # Wordlist kontrolü
         if not os.path.exists(wordlist_path):
@@ -76,42 +463,91 @@ class HttpDirBuster(BaseModule):
             return False
 
         print(f"[bold blue][*][/bold blue] Hedef: {target_url}")
-        print(f"[bold blue][*][/bold blue] Wordlist yükleniyor: {wordlist_path}")
+        print(f"[bold blue][*][/bold blue] Wordlist: {wordlist_path}")
+        client = None
+        check = None
+        if client_mode == "pooled":
+            try:
+                client = PooledHttpClient(target_url)
+            except ValueError as e:
+                print(f"[bold red][!][/bold red] {e}")
+                return False
+
+            def check(base_url, path):
+                return self.check_url_pooled(client, base_url, path)
+
+        soft404 = SoftNotFoundCache()
+        if calibrate:
+            soft404 = self.calibrate(
+                client, target_url, length_tolerance=length_tolerance
+            )
+            if soft404:
+                statuses = ", ".join(str(code) for code in sorted(soft404.statuses))
+                print(
+                    f"[bold yellow][!][/bold yellow] Wildcard/soft-404 tespit edildi "
+                    f"(durum: {statuses}); eşleşen yanıtlar filtrelenecek."
+                )
+
+        filtered = []
+        if soft404:
+            base_check = check or self.check_url
+
+            def check(base_url, path):
+                result = base_check(base_url, path)
+                if result and result[1] in soft404.statuses:
+                    fetched = self.fetch(client, base_url, path)
+                    if fetched and soft404.matches(fetched[0], fetched[1], path):
+                        filtered.append(path)
+                        return None
+                return result
 
         try:
-            with open(wordlist_path, encoding="utf-8", errors="ignore") as f:
-                paths = [line.strip() for line in f if line.strip()]
-        except Exception as e:
+            wordlist = Wordlist(wordlist_path, dedup=dedup)
+        except OSError as e:
             print(f"[bold red][!][/bold red] Dosya okunurken hata: {e}")
+            if client is not None:
+                client.close()
             return False
 
         print(
-            f"[bold blue][*][/bold blue] Tarama başlıyor... ({len(paths)} yol, {threads} thread)"
+            f"[bold blue][*][/bold blue] Tarama başlıyor... (~{wordlist.estimate_lines()} yol, "
+            f"{threads} thread, istemci: {client_mode})"
         )
 
-        found_count = 0
-        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-            future_to_url = {
-                executor.submit(self.check_url, target_url, path): path
-                for path in paths
-            }
-            for future in concurrent.futures.as_completed(future_to_url):
-                result = future.result()
-                if result:
-                    path, status, _full_url = result
-
-                    status_color = "green"
-                    if status in [401, 403]:
-                        status_color = "yellow"
-                    elif status >= 500:
-                        status_color = "red"
-
-                    print(
-                        f"[{status_color}][+] /{path:<20} (Status: {status})[/{status_color}]"
-                    )
-                    found_count += 1
+        print_lock = threading.Lock()
+        found = []
+
+        def on_hit(result):
+            path, status, _full_url = result
+
+            status_color = "green"
+            if status in [401, 403]:
+                status_color = "yellow"
+            elif status >= 500:
+                status_color = "red"
+
+            with print_lock:
+                print(
+                    f"[{status_color}][+] /{path:<20} (Status: {status})[/{status_color}]"
+                )
+                found.append(result)
+
+        try:
+            tried = self.scan_stream(target_url, iter(wordlist), threads, on_hit, check)
+        except OSError as e:
+            print(f"[bold red][!][/bold red] Dosya okunurken hata: {e}")
+            return False
+        finally:
+            wordlist.close()
+            if client is not None:
+                client.close()
 
         print(
-            f"\n[bold green]Tarama Tamamlandı![/bold green] Toplam {found_count} dizin/dosya bulundu."
+            f"\n[bold green]Tarama Tamamlandı![/bold green] {tried} yol denendi, "
+            f"toplam {len(found)} dizin/dosya bulundu."
         )
+        if filtered:
+            print(
+                f"[bold blue][*][/bold blue] {len(filtered)} wildcard/soft-404 yanıtı filtrelendi."
+            )
         return True
@@ -1,5 +1,12 @@
+import asyncio
 import concurrent.futures
+import ipaddress
+import itertools
+import math
 import socket
+import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
 
 from rich import print
@@ -8,6 +15,158 @@ from core.module import BaseModule
 from core.option import Option
 from core.workspace_manager import get_workspace_manager
 
+# async motor: RTT tabanlı timeout alt sınırı (saniye) ve soket payı
+_MIN_TIMEOUT = 0.1
+_FD_RESERVE = 64
+
+
+class _RttEstimator:
+    """Host başına RTT tahmini (RFC 6298 SRTT/RTTVAR); timeout buradan türetilir.
+
+    Hem başarılı bağlantılar hem de RST (connection refused) yanıtları ölçüm
+    sayılır. Ölçüm gelene kadar kullanıcının TIMEOUT değeri kullanılır.
+    """
+
+    def __init__(self, ceiling: float, floor: float = _MIN_TIMEOUT) -> None:
+        self.ceiling = ceiling
+        self.floor = min(floor, ceiling)
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+
+    def observe(self, rtt: float) -> None:
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+
+    @property
+    def timeout(self) -> float:
+        if self.srtt is None:
+            return self.ceiling
+        return max(self.floor, min(self.ceiling, self.srtt + 4 * self.rttvar))
+
+
+class _RateLimiter:
+    """Saniyedeki bağlantı denemesini sınırlar; rate <= 0 ise sınırsız."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        if self._next < now:
+            self._next = now
+        wait = self._next - now
+        self._next += self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class _HostState:
+    """Zamanlayıcıdaki aktif bir hedefin durumu (port listesi paylaşılır, kopyalanmaz)."""
+
+    __slots__ = ("host", "in_flight", "next_index", "open_ports", "rtt")
+
+    def __init__(self, host: str, timeout: float) -> None:
+        self.host = host
+        self.next_index = 0
+        self.in_flight = 0
+        self.open_ports: list[int] = []
+        self.rtt = _RttEstimator(ceiling=timeout)
+
+
+# next_job: şu an verilecek iş yok, bir tamamlanmayı bekle
+_WAIT = object()
+
+
+class _SweepScheduler:
+    """Tüm (host, port) çiftlerini tek pencerede round-robin dağıtan zamanlayıcı.
+
+    Hedefler iterator'dan tembel çekilir; aynı anda yalnızca pencereyi
+    doldurmaya yetecek kadar host aktif tutulur. Her host için aynı anda en
+    fazla ``per_host`` deneme yapılır. Thread-safe değildir; motor kendi
+    kilidini (veya tek thread'li event loop'u) kullanır.
+    """
+
+    def __init__(
+        self, hosts, ports: list[int], window: int, per_host: int, timeout: float
+    ) -> None:
+        self._hosts = iter(hosts)
+        self._hosts_exhausted = False
+        self.ports = ports
+        self.per_host = max(1, per_host)
+        # Bir host en fazla port sayısı kadar deneme taşıyabilir; az portlu
+        # süpürmelerde pencereyi doldurmak için daha çok host aktif tutulur.
+        per_host_load = max(1, min(self.per_host, len(ports)))
+        self.max_active = max(1, math.ceil(window / per_host_load))
+        self.timeout = timeout
+        self._active: deque[_HostState] = deque()
+        self.hosts_done = 0
+
+    def _activate_hosts(self) -> None:
+        while not self._hosts_exhausted and len(self._active) < self.max_active:
+            host = next(self._hosts, None)
+            if host is None:
+                self._hosts_exhausted = True
+                return
+            self._active.append(_HostState(host, self.timeout))
+
+    def next_job(self):
+        """(state, port), ``_WAIT`` veya iş kalmadıysa None döner."""
+        self._activate_hosts()
+        if not self._active:
+            return None
+
+        total_ports = len(self.ports)
+        for _ in range(len(self._active)):
+            state = self._active[0]
+            self._active.rotate(-1)
+            if state.next_index < total_ports and state.in_flight < self.per_host:
+                port = self.ports[state.next_index]
+                state.next_index += 1
+                state.in_flight += 1
+                return state, port
+        return _WAIT
+
+    def complete(
+        self, state: _HostState, port: int, is_open: bool
+    ) -> _HostState | None:
+        """Sonucu işler; host tamamen bittiyse durumunu döner."""
+        state.in_flight -= 1
+        if is_open:
+            state.open_ports.append(port)
+        if state.in_flight == 0 and state.next_index >= len(self.ports):
+            self._active.remove(state)
+            self.hosts_done += 1
+            return state
+        return None
+
+
+def _raise_fd_limit(wanted: int) -> int:
+    """Soft RLIMIT_NOFILE değerini gerekirse yükseltir; kullanılabilir soket sayısını döner."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return wanted
+
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        target = wanted + _FD_RESERVE
+        if soft != resource.RLIM_INFINITY and soft < target:
+            new_soft = target if hard == resource.RLIM_INFINITY else min(target, hard)
+            resource.setrlimit(resource.RLIMIT_NOFILE, (new_soft, hard))
+            soft = new_soft
+        if soft == resource.RLIM_INFINITY:
+            return wanted
+        return max(1, min(wanted, soft - _FD_RESERVE))
+    except (ValueError, OSError):
+        return wanted
+
 
 class PortScanner(BaseModule):
     def __init__(self):
@@ -21,9 +180,7 @@ class PortScanner(BaseModule):
                 name="RHOST",
                 value="127.0.0.1",
                 required=True,
-                description="Hedef IP adresi",
-                regex_check=True,
-                regex=r"^\d{1,3}(\.\d{1,3}){3}$",
+                description="Hedef IP, CIDR (10.0.0.0/24), virgüllü liste veya file:<yol>",
             ),
             "RPORTS": Option(
                 name="RPORTS",
@@ -37,6 +194,37 @@ class PortScanner(BaseModule):
                 required=True,
                 description="Eşzamanlı tarama yapacak thread sayısı",
             ),
+            "HOST_CONCURRENCY": Option(
+                name="HOST_CONCURRENCY",
+                value=256,
+                required=False,
+                description="Tek bir hosta aynı anda yapılabilecek azami bağlantı denemesi",
+            ),
+            "ENGINE": Option(
+                name="ENGINE",
+                value="thread",
+                required=True,
+                description="Tarama motoru: thread veya async (non-blocking connect)",
+                choices=["thread", "async"],
+            ),
+            "CONCURRENCY": Option(
+                name="CONCURRENCY",
+                value=1000,
+                required=False,
+                description="async motorda aynı anda açık bağlantı penceresi",
+            ),
+            "TIMEOUT": Option(
+                name="TIMEOUT",
+                value=1.0,
+                required=False,
+                description="Bağlantı zaman aşımı (saniye); async motorda RTT ile küçülür",
+            ),
+            "RATE": Option(
+                name="RATE",
+                value=0,
+                required=False,
+                description="async motorda saniyedeki azami bağlantı denemesi (0 = sınırsız)",
+            ),
             "WORKSPACE": Option(
                 name="WORKSPACE",
                 value="",
@@ -47,11 +235,11 @@ class PortScanner(BaseModule):
 
         super().__init__()
 
-    def scan_port(self, ip, port):
+    def scan_port(self, ip, port, timeout=1.0):
         """Tek bir portu tarar ve sonucu döner."""
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1.0)  # 1 saniye zaman aşımı
+                s.settimeout(timeout)
                 result = s.connect_ex((ip, int(port)))
                 if result == 0:
                     return port
@@ -82,15 +270,143 @@ class PortScanner(BaseModule):
         valid_ports = sorted([p for p in ports if 1 <= p <= 65535])
         return valid_ports
 
+    def _expand_target(self, token):
+        token = token.strip()
+        if not token or token.startswith("#"):
+            return
+        if token.startswith("file:"):
+            path = token[len("file:") :]
+            try:
+                with open(path, encoding="utf-8", errors="ignore") as f:
+                    for line in f:
+                        for part in line.replace(",", " ").split():
+                            if part.startswith("#"):
+                                break
+                            yield from self._expand_target(part)
+            except OSError as e:
+                print(f"[yellow][!][/yellow] Hedef dosyası okunamadı: {path} ({e})")
+            return
+        try:
+            network = ipaddress.ip_network(token, strict=False)
+        except ValueError:
+            print(f"[yellow][!][/yellow] Geçersiz hedef: {token}")
+            return
+        if network.version != 4:
+            print(f"[yellow][!][/yellow] Yalnızca IPv4 destekleniyor: {token}")
+            return
+        if network.num_addresses == 1:
+            yield str(network.network_address)
+        else:
+            for address in network.hosts():
+                yield str(address)
+
+    def parse_targets(self, rhost):
+        """RHOST değerini tembel bir IP iterator'ına çevirir (CIDR / liste / file:)."""
+        for token in str(rhost).replace(",", " ").split():
+            yield from self._expand_target(token)
+
+    async def _async_probe(self, ip, port, rtt, limiter):
+        """Non-blocking connect; açık ise portu döner, RTT ölçümünü günceller."""
+        await limiter.acquire()
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), rtt.timeout)
+            rtt.observe(time.perf_counter() - started)
+            return port
+        except ConnectionRefusedError:
+            # RST de bir RTT örneğidir (kapalı port)
+            rtt.observe(time.perf_counter() - started)
+            return None
+        except (TimeoutError, OSError):
+            return None
+        finally:
+            sock.close()
+
+    async def _async_sweep(self, scheduler, concurrency, rate, on_host_done):
+        """Sabit boyutlu worker penceresiyle zamanlayıcıdaki tüm işleri tüketir."""
+        limiter = _RateLimiter(rate)
+        wake = asyncio.Event()
+
+        async def worker():
+            while True:
+                job = scheduler.next_job()
+                if job is None:
+                    return
+                if job is _WAIT:
+                    # Tek thread'li event loop: clear/wait arasında uyanma kaybolmaz
+                    wake.clear()
+                    await wake.wait()
+                    continue
+                state, port = job
+                is_open = await self._async_probe(state.host, port, state.rtt, limiter)
+                finished = scheduler.complete(state, port, bool(is_open))
+                wake.set()
+                if is_open:
+                    self._report_open(state.host, port)
+                if finished is not None:
+                    on_host_done(finished)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    def _threaded_sweep(self, scheduler, threads, timeout, on_host_done):
+        """THREADS adet worker thread ile zamanlayıcıdaki tüm işleri tüketir."""
+        cond = threading.Condition()
+
+        def worker():
+            while True:
+                with cond:
+                    job = scheduler.next_job()
+                    while job is _WAIT:
+                        cond.wait()
+                        job = scheduler.next_job()
+                if job is None:
+                    return
+                state, port = job
+                is_open = self.scan_port(state.host, port, timeout) is not None
+                with cond:
+                    finished = scheduler.complete(state, port, is_open)
+                    cond.notify_all()
+                if is_open:
+                    self._report_open(state.host, port)
+                if finished is not None:
+                    on_host_done(finished)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(worker) for _ in range(threads)]:
+                future.result()
+
+    def _report_open(self, host, port):
+        print(f"[bold green][+] {host}:{port} AÇIK (OPEN)[/bold green]")
+
     def run(self, options):
-        target_ip = options.get("RHOST")
+        target_spec = options.get("RHOST")
         rports_str = str(options.get("RPORTS"))
         try:
             threads = int(options.get("THREADS"))
         except Exception:
             threads = 10
+        engine = str(options.get("ENGINE") or "thread").lower()
+        try:
+            concurrency = max(1, int(options.get("CONCURRENCY") or 1000))
+        except (TypeError, ValueError):
+            concurrency = 1000
+        try:
+            per_host = max(1, int(options.get("HOST_CONCURRENCY") or 256))
+        except (TypeError, ValueError):
+            per_host = 256
+        try:
+            timeout = float(options.get("TIMEOUT") or 1.0)
+        except (TypeError, ValueError):
+            timeout = 1.0
+        try:
+            rate = float(options.get("RATE") or 0)
+        except (TypeError, ValueError):
+            rate = 0.0
 
-        print(f"[bold blue][*][/bold blue] Hedef: {target_ip}")
+        print(f"[bold blue][*][/bold blue] Hedef: {target_spec}")
         print("[bold blue][*][/bold blue] Portlar ayrıştırılıyor...")
 
         target_ports = self.parse_ports(rports_str)
@@ -98,55 +414,81 @@ class PortScanner(BaseModule):
             print("[bold red][!] Taranacak geçerli port bulunamadı.[/bold red]")
             return False
 
-        print(
-            f"[bold blue][*][/bold blue] {len(target_ports)} port taranacak. (Thread: {threads})"
-        )
+        hosts = self.parse_targets(target_spec)
+        head = list(itertools.islice(hosts, 2))
+        if not head:
+            print("[bold red][!] Taranacak geçerli hedef bulunamadı.[/bold red]")
+            return False
+        single_host = len(head) == 1
+        hosts = itertools.chain(head, hosts)
 
-        open_ports = []
+        wm = get_workspace_manager()
+        write_loot = bool(wm and wm.active_name)
+        if not write_loot and options.get("WORKSPACE"):
+            print(
+                "[yellow][!] WORKSPACE seçeneği verildi ancak aktif workspace yok. "
+                "'workspace use <name>' çalıştırın.[/yellow]"
+            )
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-            future_to_port = {
-                executor.submit(self.scan_port, target_ip, port): port
-                for port in target_ports
-            }
-            for future in concurrent.futures.as_completed(future_to_port):
-                port = future_to_port[future]
-                try:
-                    result = future.result()
-                    if result:
-                        print(f"[bold green][+] Port {port} AÇIK (OPEN)[/bold green]")
-                        open_ports.append(port)
-                except Exception:
-                    pass
+        results: dict[str, list[int]] = {}
 
-        open_ports = sorted(open_ports)
+        def on_host_done(state):
+            # Loot, tüm tarama bitmeden host tamamlandığı anda yazılır
+            open_ports = sorted(state.open_ports)
+            if open_ports or single_host:
+                results[state.host] = open_ports
+            if not single_host and open_ports:
+                print(
+                    f"[bold blue][*][/bold blue] {state.host}: {len(open_ports)} açık port "
+                    f"({', '.join(map(str, open_ports))})"
+                )
+            if write_loot and (open_ports or single_host):
+                loot_path = wm.write_ports_loot(
+                    state.host,
+                    open_ports,
+                    extra={
+                        "scanned_ports": len(target_ports),
+                        "engine": engine,
+                        "scanned_at": datetime.now(timezone.utc).isoformat(),
+                        "module": "auxiliary/scanner/port_scanner",
+                    },
+                )
+                if loot_path:
+                    print(f"[bold blue][*][/bold blue] Loot yazıldı: {loot_path}")
 
-        if open_ports:
+        if engine == "async":
+            window = _raise_fd_limit(concurrency)
             print(
-                f"\n[bold green]Tarama Tamamlandı![/bold green] Toplam {len(open_ports)} açık port bulundu."
+                f"[bold blue][*][/bold blue] Host başına {len(target_ports)} port taranacak. "
+                f"(Motor: async, pencere: {window}, host başına: {per_host}, "
+                f"oran: {rate or 'sınırsız'}/s)"
             )
         else:
+            window = threads
             print(
-                "\n[bold yellow]Tarama Tamamlandı![/bold yellow] Açık port bulunamadı."
+                f"[bold blue][*][/bold blue] Host başına {len(target_ports)} port taranacak. (Thread: {threads})"
             )
 
-        wm = get_workspace_manager()
-        if wm and wm.active_name:
-            loot_path = wm.write_ports_loot(
-                str(target_ip),
-                open_ports,
-                extra={
-                    "scanned_ports": len(target_ports),
-                    "scanned_at": datetime.now(timezone.utc).isoformat(),
-                    "module": "auxiliary/scanner/port_scanner",
-                },
+        scheduler = _SweepScheduler(
+            hosts, target_ports, window=window, per_host=per_host, timeout=timeout
+        )
+        started = time.perf_counter()
+        if engine == "async":
+            asyncio.run(self._async_sweep(scheduler, window, rate, on_host_done))
+        else:
+            self._threaded_sweep(scheduler, window, timeout, on_host_done)
+        elapsed = time.perf_counter() - started
+
+        total_open = sum(len(ports) for ports in results.values())
+        if total_open:
+            print(
+                f"\n[bold green]Tarama Tamamlandı![/bold green] {scheduler.hosts_done} host, "
+                f"toplam {total_open} açık port bulundu. ({elapsed:.2f}s)"
             )
-            if loot_path:
-                print(f"[bold blue][*][/bold blue] Loot yazıldı: {loot_path}")
-        elif options.get("WORKSPACE"):
+        else:
             print(
-                "[yellow][!] WORKSPACE seçeneği verildi ancak aktif workspace yok. "
-                "'workspace use <name>' çalıştırın.[/yellow]"
+                f"\n[bold yellow]Tarama Tamamlandı![/bold yellow] {scheduler.hosts_done} host, "
+                f"açık port bulunamadı. ({elapsed:.2f}s)"
             )
 
         return True
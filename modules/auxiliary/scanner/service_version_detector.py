@@ -1,10 +1,27 @@
-import socket
+from datetime import UTC, datetime
 from typing import Any
 
 from rich import print
+from rich.markup import escape
+from rich.table import Table
 
+from core.fingerprint import DEFAULT_WINDOW, FingerprintEngine
 from core.module import BaseModule
 from core.option import Option
+from core.workspace_manager import get_workspace_manager
+
+
+def parse_port_list(value: Any) -> list[int]:
+    """'22' veya '22,80,443' biçimindeki port listesini ayrıştırır."""
+    ports = []
+    for part in str(value).split(","):
+        part = part.strip()
+        if part:
+            port = int(part)
+            if not 0 < port < 65536:
+                raise ValueError(f"Geçersiz port: {port}")
+            ports.append(port)
+    return ports
 
 
 class service_version_detector(BaseModule):
@@ -13,10 +30,10 @@ class service_version_detector(BaseModule):
     """
 
     Name = "Service Version Detector"
-    Description = "TCP portlarına bağlanarak dönen banner bilgisini okur ve servis versiyonunu tespit etmeye çalışır."
+    Description = "TCP portlarına probe'lar göndererek servis ve versiyonu tespit eder; port_scanner loot'undaki tüm hedefleri eşzamanlı tarayabilir."
     Author = "Mahmut P."
     Category = "auxiliary/scanner"
-    Version = "1.0"
+    Version = "1.1"
 
     Requirements = {"python": []}
 
@@ -24,52 +41,172 @@ class service_version_detector(BaseModule):
         super().__init__()
         self.Options = {
             "RHOST": Option("RHOST", "127.0.0.1", True, "Hedef IP adresi"),
-            "RPORT": Option("RPORT", 22, True, "Hedef Port"),
+            "RPORT": Option(
+                "RPORT", 22, True, "Hedef port veya virgülle ayrılmış portlar"
+            ),
+            "FROM_LOOT": Option(
+                "FROM_LOOT",
+                "false",
+                False,
+                "Hedefleri aktif workspace'teki port_scanner loot'undan al (hosts/<ip>/ports.json)",
+                choices=["true", "false"],
+            ),
+            "CONCURRENCY": Option(
+                "CONCURRENCY",
+                DEFAULT_WINDOW,
+                False,
+                "Aynı anda parmak izi alınan host:port sayısı",
+            ),
             "TIMEOUT": Option("TIMEOUT", 3, False, "Bağlantı zaman aşımı (saniye)"),
+            "READ_TIMEOUT": Option(
+                "READ_TIMEOUT", 2, False, "Probe başına yanıt bekleme süresi (saniye)"
+            ),
         }
         for option_name, option_obj in self.Options.items():
             setattr(self, option_name, option_obj.value)
 
-    def run(self, options: dict[str, Any]):
-        rhost = options.get("RHOST")
-        rport = int(options.get("RPORT", 22))
-        timeout = float(options.get("TIMEOUT", 3))
+    def _targets(self, options, wm):
+        """(hedefler, host başına port sayısı); hedef üreteci tembeldir."""
+        if str(options.get("FROM_LOOT", "false")).lower() == "true":
+            if not (wm and wm.active_name):
+                raise ValueError(
+                    "FROM_LOOT için aktif workspace gerekli ('workspace use <name>')."
+                )
+            loot = list(wm.iter_ports_loot())
+            counts = {host: len(ports) for host, ports in loot}
+            return ((host, port) for host, ports in loot for port in ports), counts
 
-        print(
-            f"[bold cyan][*] {rhost}:{rport} portunda servis dinleniyor...[/bold cyan]"
-        )
+        rhost = options.get("RHOST")
+        ports = parse_port_list(options.get("RPORT", 22))
+        return ((rhost, port) for port in ports), {rhost: len(ports)}
 
+    def run(self, options: dict[str, Any]):
+        wm = get_workspace_manager()
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout)
-                s.connect((rhost, rport))
-
-                # Olası HTTP servisleri için payload yollama (Bazen banner direkt gelmez)
-                if rport in [80, 8080, 443]:
-                    s.sendall(b"HEAD / HTTP/1.0\r\n\r\n")
-
-                banner = s.recv(1024).decode("utf-8", errors="ignore").strip()
-
-                if banner:
-                    print(
-                        f"\n[bold green][+] Banner Bulundu ({rhost}:{rport}):[/bold green]"
-                    )
-                    print(f"[green]{banner}[/green]")
-                    return True
-                else:
-                    print("[yellow][!] Cihaz bağlandı fakat banner dönmedi.[/yellow]")
-                    return True
-
-        except TimeoutError:
-            print(
-                f"[bold red][-] {rhost}:{rport} - Bağlantı zaman aşımına uğradı.[/bold red]"
+            targets, remaining = self._targets(options, wm)
+            engine = FingerprintEngine(
+                window=int(options.get("CONCURRENCY") or DEFAULT_WINDOW),
+                timeout=float(options.get("TIMEOUT", 3)),
+                read_timeout=float(options.get("READ_TIMEOUT", 2)),
             )
+        except ValueError as e:
+            print(f"[bold red][-] {e}[/bold red]")
             return False
-        except ConnectionRefusedError:
+
+        total = sum(remaining.values())
+        if not total:
             print(
-                f"[bold red][-] {rhost}:{rport} - Bağlantı reddedildi (Port kapalı olabilir).[/bold red]"
+                "[yellow][!] Loot'ta açık port bulunamadı; önce port_scanner çalıştırın.[/yellow]"
             )
             return False
-        except Exception as e:
-            print(f"[bold red][-] Beklenmeyen Hata: {e!s}[/bold red]")
+
+        single = total == 1
+        if single:
+            # Tek hedef loot'tan da gelebilir; portu RPORT'tan değil hedeften al
+            targets = list(targets)
+            host, port = targets[0]
+            print(
+                f"[bold cyan][*] {host}:{port} portunda servis dinleniyor...[/bold cyan]"
+            )
+        else:
+            print(
+                f"[bold cyan][*] {len(remaining)} host üzerinde {total} port için parmak izi alınıyor "
+                f"(pencere: {engine.window})...[/bold cyan]"
+            )
+
+        write_loot = bool(wm and wm.active_name)
+        per_host: dict[str, list[dict[str, Any]]] = {}
+        results = []
+
+        def on_result(result):
+            results.append(result)
+            if not single and not result.error:
+                label = " ".join(
+                    part for part in (result.product, result.version) if part
+                )
+                print(
+                    f"[green][+][/green] {result.host}:{result.port} "
+                    f"[bold]{result.service}[/bold] {escape(label)}"
+                )
+            if not write_loot:
+                return
+            if not result.error:
+                per_host.setdefault(result.host, []).append(result.to_dict())
+            # Host'un tüm portları bittiği anda loot yazılır
+            remaining[result.host] -= 1
+            if remaining[result.host] == 0 and per_host.get(result.host):
+                wm.write_services_loot(
+                    result.host,
+                    per_host.pop(result.host),
+                    extra={
+                        "scanned_at": datetime.now(UTC).isoformat(),
+                        "module": "auxiliary/scanner/service_version_detector",
+                    },
+                )
+
+        engine.run_stream(targets, on_result)
+
+        if single:
+            return self._report_single(results[0])
+
+        results.sort(key=lambda r: (r.host, r.port))
+        table = Table(
+            title="Servis Parmak İzleri", show_header=True, header_style="bold magenta"
+        )
+        table.add_column("Host", style="cyan")
+        table.add_column("Port", justify="right")
+        table.add_column("Servis", style="bold")
+        table.add_column("Ürün / Sürüm")
+        table.add_column("Banner", style="dim", overflow="fold")
+        for result in results:
+            if result.error:
+                continue
+            table.add_row(
+                result.host,
+                str(result.port) + ("/tls" if result.tls else ""),
+                result.service,
+                escape(" ".join(p for p in (result.product, result.version) if p)),
+                escape(result.banner),
+            )
+        print()
+        print(table)
+
+        failed = sum(1 for r in results if r.error)
+        if failed:
+            print(f"[yellow][!] {failed} hedefe bağlanılamadı.[/yellow]")
+        if write_loot:
+            print(
+                f"[bold blue][*][/bold blue] Servis loot'u yazıldı: "
+                f"{wm.get_active_path() / 'hosts'}/<ip>/services.json"
+            )
+        return failed < len(results)
+
+    def _report_single(self, result):
+        target = f"{result.host}:{result.port}"
+        if result.error:
+            if result.error == "connection refused":
+                print(
+                    f"[bold red][-] {target} - Bağlantı reddedildi (Port kapalı olabilir).[/bold red]"
+                )
+            elif result.error == "timed out":
+                print(
+                    f"[bold red][-] {target} - Bağlantı zaman aşımına uğradı.[/bold red]"
+                )
+            else:
+                print(
+                    f"[bold red][-] Beklenmeyen Hata: {escape(result.error)}[/bold red]"
+                )
             return False
+
+        if not result.banner:
+            print("[yellow][!] Cihaz bağlandı fakat banner dönmedi.[/yellow]")
+            return True
+
+        print(f"\n[bold green][+] Banner Bulundu ({target}):[/bold green]")
+        print(f"[green]{escape(result.banner)}[/green]")
+        if result.identified:
+            label = " ".join(p for p in (result.product, result.version) if p)
+            print(
+                f"[bold green][+] Servis: {result.service} {escape(label)}[/bold green]"
+            )
+        return True
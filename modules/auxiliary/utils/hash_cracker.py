@@ -9,6 +9,9 @@
 #   3. set HASH_TYPE auto
 #   4. set WORDLIST config/wordlists/passwords/common_passwords.txt
 #   5. run
+#
+# Her kelime hash tipi başına bir kez hash'lenir ve tüm hedeflerle aynı
+# anda karşılaştırılır; wordlist parçaları WORKERS süreç arasında paylaşılır.
 # =============================================================================
 
 import hashlib
@@ -23,8 +26,15 @@ from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
 from core import logger
+from core.hash_engine import (
+    DEFAULT_CHUNK_BYTES,
+    crack_batch,
+    crack_chunk,
+    parse_digest,
+)
 from core.module import BaseModule
 from core.option import Option
+from core.wordlist import Wordlist
 
 # ── Hash tipi → uzunluk eşlemesi ────────────────────────────────────────────
 HASH_LENGTHS: dict[int, list[str]] = {
@@ -92,6 +102,25 @@ class hash_cracker(BaseModule):
                 completion_dir="config/wordlists/passwords",
                 completion_extensions=[".txt"],
             ),
+            "WORKERS": Option(
+                name="WORKERS",
+                value=0,
+                required=False,
+                description="Kullanılacak süreç sayısı (0: tüm çekirdekler, 1: tek süreç)",
+            ),
+            "CHUNK_BYTES": Option(
+                name="CHUNK_BYTES",
+                value=DEFAULT_CHUNK_BYTES,
+                required=False,
+                description="Bir sürece tek seferde verilecek wordlist parçası (bayt)",
+            ),
+            "DEDUP": Option(
+                name="DEDUP",
+                value="false",
+                required=False,
+                description="Wordlist'teki tekrarlanan satırları disk üzerinde ayıkla",
+                choices=["true", "false"],
+            ),
         }
         for opt_name, opt_obj in self.Options.items():
             setattr(self, opt_name, opt_obj.value)
@@ -117,21 +146,6 @@ class hash_cracker(BaseModule):
         h.update(word.encode("utf-8", errors="replace"))
         return h.hexdigest()
 
-    def _load_wordlist(self, path: str) -> list[str]:
-        """Wordlist dosyasını satır satır okur."""
-        words: list[str] = []
-        try:
-            with open(path, encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    word = line.strip()
-                    if word:
-                        words.append(word)
-        except FileNotFoundError:
-            print(f"[bold red][-] Wordlist bulunamadı: {path}[/bold red]")
-        except Exception as e:
-            print(f"[bold red][-] Wordlist okuma hatası: {e}[/bold red]")
-        return words
-
     def _load_hashes(self, options: dict[str, Any]) -> list[str]:
         """HASH veya HASH_FILE'dan hash listesini yükler."""
         hashes: list[str] = []
@@ -157,11 +171,39 @@ class hash_cracker(BaseModule):
         self, target_hash: str, hash_type: str, words: list[str]
     ) -> str | None:
         """Tek bir hash'i wordlist üzerinde dener."""
-        target_hash = target_hash.lower()
-        for word in words:
-            if self.compute_hash(word, hash_type) == target_hash:
-                return word
-        return None
+        digest = parse_digest(target_hash)
+        if digest is None:
+            return None
+        encoded = (word.encode("utf-8", errors="replace") for word in words)
+        found = crack_chunk(encoded, {hash_type: frozenset([digest])})
+        word = found.get((hash_type, digest))
+        return word.decode("utf-8", errors="replace") if word is not None else None
+
+    def _group_targets(
+        self, hashes: list[str], hash_type_opt: str
+    ) -> tuple[list[tuple[str, str, bytes | None]], dict[str, set[bytes]]]:
+        """Hash'leri tipine göre gruplar.
+
+        Returns:
+            ([(hash, tip, digest)], {tip: digest kümesi}); tipi algılanamayan
+            veya hex olmayan hash'lerin digest'i None olur.
+        """
+        entries: list[tuple[str, str, bytes | None]] = []
+        targets: dict[str, set[bytes]] = {}
+        for target_hash in hashes:
+            if hash_type_opt == "auto":
+                ht = self.detect_hash_type(target_hash)
+                if not ht:
+                    entries.append((target_hash, "?", None))
+                    continue
+            else:
+                ht = hash_type_opt
+
+            digest = parse_digest(target_hash)
+            entries.append((target_hash, ht, digest))
+            if digest is not None:
+                targets.setdefault(ht, set()).add(digest)
+        return entries, targets
 
     # ── RUN ──────────────────────────────────────────────────────────────────
 
@@ -187,44 +229,84 @@ class hash_cracker(BaseModule):
             )
             return False
 
-        # Wordlist yükle
-        words = self._load_wordlist(wordlist_path)
-        if not words:
+        if not os.path.isfile(wordlist_path):
+            print(f"[bold red][-] Wordlist bulunamadı: {wordlist_path}[/bold red]")
+            return False
+
+        try:
+            workers = int(options.get("WORKERS") or 0)
+            chunk_bytes = max(1, int(options.get("CHUNK_BYTES") or DEFAULT_CHUNK_BYTES))
+        except (TypeError, ValueError):
+            workers, chunk_bytes = 0, DEFAULT_CHUNK_BYTES
+        dedup = str(options.get("DEDUP", "false")).lower() == "true"
+        workers = workers or os.cpu_count() or 1
+
+        entries, targets = self._group_targets(hashes, hash_type_opt)
+        unsupported = sorted(set(targets) - hashlib.algorithms_available)
+        if unsupported:
+            print(
+                f"[bold red][-] Desteklenmeyen hash tipi: {', '.join(unsupported)}[/bold red]"
+            )
+            return False
+
+        try:
+            wordlist = Wordlist(wordlist_path, dedup=dedup)
+        except OSError as e:
+            print(f"[bold red][-] Wordlist okuma hatası: {e}[/bold red]")
             return False
 
         self.console.print(f"  [cyan]Hash sayısı  :[/cyan] {len(hashes)}")
-        self.console.print(f"  [cyan]Wordlist     :[/cyan] {len(words)} kelime")
+        self.console.print(
+            f"  [cyan]Wordlist     :[/cyan] {wordlist_path} (~{wordlist.estimate_lines()} satır)"
+        )
+        self.console.print(f"  [cyan]Süreç        :[/cyan] {workers}")
         self.console.print()
 
-        # Sonuç tablosu
-        results: list[tuple[str, str, str | None]] = []
         start_time = time.time()
+        tried = 0
+
+        with (
+            wordlist,
+            Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.fields[words]} kelime"),
+                TimeElapsedColumn(),
+                console=self.console,
+            ) as progress,
+        ):
+            task = progress.add_task("Kırılıyor...", total=wordlist.size or 1, words=0)
+
+            def on_progress(count: int, nbytes: int) -> None:
+                nonlocal tried
+                tried += count
+                progress.update(task, advance=nbytes, words=tried)
+
+            try:
+                found = crack_batch(
+                    targets,
+                    wordlist,
+                    workers=workers,
+                    chunk_bytes=chunk_bytes,
+                    on_progress=on_progress,
+                )
+            except OSError as e:
+                print(f"[bold red][-] Wordlist okuma hatası: {e}[/bold red]")
+                return False
 
-        with Progress(
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            TimeElapsedColumn(),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task("Kırılıyor...", total=len(hashes))
-
-            for target_hash in hashes:
-                # Tip algılama
-                if hash_type_opt == "auto":
-                    detected = self.detect_hash_type(target_hash)
-                    if not detected:
-                        results.append((target_hash, "?", None))
-                        progress.advance(task)
-                        continue
-                    ht = detected
-                else:
-                    ht = hash_type_opt
-
-                # Saldırı
-                found = self._crack_hash(target_hash, ht, words)
-                results.append((target_hash, ht, found))
-                progress.advance(task)
+        # Sonuç tablosu
+        results: list[tuple[str, str, str | None]] = []
+        for target_hash, ht, digest in entries:
+            word = found.get((ht, digest)) if digest is not None else None
+            results.append(
+                (
+                    target_hash,
+                    ht,
+                    word.decode("utf-8", errors="replace")
+                    if word is not None
+                    else None,
+                )
+            )
 
         elapsed = time.time() - start_time
 
@@ -249,7 +331,7 @@ class hash_cracker(BaseModule):
             Panel.fit(
                 f"[green]Kırılan:[/green] {cracked}/{len(hashes)}  |  "
                 f"[cyan]Süre:[/cyan] {elapsed:.2f}s  |  "
-                f"[dim]Wordlist:[/dim] {len(words)} kelime",
+                f"[dim]Denenen:[/dim] {tried} kelime",
                 title="📊 Özet",
                 border_style="green",
             )
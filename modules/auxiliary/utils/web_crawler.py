@@ -11,6 +11,14 @@
 #   5. run
 # =============================================================================
 
+import codecs
+import hashlib
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from html.parser import HTMLParser
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
@@ -24,7 +32,229 @@ from core.module import BaseModule
 from core.option import Option
 
 requests = None  # type: ignore[assignment]
-BeautifulSoup = None  # type: ignore[assignment]
+
+# Yanıt gövdesi akış halinde bu boyutta parçalarla okunur
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class PageExtractor:
+    """Tek geçişte link, form ve meta bilgisi toplayan olay tabanlı hedef.
+
+    ``start`` / ``end`` / ``data`` / ``close`` arayüzü hem stdlib
+    ``HTMLParser`` adaptörü hem de lxml'in ``target`` parser'ı tarafından
+    çağrılır; sayfa ağacı hiç kurulmaz.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.links: list[str] = []
+        self.forms: list[dict[str, Any]] = []
+        self.meta: dict[str, str] = {}
+        self._form: dict[str, Any] | None = None
+        self._title: list[str] | None = None
+        self._title_done = False
+
+    def start(self, tag: str, attrs: dict[str, str]) -> None:
+        if tag == "a":
+            if "href" in attrs:
+                full = web_crawler._normalize_url(urljoin(self.base_url, attrs["href"]))
+                if full.startswith(("http://", "https://")):
+                    self.links.append(full)
+        elif tag == "form":
+            action = attrs.get("action", "")
+            self._form = {
+                "action": urljoin(self.base_url, action) if action else self.base_url,
+                "method": (attrs.get("method") or "GET").upper(),
+                "inputs": [],
+            }
+            self.forms.append(self._form)
+        elif tag in ("input", "textarea", "select"):
+            if self._form is not None:
+                self._form["inputs"].append(
+                    {
+                        "name": attrs.get("name", ""),
+                        "type": attrs.get("type", "text"),
+                        "value": attrs.get("value", ""),
+                    }
+                )
+        elif tag == "meta":
+            name = attrs.get("name", attrs.get("property", ""))
+            content = attrs.get("content", "")
+            if name and content:
+                self.meta[name.lower()] = content[:120]
+        elif tag == "title" and not self._title_done:
+            self._title = []
+
+    def end(self, tag: str) -> None:
+        if tag == "form":
+            self._form = None
+        elif tag == "title" and self._title is not None:
+            self.meta["title"] = "".join(self._title).strip()
+            self._title = None
+            self._title_done = True
+
+    def data(self, text: str) -> None:
+        if self._title is not None:
+            self._title.append(text)
+
+    def close(self) -> dict[str, Any]:
+        if self._title is not None:
+            self.end("title")
+        return {"links": self.links, "forms": self.forms, "meta": self.meta}
+
+
+class _StdlibFeeder(HTMLParser):
+    """stdlib HTMLParser olaylarını ``PageExtractor``'a aktarır."""
+
+    def __init__(self, target: PageExtractor):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        # Değersiz öznitelikler (<input disabled>) None gelir
+        self.target.start(tag, {k: v or "" for k, v in attrs})
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+
+class _LxmlTarget(PageExtractor):
+    """lxml ``target`` arayüzü: öznitelikler sözlük benzeri nesne olarak gelir."""
+
+    def start(self, tag, attrs):
+        super().start(tag, dict(attrs))
+
+
+def create_extractor(base_url: str, backend: str = "stream"):
+    """(feed, close) çifti döner; ``backend="lxml"`` kurulu değilse stdlib'e düşer."""
+    if backend == "lxml":
+        try:
+            from lxml import etree
+        except ImportError:
+            backend = "stream"
+        else:
+            target = _LxmlTarget(base_url)
+            parser = etree.HTMLParser(target=target)
+            return parser.feed, parser.close
+
+    extractor = PageExtractor(base_url)
+    feeder = _StdlibFeeder(extractor)
+
+    def close():
+        feeder.close()
+        return extractor.close()
+
+    return feeder.feed, close
+
+
+def extract_page(html: str, base_url: str, backend: str = "stream") -> dict[str, Any]:
+    """HTML metninden links/forms/meta bilgisini tek geçişte çıkarır."""
+    feed, close = create_extractor(base_url, backend)
+    try:
+        feed(html)
+        return close()
+    except Exception:
+        return {"links": [], "forms": [], "meta": {}}
+
+
+class UrlSeenSet:
+    """Görülen URL kümesi.
+
+    URL metinleri yerine 8 baytlık blake2b özetleri tam sayı olarak saklanır;
+    URL başına bellek maliyeti URL uzunluğundan bağımsızdır ve milyonlarca
+    URL'ye ölçeklenir.
+    """
+
+    def __init__(self):
+        self._digests: set[int] = set()
+
+    @staticmethod
+    def _key(url: str) -> int:
+        digest = hashlib.blake2b(url.encode("utf-8", "surrogatepass"), digest_size=8)
+        return int.from_bytes(digest.digest(), "big")
+
+    def add(self, url: str) -> bool:
+        """URL yeniyse ekler ve True döner."""
+        key = self._key(url)
+        if key in self._digests:
+            return False
+        self._digests.add(key)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return self._key(url) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class CrawlFrontier:
+    """Host başına öncelik kuyruklu tarama sınırı (frontier).
+
+    Her host için derinliğe göre sıralı bir heap tutulur (BFS sırası korunur);
+    hostlar round-robin dolaşılır. Nezaket (politeness) kuralları: bir hosta
+    aynı anda en fazla ``per_host`` istek ve iki istek arasında en az
+    ``delay`` saniye.
+    """
+
+    def __init__(self, per_host: int = 4, delay: float = 0.0):
+        self.per_host = max(1, per_host)
+        self.delay = max(0.0, delay)
+        self._queues: dict[str, list[tuple[int, int, str]]] = {}
+        self._hosts: deque[str] = deque()
+        self._in_flight: dict[str, int] = {}
+        self._next_allowed: dict[str, float] = {}
+        self._seq = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, url: str, depth: int) -> None:
+        host = urlparse(url).netloc
+        queue = self._queues.get(host)
+        if queue is None:
+            queue = self._queues[host] = []
+            self._hosts.append(host)
+        heapq.heappush(queue, (depth, next(self._seq), url))
+        self._size += 1
+
+    def pop(self, now: float | None = None) -> tuple[str, int] | float | None:
+        """Sıradaki (url, derinlik) çiftini döner.
+
+        Hiçbir host şu an uygun değilse beklenmesi gereken süreyi (saniye),
+        kuyruk boşsa None döner.
+        """
+        if not self._size:
+            return None
+        now = time.monotonic() if now is None else now
+        wait_for = None
+        for _ in range(len(self._hosts)):
+            host = self._hosts[0]
+            self._hosts.rotate(-1)
+            queue = self._queues[host]
+            if not queue or self._in_flight.get(host, 0) >= self.per_host:
+                continue
+            ready_at = self._next_allowed.get(host, 0.0)
+            if ready_at > now:
+                remaining = ready_at - now
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+                continue
+            depth, _, url = heapq.heappop(queue)
+            self._size -= 1
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            self._next_allowed[host] = now + self.delay
+            return url, depth
+        # Tüm hostlar limitte: bir isteğin bitmesi beklenmeli (0 = süresiz)
+        return wait_for if wait_for is not None else 0.0
+
+    def release(self, url: str) -> None:
+        """Biten isteğin host yuvasını serbest bırakır."""
+        host = urlparse(url).netloc
+        self._in_flight[host] = max(0, self._in_flight.get(host, 0) - 1)
 
 
 class web_crawler(BaseModule):
@@ -34,7 +264,7 @@ class web_crawler(BaseModule):
     ve bulunan URL'leri, formları, meta etiketlerini ve başlıkları raporlar.
 
     Özellikler:
-        - Derinlik seviyeli tarama (BFS)
+        - Derinlik seviyeli, eşzamanlı tarama (BFS, host başına nezaket limiti)
         - Form action ve input keşfi
         - Meta etiket çıkarma (title, description, keywords)
         - Robots.txt kontrolü
@@ -48,7 +278,7 @@ class web_crawler(BaseModule):
     Category = "auxiliary/utils"
     Version = "1.0"
 
-    Requirements = {"python": ["requests", "beautifulsoup4"]}
+    Requirements = {"python": ["requests"]}
 
     def __init__(self):
         super().__init__()
@@ -96,6 +326,45 @@ class web_crawler(BaseModule):
                 description="Robots.txt kontrol et (true/false)",
                 choices=["true", "false"],
             ),
+            "CONCURRENCY": Option(
+                name="CONCURRENCY",
+                value=8,
+                required=False,
+                description="Eşzamanlı istek sayısı",
+                regex_check=True,
+                regex=r"^\d+$",
+            ),
+            "PER_HOST": Option(
+                name="PER_HOST",
+                value=4,
+                required=False,
+                description="Aynı hosta aynı anda gönderilebilecek en fazla istek",
+                regex_check=True,
+                regex=r"^\d+$",
+            ),
+            "DELAY": Option(
+                name="DELAY",
+                value=0,
+                required=False,
+                description="Aynı hosta iki istek arasındaki en az süre (saniye)",
+                regex_check=True,
+                regex=r"^\d+(\.\d+)?$",
+            ),
+            "PARSER": Option(
+                name="PARSER",
+                value="stream",
+                required=False,
+                description="HTML ayrıştırıcı: stream (stdlib) veya lxml (kuruluysa, daha hızlı)",
+                choices=["stream", "lxml"],
+            ),
+            "MAX_BODY": Option(
+                name="MAX_BODY",
+                value=2 * 1024 * 1024,
+                required=False,
+                description="Sayfa başına okunacak en fazla gövde boyutu (bayt)",
+                regex_check=True,
+                regex=r"^\d+$",
+            ),
         }
         for opt_name, opt_obj in self.Options.items():
             setattr(self, opt_name, opt_obj.value)
@@ -105,14 +374,12 @@ class web_crawler(BaseModule):
     # ── YARDIMCI ─────────────────────────────────────────────────────────────
 
     def _ensure_http_deps(self) -> None:
-        """requests / bs4 yalnızca çalışma anında yüklenir."""
-        global requests, BeautifulSoup
+        """requests yalnızca çalışma anında yüklenir."""
+        global requests
         if requests is None:
             import requests as _requests
-            from bs4 import BeautifulSoup as _BeautifulSoup
 
             requests = _requests
-            BeautifulSoup = _BeautifulSoup
 
     @staticmethod
     def _same_domain(base_url: str, target_url: str) -> bool:
@@ -125,92 +392,92 @@ class web_crawler(BaseModule):
         parsed = urlparse(url)
         return parsed._replace(fragment="").geturl()
 
-    def _fetch_page(self, url: str, timeout: int, user_agent: str) -> tuple[str, int]:
-        """Sayfa HTML içeriğini ve HTTP durum kodunu döner."""
+    def _create_session(self, pool_size: int, user_agent: str):
+        """Bağlantı havuzlu requests.Session oluşturur."""
+        self._ensure_http_deps()
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = user_agent
+        return session
+
+    def _fetch_and_extract(
+        self,
+        url: str,
+        timeout: int,
+        user_agent: str,
+        session=None,
+        max_body: int = 2 * 1024 * 1024,
+        backend: str = "stream",
+    ) -> tuple[dict[str, Any] | None, int]:
+        """Sayfayı akış halinde okuyup gelen parçaları doğrudan ayrıştırıcıya besler.
+
+        Gövde ``max_body`` baytta kesilir; tüm sayfa bellekte tutulmaz.
+        (çıkarım, durum_kodu) döner; gövde boşsa çıkarım None olur.
+        """
         self._ensure_http_deps()
         try:
-            resp = requests.get(
+            resp = (session or requests).get(
                 url,
                 timeout=timeout,
                 headers={"User-Agent": user_agent},
                 allow_redirects=True,
                 verify=False,
+                stream=True,
             )
-            return resp.text, resp.status_code
         except Exception:
-            return "", 0
+            return None, 0
 
-    def _extract_links(self, html: str, base_url: str) -> list[str]:
-        """HTML'den tüm <a href> linklerini çıkarır."""
-        self._ensure_http_deps()
-        links: list[str] = []
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            for tag in soup.find_all("a", href=True):
-                href = tag["href"]
-                full = urljoin(base_url, href)
-                full = self._normalize_url(full)
-                if full.startswith(("http://", "https://")):
-                    links.append(full)
+            decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(
+                errors="replace"
+            )
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        feed, close = create_extractor(url, backend)
+        received = 0
+        try:
+            for chunk in resp.iter_content(READ_CHUNK_BYTES):
+                if not chunk:
+                    continue
+                chunk = chunk[: max_body - received]
+                received += len(chunk)
+                feed(decoder.decode(chunk))
+                if received >= max_body:
+                    break
+            feed(decoder.decode(b"", final=True))
+            extracted = close() if received else None
         except Exception:
-            pass
-        return links
+            extracted = None
+        finally:
+            resp.close()
+        return extracted, resp.status_code
+
+    def _extract_links(self, html: str, base_url: str) -> list[str]:
+        """HTML'den tüm <a href> linklerini çıkarır."""
+        return extract_page(html, base_url)["links"]
 
     def _extract_forms(self, html: str, base_url: str) -> list[dict[str, Any]]:
         """HTML'den form bilgilerini çıkarır."""
-        self._ensure_http_deps()
-        forms: list[dict[str, Any]] = []
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            for form in soup.find_all("form"):
-                action = form.get("action", "")
-                method = form.get("method", "GET").upper()
-                full_action = urljoin(base_url, action) if action else base_url
-                inputs: list[dict[str, str]] = []
-                for inp in form.find_all(["input", "textarea", "select"]):
-                    inputs.append(
-                        {
-                            "name": inp.get("name", ""),
-                            "type": inp.get("type", "text"),
-                            "value": inp.get("value", ""),
-                        }
-                    )
-                forms.append(
-                    {
-                        "action": full_action,
-                        "method": method,
-                        "inputs": inputs,
-                    }
-                )
-        except Exception:
-            pass
-        return forms
+        return extract_page(html, base_url)["forms"]
 
     def _extract_meta(self, html: str) -> dict[str, str]:
         """HTML'den başlık ve meta etiketlerini çıkarır."""
-        self._ensure_http_deps()
-        meta: dict[str, str] = {}
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            title_tag = soup.find("title")
-            if title_tag:
-                meta["title"] = title_tag.get_text(strip=True)
-            for tag in soup.find_all("meta"):
-                name = tag.get("name", tag.get("property", ""))
-                content = tag.get("content", "")
-                if name and content:
-                    meta[name.lower()] = content[:120]
-        except Exception:
-            pass
-        return meta
+        return extract_page(html, "")["meta"]
 
-    def _check_robots(self, base_url: str, timeout: int, user_agent: str) -> list[str]:
+    def _check_robots(
+        self, base_url: str, timeout: int, user_agent: str, session=None
+    ) -> list[str]:
         """Robots.txt içeriğini çeker ve disallow kurallarını döner."""
         self._ensure_http_deps()
         robots_url = urljoin(base_url, "/robots.txt")
         disallows: list[str] = []
         try:
-            resp = requests.get(
+            resp = (session or requests).get(
                 robots_url,
                 timeout=timeout,
                 headers={"User-Agent": user_agent},
@@ -227,6 +494,24 @@ class web_crawler(BaseModule):
             pass
         return disallows
 
+    def _crawl_page(
+        self,
+        session,
+        url: str,
+        timeout: int,
+        user_agent: str,
+        max_body: int,
+        backend: str,
+    ) -> dict[str, Any] | None:
+        """Worker thread'de sayfayı çeker ve tek geçişte ayrıştırır."""
+        extracted, status = self._fetch_and_extract(
+            url, timeout, user_agent, session, max_body, backend
+        )
+        if extracted is None or status == 0:
+            return None
+        extracted["status"] = status
+        return extracted
+
     # ── RUN ──────────────────────────────────────────────────────────────────
 
     def run(self, options: dict[str, Any]) -> bool:
@@ -236,6 +521,11 @@ class web_crawler(BaseModule):
         timeout = int(options.get("TIMEOUT", 5))
         user_agent = str(options.get("USER_AGENT", "MahFramework-Crawler/1.0"))
         check_robots = str(options.get("CHECK_ROBOTS", "true")).lower() == "true"
+        concurrency = max(1, int(options.get("CONCURRENCY", 8)))
+        per_host = max(1, int(options.get("PER_HOST", 4)))
+        delay = float(options.get("DELAY", 0) or 0)
+        backend = str(options.get("PARSER", "stream")).lower()
+        max_body = max(1, int(options.get("MAX_BODY", 2 * 1024 * 1024)))
 
         if not target_url.startswith(("http://", "https://")):
             print(
@@ -253,9 +543,11 @@ class web_crawler(BaseModule):
             )
         )
 
+        session = self._create_session(concurrency, user_agent)
+
         # ── Robots.txt ───────────────────────────────────────────────────
         if check_robots:
-            disallows = self._check_robots(target_url, timeout, user_agent)
+            disallows = self._check_robots(target_url, timeout, user_agent, session)
             if disallows:
                 tbl = Table(
                     title="🤖 Robots.txt — Disallow Kuralları", border_style="yellow"
@@ -266,47 +558,70 @@ class web_crawler(BaseModule):
                 self.console.print(tbl)
                 self.console.print()
 
-        # ── BFS Tarama ────────────────────────────────────────────────────
-        visited: set[str] = set()
+        # ── Eşzamanlı BFS Tarama ─────────────────────────────────────────
+        seen = UrlSeenSet()
         external_links: set[str] = set()
         all_forms: list[dict[str, Any]] = []
         page_info: list[dict[str, str]] = []
 
-        queue: list[tuple[str, int]] = [(self._normalize_url(target_url), 0)]
-
-        while queue and len(visited) < max_pages:
-            url, depth = queue.pop(0)
-            if url in visited or depth > max_depth:
-                continue
-            visited.add(url)
-
-            html, status = self._fetch_page(url, timeout, user_agent)
-            if not html or status == 0:
-                continue
-
-            # Meta
-            meta = self._extract_meta(html)
-            page_info.append(
-                {
-                    "url": url,
-                    "status": str(status),
-                    "title": meta.get("title", "-")[:60],
-                }
-            )
+        frontier = CrawlFrontier(per_host=per_host, delay=delay)
+        start_url = self._normalize_url(target_url)
+        seen.add(start_url)
+        frontier.push(start_url, 0)
+        dispatched = 0
+
+        with session, ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pending: dict[Any, tuple[str, int]] = {}
+            while pending or (frontier and dispatched < max_pages):
+                # Pencere ve nezaket kuralları izin verdikçe yeni istek gönder
+                wait_for = None
+                while len(pending) < concurrency and dispatched < max_pages:
+                    item = frontier.pop()
+                    if item is None:
+                        break
+                    if not isinstance(item, tuple):
+                        wait_for = item or None
+                        break
+                    url, depth = item
+                    future = pool.submit(
+                        self._crawl_page,
+                        session,
+                        url,
+                        timeout,
+                        user_agent,
+                        max_body,
+                        backend,
+                    )
+                    pending[future] = (url, depth)
+                    dispatched += 1
+
+                if not pending:
+                    # Yalnızca DELAY bekleniyor
+                    time.sleep(wait_for or 0.01)
+                    continue
+
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = pending.pop(future)
+                    frontier.release(url)
+                    result = future.result()
+                    if result is None:
+                        continue
+
+                    page_info.append(
+                        {
+                            "url": url,
+                            "status": str(result["status"]),
+                            "title": result["meta"].get("title", "-")[:60],
+                        }
+                    )
+                    all_forms.extend(result["forms"])
 
-            # Formlar
-            forms = self._extract_forms(html, url)
-            all_forms.extend(forms)
-
-            # Linkler
-            links = self._extract_links(html, url)
-            for link in links:
-                if self._same_domain(target_url, link):
-                    normalized = self._normalize_url(link)
-                    if normalized not in visited:
-                        queue.append((normalized, depth + 1))
-                else:
-                    external_links.add(link)
+                    for link in result["links"]:
+                        if not self._same_domain(target_url, link):
+                            external_links.add(link)
+                        elif depth < max_depth and seen.add(link):
+                            frontier.push(link, depth + 1)
 
         # ── Sonuçları Göster ──────────────────────────────────────────────
         # Sayfalar
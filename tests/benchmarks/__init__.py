@@ -0,0 +1,4 @@
+"""Çekirdek sıcak yollar için tekrarlanabilir performans ölçüm paketi.
+
+Çalıştırma: ``python -m tests.benchmarks`` (ayrıntılar README.md'de).
+"""
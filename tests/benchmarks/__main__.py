@@ -0,0 +1,156 @@
+"""Performans ölçüm paketini çalıştırır ve baseline ile karşılaştırır.
+
+Örnekler::
+
+    python -m tests.benchmarks                                  # tüm senaryolar
+    python -m tests.benchmarks --output bench/baseline.json     # baseline kaydet
+    python -m tests.benchmarks --baseline bench/baseline.json   # gerilemeleri bul
+
+Baseline ile karşılaştırmada gerileme varsa çıkış kodu 1'dir.
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+from loguru import logger
+from rich import print
+from rich.markup import escape
+from rich.table import Table
+
+from tests.benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    BenchmarkReport,
+    compare,
+    environment_info,
+)
+from tests.benchmarks.scenarios import (
+    CATALOG_SIZES,
+    DISPATCH_CALLS,
+    LOAD_SIZES,
+    REPO_ROOT,
+    run_suite,
+)
+
+DEFAULT_OUTPUT = REPO_ROOT / "config" / "benchmarks" / "latest.json"
+
+
+def _sizes(value: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(part) for part in value.split(",") if part.strip())
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Geçersiz boyut listesi: {value}") from e
+
+
+def _print_results(report: BenchmarkReport) -> None:
+    table = Table(title="Ölçüm Sonuçları (ms)", title_style="bold cyan")
+    table.add_column("Senaryo", style="cyan")
+    table.add_column("Örnek", justify="right", style="dim")
+    table.add_column("Min", justify="right")
+    table.add_column("Medyan", justify="right", style="bold")
+    table.add_column("p95", justify="right")
+    for result in report.results:
+        table.add_row(
+            escape(result.key),
+            str(result.samples),
+            f"{result.min:.3f}",
+            f"{result.median:.3f}",
+            f"{result.p95:.3f}",
+        )
+    print(table)
+
+
+def _print_comparison(
+    report: BenchmarkReport, baseline: BenchmarkReport, tolerance: float
+) -> int:
+    for key in ("python", "platform", "cpu_count"):
+        if baseline.environment.get(key) != report.environment.get(key):
+            print(
+                f"[yellow]Uyarı:[/yellow] baseline farklı ortamda alınmış ({key}: "
+                f"{baseline.environment.get(key)} → {report.environment.get(key)})"
+            )
+    regressions, improvements = compare(report, baseline, tolerance)
+    for item in improvements:
+        print(
+            f"[green]İyileşme[/green] {escape(item.key)}: {item.baseline:.3f} → "
+            f"{item.current:.3f} ms (x{item.ratio:.2f})"
+        )
+    for item in regressions:
+        print(
+            f"[bold red]Gerileme[/bold red] {escape(item.key)}: {item.baseline:.3f} → "
+            f"{item.current:.3f} ms (x{item.ratio:.2f})"
+        )
+    if not regressions:
+        print(f"[green]Gerileme yok[/green] (tolerans %{tolerance * 100:.0f})")
+    return len(regressions)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Mah Framework çekirdek performans ölçümleri",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=_sizes,
+        default=CATALOG_SIZES,
+        help="search/completer katalog boyutları (virgülle)",
+    )
+    parser.add_argument(
+        "--load-sizes",
+        type=_sizes,
+        default=LOAD_SIZES,
+        help="load_modules için diske yazılan modül sayıları (virgülle)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Senaryo başına örnek sayısı"
+    )
+    parser.add_argument(
+        "--dispatch-calls",
+        type=int,
+        default=DISPATCH_CALLS,
+        help="execute_command örnek sayısı",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT, help="Sonuç JSON dosyası"
+    )
+    parser.add_argument("--baseline", type=Path, help="Karşılaştırılacak sonuç dosyası")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Gerileme eşiği (0.25: medyan %%25 yavaşladıysa)",
+    )
+    parser.add_argument(
+        "--workdir", type=Path, help="Geçici dosyalar için dizin (varsayılan: tmp)"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = BenchmarkReport.load(args.baseline) if args.baseline else None
+
+    # Dosya log'u yazılmaz; hatalar konsolda kalır (main.py ile aynı seviye)
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        results = run_suite(
+            Path(workdir),
+            catalog_sizes=args.sizes,
+            load_sizes=args.load_sizes,
+            repeat=args.repeat,
+            dispatch_calls=args.dispatch_calls,
+            progress=lambda stage: print(f"[dim]» {stage}[/dim]"),
+        )
+    report = BenchmarkReport(results=results, environment=environment_info(REPO_ROOT))
+    _print_results(report)
+    saved = report.save(args.output)
+    print(f"Sonuçlar kaydedildi: [bold]{saved}[/bold]")
+
+    if baseline is None:
+        return 0
+    return 1 if _print_comparison(report, baseline, args.tolerance) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Ölçüm, sonuç dosyası ve baseline karşılaştırma yardımcıları.
+
+Her ölçüm (``Measurement``) bir senaryo adı ve parametreleriyle (ör.
+``{"size": 1000}``) anahtarlanır; süreler milisaniyedir. Karşılaştırma
+medyan üzerinden yapılır: gürültüye dayanıklıdır ve tek bir yavaş örnek
+(GC, disk önbelleği) gerilemeye sayılmaz.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Sonuç dosyası yapısı değişirse artırılır
+RESULT_FORMAT = 1
+
+# Medyan baseline'dan bu oranda yavaşsa gerileme sayılır
+DEFAULT_TOLERANCE = 0.25
+
+# Bu farkın (ms) altındaki değişimler ölçüm gürültüsü sayılır
+NOISE_FLOOR_MS = 0.05
+
+
+@dataclass
+class Measurement:
+    """Tek senaryonun örnek istatistikleri (ms)."""
+
+    name: str
+    params: dict[str, Any]
+    samples: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+
+    @property
+    def key(self) -> str:
+        """``load_modules.cold[size=1000]`` biçiminde kararlı anahtar."""
+        if not self.params:
+            return self.name
+        args = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{args}]"
+
+
+@dataclass
+class Comparison:
+    """Bir ölçümün baseline'a göre durumu."""
+
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+@dataclass
+class BenchmarkReport:
+    """Bir çalıştırmanın tüm ölçümleri ve ortam bilgisi."""
+
+    results: list[Measurement] = field(default_factory=list)
+    environment: dict[str, Any] = field(default_factory=dict)
+
+    def by_key(self) -> dict[str, Measurement]:
+        return {result.key: result for result in self.results}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": RESULT_FORMAT,
+            "environment": self.environment,
+            "results": [asdict(result) for result in self.results],
+        }
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BenchmarkReport":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("format") != RESULT_FORMAT:
+            raise ValueError(f"Desteklenmeyen sonuç biçimi: {data.get('format')}")
+        return cls(
+            results=[Measurement(**item) for item in data["results"]],
+            environment=data.get("environment", {}),
+        )
+
+
+def summarize(name: str, samples: list[float], **params: Any) -> Measurement:
+    """Örnek listesinden (ms) istatistik üretir."""
+    if not samples:
+        raise ValueError(f"{name}: örnek yok")
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))
+    return Measurement(
+        name=name,
+        params=params,
+        samples=len(ordered),
+        min=ordered[0],
+        median=statistics.median(ordered),
+        p95=ordered[p95_index],
+        mean=statistics.fmean(ordered),
+    )
+
+
+def time_call(func: Callable[..., Any], *args: Any) -> float:
+    """Tek çağrının süresi (ms)."""
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(
+    name: str,
+    func: Callable[..., Any],
+    repeat: int = 5,
+    warmup: int = 1,
+    setup: Callable[[], Any] | None = None,
+    **params: Any,
+) -> Measurement:
+    """``func``'ı ``repeat`` kez ölçer.
+
+    ``setup`` verilirse her örnekten önce (ölçüm dışında) çağrılır ve dönüş
+    değeri ``func``'a argüman olarak geçilir; soğuk başlangıç senaryoları
+    önbellekleri burada siler.
+    """
+    samples: list[float] = []
+    for index in range(warmup + repeat):
+        args = (setup(),) if setup is not None else ()
+        elapsed = time_call(func, *args)
+        if index >= warmup:
+            samples.append(elapsed)
+    return summarize(name, samples, **params)
+
+
+def compare(
+    current: BenchmarkReport,
+    baseline: BenchmarkReport,
+    tolerance: float = DEFAULT_TOLERANCE,
+    noise_floor: float = NOISE_FLOOR_MS,
+) -> tuple[list[Comparison], list[Comparison]]:
+    """(gerilemeler, iyileşmeler); yalnızca iki raporda da olan ölçümler karşılaştırılır."""
+    regressions: list[Comparison] = []
+    improvements: list[Comparison] = []
+    previous = baseline.by_key()
+    for key, result in current.by_key().items():
+        before = previous.get(key)
+        if before is None:
+            continue
+        item = Comparison(key=key, baseline=before.median, current=result.median)
+        if abs(item.current - item.baseline) < noise_floor:
+            continue
+        if item.current > item.baseline * (1 + tolerance):
+            regressions.append(item)
+        elif item.current < item.baseline / (1 + tolerance):
+            improvements.append(item)
+    return regressions, improvements
+
+
+def environment_info(repo_root: str | Path | None = None) -> dict[str, Any]:
+    """Sonuçların hangi ortamda alındığı (karşılaştırmada uyarı için)."""
+    info: dict[str, Any] = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+        "executable": sys.executable,
+    }
+    if repo_root is not None:
+        with contextlib.suppress(OSError, subprocess.CalledProcessError):
+            info["commit"] = (
+                subprocess.check_output(
+                    ["git", "rev-parse", "--short", "HEAD"],
+                    cwd=str(repo_root),
+                    stderr=subprocess.DEVNULL,
+                )
+                .decode()
+                .strip()
+            )
+    return info
@@ -0,0 +1,420 @@
+"""Ölçülen senaryolar ve sentetik katalog üretimi.
+
+Senaryolar gerçek yöneticileri (``ModuleManager``, ``CommandManager``,
+``CLICompleter``, ``search`` komutunun ``ModuleSearcher``'ı) geçici bir
+çalışma dizininde kullanır; depodaki ``config/`` dosyalarına dokunulmaz.
+
+- ``load_modules``: diske yazılmış sentetik modül ağacı; soğuk (katalog
+  yok) ve sıcak (katalog güncel) açılış.
+- ``module.ensure_loaded`` / ``command.ensure_loaded``: bytecode önbelleği
+  boş (soğuk) ve dolu (sıcak) gerçek yükleme.
+- ``load_commands``: depodaki ``commands/`` dizininin indekslenmesi.
+- ``execute_command``: işlem yapmayan bir komutun doğrudan ve alias
+  üzerinden dağıtımı (hook/log/alias çözümleme maliyeti).
+- ``completer.keystroke``: ``use <yol>`` yazılırken her tuş vuruşundaki
+  tamamlama gecikmesi.
+- ``search``: doğrudan kataloğa yazılmış 100–50k modüllük sentetik
+  kataloglarda terim, kısa terim, filtre ve bulanık sorgular.
+"""
+
+import contextlib
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import core.command_manager
+from core.command_manager import CommandManager
+from core.module_manager import CatalogModuleMap, ModuleManager, ModuleMeta
+from core.shared_state import shared_state
+from tests.benchmarks.harness import Measurement, measure, summarize, time_call
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Varsayılan katalog boyutları (search ve completer)
+CATALOG_SIZES = (100, 1_000, 10_000, 50_000)
+
+# Diske gerçek dosya yazılan load_modules ağacı boyutları
+LOAD_SIZES = (100, 1_000)
+
+# Tek çağrısı mikro saniyeler süren dağıtım senaryosunun örnek sayısı
+DISPATCH_CALLS = 1_000
+
+CATEGORIES = (
+    "auxiliary/scanner",
+    "auxiliary/recon",
+    "auxiliary/brute",
+    "exploit/linux",
+    "exploit/windows",
+    "post/linux",
+    "post/windows",
+)
+
+WORDS = (
+    "ssh",
+    "http",
+    "smb",
+    "dns",
+    "ftp",
+    "mysql",
+    "redis",
+    "ldap",
+    "snmp",
+    "smtp",
+    "port",
+    "banner",
+    "login",
+    "version",
+    "shell",
+    "reverse",
+    "bind",
+    "hash",
+)
+
+AUTHORS = ("Mahmut P.", "alice", "bob", "carol")
+
+SEARCH_QUERIES = {
+    "term": "ssh",
+    "short": "ss",
+    "filter": "login author:alice category:auxiliary",
+    "fuzzy": "scannr",
+}
+
+MODULE_TEMPLATE = """from core.module import BaseModule
+
+
+class {cls}(BaseModule):
+    Name = "{name}"
+    Description = "{description}"
+    Author = "{author}"
+    Category = "{category}"
+
+    def run(self, options):
+        return True
+"""
+
+NOOP_COMMAND = """from core.command import Command
+
+
+class Noop(Command):
+    Name = "noop"
+    Description = "Dağıtım ölçümü için boş komut"
+    Category = "system"
+
+    def execute(self, *args, **kwargs):
+        return True
+"""
+
+
+def synthetic_module(index: int) -> dict[str, str]:
+    """Sıra numarasından deterministik modül alanları."""
+    first = WORDS[index % len(WORDS)]
+    second = WORDS[(index // len(WORDS)) % len(WORDS)]
+    category = CATEGORIES[index % len(CATEGORIES)]
+    name = f"{first}_{second}_{index}"
+    return {
+        "path": f"{category}/{name}",
+        "name": name,
+        "class_name": f"Bench{index}",
+        "category": category,
+        "author": AUTHORS[index % len(AUTHORS)],
+        "description": f"{first.upper()} {second} {category.rsplit('/', 1)[-1]} modülü",
+    }
+
+
+def synthetic_metas(count: int, root: Path) -> Iterator[tuple[ModuleMeta, str]]:
+    """Kataloğa doğrudan yazılacak (meta, dizin) çiftleri."""
+    for index in range(count):
+        fields = synthetic_module(index)
+        yield (
+            ModuleMeta(
+                path=fields["path"],
+                file_path=str(root / f"{fields['path']}.py"),
+                name=fields["name"],
+                description=fields["description"],
+                author=fields["author"],
+                category=fields["category"],
+                mtime_ns=0,
+                size=0,
+                content_hash=f"{index:064x}",
+                class_name=fields["class_name"],
+            ),
+            fields["category"],
+        )
+
+
+def write_module_tree(modules_dir: Path, count: int) -> list[str]:
+    """``count`` modül dosyası yazar; modül yollarını döndürür."""
+    paths = []
+    for index in range(count):
+        fields = synthetic_module(index)
+        file_path = modules_dir / f"{fields['path']}.py"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(
+            MODULE_TEMPLATE.format(
+                cls=fields["class_name"],
+                name=fields["name"],
+                description=fields["description"],
+                author=fields["author"],
+                category=fields["category"],
+            ),
+            encoding="utf-8",
+        )
+        paths.append(fields["path"])
+    return paths
+
+
+def _close(manager: ModuleManager | None) -> None:
+    if manager is not None and manager._store is not None:
+        manager._store.close()
+
+
+def _remove_catalog(catalog: Path) -> None:
+    for suffix in ("", "-journal", "-wal", "-shm"):
+        Path(f"{catalog}{suffix}").unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def isolated_aliases(workdir: Path) -> Iterator[None]:
+    """Kullanıcının ``config/aliases.json`` dosyası okunmaz/yazılmaz."""
+    aliases = workdir / "aliases.json"
+    if not aliases.exists():
+        aliases.write_text("{}", encoding="utf-8")
+    previous = core.command_manager.ALIASES_FILE
+    core.command_manager.ALIASES_FILE = str(aliases)
+    try:
+        yield
+    finally:
+        core.command_manager.ALIASES_FILE = previous
+
+
+def bench_module_loading(workdir: Path, size: int, repeat: int) -> list[Measurement]:
+    """Soğuk/sıcak ``load_modules`` ve ``ensure_loaded``."""
+    root = workdir / f"tree-{size}"
+    paths = write_module_tree(root / "modules", size)
+    catalog = root / "catalog.db"
+    bytecode = root / "bytecode"
+    target = paths[len(paths) // 2]
+    current: list[ModuleManager] = []
+
+    def new_manager(cold_catalog: bool = False) -> ModuleManager:
+        if current:
+            _close(current.pop())
+        if cold_catalog:
+            _remove_catalog(catalog)
+        manager = ModuleManager(
+            modules_dir=str(root / "modules"),
+            catalog_path=catalog,
+            bytecode_cache_dir=bytecode,
+        )
+        current.append(manager)
+        return manager
+
+    def loaded_manager(cold_code: bool) -> ModuleManager:
+        manager = new_manager()
+        manager.load_modules()
+        if cold_code and manager.bytecode_cache is not None:
+            manager.bytecode_cache.clear()
+        return manager
+
+    results = [
+        measure(
+            "load_modules.cold",
+            ModuleManager.load_modules,
+            repeat=repeat,
+            warmup=0,
+            setup=lambda: new_manager(cold_catalog=True),
+            size=size,
+        ),
+        measure(
+            "load_modules.warm",
+            ModuleManager.load_modules,
+            repeat=repeat,
+            setup=new_manager,
+            size=size,
+        ),
+        measure(
+            "module.ensure_loaded.cold",
+            lambda manager: manager.ensure_loaded(target),
+            repeat=repeat,
+            warmup=0,
+            setup=lambda: loaded_manager(cold_code=True),
+            size=size,
+        ),
+        measure(
+            "module.ensure_loaded.warm",
+            lambda manager: manager.ensure_loaded(target),
+            repeat=repeat,
+            setup=lambda: loaded_manager(cold_code=False),
+            size=size,
+        ),
+    ]
+    if current:
+        _close(current.pop())
+    return results
+
+
+def bench_commands(workdir: Path, repeat: int) -> list[Measurement]:
+    """Depodaki komutların indekslenmesi ve gerçek yüklenmesi."""
+    commands_dir = str(REPO_ROOT / "commands")
+    bytecode = workdir / "command-bytecode"
+
+    def new_manager() -> CommandManager:
+        return CommandManager(commands_dir, bytecode_cache_dir=bytecode)
+
+    def loaded_manager(cold_code: bool) -> CommandManager:
+        manager = new_manager()
+        manager.load_commands()
+        if cold_code and manager.bytecode_cache is not None:
+            manager.bytecode_cache.clear()
+        return manager
+
+    return [
+        measure(
+            "load_commands",
+            CommandManager.load_commands,
+            repeat=repeat,
+            setup=new_manager,
+        ),
+        measure(
+            "command.ensure_loaded.cold",
+            lambda manager: manager.ensure_loaded("search"),
+            repeat=repeat,
+            warmup=0,
+            setup=lambda: loaded_manager(cold_code=True),
+        ),
+        measure(
+            "command.ensure_loaded.warm",
+            lambda manager: manager.ensure_loaded("search"),
+            repeat=repeat,
+            setup=lambda: loaded_manager(cold_code=False),
+        ),
+    ]
+
+
+def bench_dispatch(workdir: Path, calls: int = DISPATCH_CALLS) -> list[Measurement]:
+    """``execute_command`` dağıtım maliyeti (komutun kendisi iş yapmaz)."""
+    commands_dir = workdir / "dispatch-commands"
+    commands_dir.mkdir(parents=True, exist_ok=True)
+    (commands_dir / "noop.py").write_text(NOOP_COMMAND, encoding="utf-8")
+    manager = CommandManager(str(commands_dir), use_bytecode_cache=False)
+    manager.load_commands()
+    manager.ensure_loaded("noop")
+    manager.add_alias("nop", "noop", persist=False)
+
+    results = []
+    for name, line in (("direct", "noop a b c"), ("alias", "nop a b c")):
+        manager.execute_command(line)
+        samples = [time_call(manager.execute_command, line) for _ in range(calls)]
+        results.append(summarize(f"execute_command.{name}", samples))
+    return results
+
+
+def catalog_manager(workdir: Path, size: int) -> ModuleManager:
+    """Sentetik meta verisi doğrudan kataloğa yazılmış yönetici.
+
+    Dosya yazmadan 50k modüllük kataloglar kurulur; arama ve tamamlama
+    yalnızca kataloğu kullandığından ölçülen yol gerçekle aynıdır.
+    """
+    catalog = workdir / f"catalog-{size}.db"
+    manager = ModuleManager(
+        modules_dir=str(workdir / "catalog-modules"),
+        catalog_path=catalog,
+        use_bytecode_cache=False,
+    )
+    store = manager._open_store()
+    if len(store) != size:
+        store.close()
+        _remove_catalog(catalog)
+        manager._store = None
+        store = manager._open_store()
+        store.apply_changes(upserts=synthetic_metas(size, workdir / "catalog-modules"))
+    manager.modules = CatalogModuleMap(store)
+    return manager
+
+
+def bench_completer(
+    manager: ModuleManager, command_manager: CommandManager, size: int, repeat: int
+) -> Measurement:
+    """``use <yol>`` yazılırken tuş başına tamamlama gecikmesi."""
+    from prompt_toolkit.document import Document
+
+    from core.completer import CLICompleter
+
+    completer = CLICompleter(command_manager, manager)
+    line = "use " + synthetic_module(size // 2)["path"]
+
+    def type_line() -> list[float]:
+        return [
+            time_call(
+                lambda text: list(completer.get_completions(Document(text), None)),
+                line[:end],
+            )
+            for end in range(1, len(line) + 1)
+        ]
+
+    type_line()  # komut yükleme ve yol indeksi kurulumu ölçüme girmez
+    samples = [sample for _ in range(repeat) for sample in type_line()]
+    return summarize("completer.keystroke", samples, size=size)
+
+
+def bench_search(manager: ModuleManager, size: int, repeat: int) -> list[Measurement]:
+    """``search`` komutunun arama katmanı (yazdırma hariç)."""
+    from commands.search import ModuleSearcher
+
+    searcher = ModuleSearcher(manager)
+    results = []
+    for kind, query in SEARCH_QUERIES.items():
+        results.append(
+            measure(
+                f"search.{kind}",
+                searcher.search,
+                repeat=repeat,
+                setup=lambda q=query: q,
+                size=size,
+            )
+        )
+    return results
+
+
+def run_suite(
+    workdir: Path,
+    catalog_sizes: tuple[int, ...] = CATALOG_SIZES,
+    load_sizes: tuple[int, ...] = LOAD_SIZES,
+    repeat: int = 5,
+    dispatch_calls: int = DISPATCH_CALLS,
+    progress: Callable[[str], Any] | None = None,
+) -> list[Measurement]:
+    """Tüm senaryoları çalıştırır."""
+    report = progress or (lambda _message: None)
+    results: list[Measurement] = []
+    workdir.mkdir(parents=True, exist_ok=True)
+    with isolated_aliases(workdir):
+        report("komutlar")
+        results.extend(bench_commands(workdir, repeat))
+        results.extend(bench_dispatch(workdir, dispatch_calls))
+
+        for size in load_sizes:
+            report(f"load_modules ({size})")
+            results.extend(bench_module_loading(workdir, size, repeat))
+
+        command_manager = CommandManager(
+            str(REPO_ROOT / "commands"), bytecode_cache_dir=workdir / "command-bytecode"
+        )
+        command_manager.load_commands()
+        previous = shared_state.module_manager, shared_state.command_manager
+        try:
+            shared_state.command_manager = command_manager
+            for size in catalog_sizes:
+                report(f"katalog ({size})")
+                manager = catalog_manager(workdir, size)
+                shared_state.module_manager = manager
+                try:
+                    results.append(
+                        bench_completer(manager, command_manager, size, repeat)
+                    )
+                    results.extend(bench_search(manager, size, repeat))
+                finally:
+                    _close(manager)
+        finally:
+            shared_state.module_manager, shared_state.command_manager = previous
+    return results
@@ -0,0 +1,70 @@
+"""Ölçüm paketinin küçük boyutlarda çalıştığını ve karşılaştırma mantığını doğrular.
+
+Süreler burada kontrol edilmez; gerileme kontrolü ``python -m tests.benchmarks
+--baseline`` ile yapılır.
+"""
+
+from tests.benchmarks.harness import BenchmarkReport, Measurement, compare, summarize
+from tests.benchmarks.scenarios import run_suite
+
+
+def _measurement(name, median, **params):
+    return Measurement(name, params, 1, median, median, median, median)
+
+
+def test_suite_smoke_run_and_report_roundtrip(tmp_path):
+    results = run_suite(
+        tmp_path / "work",
+        catalog_sizes=(100,),
+        load_sizes=(20,),
+        repeat=1,
+        dispatch_calls=10,
+    )
+    keys = {result.key for result in results}
+    assert {
+        "load_commands",
+        "command.ensure_loaded.cold",
+        "execute_command.alias",
+        "load_modules.cold[size=20]",
+        "load_modules.warm[size=20]",
+        "module.ensure_loaded.warm[size=20]",
+        "completer.keystroke[size=100]",
+        "search.fuzzy[size=100]",
+    } <= keys
+    assert all(result.median >= 0 for result in results)
+
+    saved = BenchmarkReport(results=results, environment={"python": "3"}).save(
+        tmp_path / "out" / "result.json"
+    )
+    loaded = BenchmarkReport.load(saved)
+    assert loaded.by_key().keys() == keys
+    assert loaded.environment == {"python": "3"}
+
+
+def test_compare_flags_regressions_beyond_tolerance_and_noise():
+    baseline = BenchmarkReport(
+        results=[
+            _measurement("search.term", 10.0, size=100),
+            _measurement("load_commands", 10.0),
+            _measurement("execute_command.direct", 0.01),
+            _measurement("removed", 1.0),
+        ]
+    )
+    current = BenchmarkReport(
+        results=[
+            _measurement("search.term", 14.0, size=100),  # %40 yavaş
+            _measurement("load_commands", 5.0),  # iyileşme
+            _measurement("execute_command.direct", 0.05),  # gürültü eşiği altında
+            _measurement("new", 1.0),
+        ]
+    )
+    regressions, improvements = compare(current, baseline, tolerance=0.25)
+    assert [item.key for item in regressions] == ["search.term[size=100]"]
+    assert regressions[0].ratio == 1.4
+    assert [item.key for item in improvements] == ["load_commands"]
+
+
+def test_summarize_statistics():
+    result = summarize("x", [5.0, 1.0, 3.0, 2.0, 4.0], size=10)
+    assert (result.min, result.median, result.p95, result.mean) == (1.0, 3.0, 5.0, 3.0)
+    assert result.key == "x[size=10]"
@@ -215,6 +215,33 @@ def test_search_empty_result():
     assert result is True
 
 
+def test_search_filters_and_fuzzy_without_catalog():
+    """Katalog açık değilken bellek içi arama filtre, önek ve bulanık eşleşmeyi desteklemeli."""
+    from commands.search import ModuleSearcher
+    from core.module_manager import ModuleManager
+
+    def stub(name, author, category):
+        return MagicMock(
+            Name=name, Description="Banner grabber", Author=author, Category=category
+        )
+
+    mgr = ModuleManager(modules_dir="tests/mock_modules")
+    mgr.modules = {
+        "auxiliary/scanner/ssh_brute": stub("ssh_brute", "Mahmut", "auxiliary/scanner"),
+        "exploit/brute_ftp": stub("brute_ftp", "Ali", "exploit"),
+    }
+    searcher = ModuleSearcher(mgr)
+
+    assert [r["path"] for r in searcher.search("brute")] == [
+        "exploit/brute_ftp",
+        "auxiliary/scanner/ssh_brute",
+    ]
+    result = searcher.search("brute category:auxiliary author:mah")
+    assert [r["path"] for r in result] == ["auxiliary/scanner/ssh_brute"]
+    assert result[0]["matches"]["author"] == "Mahmut"
+    assert len(searcher.search("grabbr")) == 2
+
+
 def test_run_no_module_selected():
     """Modül seçili değilken run False döndürmeli."""
     reset_shared_state()
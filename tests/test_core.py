@@ -1,7 +1,12 @@
+import itertools
 from pathlib import Path
 
+import core.wordlist
 from core.command_manager import CommandManager
+from core.completion_index import PrefixIndex
 from core.module_manager import ModuleManager
+from core.startup import BackgroundTask, StartupTimer
+from core.wordlist import Wordlist, iter_lines
 
 
 def test_module_manager_initialization():
@@ -19,3 +24,162 @@ def test_command_manager_initialization():
     assert cm.aliases == {}
     # Default directory should be "commands"
     assert cm.commands_dir == Path("commands")
+
+
+def test_wordlist_iteration_and_split(tmp_path):
+    """Wordlist satırları kırpılır; split aralıkları her satırı bir kez kapsar."""
+    path = tmp_path / "words.txt"
+    words = [f"word{i}" for i in range(500)]
+    path.write_bytes(
+        b"\r\n".join(w.encode() for w in words[:3])
+        + b"\n\n"
+        + "\n".join(words[3:]).encode()
+    )
+
+    wordlist = Wordlist(str(path))
+    assert list(wordlist) == words
+    assert wordlist.estimate_lines() == 501
+
+    ranges = list(wordlist.split(97))
+    assert ranges[0][0] == 0 and ranges[-1][1] == wordlist.size
+    assert all(a[1] == b[0] for a, b in itertools.pairwise(ranges))
+    chunked = [
+        w.decode() for start, end in ranges for w in iter_lines(str(path), start, end)
+    ]
+    assert chunked == words
+
+
+def test_wordlist_dedup_keeps_first_order(tmp_path, monkeypatch):
+    """Disk üzerinde tekilleştirme ilk görülme sırasını korur ve temizlenir."""
+    monkeypatch.setattr(core.wordlist, "DEDUP_BUCKET_BYTES", 16)
+    path = tmp_path / "dupes.txt"
+    path.write_text("b\na\nb\nc\na\nd\nc\n")
+
+    with Wordlist(str(path), dedup=True) as wordlist:
+        assert list(wordlist) == ["b", "a", "c", "d"]
+        deduped = Path(wordlist.path)
+        assert deduped.exists()
+    assert not deduped.exists()
+    assert list(Wordlist(str(path))) == ["b", "a", "b", "c", "a", "d", "c"]
+
+
+def test_wordlist_dedup_buckets_by_line_count(tmp_path, monkeypatch):
+    """Kısa satırlı listelerde kova sayısı bayta değil satır sayısına göre belirlenir."""
+    path = tmp_path / "short.txt"
+    words = [f"w{i % 300}" for i in range(1000)]
+    path.write_text("\n".join(words) + "\n")
+    assert Wordlist(str(path))._dedup_buckets() == 1
+
+    monkeypatch.setattr(core.wordlist, "DEDUP_BUCKET_LINES", 100)
+    assert Wordlist(str(path))._dedup_buckets() == 10
+    with Wordlist(str(path), dedup=True) as wordlist:
+        assert list(wordlist) == [f"w{i}" for i in range(300)]
+
+
+def test_prefix_index_completion_and_segments():
+    """Önek aralığı bisect ile bulunur; alt ağaçlar tek girdi olarak önerilir."""
+    index = PrefixIndex(
+        [
+            "auxiliary/scanner/port_scanner",
+            "auxiliary/scanner/ssh_brute",
+            "auxiliary/scan_quick",
+            "auxiliary/analyze/banner_grabber",
+            "exploit/vsftpd",
+        ]
+    )
+    assert index.complete("auxiliary/sc") == [
+        "auxiliary/scan_quick",
+        "auxiliary/scanner/port_scanner",
+        "auxiliary/scanner/ssh_brute",
+    ]
+    assert index.complete_segments("") == ["auxiliary/", "exploit/"]
+    assert index.complete_segments("auxiliary/") == [
+        "auxiliary/analyze/",
+        "auxiliary/scan_quick",
+        "auxiliary/scanner/",
+    ]
+    assert index.suggest("auxiliary/", flat_limit=2) == index.complete_segments(
+        "auxiliary/"
+    )
+    assert index.suggest("auxiliary/scanner/", flat_limit=2) == [
+        "auxiliary/scanner/port_scanner",
+        "auxiliary/scanner/ssh_brute",
+    ]
+
+    index.add("auxiliary/scanner/dns_enum")
+    index.discard("auxiliary/scanner/ssh_brute")
+    assert index.complete("auxiliary/scanner/") == [
+        "auxiliary/scanner/dns_enum",
+        "auxiliary/scanner/port_scanner",
+    ]
+    assert "exploit/vsftpd" in index and "exploit" not in index
+
+
+def test_command_manager_completion_index_tracks_aliases(tmp_path, monkeypatch):
+    """Alias ekleme/silme tamamlama indeksini yeniden sıralamadan günceller."""
+    monkeypatch.setattr(
+        "core.command_manager.ALIASES_FILE", str(tmp_path / "aliases.json")
+    )
+    cm = CommandManager()
+    cm.commands = {"search": object(), "sessions": object(), "use": object()}
+    assert cm.complete_names("se") == ["search", "sessions"]
+
+    cm.add_alias("sea", "search")
+    assert cm.complete_names("se") == ["sea", "search", "sessions"]
+    cm.remove_alias("sea")
+    assert cm.complete_names("se") == ["search", "sessions"]
+
+
+def test_command_manager_loads_commands_from_bytecode_cache(tmp_path, monkeypatch):
+    """İkinci açılışta komut kodu önbellekten gelir, yeniden derlenmez."""
+    monkeypatch.setattr(
+        "core.command_manager.ALIASES_FILE", str(tmp_path / "aliases.json")
+    )
+    commands_dir = tmp_path / "commands"
+    commands_dir.mkdir()
+    (commands_dir / "ping.py").write_text(
+        "from core.command import Command\n\n\n"
+        "class Ping(Command):\n"
+        '    Name = "ping"\n'
+        '    Description = "Önbellek testi"\n\n'
+        "    def execute(self, *args, **kwargs):\n"
+        "        return True\n",
+        encoding="utf-8",
+    )
+
+    def load():
+        cm = CommandManager(str(commands_dir), bytecode_cache_dir=tmp_path / "bytecode")
+        cm.load_commands()
+        return cm, cm.ensure_loaded("ping")
+
+    _, first = load()
+    assert first is not None and first.execute()
+
+    monkeypatch.setattr("core.bytecode_cache.compile", None, raising=False)
+    cm, second = load()
+    assert second is not None and second.execute()
+    assert cm.bytecode_cache.hits == 1
+
+
+def test_startup_timer_phases_and_background_task():
+    """Aşamalar ardışık ölçülür; arka plan işi sonucu veya hatası aktarılır."""
+    timer = StartupTimer(budget_ms=10_000)
+    timer.mark("import")
+    task = BackgroundTask(lambda x: x * 2, 21)
+    timer.mark("modules")
+    assert [name for name, _ in timer.phases] == ["import", "modules"]
+    assert abs(sum(ms for _, ms in timer.phases) - timer.total_ms) < 1e-6
+    assert timer.within_budget
+    assert "bütçe 10000 ms" in timer.summary()
+    assert task.result(timeout=5) == 42
+
+    def fail():
+        raise ValueError("banner")
+
+    failing = BackgroundTask(fail)
+    try:
+        failing.result(timeout=5)
+    except ValueError as e:
+        assert str(e) == "banner"
+    else:
+        raise AssertionError("hata aktarılmadı")
@@ -1,5 +1,7 @@
 import os
+import struct
 import tempfile
+import zlib
 from unittest.mock import patch
 
 import pytest
@@ -222,3 +224,186 @@ class TestMetadataCleaner:
                 os.unlink(temp_path)
             if os.path.exists(backup_path):
                 os.unlink(backup_path)
+
+    def test_segment_strip_is_lossless(self, cleaner, tmp_path):
+        """JPEG/PNG segment temizliği pikselleri yeniden kodlamadan kaldırmalı."""
+        try:
+            import piexif
+            from PIL import Image, PngImagePlugin
+        except ImportError:
+            pytest.skip("Pillow veya piexif kurulu değil")
+
+        exif_bytes = piexif.dump({"0th": {piexif.ImageIFD.Make: b"TestCamera"}})
+        img = Image.new("RGB", (64, 48), color="red")
+        jpeg = tmp_path / "photo.jpg"
+        img.save(jpeg, format="JPEG", exif=exif_bytes, comment=b"gizli", xmp=b"<x/>")
+        original = jpeg.read_bytes()
+
+        method = cleaner._clean_metadata(str(jpeg), str(tmp_path / "clean.jpg"))
+        assert method.startswith("Segment")
+        cleaned = (tmp_path / "clean.jpg").read_bytes()
+        # Sıkıştırılmış görüntü verisi bayt bayt korunur
+        assert original.endswith(cleaned[cleaned.index(b"\xff\xda") :])
+        assert b"TestCamera" not in cleaned and b"gizli" not in cleaned
+        with Image.open(tmp_path / "clean.jpg") as result:
+            assert not result.getexif() and "xmp" not in result.info
+
+        info = PngImagePlugin.PngInfo()
+        info.add_text("Author", "gizli")
+        png = tmp_path / "shot.png"
+        img.save(png, pnginfo=info, exif=exif_bytes)
+        cleaner._clean_metadata(str(png), str(png))
+        with Image.open(png) as result:
+            result.load()
+            assert result.info == {}
+            assert result.tobytes() == img.tobytes()
+
+    def test_reencode_fallback_keeps_palette(self, cleaner, tmp_path):
+        """Segment yolu olmayan formatlar Pillow ile yeniden kaydedilmeli."""
+        try:
+            from PIL import Image
+        except ImportError:
+            pytest.skip("Pillow kurulu değil")
+
+        img = Image.new("P", (8, 8), color=3)
+        img.putpalette([0, 0, 0, 10, 20, 30, 40, 50, 60, 255, 0, 0] * 64)
+        gif = tmp_path / "anim.gif"
+        img.save(gif, comment=b"gizli")
+
+        method = cleaner._clean_metadata(str(gif), str(tmp_path / "clean.gif"))
+        assert method.startswith("Yeniden")
+        with Image.open(tmp_path / "clean.gif") as result:
+            assert "comment" not in result.info
+            assert result.convert("RGB").getpixel((0, 0)) == (255, 0, 0)
+
+
+@pytest.fixture
+def evidence_tree(tmp_path, monkeypatch):
+    """GPS'li/GPS'siz JPEG'ler, iç içe dizin ve görüntü olmayan dosya içeren ağaç."""
+    piexif = pytest.importorskip("piexif")
+    Image = pytest.importorskip("PIL.Image")
+    from core.shared_state import shared_state
+    from core.workspace_manager import WorkspaceManager
+
+    wm = WorkspaceManager(root=tmp_path / "workspaces")
+    wm.create("case")
+    monkeypatch.setattr(shared_state, "workspace_manager", wm, raising=False)
+
+    root = tmp_path / "evidence"
+    (root / "sub").mkdir(parents=True)
+    gps = {
+        piexif.GPSIFD.GPSLatitudeRef: b"N",
+        piexif.GPSIFD.GPSLatitude: ((41, 1), (0, 1), (0, 1)),
+        piexif.GPSIFD.GPSLongitudeRef: b"E",
+        piexif.GPSIFD.GPSLongitude: ((29, 1), (0, 1), (0, 1)),
+    }
+    for index, path in enumerate(
+        [root / "a.jpg", root / "b.jpg", root / "sub" / "c.jpg"]
+    ):
+        exif = {"0th": {piexif.ImageIFD.Make: f"Cam{index}".encode()}}
+        if index == 2:
+            exif["GPS"] = gps
+        Image.new("RGB", (32, 32), "white").save(
+            path, format="JPEG", exif=piexif.dump(exif)
+        )
+    (root / "notes.txt").write_text("görüntü değil")
+    return root, wm.get_loot_dir()
+
+
+class TestMetadataBatch:
+    def test_extractor_directory_mode_and_resume(self, evidence_tree):
+        import json
+
+        root, loot = evidence_tree
+        options = {"FILE": str(root), "WORKERS": 2, "OUTPUT_FORMAT": "jsonl"}
+        with patch("modules.auxiliary.forensics.metadata_extractor.print"):
+            assert MetadataExtractor().run(options) is True
+
+        (report,) = loot.glob("metadata_extractor-*.jsonl")
+        rows = {
+            os.path.basename(r["path"]): r
+            for r in map(json.loads, report.read_text().splitlines())
+        }
+        assert set(rows) == {"a.jpg", "b.jpg", "c.jpg"}
+        assert rows["a.jpg"]["make"] == "Cam0"
+        assert rows["c.jpg"]["gps_lat"] == 41.0 and rows["c.jpg"]["gps_lon"] == 29.0
+
+        # Yarım kalmış son satır kesilir, kayıtlı dosyalar yeniden işlenmez
+        lines = report.read_text().splitlines(keepends=True)
+        report.write_text(lines[0] + lines[1] + lines[2][:10])
+        with patch("modules.auxiliary.forensics.metadata_extractor.print"):
+            assert MetadataExtractor().run({**options, "WORKERS": 1}) is True
+        rows = [json.loads(line) for line in report.read_text().splitlines()]
+        assert len(rows) == 3
+        assert len({r["path"] for r in rows}) == 3
+
+    def test_cleaner_glob_mode_writes_output_tree(self, evidence_tree, tmp_path):
+        import csv
+
+        root, loot = evidence_tree
+        out = tmp_path / "clean"
+        options = {
+            "FILE": str(root / "**" / "*.jpg"),
+            "OUTPUT": str(out),
+            "WORKERS": 1,
+            "OUTPUT_FORMAT": "csv",
+        }
+        with patch("modules.auxiliary.forensics.metadata_cleaner.print"):
+            assert MetadataCleaner().run(options) is True
+
+        assert (out / "sub" / "c.jpg").is_file()
+        assert b"Cam2" not in (out / "sub" / "c.jpg").read_bytes()
+        # Kaynak dosyalar değişmez
+        assert b"Cam2" in (root / "sub" / "c.jpg").read_bytes()
+        (report,) = loot.glob("metadata_cleaner-*.csv")
+        rows = list(csv.DictReader(report.open()))
+        assert len(rows) == 3
+        assert {r["method"] for r in rows} == {"segment"}
+        assert all("EXIF" in r["removed"] for r in rows)
+
+    def test_cleaner_resume_keeps_original_backup(self, evidence_tree):
+        from core.metadata_batch import ResultWriter
+
+        root, _ = evidence_tree
+        originals = {p: p.read_bytes() for p in root.rglob("*.jpg")}
+        options = {"FILE": str(root), "WORKERS": 1, "BACKUP": "true"}
+
+        # Dosyalar yerinde temizlendikten sonra, checkpoint yazılmadan kesinti
+        with (
+            patch.object(ResultWriter, "write", side_effect=KeyboardInterrupt),
+            patch("modules.auxiliary.forensics.metadata_cleaner.print"),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            MetadataCleaner().run(options)
+        assert all(b"Cam" not in p.read_bytes() for p in originals)
+
+        for resume in ("true", "false"):
+            with patch("modules.auxiliary.forensics.metadata_cleaner.print"):
+                assert MetadataCleaner().run({**options, "RESUME": resume}) is True
+            for path, data in originals.items():
+                assert (path.parent / (path.name + ".backup")).read_bytes() == data
+
+    def test_extract_large_png_reads_exif_without_decoding(self, tmp_path):
+        piexif = pytest.importorskip("piexif")
+        Image = pytest.importorskip("PIL.Image")
+        from core.metadata_batch import HEADER_BYTES, extract_file
+
+        noise = Image.frombytes("RGB", (800, 800), os.urandom(800 * 800 * 3))
+        plain = tmp_path / "plain.png"
+        noise.save(plain)
+        # eXIf chunk'ı IDAT'tan sonra, IEND'den hemen önce
+        exif = piexif.dump({"0th": {piexif.ImageIFD.Make: b"PngCam"}})[6:]
+        chunk = struct.pack(">I4s", len(exif), b"eXIf") + exif
+        chunk += struct.pack(">I", zlib.crc32(b"eXIf" + exif))
+        data = plain.read_bytes()
+        tagged = tmp_path / "tagged.png"
+        tagged.write_bytes(data[:-12] + chunk + data[-12:])
+        assert plain.stat().st_size > HEADER_BYTES
+
+        with patch(
+            "PIL.ImageFile.ImageFile.load", side_effect=AssertionError("decoded")
+        ):
+            record = extract_file(str(plain))
+            assert record["error"] == ""
+            assert (record["format"], record["width"]) == ("PNG", 800)
+            assert extract_file(str(tagged))["make"] == "PngCam"
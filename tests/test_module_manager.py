@@ -1,9 +1,16 @@
+import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
+from core.bytecode_cache import BytecodeCache, source_hash
 from core.module import BaseModule
+from core.module_catalog import ModuleCatalogStore, parse_search_query
 from core.module_manager import ModuleManager
+from core.module_prewarm import ModulePrewarmer
 from core.shared_state import shared_state
+from core.validation_pipeline import ValidationPipeline
 
 
 # Test için geçici modüller
@@ -91,5 +98,293 @@ class TestModuleManager(unittest.TestCase):
         mock_check_options.assert_called_once()
 
 
+MODULE_TEMPLATE = """from core.module import BaseModule
+
+
+class {cls}(BaseModule):
+    Name = "{name}"
+    Description = "Katalog testi"
+    Category = "auxiliary/{cat}"
+
+    def run(self, options):
+        return True
+"""
+
+
+class TestModuleCatalogIndexing(unittest.TestCase):
+    """load_modules artımlı indeksleme ve SQLite katalog davranışı."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.modules_dir = self.root / "modules"
+        self.catalog = self.root / "catalog.db"
+        for cat, names in {"alpha": ["one", "two"], "beta": ["three"]}.items():
+            (self.modules_dir / cat).mkdir(parents=True)
+            for name in names:
+                self._write(
+                    f"{cat}/{name}.py",
+                    MODULE_TEMPLATE.format(cls=name.title(), name=name, cat=cat),
+                )
+        self._write("beta/helpers.py", "VALUE = 1\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, rel, text):
+        (self.modules_dir / rel).write_text(text, encoding="utf-8")
+
+    def _manager(self, catalog=None, **kwargs):
+        kwargs.setdefault("bytecode_cache_dir", self.root / "bytecode")
+        return ModuleManager(
+            modules_dir=str(self.modules_dir),
+            catalog_path=catalog or self.catalog,
+            **kwargs,
+        )
+
+    def test_warm_start_skips_parsing_and_catalog_write(self):
+        self._manager().load_modules()
+
+        manager = self._manager()
+        with (
+            patch.object(
+                ModuleManager, "_index_files", wraps=manager._index_files
+            ) as index,
+            patch.object(ModuleCatalogStore, "apply_changes") as apply,
+        ):
+            manager.load_modules()
+        index.assert_called_once_with([])
+        apply.assert_not_called()
+        self.assertEqual(
+            manager.get_module_paths(), ["alpha/one", "alpha/two", "beta/three"]
+        )
+        # Stub'lar yalnızca erişildiğinde oluşturulur
+        self.assertEqual(manager.modules._items, {})
+        self.assertEqual(
+            manager.count_by_category(), {"Auxiliary/alpha": 2, "Auxiliary/beta": 1}
+        )
+
+    def test_new_and_removed_files_are_detected(self):
+        self._manager().load_modules()
+        self._write(
+            "alpha/four.py",
+            MODULE_TEMPLATE.format(cls="Four", name="four", cat="alpha"),
+        )
+        os.remove(self.modules_dir / "beta" / "three.py")
+        # Aynı saniye içindeki değişiklikler için dizin mtime'larını ileri al
+        for cat in ("alpha", "beta"):
+            os.utime(self.modules_dir / cat, ns=(1, 10**18))
+
+        manager = self._manager()
+        manager.load_modules()
+        self.assertEqual(
+            manager.get_module_paths(), ["alpha/four", "alpha/one", "alpha/two"]
+        )
+        self.assertEqual(manager.modules["alpha/four"].Name, "four")
+        self.assertFalse(manager.has_module("beta/three"))
+
+    def test_catalog_queries_use_store(self):
+        self._write(
+            "beta/three.py",
+            MODULE_TEMPLATE.format(cls="Three", name="three", cat="beta").replace(
+                'Description = "Katalog testi"',
+                'Description = "Banner grabber"\n    Author = "Mahmut"',
+            ),
+        )
+        manager = self._manager()
+        manager.load_modules()
+        store = manager._store
+        search = lambda text: [m.path for m in store.search(parse_search_query(text))]  # noqa: E731
+
+        self.assertEqual(search("grabber"), ["beta/three"])
+        self.assertEqual(search("ab"), ["beta/three"])  # kısa terim: LIKE
+        self.assertEqual(
+            search("category:auxiliary"), ["alpha/one", "alpha/two", "beta/three"]
+        )
+        self.assertEqual(search("category:auxiliary/alpha"), ["alpha/one", "alpha/two"])
+        self.assertEqual(search("author:mah"), ["beta/three"])
+        self.assertEqual(search("testi author:mahmut"), [])
+        # Önek önceliği: adı "t" ile başlayanlar öne alınır
+        self.assertEqual(search("t"), ["alpha/two", "beta/three", "alpha/one"])
+        # Bulanık: yazım hatası
+        self.assertEqual(search("grabbr"), ["beta/three"])
+        self.assertEqual(search("zzzzzz"), [])
+
+        # reload_module FTS indeksini günceller
+        self._write(
+            "beta/three.py",
+            MODULE_TEMPLATE.format(cls="Three", name="three", cat="beta"),
+        )
+        manager.reload_module("beta/three")
+        self.assertEqual(search("grabber"), [])
+
+    def test_search_catalog_skips_modules_that_failed_to_load(self):
+        manager = self._manager()
+        manager.load_modules()
+        query = parse_search_query("category:auxiliary/alpha")
+        self.assertEqual(
+            [m.path for m in manager.search_catalog(query)], ["alpha/one", "alpha/two"]
+        )
+
+        self._write(
+            "alpha/one.py",
+            "import nonexistent_pkg_123\n"
+            + MODULE_TEMPLATE.format(cls="One", name="one", cat="alpha"),
+        )
+        with patch("core.module_manager.print"):
+            self.assertIsNone(manager.ensure_loaded("alpha/one"))
+        self.assertNotIn("alpha/one", manager.modules)
+        self.assertNotIn(None, manager.modules)
+        self.assertEqual([m.path for m in manager.search_catalog(query)], ["alpha/two"])
+        self.assertEqual(
+            [m.path for m in manager.search_catalog(query, limit=1)], ["alpha/two"]
+        )
+
+    def test_path_completion_index_is_updated_incrementally(self):
+        manager = self._manager()
+        manager.load_modules()
+        index = manager.get_path_index()
+        self.assertEqual(
+            manager.complete_module_paths("alpha/"), ["alpha/one", "alpha/two"]
+        )
+
+        self._write(
+            "alpha/four.py",
+            MODULE_TEMPLATE.format(cls="Four", name="four", cat="alpha"),
+        )
+        self.assertTrue(manager.reload_module("alpha/four"))
+        self.assertIs(manager.get_path_index(), index)
+        self.assertEqual(
+            manager.complete_module_paths("alpha/"),
+            ["alpha/four", "alpha/one", "alpha/two"],
+        )
+        self.assertEqual(index.suggest("", flat_limit=2), ["alpha/", "beta/"])
+
+    def test_prewarm_loads_frequent_modules_in_background(self):
+        manager = self._manager()
+        manager.load_modules()
+        history = self.root / ".mah_history"
+        history.write_text(
+            "\n# 2026-01-01\n+use beta/three\n\n# 2026-01-01\n+use alpha/one\n"
+            "\n# 2026-01-01\n+use beta/three\n\n# 2026-01-01\n+use missing/module\n",
+            encoding="utf-8",
+        )
+        audit = self.root / "audit.log"
+        audit.write_text(
+            "[t] MODULE: Run: alpha/two Status: SUCCESS\n", encoding="utf-8"
+        )
+
+        prewarmer = ModulePrewarmer.from_usage(
+            manager, history, audit, max_modules=2, idle_delay=0
+        )
+        self.assertEqual(prewarmer.candidates, ["beta/three", "alpha/two"])
+        prewarmer.start()
+        prewarmer._thread.join(5)
+        self.assertEqual(prewarmer.stop_reason, "done")
+        self.assertEqual(prewarmer.loaded, ["beta/three", "alpha/two"])
+        self.assertFalse(getattr(manager.modules["beta/three"], "_is_stub", False))
+        self.assertTrue(manager.modules["alpha/one"]._is_stub)
+
+    def test_prewarm_respects_memory_budget_and_cancel(self):
+        manager = self._manager()
+        manager.load_modules()
+        rss = iter([0, 10 * 1024 * 1024])
+        with patch("core.module_prewarm.current_rss", side_effect=lambda: next(rss)):
+            prewarmer = ModulePrewarmer(
+                manager, ["alpha/one", "alpha/two"], memory_budget_mb=1, idle_delay=0
+            )
+            prewarmer.start()
+            prewarmer._thread.join(5)
+        self.assertEqual(prewarmer.stop_reason, "memory")
+        self.assertEqual(prewarmer.loaded, [])
+
+        prewarmer = ModulePrewarmer(manager, ["alpha/one"], idle_delay=60)
+        prewarmer.start()
+        prewarmer.cancel(timeout=5)
+        self.assertFalse(prewarmer.running)
+        self.assertEqual(prewarmer.stop_reason, "cancelled")
+
+    def test_prewarm_failure_keeps_stub_for_user_retry(self):
+        manager = self._manager()
+        manager.load_modules()
+        self._write(
+            "alpha/one.py",
+            MODULE_TEMPLATE.format(cls="One", name="one", cat="alpha")
+            + "import nonexistent_pkg_123\n",
+        )
+        with (
+            patch("builtins.print") as mock_print,
+            patch("core.module_manager.print") as rich_print,
+        ):
+            self.assertFalse(manager.prewarm_module("alpha/one"))
+        mock_print.assert_not_called()
+        rich_print.assert_not_called()
+        self.assertIn("alpha/one", manager.modules)
+
+    def test_parallel_cold_index_matches_serial(self):
+        serial = self._manager(index_workers=1)
+        serial.load_modules()
+
+        with (
+            patch("core.module_manager.PARALLEL_INDEX_THRESHOLD", 1),
+            patch("core.module_manager.logger.debug") as debug,
+        ):
+            parallel = self._manager(self.root / "parallel.db", index_workers=2)
+            parallel.load_modules()
+        debug.assert_not_called()  # seri moda düşülmedi
+        self.assertEqual(
+            {p: m.Name for p, m in parallel.modules.items()},
+            {p: m.Name for p, m in serial.modules.items()},
+        )
+
+    def test_bytecode_cache_skips_compile_and_validation(self):
+        first = self._manager(use_validation_pipeline=True)
+        first.load_modules()
+        self.assertEqual(first.ensure_loaded("alpha/one").Name, "one")
+
+        second = self._manager(use_validation_pipeline=True)
+        second.load_modules()
+        with (
+            patch.object(ValidationPipeline, "_validate_module") as validate,
+            patch("core.validation_pipeline.scan_source") as scan,
+            patch("core.module_manager.compile", create=True) as compile_mock,
+        ):
+            instance = second.ensure_loaded("alpha/one")
+        validate.assert_not_called()
+        scan.assert_not_called()
+        compile_mock.assert_not_called()
+        self.assertEqual(instance.Name, "one")
+        self.assertEqual(second.bytecode_cache.hits, 2)  # doğrulama sonucu + kod
+
+        # İçerik değişince girdi eşleşmez; yeniden doğrulanıp derlenir
+        self._write(
+            "alpha/one.py",
+            MODULE_TEMPLATE.format(cls="One", name="one v2", cat="alpha"),
+        )
+        third = self._manager(use_validation_pipeline=True)
+        third.load_modules()
+        with patch.object(
+            ValidationPipeline,
+            "_validate_module",
+            wraps=third._validation_pipeline._validate_module,
+        ) as validate:
+            self.assertEqual(third.ensure_loaded("alpha/one").Name, "one v2")
+        validate.assert_called_once()
+
+    def test_bytecode_cache_ignores_corrupt_entries(self):
+        cache = BytecodeCache(self.root / "bytecode")
+        source = "VALUE = 41 + 1\n"
+        digest = source_hash(source)
+        cache.store(digest, "x.py", code=compile(source, "x.py", "exec"))
+        entry_path = cache._entry_path(digest, "x.py", "exec")
+        entry_path.write_bytes(entry_path.read_bytes()[:-4])
+
+        code = cache.get_code(source, "x.py", digest)
+        namespace = {}
+        exec(code, namespace)
+        self.assertEqual(namespace["VALUE"], 42)
+        self.assertEqual(cache.load(digest, "x.py").code.co_filename, "x.py")
+
+
 if __name__ == "__main__":
     unittest.main()
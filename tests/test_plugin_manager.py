@@ -158,3 +158,69 @@ def test_hook_error_handling(plugin_manager):
 
     handler_error.assert_called_once()
     handler_success.assert_called_once()
+
+
+def test_hook_dispatch_fast_path_and_stats(plugin_manager):
+    """Abonesi olmayan hook atlanır; çağrılar plugin bazında sayılır."""
+    handler = MagicMock(side_effect=[None, Exception("Boom!")])
+
+    class StatPlugin(BasePlugin):
+        Name = "Stat"
+
+        def get_hooks(self):
+            return {HookType.PRE_COMMAND: handler}
+
+    plugin = StatPlugin()
+    plugin_manager.plugins["Stat"] = plugin
+    assert not plugin_manager.has_subscribers(HookType.PRE_COMMAND)
+
+    plugin_manager._register_hooks(plugin)
+    assert plugin_manager.has_subscribers(HookType.PRE_COMMAND)
+    assert not plugin_manager.has_subscribers(HookType.ON_STARTUP)
+    plugin_manager.trigger_hook(HookType.PRE_COMMAND, command_line="help")
+    plugin_manager.trigger_hook(HookType.PRE_COMMAND, command_line="help")
+
+    stats = plugin_manager.get_hook_stats()[("pre_command", "Stat")]
+    assert (stats.calls, stats.errors) == (2, 1)
+
+    plugin_manager.disable_plugin("Stat")
+    assert not plugin_manager.has_subscribers(HookType.PRE_COMMAND)
+
+
+def test_async_hooks_do_not_block_and_queue_is_bounded(plugin_manager):
+    """AsyncHooks handler'ları kuyrukta çalışır; kuyruk doluysa olay düşürülür."""
+    import threading
+
+    from core.hook_dispatch import HookDispatcher
+
+    started = threading.Event()
+    release = threading.Event()
+    seen = []
+
+    def slow_handler(session_id, **kwargs):
+        started.set()
+        release.wait(5)
+        seen.append(session_id)
+
+    class NotifyPlugin(BasePlugin):
+        Name = "Notify"
+        AsyncHooks = frozenset({HookType.ON_SESSION_OPEN})
+
+        def get_hooks(self):
+            return {HookType.ON_SESSION_OPEN: slow_handler}
+
+    plugin_manager._dispatcher = HookDispatcher(queue_size=2)
+    plugin_manager._register_hooks(NotifyPlugin())
+    plugin_manager.trigger_hook(HookType.ON_SESSION_OPEN, session_id=0)
+    assert started.wait(5)
+    for session_id in range(1, 5):
+        plugin_manager.trigger_hook(HookType.ON_SESSION_OPEN, session_id=session_id)
+
+    # Worker ilk olayı aldı; kuyrukta 2 yer var, kalan 2 olay düşürüldü
+    assert seen == []
+    release.set()
+    assert plugin_manager._dispatcher.drain(timeout=5)
+    assert seen == [0, 1, 2]
+    stats = plugin_manager.get_hook_stats()[("on_session_open", "Notify")]
+    assert (stats.calls, stats.dropped) == (3, 2)
+    plugin_manager.shutdown_hooks()
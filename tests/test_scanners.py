@@ -1,10 +1,36 @@
+import asyncio
+import contextlib
+import json
+import socket
+import threading
 import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from modules.auxiliary.scanner.http_dir_buster import HttpDirBuster
-from modules.auxiliary.scanner.port_scanner import PortScanner
+from core.fingerprint import FingerprintEngine, SignatureDB
+from modules.auxiliary.recon.dns_enum import dns_enum
+from modules.auxiliary.recon.subdomain_finder import (
+    ConcurrentResolver,
+    SubdomainFinder,
+    parse_nameservers,
+)
+from modules.auxiliary.scanner.http_dir_buster import (
+    HttpDirBuster,
+    PooledHttpClient,
+    SoftNotFoundCache,
+)
+from modules.auxiliary.scanner.port_scanner import (
+    _WAIT,
+    PortScanner,
+    _RttEstimator,
+    _SweepScheduler,
+)
+from modules.auxiliary.scanner.service_version_detector import (
+    service_version_detector,
+)
+from modules.auxiliary.scanner.ssh_brute import CredentialEngine, ssh_brute
 
 
 class TestPortScanner:
@@ -47,6 +73,132 @@ class TestPortScanner:
         result = scanner.scan_port("127.0.0.1", 80)
         assert result is None
 
+    def test_rtt_estimator_shrinks_timeout(self):
+        rtt = _RttEstimator(ceiling=1.0, floor=0.01)
+        assert rtt.timeout == 1.0
+        for _ in range(5):
+            rtt.observe(0.02)
+        assert 0.01 <= rtt.timeout < 0.1
+
+    def test_rtt_estimator_clamped_to_ceiling(self):
+        rtt = _RttEstimator(ceiling=0.5)
+        rtt.observe(3.0)
+        assert rtt.timeout == 0.5
+
+    def test_async_scan_local_listener(self, scanner):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(8)
+        open_port = listener.getsockname()[1]
+
+        # Kapalı port: bağla ve bırak
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        probe.bind(("127.0.0.1", 0))
+        closed_port = probe.getsockname()[1]
+        probe.close()
+
+        done = []
+        scheduler = _SweepScheduler(
+            ["127.0.0.1"],
+            sorted([open_port, closed_port]),
+            window=16,
+            per_host=8,
+            timeout=1.0,
+        )
+        try:
+            asyncio.run(scanner._async_sweep(scheduler, 16, 0, done.append))
+        finally:
+            listener.close()
+        assert len(done) == 1
+        assert done[0].open_ports == [open_port]
+
+    def test_run_writes_loot_per_host(self, scanner, tmp_path, monkeypatch):
+        import json
+
+        from core.shared_state import shared_state
+        from core.workspace_manager import WorkspaceManager
+
+        wm = WorkspaceManager(root=tmp_path / "workspaces")
+        wm.create("lab")
+        monkeypatch.setattr(shared_state, "workspace_manager", wm, raising=False)
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(8)
+        open_port = listener.getsockname()[1]
+        try:
+            assert scanner.run(
+                {
+                    "RHOST": "127.0.0.1",
+                    "RPORTS": str(open_port),
+                    "THREADS": 2,
+                    "ENGINE": "async",
+                    "TIMEOUT": 0.5,
+                }
+            )
+        finally:
+            listener.close()
+
+        loot = wm.get_active_path() / "hosts" / "127.0.0.1" / "ports.json"
+        data = json.loads(loot.read_text(encoding="utf-8"))
+        assert data["open_ports"] == [open_port]
+        assert data["engine"] == "async"
+
+    def test_parse_targets_cidr_and_list(self, scanner):
+        hosts = list(scanner.parse_targets("10.0.0.0/30, 192.168.1.5"))
+        assert hosts == ["10.0.0.1", "10.0.0.2", "192.168.1.5"]
+
+    def test_parse_targets_file(self, scanner, tmp_path):
+        host_file = tmp_path / "hosts.txt"
+        host_file.write_text("# lab\n10.0.0.7\n10.0.1.0/31\n", encoding="utf-8")
+        hosts = list(scanner.parse_targets(f"file:{host_file}"))
+        assert hosts == ["10.0.0.7", "10.0.1.0", "10.0.1.1"]
+
+    def test_parse_targets_invalid(self, scanner):
+        assert list(scanner.parse_targets("not-an-ip")) == []
+
+    def test_scheduler_interleaves_hosts_with_cap(self):
+        scheduler = _SweepScheduler(
+            ["10.0.0.1", "10.0.0.2"], [1, 2, 3], window=4, per_host=2, timeout=1.0
+        )
+        jobs = [scheduler.next_job() for _ in range(4)]
+        assert [(s.host, p) for s, p in jobs] == [
+            ("10.0.0.1", 1),
+            ("10.0.0.2", 1),
+            ("10.0.0.1", 2),
+            ("10.0.0.2", 2),
+        ]
+        # İki host da üst sınırda: tamamlanma beklenmeli
+        assert scheduler.next_job() is _WAIT
+        first_state = jobs[0][0]
+        assert scheduler.complete(first_state, 1, True) is None
+        state, port = scheduler.next_job()
+        assert (state.host, port) == ("10.0.0.1", 3)
+        scheduler.complete(state, 3, False)
+        finished = scheduler.complete(first_state, 2, False)
+        assert finished is first_state
+        assert finished.open_ports == [1]
+
+    def test_scheduler_fills_window_on_few_port_sweep(self):
+        hosts = [f"10.0.0.{i}" for i in range(1, 255)]
+        scheduler = _SweepScheduler(
+            hosts, [80, 443], window=10, per_host=256, timeout=1.0
+        )
+        jobs = []
+        while (job := scheduler.next_job()) is not _WAIT:
+            jobs.append(job)
+        # Pencere dolar: 5 host x 2 port aynı anda uçuşta
+        assert len(jobs) == 10
+        assert len({state.host for state, _ in jobs}) == 5
+
+        # Biten hostun yerini sıradaki host alır, pencere dolu kalır
+        for state, port in jobs:
+            if state.host == "10.0.0.1":
+                scheduler.complete(state, port, False)
+        refill = [scheduler.next_job(), scheduler.next_job()]
+        assert {state.host for state, _ in refill} == {"10.0.0.6"}
+        assert scheduler.next_job() is _WAIT
+
 
 class TestHttpDirBuster:
     @pytest.fixture
@@ -86,3 +238,743 @@ class TestHttpDirBuster:
 
         result = buster.check_url("http://example.com", "secret")
         assert result == ("secret", 403, "http://example.com/secret")
+
+    def test_iter_wordlist_skips_blank_lines(self, buster, tmp_path):
+        wordlist = tmp_path / "dirs.txt"
+        wordlist.write_text("admin\n\n  \nlogin\n", encoding="utf-8")
+        assert list(buster.iter_wordlist(str(wordlist))) == ["admin", "login"]
+
+    def test_scan_stream_processes_all_paths(self, buster):
+        paths = (f"p{i}" for i in range(500))
+        hits = []
+
+        def fake_check(base_url, path):
+            return (path, 200, f"{base_url}/{path}") if path.endswith("7") else None
+
+        with patch.object(buster, "check_url", side_effect=fake_check):
+            sent = buster.scan_stream("http://example.com", paths, 4, hits.append)
+
+        assert sent == 500
+        assert len(hits) == 50
+
+    def test_scan_stream_survives_failing_checks(self, buster):
+        hits = []
+
+        def flaky_check(base_url, path):
+            if path.startswith("bad"):
+                raise ConnectionResetError(path)
+            return (path, 200, f"{base_url}/{path}")
+
+        # Tek worker ve dar kuyruk: ölen worker üreticiyi kilitlerdi
+        paths = [f"bad{i}" for i in range(20)] + ["admin"]
+        with (
+            patch.object(buster, "check_url", side_effect=flaky_check),
+            patch("modules.auxiliary.scanner.http_dir_buster.logger") as log,
+            patch("modules.auxiliary.scanner.http_dir_buster.print") as mock_print,
+        ):
+            sent = buster.scan_stream("http://example.com", paths, 1, hits.append)
+
+        assert sent == 21
+        assert [hit[0] for hit in hits] == ["admin"]
+        assert log.exception.call_count == 20
+        assert "20 yol kontrol edilirken hata" in str(mock_print.call_args)
+
+
+@pytest.fixture
+def keepalive_server():
+    """HEAD isteklerine yanıt veren, istemci portlarını kaydeden HTTP/1.1 sunucusu.
+
+    /old -> /admin yönlendirir, /loop kendine yönlendirir, /nohead HEAD'i
+    405 ile reddedip yalnızca GET'e 200 döner.
+    """
+    client_ports = []
+    redirects = {"/old": "/admin", "/loop": "/loop"}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, status, location=None):
+            self.send_response(status)
+            if location:
+                self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_HEAD(self):
+            client_ports.append(self.client_address[1])
+            if self.path in redirects:
+                self._reply(301, redirects[self.path])
+            elif self.path == "/nohead":
+                self._reply(405)
+            else:
+                self._reply(200 if self.path == "/admin" else 404)
+
+        def do_GET(self):
+            self._reply(200 if self.path == "/nohead" else 404)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", client_ports
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledHttpClient:
+    def test_reuses_connection(self, keepalive_server):
+        base_url, client_ports = keepalive_server
+        client = PooledHttpClient(base_url)
+        try:
+            assert client.head("admin") == 200
+            assert client.head("missing") == 404
+            assert client.head("/admin") == 200
+        finally:
+            client.close()
+        assert len(client_ports) == 3
+        assert len(set(client_ports)) == 1
+
+    def test_check_url_pooled(self, keepalive_server):
+        base_url, _ = keepalive_server
+        buster = HttpDirBuster()
+        client = PooledHttpClient(base_url)
+        try:
+            assert buster.check_url_pooled(client, base_url, "admin") == (
+                "admin",
+                200,
+                f"{base_url}/admin",
+            )
+            assert buster.check_url_pooled(client, base_url, "nothing") is None
+        finally:
+            client.close()
+
+    def test_check_url_pooled_follows_redirects_and_head_fallback(
+        self, keepalive_server
+    ):
+        base_url, client_ports = keepalive_server
+        buster = HttpDirBuster()
+        client = PooledHttpClient(base_url)
+        try:
+            # Yönlendirme takip edilir, son durum raporlanır (urllib ile aynı)
+            assert buster.check_url_pooled(client, base_url, "old")[1] == 200
+            assert buster.check_url_pooled(client, base_url, "loop") is None
+            assert buster.check_url_pooled(client, base_url, "nohead")[1] == 200
+        finally:
+            client.close()
+        assert len(set(client_ports)) == 1
+
+    def test_invalid_url(self):
+        with pytest.raises(ValueError):
+            PooledHttpClient("ftp://example.com")
+
+
+@pytest.fixture
+def soft404_server():
+    """Var olmayan yollara da 200 ve yolu içeren bir hata sayfası döndüren sunucu."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _body(self):
+            if self.path == "/admin":
+                return b"<html>Yonetim paneli</html>"
+            return f"<html>{self.path.lstrip('/')} sayfasi bulunamadi</html>".encode()
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(self._body())))
+            self.end_headers()
+
+        def do_GET(self):
+            body = self._body()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSoftNotFound:
+    def test_calibrate_detects_soft_404(self, soft404_server):
+        buster = HttpDirBuster()
+        client = PooledHttpClient(soft404_server)
+        try:
+            cache = buster.calibrate(client, soft404_server)
+            assert cache.statuses == {200}
+            status, body = buster.fetch(client, soft404_server, "backup")
+            assert cache.matches(status, body, "backup")
+            status, body = buster.fetch(client, soft404_server, "admin")
+            assert not cache.matches(status, body, "admin")
+        finally:
+            client.close()
+
+    def test_same_length_real_page_is_not_filtered(self):
+        cache = SoftNotFoundCache()
+        cache.add(200, b"<html>x1 sayfasi yok</html>", "x1")
+        real = b"<html>Gercek sayfa</html>"
+        assert len(real) == len(b"<html> sayfasi yok</html>")
+        assert cache.matches(200, b"<html>abc sayfasi yok</html>", "abc")
+        assert not cache.matches(200, real, "panel")
+
+    def test_length_tolerance_is_opt_in_and_status_scoped(self):
+        cache = SoftNotFoundCache(length_tolerance=8)
+        cache.add(200, b"<html>hata 12:00:01</html>", "x1")
+        assert cache.matches(200, b"<html>hata 12:00:01.25</html>", "abc")
+        assert not cache.matches(200, b"<html>" + b"a" * 40 + b"</html>", "abc")
+        cache.add(403, b"yasak", "x2")
+        assert not cache.matches(403, b"<html>hata 12:00:01</html>", "abc")
+
+    def test_run_filters_soft_404_hits(self, soft404_server, tmp_path):
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("admin\nbackup\nold-site\n")
+        buster = HttpDirBuster()
+        options = {
+            "RHOST": soft404_server,
+            "WORDLIST": str(wordlist),
+            "THREADS": 2,
+            "CLIENT": "urllib",
+            "CALIBRATE": "true",
+        }
+        with patch("modules.auxiliary.scanner.http_dir_buster.print") as mock_print:
+            assert buster.run(options) is True
+        output = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "/admin" in output
+        assert "/backup" not in output
+        assert "2 wildcard/soft-404 yanıtı filtrelendi" in output
+
+
+@pytest.fixture
+def dns_server():
+    """Yerel UDP DNS sunucusu: www/mail için A kaydı, *.wild için wildcard, diğerleri NXDOMAIN.
+
+    "flaky" adına gelen ilk sorgu yanıtsız bırakılır (yeniden deneme testi).
+    """
+    import dns.message
+    import dns.rcode
+    import dns.rrset
+
+    records = {"www.example.test.": "192.0.2.10", "mail.example.test.": "192.0.2.20"}
+    seen = set()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(0.2)
+    stop = threading.Event()
+
+    def serve():
+        while not stop.is_set():
+            try:
+                data, addr = sock.recvfrom(4096)
+            except OSError:
+                continue
+            query = dns.message.from_wire(data)
+            name = query.question[0].name.to_text()
+            if name.startswith("flaky.") and name not in seen:
+                seen.add(name)
+                continue
+            response = dns.message.make_response(query)
+            address = records.get(name)
+            if address is None and name.endswith(".wild.test."):
+                address = "198.51.100.1"
+            if address is None and name.startswith("flaky."):
+                address = "192.0.2.30"
+            if address:
+                response.answer.append(
+                    dns.rrset.from_text(name, 60, "IN", "A", address)
+                )
+            else:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            sock.sendto(response.to_wire(), addr)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{sock.getsockname()[1]}"
+    stop.set()
+    thread.join()
+    sock.close()
+
+
+class TestSubdomainFinder:
+    def test_resolver_window_and_retries(self, dns_server):
+        resolver = ConcurrentResolver(
+            parse_nameservers(dns_server), window=4, timeout=0.3, retries=1
+        )
+        results = resolver.resolve_many(
+            ["www.example.test", "nope.example.test", "flaky.example.test"]
+        )
+        assert results == {
+            "www.example.test": ["192.0.2.10"],
+            "nope.example.test": [],
+            "flaky.example.test": ["192.0.2.30"],
+        }
+
+    def test_parse_nameservers(self):
+        assert parse_nameservers("1.1.1.1, 127.0.0.1:5353") == [
+            ("1.1.1.1", 53),
+            ("127.0.0.1", 5353),
+        ]
+        with pytest.raises(ValueError):
+            parse_nameservers("not-an-ip")
+
+    def test_run_finds_hosts_and_filters_wildcard(self, dns_server, tmp_path):
+        wordlist = tmp_path / "subs.txt"
+        wordlist.write_text("www\nmail\nrandom\n")
+        finder = SubdomainFinder()
+        options = {
+            "DOMAIN": "example.test",
+            "WORDLIST": str(wordlist),
+            "NAMESERVERS": dns_server,
+            "CONCURRENCY": 10,
+            "TIMEOUT": 0.5,
+            "CALIBRATE": "true",
+        }
+        with patch("modules.auxiliary.recon.subdomain_finder.print") as mock_print:
+            assert finder.run(options) is True
+        output = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "www.example.test" in output and "192.0.2.10" in output
+        assert "mail.example.test" in output
+        assert "filtrelendi" not in output
+
+        wordlist.write_text("www\nadmin\n")
+        options["DOMAIN"] = "wild.test"
+        with patch("modules.auxiliary.recon.subdomain_finder.print") as mock_print:
+            assert finder.run(options) is True
+        output = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "2 wildcard yanıtı filtrelendi" in output
+
+
+@pytest.fixture
+def dns_zone_server():
+    """Birden çok kayıt tipi sunan, gelen sorguları sayan yerel UDP DNS sunucusu."""
+    import dns.message
+    import dns.rcode
+    import dns.rdatatype
+    import dns.rrset
+
+    zone = {
+        ("a.test.", "A"): ["192.0.2.1"],
+        ("a.test.", "MX"): ["10 mail.a.test."],
+        ("a.test.", "TXT"): ['"v=spf1 -all"'],
+        ("b.test.", "A"): ["192.0.2.2"],
+        ("b.test.", "NS"): ["ns1.b.test."],
+    }
+    known = {name for name, _ in zone}
+    queries = []
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(0.2)
+    stop = threading.Event()
+
+    def serve():
+        while not stop.is_set():
+            try:
+                data, addr = sock.recvfrom(4096)
+            except OSError:
+                continue
+            query = dns.message.from_wire(data)
+            question = query.question[0]
+            name = question.name.to_text()
+            qtype = dns.rdatatype.to_text(question.rdtype)
+            queries.append((name, qtype))
+            response = dns.message.make_response(query)
+            if name not in known:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            elif (name, qtype) in zone:
+                response.answer.append(
+                    dns.rrset.from_text_list(
+                        name, 300, "IN", qtype, zone[(name, qtype)]
+                    )
+                )
+            sock.sendto(response.to_wire(), addr)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{sock.getsockname()[1]}", queries
+    stop.set()
+    thread.join()
+    sock.close()
+
+
+class TestDnsEnum:
+    def test_batch_resolves_all_types_and_streams_loot(self, dns_zone_server, tmp_path):
+        nameserver, queries = dns_zone_server
+        domains = tmp_path / "domains.txt"
+        domains.write_text("a.test\nb.test\nmissing.test\n")
+        loot = tmp_path / "dns_enum.jsonl"
+        module = dns_enum()
+        options = {
+            "DOMAIN_FILE": str(domains),
+            "NAMESERVERS": nameserver,
+            "CONCURRENCY": 8,
+            "TIMEOUT": 1.0,
+        }
+        with (
+            patch("modules.auxiliary.recon.dns_enum.print") as mock_print,
+            patch.object(module, "_loot_file", return_value=loot),
+        ):
+            assert module.run(options) is True
+        output = " ".join(
+            str(arg) for call in mock_print.call_args_list for arg in call.args
+        )
+        assert "a.test MX 10 mail.a.test." in output
+        assert "b.test NS ns1.b.test." in output
+        assert "missing.test: bulunamadı" in output
+        # NXDOMAIN önbelleğe girince aynı adın diğer tipleri sorulmayabilir
+        sent = len(queries)
+        assert 11 <= sent <= 15
+
+        rows = [json.loads(line) for line in loot.read_text().splitlines()]
+        assert {(row["domain"], row["type"]) for row in rows} == {
+            ("a.test", "A"),
+            ("a.test", "MX"),
+            ("a.test", "TXT"),
+            ("b.test", "A"),
+            ("b.test", "NS"),
+        }
+
+        # İkinci çalıştırma TTL dolmadan önbellekten yanıtlanır
+        with (
+            patch("modules.auxiliary.recon.dns_enum.print"),
+            patch.object(module, "_loot_file", return_value=None),
+        ):
+            assert module.run(options) is True
+        assert len(queries) == sent
+
+    def test_single_domain_nxdomain(self, dns_zone_server):
+        nameserver, _ = dns_zone_server
+        options = {"DOMAIN": "missing.test", "NAMESERVERS": nameserver, "TIMEOUT": 1.0}
+        with patch("modules.auxiliary.recon.dns_enum.print") as mock_print:
+            assert dns_enum().run(options) is False
+        assert "NXDOMAIN" in str(mock_print.call_args_list[-1].args[0])
+
+
+@pytest.fixture
+def ssh_server():
+    """Yalnızca admin:pw37 kabul eden, bağlantı ve deneme sayan paramiko sunucusu."""
+    paramiko = pytest.importorskip("paramiko")
+    host_key = paramiko.RSAKey.generate(1024)
+    stats = {"connections": 0, "auths": []}
+
+    class Server(paramiko.ServerInterface):
+        def get_allowed_auths(self, username):
+            return "password"
+
+        def check_auth_password(self, username, password):
+            stats["auths"].append((username, password))
+            if (username, password) == ("admin", "pw37"):
+                return paramiko.AUTH_SUCCESSFUL
+            return paramiko.AUTH_FAILED
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(32)
+    transports = []
+
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            stats["connections"] += 1
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(host_key)
+            transports.append(transport)
+            with contextlib.suppress(Exception):
+                transport.start_server(server=Server())
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield listener.getsockname()[1], stats
+    listener.close()
+    for transport in transports:
+        transport.close()
+
+
+class FakeSession:
+    def __init__(self, username, valid, log):
+        self.username = username
+        self.attempts = 0
+        self.alive = True
+        self._valid = valid
+        self._log = log
+
+    def try_password(self, password):
+        self.attempts += 1
+        self._log.append((self.username, password))
+        return (self.username, password) in self._valid
+
+    def close(self):
+        self.alive = False
+
+
+class TestSSHBrute:
+    def test_matrix_reuses_connections_and_stops_on_hit(self, ssh_server, tmp_path):
+        port, stats = ssh_server
+        (tmp_path / "users.txt").write_text("root\nadmin\nguest\n")
+        (tmp_path / "pw.txt").write_text("\n".join(f"pw{i}" for i in range(60)))
+        module = ssh_brute()
+        options = {
+            "RHOST": "127.0.0.1",
+            "RPORT": port,
+            "USERNAME": "unused",
+            "USER_FILE": str(tmp_path / "users.txt"),
+            "WORDLIST": str(tmp_path / "pw.txt"),
+            "THREADS": 3,
+            "TIMEOUT": 5,
+            "ATTEMPTS_PER_CONN": 5,
+        }
+        with patch("modules.auxiliary.scanner.ssh_brute.print"):
+            assert module.run(options) is True
+
+        engine = module.engine
+        assert engine.found == [("admin", "pw37")]
+        assert module.success_password == "pw37"
+        # guest hiç denenmez; admin için kuyrukta bekleyenler atılır
+        assert not any(user == "guest" for user, _ in stats["auths"])
+        assert len(stats["auths"]) < 2 * 60
+        assert stats["connections"] == engine.connections
+        assert engine.connections * 3 <= engine.attempts
+
+    def test_engine_continues_per_user_without_stop_on_success(self):
+        log = []
+        valid = {("root", "b"), ("admin", "c")}
+        engine = CredentialEngine(
+            lambda user: FakeSession(user, valid, log),
+            threads=2,
+            attempts_per_connection=2,
+            stop_on_success=False,
+        )
+        credentials = ssh_brute.iter_credentials(
+            ["root", "admin"], ["a", "b", "c", "d"]
+        )
+        found = engine.run(credentials)
+
+        assert sorted(found) == [("admin", "c"), ("root", "b")]
+        assert engine.connections >= 2 and engine.fatal_error is None
+
+    def test_engine_stops_when_target_unreachable(self):
+        def connect(user):
+            raise ConnectionRefusedError("kapalı")
+
+        engine = CredentialEngine(connect, threads=2)
+        credentials = ssh_brute.iter_credentials(
+            ["root"], (f"p{i}" for i in range(1000))
+        )
+        assert engine.run(credentials) == []
+        assert engine.fatal_error and "bağlanılamıyor" in engine.fatal_error
+        assert engine.failed < 1000 and engine.connections == 0
+
+
+@pytest.fixture
+def service_ports():
+    """Banner gönderen (SSH benzeri), önce istemciyi bekleyen (HTTP) ve sessiz sunucular."""
+    listeners = []
+
+    def banner_server(banner):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(16)
+        listeners.append(sock)
+
+        def serve():
+            while True:
+                try:
+                    conn, _ = sock.accept()
+                except OSError:
+                    return
+                if banner:
+                    conn.sendall(banner)
+                threading.Timer(1.0, conn.close).start()
+
+        threading.Thread(target=serve, daemon=True).start()
+        return sock.getsockname()[1]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    http = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=http.serve_forever, daemon=True).start()
+    yield {
+        "ssh": banner_server(b"SSH-2.0-OpenSSH_9.6p1 Ubuntu-3\r\n"),
+        "silent": banner_server(b""),
+        "http": http.server_address[1],
+    }
+    http.shutdown()
+    http.server_close()
+    for sock in listeners:
+        sock.close()
+
+
+@pytest.fixture
+def tls_banner_port(tmp_path):
+    """TLS el sıkışmasından sonra IMAP banner'ı gönderen (IMAPS benzeri) sunucu."""
+    import datetime
+    import ssl
+
+    pytest.importorskip("cryptography")
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = tmp_path / "cert.pem", tmp_path / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(16)
+
+    def serve():
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except OSError:
+                return
+            try:
+                tls = context.wrap_socket(conn, server_side=True)
+            except (OSError, ssl.SSLError):
+                conn.close()
+                continue
+            tls.sendall(b"* OK [CAPABILITY IMAP4rev1] Dovecot ready.\r\n")
+            threading.Timer(1.0, tls.close).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield sock.getsockname()[1]
+    sock.close()
+
+
+class TestServiceFingerprint:
+    def test_signature_db_matches_by_probe(self):
+        db = SignatureDB.compile()
+        response = b"HTTP/1.1 200 OK\r\nServer: nginx/1.25.3\r\n\r\n"
+        assert db.match("GetRequest", response) == ("http", "nginx", "1.25.3")
+        # Yanıt yalnızca kendi probe'unun imzalarına karşı denenir
+        assert db.match("NULL", response) is None
+        assert db.match("NULL", b"220 (vsFTPd 3.0.5)\r\n") == ("ftp", "vsftpd", "3.0.5")
+        mariadb = b"\x5b\x00\x00\x00\x0a5.5.5-10.6.12-MariaDB-1:10.6.12+maria\x00"
+        assert db.match("NULL", mariadb) == ("mysql", "MariaDB", "10.6.12-MariaDB-1")
+        mysql = b"\x4a\x00\x00\x00\x0a8.0.36\x00"
+        assert db.match("NULL", mysql) == ("mysql", "MySQL", "8.0.36")
+        assert [p.name for p in db.probes_for(8080)][:2] == ["GetRequest", "NULL"]
+
+    def test_engine_probes_targets_concurrently(self, service_ports):
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+        closed.close()
+
+        engine = FingerprintEngine(window=8, timeout=1.0, read_timeout=0.3)
+        results = {
+            r.port: r
+            for r in engine.run_many(
+                ("127.0.0.1", port) for port in [*service_ports.values(), closed_port]
+            )
+        }
+        ssh = results[service_ports["ssh"]]
+        assert (ssh.service, ssh.product, ssh.version) == ("ssh", "OpenSSH", "9.6p1")
+        assert ssh.probe == "NULL"
+        http = results[service_ports["http"]]
+        assert http.service == "http" and http.probe == "GetRequest"
+        silent = results[service_ports["silent"]]
+        assert not silent.identified and not silent.error
+        assert results[closed_port].error == "connection refused"
+
+    def test_engine_reads_banner_over_tls_first(
+        self, tls_banner_port, service_ports, monkeypatch
+    ):
+        ports = {tls_banner_port, service_ports["ssh"]}
+        monkeypatch.setattr("core.fingerprint.TLS_PORTS", frozenset(ports))
+
+        # Okuma zaman aşımı bağlantı süresinden uzun: düz probe'lar denenseydi
+        # ilk yanıt ancak zaman aşımından sonra gelirdi
+        engine = FingerprintEngine(window=4, timeout=1.0, read_timeout=5.0)
+        results = {r.port: r for r in engine.run_many(("127.0.0.1", p) for p in ports)}
+        imaps = results[tls_banner_port]
+        assert (imaps.service, imaps.product) == ("imap", "Dovecot imapd")
+        assert imaps.probe == "NULL" and imaps.tls
+        # TLS konuşmayan servis düz probe'lara düşer
+        ssh = results[service_ports["ssh"]]
+        assert ssh.service == "ssh" and not ssh.tls
+
+    def test_run_from_loot_writes_services_per_host(
+        self, service_ports, tmp_path, monkeypatch
+    ):
+        from core.shared_state import shared_state
+        from core.workspace_manager import WorkspaceManager
+
+        wm = WorkspaceManager(root=tmp_path / "workspaces")
+        wm.create("lab")
+        monkeypatch.setattr(shared_state, "workspace_manager", wm, raising=False)
+        wm.write_ports_loot("127.0.0.1", [service_ports["ssh"], service_ports["http"]])
+
+        module = service_version_detector()
+        options = {"FROM_LOOT": "true", "TIMEOUT": 1, "READ_TIMEOUT": 0.3}
+        with patch(
+            "modules.auxiliary.scanner.service_version_detector.print"
+        ) as mock_print:
+            assert module.run(options) is True
+        output = " ".join(
+            str(a) for call in mock_print.call_args_list for a in call.args
+        )
+        assert "OpenSSH 9.6p1" in output
+
+        loot = wm.get_active_path() / "hosts" / "127.0.0.1" / "services.json"
+        data = json.loads(loot.read_text(encoding="utf-8"))
+        services = {s["port"]: s["service"] for s in data["services"]}
+        assert services == {service_ports["ssh"]: "ssh", service_ports["http"]: "http"}
+
+    def test_run_from_loot_single_port_reports_loot_port(
+        self, service_ports, tmp_path, monkeypatch
+    ):
+        from core.shared_state import shared_state
+        from core.workspace_manager import WorkspaceManager
+
+        wm = WorkspaceManager(root=tmp_path / "workspaces")
+        wm.create("lab")
+        monkeypatch.setattr(shared_state, "workspace_manager", wm, raising=False)
+        wm.write_ports_loot("127.0.0.1", [service_ports["ssh"]])
+
+        options = {"FROM_LOOT": "true", "RPORT": 22, "READ_TIMEOUT": 0.3}
+        with patch(
+            "modules.auxiliary.scanner.service_version_detector.print"
+        ) as mock_print:
+            assert service_version_detector().run(options) is True
+        first = str(mock_print.call_args_list[0].args[0])
+        assert f"127.0.0.1:{service_ports['ssh']} portunda" in first
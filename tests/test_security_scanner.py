@@ -199,4 +199,24 @@ def test_sandbox_executor_allowed_import():
     sandbox = SandboxExecutor()
     source = "import json\nx = json.dumps({'a': 1})"
     result = sandbox.exec_module_restricted(source, "test.py")
-    assert result is not None
\ No newline at end of file
+    assert result is not None
+
+
+def test_compiled_rules_match_pattern_lists():
+    """Tek sözlüğe derlenen kurallar desen listelerindeki tüm girdileri kapsamalı."""
+    from core import code_scanner
+
+    compiled = [rule for rules in code_scanner._CALL_RULES.values() for rule in rules]
+    patterns = (
+        code_scanner.EXECUTION_PATTERNS
+        + code_scanner.SHELL_PATTERNS
+        + code_scanner.NATIVE_PATTERNS
+    )
+    assert sorted(compiled) == sorted(patterns)
+    assert code_scanner._CALL_RULES["system"] == (patterns[4],)
+
+    result = code_scanner.scan_source(
+        "import os\nsh.os.system('x')\nsystem('y')\nprint(1)\n"
+    )
+    assert [item[3] for item in result.dangerous] == [2]
+    assert len(code_scanner.RULES_VERSION) == 16
@@ -109,6 +109,20 @@ class TestSessionManager(unittest.TestCase):
         # Session listesi boş olmalı
         self.assertEqual(len(self.session_manager.sessions), 0)
 
+    def test_session_hooks_run_outside_lock(self):
+        """Yavaş bir plugin hook'u oturum kilidini tutarken çalışmamalı."""
+        lock_states = []
+        plugin_manager = MagicMock()
+        plugin_manager.trigger_hook.side_effect = lambda *args, **kwargs: (
+            lock_states.append(self.session_manager.lock.locked())
+        )
+        shared_state.plugin_manager = plugin_manager
+
+        self.session_manager.add_session(MagicMock(), {"type": "Test"})
+        self.session_manager.shutdown_all()
+
+        self.assertEqual(lock_states, [False, False])
+
 
 if __name__ == "__main__":
     unittest.main()
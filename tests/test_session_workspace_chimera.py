@@ -199,7 +199,11 @@ class TestPortScannerLoot:
         ctx.workspace_manager = wm
 
         scanner = PortScanner()
-        with patch.object(scanner, "scan_port", side_effect=lambda ip, p: p if p in (80, 443) else None):
+        with patch.object(
+            scanner,
+            "scan_port",
+            side_effect=lambda ip, p, timeout=1.0: p if p in (80, 443) else None,
+        ):
             ok = scanner.run(
                 {"RHOST": "127.0.0.1", "RPORTS": "80,443,9999", "THREADS": 2}
             )
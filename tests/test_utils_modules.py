@@ -3,9 +3,15 @@
 # =============================================================================
 
 import hashlib
+import io
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.console import Console
+
+from core.hash_engine import crack_batch
+from core.wordlist import Wordlist
 
 # ── Process Manager ──────────────────────────────────────────────────────────
 from modules.auxiliary.os.process_manager import process_manager
@@ -17,7 +23,12 @@ from modules.auxiliary.os.service_manager import service_manager
 from modules.auxiliary.utils.hash_cracker import hash_cracker
 
 # ── Web Crawler ──────────────────────────────────────────────────────────────
-from modules.auxiliary.utils.web_crawler import web_crawler
+from modules.auxiliary.utils.web_crawler import (
+    CrawlFrontier,
+    UrlSeenSet,
+    extract_page,
+    web_crawler,
+)
 
 
 # =============================================================================
@@ -76,10 +87,12 @@ class TestWebCrawler:
         result = mod.run({"TARGET_URL": "not-a-url"})
         assert result is False
 
-    @patch("modules.auxiliary.utils.web_crawler.requests.get")
+    @patch("requests.Session.get")
     def test_run_basic(self, mock_get, mod):
         mock_resp = MagicMock()
         mock_resp.text = "<html><head><title>Hi</title></head><body></body></html>"
+        mock_resp.encoding = "utf-8"
+        mock_resp.iter_content.return_value = [mock_resp.text.encode()]
         mock_resp.status_code = 200
         mock_get.return_value = mock_resp
 
@@ -95,6 +108,118 @@ class TestWebCrawler:
         )
         assert result is True
 
+    def test_frontier_politeness_and_order(self):
+        frontier = CrawlFrontier(per_host=1, delay=5.0)
+        frontier.push("http://a.test/deep", 2)
+        frontier.push("http://a.test/", 0)
+        frontier.push("http://b.test/", 1)
+
+        assert frontier.pop(now=100.0) == ("http://a.test/", 0)
+        assert frontier.pop(now=100.0) == ("http://b.test/", 1)
+        # a.test hâlâ meşgul
+        assert frontier.pop(now=100.0) == 0.0
+        frontier.release("http://a.test/")
+        # Yuva boşaldı ama DELAY dolmadı
+        assert frontier.pop(now=102.0) == pytest.approx(3.0)
+        assert frontier.pop(now=105.0) == ("http://a.test/deep", 2)
+        assert frontier.pop(now=105.0) is None
+
+    def test_url_seen_set(self):
+        seen = UrlSeenSet()
+        assert seen.add("http://example.com/a") is True
+        assert seen.add("http://example.com/a") is False
+        assert "http://example.com/a" in seen
+        assert "http://example.com/b" not in seen
+        assert len(seen) == 1
+
+    def test_run_concurrent_crawl(self, mod):
+        """Yerel sunucuda 40 sayfalık zincir; MAX_PAGES sınırı uygulanır."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        requested = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requested.append(self.path)
+                page = int(self.path.strip("/") or 0)
+                links = "".join(
+                    f'<a href="/{n}">{n}</a>'
+                    for n in (page * 2 + 1, page * 2 + 2)
+                    if n < 40
+                )
+                body = (
+                    f"<html><title>p{page}</title><body>{links}</body></html>".encode()
+                )
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            options = {
+                "TARGET_URL": f"http://127.0.0.1:{server.server_address[1]}/",
+                "MAX_DEPTH": 10,
+                "MAX_PAGES": 25,
+                "TIMEOUT": 2,
+                "USER_AGENT": "Test",
+                "CHECK_ROBOTS": "false",
+                "CONCURRENCY": 4,
+                "PER_HOST": 4,
+            }
+            mod.console = Console(file=io.StringIO(), width=200)
+            assert mod.run(options) is True
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert len(requested) == 25
+        assert len(set(requested)) == 25
+        assert "Sayfa: 25" in mod.console.file.getvalue()
+
+    def test_extract_page_single_pass(self):
+        html = (
+            "<html><head><title> Giriş </title><meta property='og:site' content='x'>"
+            "<title>ikinci</title></head><body><a href='/a#top'>a</a>"
+            "<form><input name='q' disabled><select name='s'></select></form>"
+            "<input name='outside'><a href='mailto:x@y'>m</a></body></html>"
+        )
+        page = extract_page(html, "http://example.com/dir/")
+        assert page["links"] == ["http://example.com/a"]
+        assert page["meta"] == {"title": "Giriş", "og:site": "x"}
+        assert page["forms"] == [
+            {
+                "action": "http://example.com/dir/",
+                "method": "GET",
+                "inputs": [
+                    {"name": "q", "type": "text", "value": ""},
+                    {"name": "s", "type": "text", "value": ""},
+                ],
+            }
+        ]
+
+    @patch("requests.Session.get")
+    def test_fetch_and_extract_caps_body(self, mock_get, mod):
+        mock_resp = MagicMock()
+        mock_resp.encoding = "utf-8"
+        mock_resp.status_code = 200
+        head = b"<html><a href='/first'>1</a>"
+        mock_resp.iter_content.return_value = [head, b"<a href='/second'>2</a>" * 100]
+        mock_get.return_value = mock_resp
+
+        session = mod._create_session(1, "Test")
+        page, status = mod._fetch_and_extract(
+            "http://example.com/", 2, "Test", session, max_body=len(head) + 5
+        )
+        assert status == 200
+        assert page["links"] == ["http://example.com/first"]
+        mock_resp.close.assert_called_once()
+
 
 # =============================================================================
 # TestHashCracker
@@ -151,6 +276,60 @@ class TestHashCracker:
         result = mod.run({"HASH": "", "HASH_FILE": "", "WORDLIST": "irrelevant"})
         assert result is False
 
+    def test_crack_batch_process_pool(self, tmp_path):
+        words = [f"word{i}" for i in range(2000)]
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("\n".join(words) + "\n")
+        targets = {
+            "md5": {hashlib.md5(b"word7").digest(), hashlib.md5(b"nope").digest()},
+            "sha1": {hashlib.sha1(b"word1999").digest()},
+        }
+        found = crack_batch(
+            targets, Wordlist(str(wordlist)), workers=2, chunk_bytes=300
+        )
+        assert found == {
+            ("md5", hashlib.md5(b"word7").digest()): b"word7",
+            ("sha1", hashlib.sha1(b"word1999").digest()): b"word1999",
+        }
+
+    def test_run_hash_file_mixed_types(self, mod, tmp_path):
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("admin\nletmein\nhunter2\n")
+        hash_file = tmp_path / "hashes.txt"
+        hash_file.write_text(
+            f"{hashlib.md5(b'hunter2').hexdigest()}\n"
+            f"{hashlib.sha256(b'admin').hexdigest()}\n"
+            f"{hashlib.md5(b'missing').hexdigest()}\nzz\n"
+        )
+        options = {
+            "HASH_FILE": str(hash_file),
+            "WORDLIST": str(wordlist),
+            "HASH_TYPE": "auto",
+            "WORKERS": 1,
+        }
+        mod.console = Console(file=io.StringIO(), width=200)
+        assert mod.run(options) is True
+        output = mod.console.file.getvalue()
+        assert "hunter2" in output and "admin" in output
+        assert "Kırılan: 2/4" in output
+
+    def test_run_rejects_unsupported_hash_type(self, mod, tmp_path):
+        wordlist = tmp_path / "words.txt"
+        wordlist.write_text("admin\n")
+        options = {
+            "HASH": hashlib.md5(b"admin").hexdigest(),
+            "WORDLIST": str(wordlist),
+            "HASH_TYPE": "md4x",
+            "WORKERS": 1,
+        }
+        with (
+            patch("modules.auxiliary.utils.hash_cracker.crack_batch") as crack,
+            patch("modules.auxiliary.utils.hash_cracker.print") as mock_print,
+        ):
+            assert mod.run(options) is False
+        crack.assert_not_called()
+        assert "Desteklenmeyen hash tipi: md4x" in str(mock_print.call_args)
+
 
 # =============================================================================
 # TestServiceManager
@@ -318,4 +318,37 @@ def test_sandbox_strict_default():
 def test_sandbox_strict_custom():
     """SandboxExecutor strict parametresi ayarlanabilmeli."""
     sandbox = SandboxExecutor(strict=False)
-    assert sandbox.strict is False
\ No newline at end of file
+    assert sandbox.strict is False
+
+
+def test_pipeline_verdict_cache_persists_and_tracks_rules(tmp_path, monkeypatch):
+    """Değişmemiş dosyanın doğrulaması önbellekten gelir; kural sürümü değişince yenilenir."""
+    from core import validation_pipeline
+    from core.bytecode_cache import BytecodeCache
+
+    module_file = tmp_path / "mod.py"
+    module_file.write_text("x = 1\n", encoding="utf-8")
+    calls = []
+    original = ValidationPipeline._validate_module
+
+    def counting(self, *args):
+        calls.append(args[0])
+        return original(self, *args)
+
+    monkeypatch.setattr(ValidationPipeline, "_validate_module", counting)
+
+    def validate():
+        pipeline = ValidationPipeline(verdict_cache=BytecodeCache(tmp_path / "cache"))
+        return pipeline.validate_module_file(str(module_file))
+
+    assert validate().is_valid and validate().is_valid
+    assert len(calls) == 1
+
+    monkeypatch.setattr(validation_pipeline, "VALIDATION_RULES_VERSION", "yeni")
+    assert validate().is_valid
+    assert len(calls) == 2
+
+    # Geçersiz sonuç saklanmaz (ör. eksik bağımlılık sonradan kurulabilir)
+    module_file.write_text("import nonexistent_pkg_123\n", encoding="utf-8")
+    assert not validate().is_valid and not validate().is_valid
+    assert len(calls) == 4